@@ -11,7 +11,8 @@ import subprocess
 import time
 from typing import Dict, List, Any, Optional
 from concurrent.futures import ThreadPoolExecutor
-import requests
+
+from ..services.http_client import PooledHTTPClient, get_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -20,7 +21,9 @@ class AgentCoreOrchestrator:
     Orchestrates multiple AgentCore agents for financial risk analysis
     """
     
-    def __init__(self):
+    def __init__(self, http_client: Optional[PooledHTTPClient] = None):
+        # Shared keep-alive pool; each agent port is limited separately
+        self.http_client = http_client or get_http_client()
         self.agents = {
             "regulatory_compliance": {
                 "port": 8081,
@@ -98,7 +101,7 @@ class AgentCoreOrchestrator:
     async def _is_port_in_use(self, port: int) -> bool:
         """Check if a port is currently in use"""
         try:
-            response = requests.get(f"http://localhost:{port}/health", timeout=2)
+            response = await self.http_client.get(f"http://localhost:{port}/health", timeout=2, retries=0)
             return response.status_code == 200
         except:
             return False
@@ -122,10 +125,11 @@ class AgentCoreOrchestrator:
     async def _test_agent_connectivity(self, agent_name: str, port: int) -> bool:
         """Test if agent is responding"""
         try:
-            response = requests.post(
+            response = await self.http_client.post(
                 f"http://localhost:{port}/invocations",
                 json={"test": "connectivity"},
-                timeout=5
+                timeout=5,
+                retries=0
             )
             return response.status_code == 200
         except:
@@ -201,11 +205,13 @@ class AgentCoreOrchestrator:
         try:
             logger.info(f"Executing AgentCore agent: {agent_name}")
             
-            # Make HTTP request to AgentCore agent
-            response = requests.post(
+            # Make HTTP request to AgentCore agent; never resent, the agent
+            # may already be running the first attempt
+            response = await self.http_client.post(
                 f"http://localhost:{port}/invocations",
                 json=payload,
-                timeout=30
+                timeout=30,
+                retries=0
             )
             
             if response.status_code == 200:
@@ -286,7 +292,8 @@ class AgentCoreOrchestrator:
             try:
                 process = agent_info["process"]
                 process.terminate()
-                process.wait(timeout=5)
+                # Wait off the event loop so the API stays responsive
+                await asyncio.to_thread(process.wait, 5)
                 logger.info(f"AgentCore agent {agent_name} stopped")
             except Exception as e:
                 logger.error(f"Failed to stop AgentCore agent {agent_name}: {e}")
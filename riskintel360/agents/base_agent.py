@@ -7,7 +7,7 @@ import asyncio
 import logging
 from abc import ABC, abstractmethod
 from datetime import datetime, UTC
-from typing import Dict, Any, Optional, List, Union
+from typing import Dict, Any, Optional, List, Union, Callable
 from dataclasses import dataclass, field
 
 from ..services.bedrock_client import BedrockClient, BedrockRequest
@@ -187,6 +187,10 @@ class BaseAgent(ABC):
         self.current_task: Optional[str] = None
         self.task_results: Dict[str, Any] = {}
         
+        # Optional (agent_id, progress) callback set by the orchestrator; it
+        # must be cheap, since agents report progress many times per task
+        self.progress_reporter: Optional[Callable[[str, float], None]] = None
+        
     async def start(self) -> None:
         """Start the agent and set status to running"""
         self.state.status = SessionStatus.RUNNING
@@ -366,6 +370,12 @@ class BaseAgent(ABC):
         self.state.progress = max(0.0, min(1.0, progress))
         self.state.last_activity = datetime.now(UTC)
         self.logger.debug(f"📊 Progress updated: {progress:.1%}")
+        
+        if self.progress_reporter is not None:
+            try:
+                self.progress_reporter(self.agent_id, self.state.progress)
+            except Exception as e:
+                self.logger.debug(f"Progress reporter failed: {e}")
     
     def get_state(self) -> AgentState:
         """Get current agent state"""
@@ -13,13 +13,14 @@ from datetime import datetime, UTC, timedelta
 from typing import Dict, Any, Optional, List, Union
 from dataclasses import dataclass
 import aiohttp
-import yfinance as yf
-from sklearn.linear_model import LinearRegression
-from sklearn.preprocessing import StandardScaler
 import warnings
 
 from .base_agent import BaseAgent, AgentConfig
 from ..models.agent_models import MessageType, Priority, AgentType
+from ..utils.lazy_imports import lazy_import
+
+# yfinance is only needed when live market data is fetched
+yf = lazy_import("yfinance")
 
 # Suppress sklearn warnings for cleaner output
 warnings.filterwarnings('ignore', category=UserWarning)
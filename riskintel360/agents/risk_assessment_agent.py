@@ -13,12 +13,14 @@ from datetime import datetime, UTC, timedelta
 from typing import Dict, Any, Optional, List, Union
 from dataclasses import dataclass
 import aiohttp
-import boto3
 from botocore.exceptions import ClientError, NoCredentialsError
 import warnings
 
 from .base_agent import BaseAgent, AgentConfig
 from ..models.agent_models import MessageType, Priority, AgentType
+from ..utils.lazy_imports import lazy_import
+
+boto3 = lazy_import("boto3")
 
 # Suppress warnings for cleaner output
 warnings.filterwarnings('ignore', category=UserWarning)
@@ -22,8 +22,17 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/demo", tags=["Competition Demo"])
 
-# Global demo service instance
-demo_service = CompetitionDemoService()
+# Global demo service instance, created on first use so that application
+# startup does not build Bedrock/AgentCore clients and the LangGraph supervisor
+_demo_service: Optional[CompetitionDemoService] = None
+
+
+def get_demo_service() -> CompetitionDemoService:
+    """Get or create the global competition demo service"""
+    global _demo_service
+    if _demo_service is None:
+        _demo_service = CompetitionDemoService()
+    return _demo_service
 
 # Store demo results for presentation
 demo_results_cache: Dict[str, DemoResult] = {}
@@ -32,15 +41,15 @@ demo_results_cache: Dict[str, DemoResult] = {}
 @router.get("/status")
 async def get_demo_status() -> Dict[str, Any]:
     """Get demo service status including AWS configuration"""
-    return demo_service.get_aws_status()
+    return get_demo_service().get_aws_status()
 
 
 @router.post("/reconfigure-aws")
 async def reconfigure_aws_integration() -> Dict[str, Any]:
     """Reconfigure AWS integration when credentials are added or updated"""
     try:
-        success = await demo_service.reconfigure_aws_integration()
-        status = demo_service.get_aws_status()
+        success = await get_demo_service().reconfigure_aws_integration()
+        status = get_demo_service().get_aws_status()
         
         return {
             "reconfiguration_successful": success,
@@ -61,7 +70,7 @@ async def reconfigure_aws_integration() -> Dict[str, Any]:
 async def get_demo_scenarios() -> List[Dict[str, Any]]:
     """Get available demo scenarios for competition presentation"""
     try:
-        scenarios = await demo_service.get_demo_scenarios()
+        scenarios = await get_demo_service().get_demo_scenarios()
         return scenarios
     except Exception as e:
         logger.error(f"Failed to get demo scenarios: {str(e)}")
@@ -92,7 +101,7 @@ async def execute_demo_scenario(
 
         
         # Get AWS status for immediate feedback
-        aws_status = demo_service.aws_configured
+        aws_status = get_demo_service().aws_configured
         aws_message = "Using Amazon Bedrock Nova for live AI analysis" if aws_status else "AWS not configured - using comprehensive simulated analysis for demonstration"
         
         # Execute demo with appropriate mode based on parameters
@@ -109,7 +118,7 @@ async def execute_demo_scenario(
             if force_mock or not aws_status:
                 # Mock execution should be fast
                 result = await asyncio.wait_for(
-                    demo_service.run_demo_scenario(scenario, force_mock=True),
+                    get_demo_service().run_demo_scenario(scenario, force_mock=True),
                     timeout=10.0  # 10 seconds max for mock
                 )
             else:
@@ -117,14 +126,14 @@ async def execute_demo_scenario(
                 try:
                     logger.info(f"Starting real AWS Bedrock execution: {execution_id}")
                     result = await asyncio.wait_for(
-                        demo_service.run_demo_scenario(scenario, force_mock=False),
+                        get_demo_service().run_demo_scenario(scenario, force_mock=False),
                         timeout=90.0  # 90 seconds max for real AWS (increased)
                     )
                     logger.info(f"AWS Bedrock execution completed successfully: {execution_id}")
                 except asyncio.TimeoutError:
                     logger.warning(f"AWS Bedrock execution timed out after 90 seconds, falling back to mock: {execution_id}")
                     result = await asyncio.wait_for(
-                        demo_service.run_demo_scenario(scenario, force_mock=True),
+                        get_demo_service().run_demo_scenario(scenario, force_mock=True),
                         timeout=10.0
                     )
                     force_mock = True  # Update flag for response message
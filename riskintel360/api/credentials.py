@@ -7,13 +7,15 @@ import logging
 from typing import Dict, List, Optional, Any
 from fastapi import APIRouter, HTTPException, Depends, status
 from pydantic import BaseModel, Field, field_validator
-import boto3
 from botocore.exceptions import ClientError, NoCredentialsError
 
 from ..services.credential_manager import credential_manager, CredentialConfig
 from ..services.cost_management import AWSCostManager, CostProfile, DetailedCostEstimate
 from ..auth.dependencies import get_current_user
 from ..auth.models import User
+from ..utils.lazy_imports import lazy_import
+
+boto3 = lazy_import("boto3")
 
 logger = logging.getLogger(__name__)
 
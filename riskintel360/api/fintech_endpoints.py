@@ -20,9 +20,7 @@ from riskintel360.models.fintech_models import (
 )
 from riskintel360.services.performance_monitor import performance_monitor
 from riskintel360.models.agent_models import AgentType, Priority
-from riskintel360.services.workflow_orchestrator import WorkflowOrchestrator
 from riskintel360.services.agent_runtime import get_session_manager
-from riskintel360.agents.agent_factory import AgentFactory
 from riskintel360.auth.middleware import sanitize_html_input, validate_sql_input
 from riskintel360.config.settings import get_settings
 
@@ -54,6 +52,16 @@ def get_current_user_or_demo(request: Request) -> Dict[str, str]:
             )
         return request.state.current_user
 
+
+def _create_agent_factory():
+    """
+    Create an agent factory for result lookups.
+    The factory module imports all six agents (pandas, sklearn, yfinance, boto3),
+    so it is loaded on the first request that needs it rather than at startup.
+    """
+    from riskintel360.agents.agent_factory import AgentFactory
+    return AgentFactory()
+
 router = APIRouter(prefix="/fintech")
 
 
@@ -960,7 +968,7 @@ async def get_risk_analysis_result(
         current_user = request.state.current_user
         
         # Get result from agent factory or data store
-        agent_factory = AgentFactory()
+        agent_factory = _create_agent_factory()
         result = await agent_factory.get_analysis_result(analysis_id, current_user["user_id"])
         
         if not result:
@@ -998,7 +1006,7 @@ async def get_compliance_check_result(
         current_user = request.state.current_user
         
         # Get result from agent factory or data store
-        agent_factory = AgentFactory()
+        agent_factory = _create_agent_factory()
         result = await agent_factory.get_analysis_result(analysis_id, current_user["user_id"])
         
         if not result:
@@ -1036,7 +1044,7 @@ async def get_fraud_detection_result(
         current_user = request.state.current_user
         
         # Get result from agent factory or data store
-        agent_factory = AgentFactory()
+        agent_factory = _create_agent_factory()
         result = await agent_factory.get_analysis_result(analysis_id, current_user["user_id"])
         
         if not result:
@@ -1074,7 +1082,7 @@ async def get_market_intelligence_result(
         current_user = request.state.current_user
         
         # Get result from agent factory or data store
-        agent_factory = AgentFactory()
+        agent_factory = _create_agent_factory()
         result = await agent_factory.get_analysis_result(analysis_id, current_user["user_id"])
         
         if not result:
@@ -1112,7 +1120,7 @@ async def get_kyc_verification_result(
         current_user = request.state.current_user
         
         # Get result from agent factory or data store
-        agent_factory = AgentFactory()
+        agent_factory = _create_agent_factory()
         result = await agent_factory.get_analysis_result(analysis_id, current_user["user_id"])
         
         if not result:
@@ -1238,7 +1246,7 @@ async def start_risk_analysis_workflow(
         logger.info(f"Starting risk analysis workflow {analysis_id}")
         
         # Create agent factory and get risk assessment agent
-        agent_factory = AgentFactory()
+        agent_factory = _create_agent_factory()
         risk_agent = await agent_factory.create_agent(AgentType.RISK_ASSESSMENT)
         
         # Execute risk analysis
@@ -1273,7 +1281,7 @@ async def start_compliance_check_workflow(
         logger.info(f"Starting compliance check workflow {analysis_id}")
         
         # Create agent factory and get regulatory compliance agent
-        agent_factory = AgentFactory()
+        agent_factory = _create_agent_factory()
         compliance_agent = await agent_factory.create_agent(AgentType.REGULATORY_COMPLIANCE)
         
         # Execute compliance check
@@ -1307,7 +1315,7 @@ async def start_fraud_detection_workflow(
         logger.info(f"Starting fraud detection workflow {analysis_id}")
         
         # Create agent factory and get fraud detection agent
-        agent_factory = AgentFactory()
+        agent_factory = _create_agent_factory()
         fraud_agent = await agent_factory.create_agent(AgentType.FRAUD_DETECTION)
         
         # Execute fraud detection
@@ -1342,7 +1350,7 @@ async def start_market_intelligence_workflow(
         logger.info(f"Starting market intelligence workflow {analysis_id}")
         
         # Create agent factory and get market analysis agent
-        agent_factory = AgentFactory()
+        agent_factory = _create_agent_factory()
         market_agent = await agent_factory.create_agent(AgentType.MARKET_ANALYSIS)
         
         # Execute market intelligence
@@ -1377,7 +1385,7 @@ async def start_kyc_verification_workflow(
         logger.info(f"Starting KYC verification workflow {analysis_id}")
         
         # Create agent factory and get KYC verification agent
-        agent_factory = AgentFactory()
+        agent_factory = _create_agent_factory()
         kyc_agent = await agent_factory.create_agent(AgentType.KYC_VERIFICATION)
         
         # Execute KYC verification
@@ -13,6 +13,8 @@ from fastapi.responses import JSONResponse
 from riskintel360.config.settings import get_settings
 from riskintel360.config.environment import get_environment_manager
 from riskintel360.services.agent_runtime import get_session_manager, shutdown_session_manager
+from riskintel360.services.caching_service import get_cache_manager
+from riskintel360.services.http_client import shutdown_http_client
 from riskintel360.models import data_manager
 from riskintel360.utils.logging import setup_logging
 
@@ -74,6 +76,14 @@ async def lifespan(app: FastAPI):
         session_manager = await get_session_manager()
         logger.info("Session manager initialized successfully")
         
+        # Start cache invalidation listener (enables the in-process L1 cache)
+        await get_cache_manager().cache_service.start_invalidation_listener()
+        
+        # Create the shared workflow orchestrator: starts queue workers in queue
+        # mode, otherwise resumes workflows interrupted by the previous shutdown
+        from riskintel360.services.workflow_orchestrator import start_workflow_orchestrator
+        await start_workflow_orchestrator()
+        
         logger.info("RiskIntel360 Platform API started successfully")
         
     except Exception as e:
@@ -90,6 +100,16 @@ async def lifespan(app: FastAPI):
         await shutdown_session_manager()
         logger.info("Session manager shutdown completed")
         
+        # Close the pooled outbound HTTP session
+        await shutdown_http_client()
+        
+        # Stop cache invalidation listener
+        await get_cache_manager().shutdown()
+        
+        # Flush and stop the shared workflow orchestrator (imported lazily, it pulls in LangGraph)
+        from riskintel360.services.workflow_orchestrator import shutdown_workflow_orchestrator
+        await shutdown_workflow_orchestrator()
+        
     except Exception as e:
         logger.error(f"Error during shutdown: {e}")
     
@@ -20,7 +20,6 @@ from riskintel360.models import (
     WorkflowStatus,
     data_manager
 )
-from riskintel360.services.workflow_orchestrator import WorkflowOrchestrator
 from riskintel360.services.agent_runtime import get_session_manager
 from riskintel360.auth.auth_decorators import require_auth, require_role
 from riskintel360.auth.middleware import sanitize_html_input, validate_sql_input
@@ -754,18 +753,11 @@ async def start_validation_workflow(validation_request: ValidationRequest):
         validation_request.status = WorkflowStatus.IN_PROGRESS
         await data_manager.update_validation_request(validation_request)
         
-        # Create and start real workflow orchestrator
-        from riskintel360.services.workflow_orchestrator import WorkflowOrchestrator
-        from riskintel360.services.agentcore_client import create_agentcore_client
-        from riskintel360.services.bedrock_client import create_bedrock_client
+        # Use the shared workflow orchestrator (one result cache and admission queue per process)
+        from riskintel360.services.workflow_orchestrator import get_workflow_orchestrator
         
         try:
-            # Initialize clients
-            agentcore_client = create_agentcore_client()
-            bedrock_client = create_bedrock_client()
-            
-            # Create workflow orchestrator
-            orchestrator = WorkflowOrchestrator()
+            orchestrator = get_workflow_orchestrator()
             
             # Start the workflow
             workflow_id = await orchestrator.start_workflow(
@@ -783,7 +775,7 @@ async def start_validation_workflow(validation_request: ValidationRequest):
             stall_count = 0
             
             while time.time() - start_time < max_wait_time:
-                workflow_status = orchestrator.get_workflow_status(workflow_id)
+                workflow_status = await orchestrator.fetch_workflow_status(workflow_id)
                 
                 if workflow_status:
                     progress = workflow_status.get("progress", 0.0)
@@ -813,7 +805,7 @@ async def start_validation_workflow(validation_request: ValidationRequest):
                 await asyncio.sleep(5)  # Check every 5 seconds
             
             # Get final workflow state
-            workflow_status = orchestrator.get_workflow_status(workflow_id)
+            workflow_status = await orchestrator.fetch_workflow_status(workflow_id)
             
             if workflow_status and workflow_status.get("progress", 0.0) >= 1.0:
                 # Create result from workflow output
@@ -8,12 +8,6 @@ import json
 from typing import Dict, Any, Optional
 from fastapi import APIRouter, HTTPException, Depends, status
 from fastapi.responses import Response
-import matplotlib
-matplotlib.use('Agg')  # Use non-interactive backend
-import matplotlib.pyplot as plt
-import plotly.graph_objects as go
-import plotly.express as px
-from plotly.utils import PlotlyJSONEncoder
 import io
 import base64
 
@@ -25,6 +19,18 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/v1/visualizations")
 
 
+def _get_pyplot():
+    """
+    Import matplotlib's pyplot on first use.
+    matplotlib and plotly are only needed by the chart endpoints, so they are
+    kept off the API import path to keep process start-up fast.
+    """
+    import matplotlib
+    matplotlib.use('Agg')  # Use non-interactive backend
+    import matplotlib.pyplot as plt
+    return plt
+
+
 @router.get("/{validation_id}/market-analysis")
 async def get_market_analysis_chart(
     validation_id: str,
@@ -275,6 +281,9 @@ async def get_plotly_chart(
                 detail="Validation result not found"
             )
 
+        import plotly.graph_objects as go
+        from plotly.utils import PlotlyJSONEncoder
+
         if chart_type == "market_growth":
             # Create market growth trend chart
             fig = go.Figure()
@@ -408,6 +417,7 @@ async def get_matplotlib_chart(
             )
 
         # Create matplotlib figure
+        plt = _get_pyplot()
         plt.style.use('default')
         fig, ax = plt.subplots(figsize=(10, 6))
 
@@ -254,6 +254,14 @@ async def send_progress_update(validation_id: str, progress_data: dict):
         logger.error(f"Failed to send progress update for {validation_id}: {e}")
 
 
+async def send_validation_progress_update(validation_id: str, progress_data: dict):
+    """
+    Send a workflow progress update to connected WebSocket clients.
+    Entry point used by the workflow orchestrator's progress aggregator.
+    """
+    await send_progress_update(validation_id, progress_data)
+
+
 # Function to send completion notification
 async def send_validation_completion(validation_id: str, result_data: dict):
     """
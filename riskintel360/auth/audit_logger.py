@@ -8,13 +8,15 @@ import logging
 from datetime import datetime, timezone
 from typing import Optional, Dict, Any
 import uuid
-import boto3
 from botocore.exceptions import ClientError
 
 from riskintel360.config.settings import get_settings
 from .models import (
     AuditLogEntry, AuditAction, ResourceType, SecurityContext
 )
+from ..utils.lazy_imports import lazy_import
+
+boto3 = lazy_import("boto3")
 
 logger = logging.getLogger(__name__)
 
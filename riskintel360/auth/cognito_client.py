@@ -7,7 +7,6 @@ import json
 import logging
 from typing import Optional, Dict, Any, List
 from datetime import datetime, timedelta, timezone
-import boto3
 from botocore.exceptions import ClientError, NoCredentialsError
 import jwt
 from jwt.exceptions import InvalidTokenError, ExpiredSignatureError
@@ -17,6 +16,9 @@ from .models import (
     User, Role, Permission, TokenClaims, AuthenticationRequest, 
     AuthenticationResponse, UserStatus, RoleType, PermissionType
 )
+from ..utils.lazy_imports import lazy_import
+
+boto3 = lazy_import("boto3")
 
 logger = logging.getLogger(__name__)
 
@@ -4,11 +4,13 @@ Handles AWS credentials, region settings, and service configurations.
 """
 
 import os
-import boto3
 from typing import Optional, Dict, Any
 from dataclasses import dataclass
 from botocore.exceptions import NoCredentialsError, ClientError
 import logging
+from ..utils.lazy_imports import lazy_import
+
+boto3 = lazy_import("boto3")
 
 logger = logging.getLogger(__name__)
 
@@ -60,7 +62,7 @@ class AWSClientManager:
         self._clients: Dict[str, Any] = {}
         self._session: Optional[boto3.Session] = None
         
-    def _get_session(self) -> boto3.Session:
+    def _get_session(self) -> "boto3.Session":
         """Get or create boto3 session with proper credentials"""
         if self._session is None:
             session_kwargs = {}
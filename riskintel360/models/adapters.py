@@ -15,7 +15,6 @@ from datetime import datetime, timezone
 from typing import Dict, List, Optional, Any, Union
 from contextlib import asynccontextmanager
 
-import boto3
 from botocore.exceptions import ClientError
 from sqlalchemy import create_engine, select, update, delete
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
@@ -30,6 +29,9 @@ from .database import (
     Base, ValidationRequestDB, ValidationResultDB, AgentMessageDB,
     WorkflowStateDB, AgentStateDB, ExternalDataSourceDB
 )
+from ..utils.lazy_imports import lazy_import
+
+boto3 = lazy_import("boto3")
 
 
 class DataAccessAdapter(ABC):
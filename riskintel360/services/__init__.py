@@ -1,37 +1,41 @@
 """
 Services module for RiskIntel360 Platform
 Contains business logic services, external integrations, and orchestration services.
+
+Exports are resolved lazily so that importing a single service module does not
+pull in boto3, aioboto3 and redis through every other service.
 """
 
-# Import all services for easy access
-from .connection_pool import (
-    ConnectionPoolManager,
-    PostgreSQLConnectionPool,
-    DynamoDBConnectionPool,
-    RedisConnectionPool,
-    get_connection_pool_manager
-)
-
-from .caching_service import (
-    CacheManager,
-    CachingService,
-    get_caching_service,
-    get_cache_manager,
-    cached,
-    cache_invalidate
-)
-
-from .performance_optimizer import (
-    PerformanceOptimizer,
-    PerformanceMonitor,
-    get_performance_optimizer,
-    performance_monitor
-)
-
-from .auto_scaling import (
-    AutoScalingService,
-    ScalingMetrics
-)
+from ..utils.lazy_imports import lazy_attribute_loader
+
+_LAZY_EXPORTS = {
+    # Connection Pool
+    'ConnectionPoolManager': '.connection_pool',
+    'PostgreSQLConnectionPool': '.connection_pool',
+    'DynamoDBConnectionPool': '.connection_pool',
+    'RedisConnectionPool': '.connection_pool',
+    'get_connection_pool_manager': '.connection_pool',
+
+    # Caching
+    'CacheManager': '.caching_service',
+    'CachingService': '.caching_service',
+    'get_caching_service': '.caching_service',
+    'get_cache_manager': '.caching_service',
+    'cached': '.caching_service',
+    'cache_invalidate': '.caching_service',
+
+    # Performance
+    'PerformanceOptimizer': '.performance_optimizer',
+    'PerformanceMonitor': '.performance_optimizer',
+    'get_performance_optimizer': '.performance_optimizer',
+    'performance_monitor': '.performance_optimizer',
+
+    # Auto Scaling
+    'AutoScalingService': '.auto_scaling',
+    'ScalingMetrics': '.auto_scaling',
+}
+
+__getattr__ = lazy_attribute_loader(__name__, _LAZY_EXPORTS)
 
 __all__ = [
     # Connection Pool
@@ -4,8 +4,11 @@ Implements asyncio-based message routing and inter-agent communication.
 """
 
 import asyncio
+import heapq
 import logging
-from typing import Dict, Any, List, Optional, Callable, Set
+import time
+from collections import deque
+from typing import Dict, Any, List, Optional, Callable, Set, Deque, Tuple, Iterable
 from enum import Enum
 from dataclasses import dataclass
 from datetime import datetime, timedelta, UTC
@@ -13,6 +16,8 @@ import json
 import uuid
 
 from .agentcore_client import AgentCoreClient, AgentCorePrimitive
+from .message_bus import MessageBusTransport
+from .workflow_admission import PRIORITY_ORDER
 from ..models.agent_models import (
     AgentMessage, MessageType, Priority, AgentType,
     AgentState, SessionStatus
@@ -50,6 +55,19 @@ class MessageRoute:
     expires_at: Optional[datetime] = None
 
 
+class AgentRequestError(Exception):
+    """Raised when a request cannot be delivered to its recipient"""
+    pass
+
+
+@dataclass
+class _PendingRequest:
+    """Requester waiting on a correlated response"""
+    requester_id: str
+    request_message_id: str
+    future: asyncio.Future
+
+
 @dataclass
 class MessageDeliveryReceipt:
     """Message delivery receipt"""
@@ -60,27 +78,168 @@ class MessageDeliveryReceipt:
     error_message: Optional[str] = None
 
 
+class QueueMetrics:
+    """
+    Depth and wait statistics for agent queues, updated on every put and get
+    so reporting never has to walk the queues.
+    """
+
+    def __init__(self):
+        self.depth: Dict[Priority, int] = {priority: 0 for priority in PRIORITY_ORDER}
+        self.dequeued: Dict[Priority, int] = {priority: 0 for priority in PRIORITY_ORDER}
+        self.total_wait: Dict[Priority, float] = {priority: 0.0 for priority in PRIORITY_ORDER}
+        self.max_wait: Dict[Priority, float] = {priority: 0.0 for priority in PRIORITY_ORDER}
+        self.aged_promotions = 0
+        # Set on every put so consumers can wait for traffic instead of polling
+        self.activity: Optional[asyncio.Event] = None
+
+    @property
+    def pending(self) -> int:
+        return sum(self.depth.values())
+
+    def record_put(self, priority: Priority) -> None:
+        self.depth[priority] += 1
+        if self.activity is not None:
+            self.activity.set()
+
+    def record_get(self, priority: Priority, wait: float, promoted: bool) -> None:
+        self.depth[priority] -= 1
+        self.dequeued[priority] += 1
+        self.total_wait[priority] += wait
+        self.max_wait[priority] = max(self.max_wait[priority], wait)
+        if promoted:
+            self.aged_promotions += 1
+
+    def record_discard(self, priority: Priority, count: int) -> None:
+        self.depth[priority] -= count
+
+
+class _PriorityLanes:
+    """FIFO lane per priority; sized like the deque ``asyncio.Queue`` normally uses"""
+
+    def __init__(self):
+        self.lanes: Dict[Priority, Deque[Tuple[float, AgentMessage]]] = {
+            priority: deque() for priority in PRIORITY_ORDER
+        }
+        self.size = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+
+class PriorityMessageQueue(asyncio.Queue):
+    """
+    Agent message queue that serves higher priorities first, with aging.
+
+    Messages wait in one FIFO lane per priority. A message's effective rank
+    improves by one priority level every ``aging_interval`` seconds it waits,
+    so LOW traffic is delayed behind CRITICAL traffic but never starved.
+    Only lane heads are compared, so each get is O(number of priorities).
+    """
+
+    def __init__(self, maxsize: int = 0, aging_interval: float = 5.0, metrics: Optional[QueueMetrics] = None):
+        """
+        Initialize the queue.
+
+        Args:
+            maxsize: Maximum queued messages (0 for unbounded)
+            aging_interval: Seconds of waiting that promote a message by one priority level
+            metrics: Metrics to update (shared across queues by the manager)
+        """
+        self.aging_interval = aging_interval
+        self.metrics = metrics or QueueMetrics()
+        super().__init__(maxsize)
+
+    def _init(self, maxsize: int) -> None:
+        self._queue = _PriorityLanes()
+
+    def _put(self, message: AgentMessage) -> None:
+        self._queue.lanes[message.priority].append((time.monotonic(), message))
+        self._queue.size += 1
+        self.metrics.record_put(message.priority)
+
+    def _get(self) -> AgentMessage:
+        now = time.monotonic()
+        best_priority = None
+        best_key = None
+        first_nonempty = None
+
+        for rank, priority in enumerate(PRIORITY_ORDER):
+            lane = self._queue.lanes[priority]
+            if not lane:
+                continue
+            if first_nonempty is None:
+                first_nonempty = priority
+            enqueued_at = lane[0][0]
+            aged_rank = rank - (now - enqueued_at) / self.aging_interval if self.aging_interval > 0 else rank
+            key = (aged_rank, enqueued_at)
+            if best_key is None or key < best_key:
+                best_key = key
+                best_priority = priority
+
+        enqueued_at, message = self._queue.lanes[best_priority].popleft()
+        self._queue.size -= 1
+        self.metrics.record_get(best_priority, now - enqueued_at, best_priority is not first_nonempty)
+        return message
+
+    def clear(self) -> int:
+        """Drop all queued messages without counting them as delivered"""
+        dropped = 0
+        for priority, lane in self._queue.lanes.items():
+            if lane:
+                self.metrics.record_discard(priority, len(lane))
+                dropped += len(lane)
+                lane.clear()
+        self._queue.size = 0
+        for _ in range(dropped):
+            self._wakeup_next(self._putters)
+        return dropped
+
+    def depth_by_priority(self) -> Dict[Priority, int]:
+        """Queued messages per priority"""
+        return {priority: len(lane) for priority, lane in self._queue.lanes.items()}
+
+
 class AgentCommunicationManager:
     """
     Manages agent communication protocols using asyncio queues and AgentCore coordination.
     Provides message routing, delivery guarantees, and inter-agent coordination.
     """
     
-    def __init__(self, agentcore_client: AgentCoreClient, cleanup_interval: int = 60, message_process_interval: float = 0.1):
+    # How long delivery receipts (and routes without an expiry) are kept
+    RECEIPT_RETENTION = timedelta(hours=1)
+    
+    def __init__(
+        self,
+        agentcore_client: AgentCoreClient,
+        cleanup_interval: int = 60,
+        message_process_interval: float = 0.1,
+        queue_aging_interval: float = 5.0,
+        transport: Optional[MessageBusTransport] = None
+    ):
         """
         Initialize communication manager with AgentCore client.
         
         Args:
             agentcore_client: AgentCore client for message routing
-            cleanup_interval: Interval in seconds for cleanup task (default: 60)
-            message_process_interval: Interval in seconds for message processing (default: 0.1)
+            cleanup_interval: Longest the expiry task sleeps before re-checking its
+                schedule; expiries themselves fire on time (default: 60)
+            message_process_interval: Minimum spacing in seconds between queue
+                backlog reports (default: 0.1)
+            queue_aging_interval: Seconds of waiting that promote a queued message
+                by one priority level (default: 5.0)
+            transport: Optional message bus reaching agents hosted by other
+                processes (in-process routing only if omitted)
         """
         self.agentcore_client = agentcore_client
+        self.transport = transport
         self.cleanup_interval = cleanup_interval
         self.message_process_interval = message_process_interval
+        self.queue_aging_interval = queue_aging_interval
         
-        # Message queues for each agent
-        self.agent_queues: Dict[str, asyncio.Queue] = {}
+        # Priority message queues for each agent, sharing incremental metrics
+        self.agent_queues: Dict[str, PriorityMessageQueue] = {}
+        self.queue_metrics = QueueMetrics()
         
         # Message handlers for each agent
         self.message_handlers: Dict[str, Callable] = {}
@@ -94,29 +253,53 @@ class AgentCommunicationManager:
         # Delivery receipts
         self.delivery_receipts: Dict[str, MessageDeliveryReceipt] = {}
         
+        # Outstanding request() calls by correlation ID
+        self._pending_requests: Dict[str, _PendingRequest] = {}
+        
+        # Min-heap of (deadline, sequence, kind, message_id) for route expiry and
+        # receipt retention; stale entries are skipped when popped
+        self._expiry_heap: List[Tuple[float, int, str, str]] = []
+        self._expiry_sequence = 0
+        self._expiry_wake: Optional[asyncio.Event] = None
+        
         # Communication statistics
         self.stats = {
             "messages_sent": 0,
             "messages_delivered": 0,
             "messages_failed": 0,
-            "active_agents": 0
+            "active_agents": 0,
+            "requests": 0,
+            "request_timeouts": 0
         }
         
         # Background tasks
         self._cleanup_task: Optional[asyncio.Task] = None
         self._message_processor_task: Optional[asyncio.Task] = None
+        self._bus_task: Optional[asyncio.Task] = None
+        self._background_tasks: Set[asyncio.Task] = set()
         
         logger.info("??AgentCommunicationManager initialized")
     
     async def start(self) -> None:
         """Start the communication manager background tasks"""
         try:
+            self._expiry_wake = asyncio.Event()
+            self.queue_metrics.activity = asyncio.Event()
+            
             # Start message cleanup task
             self._cleanup_task = asyncio.create_task(self._cleanup_expired_messages())
             
             # Start message processor task
             self._message_processor_task = asyncio.create_task(self._process_message_queue())
             
+            # Join the cross-process bus with every agent registered so far
+            if self.transport:
+                if not await self.transport.connect():
+                    raise RuntimeError("Agent message bus unavailable")
+                for agent_id in list(self.agent_queues):
+                    await self.transport.register_agent(agent_id)
+                self._bus_task = asyncio.create_task(self._consume_bus())
+            
             logger.info("??Communication manager started")
             
         except Exception as e:
@@ -137,17 +320,28 @@ class AgentCommunicationManager:
                 self._message_processor_task.cancel()
                 tasks_to_cancel.append(self._message_processor_task)
             
+            if self._bus_task and not self._bus_task.done():
+                self._bus_task.cancel()
+                tasks_to_cancel.append(self._bus_task)
+            
             # Wait for all tasks to be cancelled
             if tasks_to_cancel:
                 await asyncio.gather(*tasks_to_cancel, return_exceptions=True)
             
+            if self._background_tasks:
+                await asyncio.gather(*self._background_tasks, return_exceptions=True)
+            
+            if self.transport:
+                await self.transport.close()
+            
             # Clear queues
             for queue in self.agent_queues.values():
-                while not queue.empty():
-                    try:
-                        queue.get_nowait()
-                    except asyncio.QueueEmpty:
-                        break
+                queue.clear()
+            
+            # Fail outstanding requests rather than leaving callers waiting
+            for pending in self._pending_requests.values():
+                if not pending.future.done():
+                    pending.future.set_exception(AgentRequestError("Communication manager stopped"))
             
             logger.info("??Communication manager stopped")
             
@@ -173,7 +367,13 @@ class AgentCommunicationManager:
         """
         try:
             # Create message queue for agent
-            self.agent_queues[agent_id] = asyncio.Queue(maxsize=100)
+            if agent_id in self.agent_queues:
+                self.agent_queues[agent_id].clear()
+            self.agent_queues[agent_id] = PriorityMessageQueue(
+                maxsize=100,
+                aging_interval=self.queue_aging_interval,
+                metrics=self.queue_metrics
+            )
             
             # Register message handler
             if message_handler:
@@ -192,12 +392,14 @@ class AgentCommunicationManager:
             
             if success:
                 self.stats["active_agents"] += 1
+                if self.transport:
+                    self._run_in_background(self.transport.register_agent(agent_id))
                 logger.info(f"??Agent {agent_id} registered for communication")
                 return True
             else:
                 # Cleanup on failure
                 if agent_id in self.agent_queues:
-                    del self.agent_queues[agent_id]
+                    self.agent_queues.pop(agent_id).clear()
                 if agent_id in self.message_handlers:
                     del self.message_handlers[agent_id]
                 return False
@@ -222,7 +424,7 @@ class AgentCommunicationManager:
             
             # Cleanup local resources
             if agent_id in self.agent_queues:
-                del self.agent_queues[agent_id]
+                self.agent_queues.pop(agent_id).clear()
             
             if agent_id in self.message_handlers:
                 del self.message_handlers[agent_id]
@@ -231,6 +433,9 @@ class AgentCommunicationManager:
             for topic, subscribers in self.subscriptions.items():
                 subscribers.discard(agent_id)
             
+            if self.transport:
+                self._run_in_background(self.transport.unregister_agent(agent_id))
+            
             if success:
                 self.stats["active_agents"] = max(0, self.stats["active_agents"] - 1)
                 logger.info(f"??Agent {agent_id} unregistered from communication")
@@ -277,28 +482,7 @@ class AgentCommunicationManager:
                 expires_at=datetime.now(UTC) + expires_in if expires_in else None
             )
             
-            # Create routing information
-            route = MessageRoute(
-                sender_id=sender_id,
-                recipient_id=recipient_id,
-                protocol=protocol,
-                priority=priority,
-                created_at=datetime.now(UTC),
-                expires_at=message.expires_at
-            )
-            
-            self.routing_table[message.message_id] = route
-            
-            # Route message based on protocol
-            success = await self._route_message(message, protocol)
-            
-            if success:
-                self.stats["messages_sent"] += 1
-                logger.info(f"??Message {message.message_id} sent from {sender_id} to {recipient_id}")
-            else:
-                self.stats["messages_failed"] += 1
-                logger.error(f"??Failed to send message {message.message_id}")
-            
+            await self._dispatch(message, protocol)
             return message.message_id
             
         except Exception as e:
@@ -306,6 +490,152 @@ class AgentCommunicationManager:
             self.stats["messages_failed"] += 1
             raise
     
+    async def request(
+        self,
+        sender_id: str,
+        recipient_id: str,
+        content: Dict[str, Any],
+        message_type: MessageType = MessageType.REQUEST_DATA,
+        priority: Priority = Priority.MEDIUM,
+        timeout: float = 30.0
+    ) -> AgentMessage:
+        """
+        Send a request and wait for the correlated response.
+        
+        The response is handed straight to the caller when it arrives rather
+        than being queued for ``get_messages``. The recipient answers with
+        ``respond``.
+        
+        Args:
+            sender_id: Requesting agent ID
+            recipient_id: Agent expected to respond
+            content: Request content
+            message_type: Type of request message
+            priority: Request priority
+            timeout: Seconds to wait for the response
+            
+        Returns:
+            AgentMessage: The response
+            
+        Raises:
+            AgentRequestError: The request could not be delivered
+            asyncio.TimeoutError: No response arrived within ``timeout``
+        """
+        message = AgentMessage(
+            sender_id=sender_id,
+            recipient_id=recipient_id,
+            message_type=message_type,
+            content=content,
+            priority=priority,
+            correlation_id=str(uuid.uuid4()),
+            expires_at=datetime.now(UTC) + timedelta(seconds=timeout)
+        )
+        
+        future = asyncio.get_running_loop().create_future()
+        self._pending_requests[message.correlation_id] = _PendingRequest(
+            requester_id=sender_id,
+            request_message_id=message.message_id,
+            future=future
+        )
+        self.stats["requests"] += 1
+        
+        try:
+            if not await self._dispatch(message, CommunicationProtocol.REQUEST_RESPONSE):
+                raise AgentRequestError(f"Request {message.message_id} could not be delivered to {recipient_id}")
+            
+            try:
+                return await asyncio.wait_for(future, timeout=timeout)
+            except asyncio.TimeoutError:
+                self.stats["request_timeouts"] += 1
+                raise
+        finally:
+            # Also runs when the caller is cancelled
+            self._pending_requests.pop(message.correlation_id, None)
+    
+    async def respond(
+        self,
+        request: AgentMessage,
+        content: Dict[str, Any],
+        message_type: MessageType = MessageType.PROVIDE_DATA,
+        priority: Optional[Priority] = None
+    ) -> str:
+        """
+        Reply to a message received from ``request``.
+        
+        Args:
+            request: The request message being answered
+            content: Response content
+            message_type: Type of response message
+            priority: Response priority (the request's priority if omitted)
+            
+        Returns:
+            str: Message ID of the response
+        """
+        message = AgentMessage(
+            sender_id=request.recipient_id,
+            recipient_id=request.sender_id,
+            message_type=message_type,
+            content=content,
+            priority=priority or request.priority,
+            correlation_id=request.correlation_id
+        )
+        await self._dispatch(message, CommunicationProtocol.DIRECT_MESSAGE)
+        return message.message_id
+    
+    async def _dispatch(self, message: AgentMessage, protocol: CommunicationProtocol) -> bool:
+        """
+        Track and route a message.
+        
+        Args:
+            message: Message to send
+            protocol: Communication protocol
+            
+        Returns:
+            bool: True if routing successful
+        """
+        # Create routing information
+        route = MessageRoute(
+            sender_id=message.sender_id,
+            recipient_id=message.recipient_id,
+            protocol=protocol,
+            priority=message.priority,
+            created_at=datetime.now(UTC),
+            expires_at=message.expires_at
+        )
+        
+        self.routing_table[message.message_id] = route
+        self._schedule_expiry(
+            (route.expires_at or route.created_at + self.RECEIPT_RETENTION).timestamp(),
+            "route",
+            message.message_id
+        )
+        
+        # Route message based on protocol
+        success = await self._route_message(message, protocol)
+        
+        if success:
+            self.stats["messages_sent"] += 1
+            logger.info(f"??Message {message.message_id} sent from {message.sender_id} to {message.recipient_id}")
+        else:
+            self.stats["messages_failed"] += 1
+            logger.error(f"??Failed to send message {message.message_id}")
+        
+        return success
+    
+    async def _enqueue(self, message: AgentMessage) -> None:
+        """Queue a message for a local agent, or complete the request() awaiting it"""
+        pending = self._pending_requests.get(message.correlation_id) if message.correlation_id else None
+        if (
+            pending is not None
+            and pending.requester_id == message.recipient_id
+            and pending.request_message_id != message.message_id
+        ):
+            if not pending.future.done():
+                pending.future.set_result(message)
+            return
+        
+        await self.agent_queues[message.recipient_id].put(message)
+    
     async def _route_message(
         self,
         message: AgentMessage,
@@ -345,14 +675,10 @@ class AgentCommunicationManager:
         try:
             # Deliver to local queue if recipient is registered
             if message.recipient_id in self.agent_queues:
-                await self.agent_queues[message.recipient_id].put(message)
+                await self._enqueue(message)
                 
                 # Create delivery receipt
-                self.delivery_receipts[message.message_id] = MessageDeliveryReceipt(
-                    message_id=message.message_id,
-                    status=MessageStatus.DELIVERED,
-                    delivered_at=datetime.now(UTC)
-                )
+                self._record_delivery(message.message_id)
                 
                 self.stats["messages_delivered"] += 1
                 
@@ -367,6 +693,12 @@ class AgentCommunicationManager:
                 except Exception as e:
                     logger.debug(f"? ï? AgentCore routing failed for message {message.message_id}: {e}")
                 
+                return True
+            elif message.recipient_id in await self._remote_agents():
+                # Hosted by another process
+                await self.transport.send([message])
+                self._record_delivery(message.message_id)
+                self.stats["messages_delivered"] += 1
                 return True
             else:
                 logger.warning(f"??Recipient {message.recipient_id} not registered")
@@ -379,43 +711,18 @@ class AgentCommunicationManager:
     async def _route_broadcast_message(self, message: AgentMessage) -> bool:
         """Route broadcast message to all registered agents"""
         try:
-            success_count = 0
+            # Don't send to sender
+            recipients = [agent_id for agent_id in self.agent_queues if agent_id != message.sender_id]
+            success_count = await self._fan_out(message, recipients, require_routing=False)
             
-            for agent_id in self.agent_queues.keys():
-                if agent_id != message.sender_id:  # Don't send to sender
-                    # Create copy of message for each recipient
-                    broadcast_message = AgentMessage(
-                        sender_id=message.sender_id,
-                        recipient_id=agent_id,
-                        message_type=message.message_type,
-                        content=message.content,
-                        priority=message.priority,
-                        correlation_id=message.correlation_id,
-                        expires_at=message.expires_at
-                    )
-                    
-                    # Deliver to local queue
-                    await self.agent_queues[agent_id].put(broadcast_message)
-                    success_count += 1
-                    
-                    # Also notify AgentCore (but don't fail if it doesn't work)
-                    try:
-                        response = await self.agentcore_client.route_message(
-                            sender_id=message.sender_id,
-                            recipient_id=agent_id,
-                            message=broadcast_message
-                        )
-                        logger.debug(f"??AgentCore broadcast routing {'succeeded' if response.success else 'failed'} for {agent_id}")
-                    except Exception as e:
-                        logger.debug(f"? ï? AgentCore broadcast routing failed for {agent_id}: {e}")
+            # Agents hosted by other processes
+            remote_agents = await self._remote_agents()
+            remote_agents.discard(message.sender_id)
+            success_count += await self._send_remote(message, remote_agents)
             
             # Consider broadcast successful if at least one delivery succeeded
             if success_count > 0:
-                self.delivery_receipts[message.message_id] = MessageDeliveryReceipt(
-                    message_id=message.message_id,
-                    status=MessageStatus.DELIVERED,
-                    delivered_at=datetime.now(UTC)
-                )
+                self._record_delivery(message.message_id)
                 self.stats["messages_delivered"] += 1
                 return True
             
@@ -430,36 +737,19 @@ class AgentCommunicationManager:
         try:
             # Extract recipient list from message content
             recipients = message.content.get("recipients", [])
-            success_count = 0
+            success_count = await self._fan_out(
+                message,
+                [recipient_id for recipient_id in recipients if recipient_id in self.agent_queues],
+                require_routing=True
+            )
             
-            for recipient_id in recipients:
-                if recipient_id in self.agent_queues:
-                    multicast_message = AgentMessage(
-                        sender_id=message.sender_id,
-                        recipient_id=recipient_id,
-                        message_type=message.message_type,
-                        content=message.content,
-                        priority=message.priority,
-                        correlation_id=message.correlation_id,
-                        expires_at=message.expires_at
-                    )
-                    
-                    response = await self.agentcore_client.route_message(
-                        sender_id=message.sender_id,
-                        recipient_id=recipient_id,
-                        message=multicast_message
-                    )
-                    
-                    if response.success:
-                        await self.agent_queues[recipient_id].put(multicast_message)
-                        success_count += 1
+            remote_agents = await self._remote_agents()
+            success_count += await self._send_remote(
+                message, [recipient_id for recipient_id in recipients if recipient_id in remote_agents]
+            )
             
             if success_count > 0:
-                self.delivery_receipts[message.message_id] = MessageDeliveryReceipt(
-                    message_id=message.message_id,
-                    status=MessageStatus.DELIVERED,
-                    delivered_at=datetime.now(UTC)
-                )
+                self._record_delivery(message.message_id)
                 self.stats["messages_delivered"] += 1
                 return True
             
@@ -492,36 +782,18 @@ class AgentCommunicationManager:
                 return False
             
             subscribers = self.subscriptions.get(topic, set())
-            success_count = 0
+            success_count = await self._fan_out(
+                message,
+                [subscriber_id for subscriber_id in subscribers if subscriber_id in self.agent_queues],
+                require_routing=True
+            )
             
-            for subscriber_id in subscribers:
-                if subscriber_id in self.agent_queues:
-                    pub_sub_message = AgentMessage(
-                        sender_id=message.sender_id,
-                        recipient_id=subscriber_id,
-                        message_type=message.message_type,
-                        content=message.content,
-                        priority=message.priority,
-                        correlation_id=message.correlation_id,
-                        expires_at=message.expires_at
-                    )
-                    
-                    response = await self.agentcore_client.route_message(
-                        sender_id=message.sender_id,
-                        recipient_id=subscriber_id,
-                        message=pub_sub_message
-                    )
-                    
-                    if response.success:
-                        await self.agent_queues[subscriber_id].put(pub_sub_message)
-                        success_count += 1
+            if self.transport:
+                remote_subscribers = await self.transport.subscribers(topic) - set(self.agent_queues)
+                success_count += await self._send_remote(message, remote_subscribers)
             
             if success_count > 0:
-                self.delivery_receipts[message.message_id] = MessageDeliveryReceipt(
-                    message_id=message.message_id,
-                    status=MessageStatus.DELIVERED,
-                    delivered_at=datetime.now(UTC)
-                )
+                self._record_delivery(message.message_id)
                 self.stats["messages_delivered"] += 1
                 return True
             
@@ -551,6 +823,8 @@ class AgentCommunicationManager:
                 self.subscriptions[topic] = set()
             
             self.subscriptions[topic].add(agent_id)
+            if self.transport:
+                await self.transport.subscribe(agent_id, topic)
             logger.info(f"??Agent {agent_id} subscribed to topic '{topic}'")
             return True
             
@@ -577,6 +851,9 @@ class AgentCommunicationManager:
                 if not self.subscriptions[topic]:
                     del self.subscriptions[topic]
             
+            if self.transport:
+                await self.transport.unsubscribe(agent_id, topic)
+            
             logger.info(f"??Agent {agent_id} unsubscribed from topic '{topic}'")
             return True
             
@@ -586,7 +863,7 @@ class AgentCommunicationManager:
     
     async def get_messages(self, agent_id: str, timeout: float = 1.0) -> List[AgentMessage]:
         """
-        Get pending messages for an agent.
+        Get pending messages for an agent, highest (aged) priority first.
         
         Args:
             agent_id: Agent identifier
@@ -668,20 +945,193 @@ class AgentCommunicationManager:
             logger.error(f"??Failed to acknowledge message {message_id}: {e}")
             return False
     
+    async def _remote_agents(self) -> Set[str]:
+        """Agents registered on the message bus by other processes"""
+        if not self.transport:
+            return set()
+        return await self.transport.registered_agents() - set(self.agent_queues)
+    
+    @staticmethod
+    def _envelope(message: AgentMessage, recipient_id: str) -> AgentMessage:
+        """
+        Per-recipient view of a fan-out message.
+        
+        A shallow copy: the content payload is shared by every recipient (treat
+        it as read-only) and only the recipient differs. The message ID is kept,
+        so acknowledging any copy acknowledges the fan-out.
+        """
+        return message.model_copy(update={"recipient_id": recipient_id})
+    
+    async def _fan_out(self, message: AgentMessage, recipients: List[str], require_routing: bool) -> int:
+        """
+        Deliver one message to several local agents with a single AgentCore call.
+        
+        Args:
+            message: Message to fan out
+            recipients: Local recipient agent IDs
+            require_routing: Only enqueue for recipients AgentCore routed; otherwise
+                enqueue first and notify AgentCore best-effort
+            
+        Returns:
+            int: Number of recipients the message was queued for
+        """
+        if not recipients:
+            return 0
+        
+        if require_routing:
+            response = await self.agentcore_client.route_message_batch(
+                sender_id=message.sender_id,
+                recipient_ids=recipients,
+                message=message
+            )
+            if not response.success:
+                return 0
+            routed = set(response.result.get("routed", []))
+            recipients = [recipient_id for recipient_id in recipients if recipient_id in routed]
+        
+        delivered = 0
+        for recipient_id in recipients:
+            queue = self.agent_queues.get(recipient_id)
+            if queue is not None:
+                await queue.put(self._envelope(message, recipient_id))
+                delivered += 1
+        
+        if not require_routing:
+            # Also notify AgentCore (but don't fail if it doesn't work)
+            try:
+                response = await self.agentcore_client.route_message_batch(
+                    sender_id=message.sender_id,
+                    recipient_ids=recipients,
+                    message=message
+                )
+                logger.debug(f"??AgentCore fan-out routing {'succeeded' if response.success else 'failed'} for {len(recipients)} agents")
+            except Exception as e:
+                logger.debug(f"? ï? AgentCore fan-out routing failed for message {message.message_id}: {e}")
+        
+        return delivered
+    
+    async def _send_remote(self, message: AgentMessage, recipients: Iterable[str]) -> int:
+        """
+        Send a fan-out message to remote recipients in a single batch.
+        
+        Args:
+            message: Message being fanned out
+            recipients: Remote recipient agent IDs
+            
+        Returns:
+            int: Number of recipients sent to
+        """
+        envelopes = [self._envelope(message, recipient_id) for recipient_id in recipients]
+        if envelopes:
+            await self.transport.send(envelopes)
+        return len(envelopes)
+    
+    def _run_in_background(self, coro) -> None:
+        """Run a bus bookkeeping call without blocking a synchronous caller"""
+        try:
+            task = asyncio.get_running_loop().create_task(coro)
+        except RuntimeError:
+            # No event loop yet: start() registers agents with the bus
+            coro.close()
+            return
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+    
+    async def _consume_bus(self) -> None:
+        """Background task moving bus messages for local agents into their queues"""
+        while True:
+            try:
+                deliveries = await self.transport.receive(list(self.agent_queues), count=100, block_ms=1000)
+                
+                acks = []
+                for agent_id, delivery_id, message in deliveries:
+                    if agent_id not in self.agent_queues:
+                        # No longer hosted here; left unacknowledged for redelivery
+                        continue
+                    # Blocks while the agent's queue is full, which stops us
+                    # reading further and leaves the backlog on the bus
+                    await self._enqueue(message)
+                    acks.append((agent_id, delivery_id))
+                
+                await self.transport.ack(acks)
+                
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"??Error consuming agent message bus: {e}")
+                await asyncio.sleep(1.0)
+    
+    def _record_delivery(self, message_id: str) -> None:
+        """Create a delivery receipt and schedule its removal"""
+        receipt = MessageDeliveryReceipt(
+            message_id=message_id,
+            status=MessageStatus.DELIVERED,
+            delivered_at=datetime.now(UTC)
+        )
+        self.delivery_receipts[message_id] = receipt
+        self._schedule_expiry((receipt.delivered_at + self.RECEIPT_RETENTION).timestamp(), "receipt", message_id)
+    
+    def _schedule_expiry(self, deadline: float, kind: str, message_id: str) -> None:
+        """Add an expiry to the heap, waking the expiry task if it is now the earliest"""
+        self._expiry_sequence += 1
+        heapq.heappush(self._expiry_heap, (deadline, self._expiry_sequence, kind, message_id))
+        if self._expiry_wake is not None and self._expiry_heap[0][1] == self._expiry_sequence:
+            self._expiry_wake.set()
+    
+    def _expire_due(self, now: float) -> Tuple[int, int]:
+        """
+        Pop and apply every expiry that is due.
+        
+        Args:
+            now: Current UNIX timestamp
+            
+        Returns:
+            (expired routes, removed receipts)
+        """
+        expired_routes = 0
+        expired_receipts = 0
+        
+        while self._expiry_heap and self._expiry_heap[0][0] <= now:
+            deadline, _, kind, msg_id = heapq.heappop(self._expiry_heap)
+            
+            if kind == "route":
+                route = self.routing_table.get(msg_id)
+                if route is None:
+                    continue
+                del self.routing_table[msg_id]
+                
+                # Mark as expired in delivery receipts
+                if route.expires_at and msg_id in self.delivery_receipts:
+                    self.delivery_receipts[msg_id].status = MessageStatus.EXPIRED
+                    expired_routes += 1
+            else:
+                receipt = self.delivery_receipts.get(msg_id)
+                # Skip entries superseded by a later receipt for the same message
+                if receipt is None or (receipt.delivered_at + self.RECEIPT_RETENTION).timestamp() > deadline:
+                    continue
+                del self.delivery_receipts[msg_id]
+                expired_receipts += 1
+        
+        return expired_routes, expired_receipts
+    
     async def _default_message_handler(self, message_data: Dict[str, Any]) -> None:
         """Default message handler for agents without custom handlers"""
         logger.info(f"??¨ Default handler received message: {message_data.get('message_id', 'unknown')}")
     
     async def _process_message_queue(self) -> None:
-        """Background task to monitor message queues (messages are retrieved via get_messages)"""
+        """Background task reporting queue backlog as messages arrive (messages are retrieved via get_messages)"""
+        activity = self.queue_metrics.activity
         while True:
             try:
-                # Just monitor queue health and log statistics
-                total_pending = sum(queue.qsize() for queue in self.agent_queues.values())
+                # Sleep until a message is queued rather than polling
+                await activity.wait()
+                activity.clear()
+                
+                total_pending = self.queue_metrics.pending
                 if total_pending > 0:
                     logger.debug(f"?? Total pending messages across all queues: {total_pending}")
                 
-                # Sleep to prevent busy waiting
+                # Bound the report rate under sustained traffic
                 await asyncio.sleep(self.message_process_interval)
                 
             except asyncio.CancelledError:
@@ -691,39 +1141,24 @@ class AgentCommunicationManager:
                 await asyncio.sleep(1.0)
     
     async def _cleanup_expired_messages(self) -> None:
-        """Background task to cleanup expired messages and receipts"""
+        """Background task expiring routes and receipts as their deadlines come due"""
+        wake = self._expiry_wake
         while True:
             try:
-                current_time = datetime.now(UTC)
-                
-                # Cleanup expired routing entries
-                expired_routes = [
-                    msg_id for msg_id, route in self.routing_table.items()
-                    if route.expires_at and route.expires_at < current_time
-                ]
-                
-                for msg_id in expired_routes:
-                    del self.routing_table[msg_id]
-                    
-                    # Mark as expired in delivery receipts
-                    if msg_id in self.delivery_receipts:
-                        self.delivery_receipts[msg_id].status = MessageStatus.EXPIRED
-                
-                # Cleanup old delivery receipts (older than 1 hour)
-                cutoff_time = current_time - timedelta(hours=1)
-                expired_receipts = [
-                    msg_id for msg_id, receipt in self.delivery_receipts.items()
-                    if receipt.delivered_at < cutoff_time
-                ]
-                
-                for msg_id in expired_receipts:
-                    del self.delivery_receipts[msg_id]
+                wake.clear()
+                expired_routes, expired_receipts = self._expire_due(time.time())
                 
                 if expired_routes or expired_receipts:
-                    logger.debug(f"?§¹ Cleaned up {len(expired_routes)} expired routes and {len(expired_receipts)} old receipts")
+                    logger.debug(f"?§¹ Cleaned up {expired_routes} expired routes and {expired_receipts} old receipts")
                 
-                # Sleep for configured interval before next cleanup
-                await asyncio.sleep(self.cleanup_interval)
+                # Sleep until the next deadline or an earlier one is scheduled
+                delay = self.cleanup_interval
+                if self._expiry_heap:
+                    delay = min(delay, max(0.0, self._expiry_heap[0][0] - time.time()))
+                try:
+                    await asyncio.wait_for(wake.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
                 
             except asyncio.CancelledError:
                 break
@@ -738,10 +1173,28 @@ class AgentCommunicationManager:
         Returns:
             Dict containing communication statistics
         """
+        metrics = self.queue_metrics
+        queue_priorities = {
+            priority.value: {
+                "depth": metrics.depth[priority],
+                "dequeued": metrics.dequeued[priority],
+                "avg_wait_seconds": (
+                    metrics.total_wait[priority] / metrics.dequeued[priority] if metrics.dequeued[priority] else 0.0
+                ),
+                "max_wait_seconds": metrics.max_wait[priority]
+            }
+            for priority in PRIORITY_ORDER
+        }
+        
         return {
             **self.stats,
             "active_queues": len(self.agent_queues),
-            "pending_messages": sum(queue.qsize() for queue in self.agent_queues.values()),
+            "pending_messages": metrics.pending,
+            "queue_priorities": queue_priorities,
+            "aged_promotions": metrics.aged_promotions,
+            "scheduled_expiries": len(self._expiry_heap),
+            "message_bus": self.transport.get_stats() if self.transport else None,
+            "pending_requests": len(self._pending_requests),
             "active_subscriptions": len(self.subscriptions),
             "pending_routes": len(self.routing_table),
             "delivery_receipts": len(self.delivery_receipts)
@@ -749,7 +1202,13 @@ class AgentCommunicationManager:
 
 
 # Convenience function for creating communication manager
-def create_communication_manager(agentcore_client: AgentCoreClient, cleanup_interval: int = 5, message_process_interval: float = 0.1) -> AgentCommunicationManager:
+def create_communication_manager(
+    agentcore_client: AgentCoreClient,
+    cleanup_interval: int = 5,
+    message_process_interval: float = 0.1,
+    queue_aging_interval: float = 5.0,
+    transport: Optional[MessageBusTransport] = None
+) -> AgentCommunicationManager:
     """
     Create a new agent communication manager.
     
@@ -757,11 +1216,15 @@ def create_communication_manager(agentcore_client: AgentCoreClient, cleanup_inte
         agentcore_client: AgentCore client for message routing
         cleanup_interval: Interval in seconds for cleanup task (default: 5 for testing)
         message_process_interval: Interval in seconds for message processing (default: 0.1)
+        queue_aging_interval: Seconds of waiting that promote a queued message by one priority level
+        transport: Optional cross-process message bus
         
     Returns:
         AgentCommunicationManager: Configured communication manager
     """
-    return AgentCommunicationManager(agentcore_client, cleanup_interval, message_process_interval)
+    return AgentCommunicationManager(
+        agentcore_client, cleanup_interval, message_process_interval, queue_aging_interval, transport
+    )
 
 # Backward compatibility alias
 AgentCommunicationService = AgentCommunicationManager
@@ -5,11 +5,17 @@ for persistent validation pattern storage and cross-agent knowledge sharing.
 """
 
 import asyncio
+import heapq
 import json
 import logging
 import pickle
+import re
+import sys
+import time
+from collections import OrderedDict
+from contextlib import aclosing
 from datetime import datetime, timedelta, timezone
-from typing import Dict, Any, List, Optional, Set, Union, Tuple
+from typing import Dict, Any, List, Optional, Set, Union, Tuple, AsyncIterator
 from enum import Enum
 from dataclasses import dataclass, asdict
 from abc import ABC, abstractmethod
@@ -17,15 +23,35 @@ import hashlib
 import uuid
 
 import redis.asyncio as redis
-import boto3
 from botocore.exceptions import ClientError
 
 from ..config.settings import get_settings
 from ..models.core import ValidationRequest, ValidationResult, AgentMessage, Priority
+from .memory_codec import MemoryCodec, get_memory_codec
+from .pattern_index import PatternEmbeddingIndex
+from ..utils.lazy_imports import lazy_import
+
+boto3 = lazy_import("boto3")
 
 logger = logging.getLogger(__name__)
 
 
+def _to_epoch_micros(value: datetime) -> int:
+    """Encode a datetime as integer microseconds since the epoch"""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return int(value.timestamp() * 1_000_000)
+
+
+def _parse_timestamp(value: Any) -> datetime:
+    """Decode epoch microseconds, ISO strings (legacy records) or datetimes"""
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, (int, float)):
+        return datetime.fromtimestamp(value / 1_000_000, tz=timezone.utc)
+    return datetime.fromisoformat(value)
+
+
 class MemoryType(str, Enum):
     """Types of memory storage"""
     SHORT_TERM = "short_term"  # Session-based memory
@@ -76,9 +102,18 @@ class MemoryEntry:
             "confidence_score": self.confidence_score
         }
     
+    def to_record(self) -> Dict[str, Any]:
+        """Convert to a storage record with epoch-microsecond timestamps"""
+        return {
+            **self.to_dict(),
+            "created_at": _to_epoch_micros(self.created_at),
+            "updated_at": _to_epoch_micros(self.updated_at),
+            "expires_at": _to_epoch_micros(self.expires_at) if self.expires_at else None
+        }
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "MemoryEntry":
-        """Create from dictionary"""
+        """Create from dictionary or storage record"""
         return cls(
             id=data["id"],
             agent_id=data["agent_id"],
@@ -87,9 +122,9 @@ class MemoryEntry:
             key=data["key"],
             value=data["value"],
             metadata=data["metadata"],
-            created_at=datetime.fromisoformat(data["created_at"]),
-            updated_at=datetime.fromisoformat(data["updated_at"]),
-            expires_at=datetime.fromisoformat(data["expires_at"]) if data["expires_at"] else None,
+            created_at=_parse_timestamp(data["created_at"]),
+            updated_at=_parse_timestamp(data["updated_at"]),
+            expires_at=_parse_timestamp(data["expires_at"]) if data["expires_at"] else None,
             access_count=data["access_count"],
             confidence_score=data["confidence_score"]
         )
@@ -108,6 +143,7 @@ class ValidationPattern:
     usage_count: int
     created_at: datetime
     last_used: datetime
+    business_concept: str = ""  # Source text for similarity search
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization"""
@@ -117,9 +153,16 @@ class ValidationPattern:
         data["last_used"] = self.last_used.isoformat()
         return data
     
+    def to_record(self) -> Dict[str, Any]:
+        """Convert to a storage record with epoch-microsecond timestamps"""
+        data = asdict(self)
+        data["created_at"] = _to_epoch_micros(self.created_at)
+        data["last_used"] = _to_epoch_micros(self.last_used)
+        return data
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ValidationPattern":
-        """Create from dictionary"""
+        """Create from dictionary or storage record"""
         return cls(
             pattern_id=data["pattern_id"],
             business_concept_hash=data["business_concept_hash"],
@@ -129,8 +172,9 @@ class ValidationPattern:
             failure_indicators=data["failure_indicators"],
             confidence_score=data["confidence_score"],
             usage_count=data["usage_count"],
-            created_at=datetime.fromisoformat(data["created_at"]) if isinstance(data["created_at"], str) else data["created_at"],
-            last_used=datetime.fromisoformat(data["last_used"]) if isinstance(data["last_used"], str) else data["last_used"]
+            created_at=_parse_timestamp(data["created_at"]),
+            last_used=_parse_timestamp(data["last_used"]),
+            business_concept=data.get("business_concept", "")
         )
 
 
@@ -176,12 +220,136 @@ class MemoryBackend(ABC):
     async def expire(self, key: str, ttl: int) -> bool:
         """Set expiration for key"""
         pass
+    
+    async def scan_keys(self, pattern: str = "*", batch_size: int = 500) -> AsyncIterator[List[str]]:
+        """
+        Iterate over keys matching pattern in batches.
+        
+        Callers can stop early; backends override this to avoid listing the
+        whole keyspace at once.
+        """
+        keys = await self.keys(pattern)
+        for start in range(0, len(keys), batch_size):
+            yield keys[start:start + batch_size]
+    
+    async def retrieve_many(self, keys: List[str]) -> List[Optional[Any]]:
+        """Retrieve several values, in key order (None where missing)"""
+        return [await self.retrieve(key) for key in keys]
+    
+    async def store_many(self, items: List[Tuple[str, Any, Optional[int]]]) -> int:
+        """Store several (key, value, ttl) items, returning how many were written"""
+        stored = 0
+        for key, value, ttl in items:
+            if await self.store(key, value, ttl):
+                stored += 1
+        return stored
+    
+    async def delete_many(self, keys: List[str]) -> int:
+        """Delete several keys, returning how many were removed"""
+        deleted = 0
+        for key in keys:
+            if await self.delete(key):
+                deleted += 1
+        return deleted
+
 
+def _decode_key(key: Union[bytes, str]) -> str:
+    """Keys come back as bytes from clients that do not decode responses"""
+    return key.decode("utf-8") if isinstance(key, bytes) else key
 
-class RedisMemoryBackend(MemoryBackend):
+
+class _RedisBatchOperations:
+    """
+    Batch primitives shared by the Redis-protocol backends.
+    
+    Uses cursor-based SCAN instead of the blocking KEYS command, MGET for
+    retrieval and UNLINK so large deletes are reclaimed off the main thread.
+    Values go through the backend's MemoryCodec; the client returns raw bytes.
+    """
+    
+    client: Optional[redis.Redis]
+    codec: MemoryCodec
+    
+    async def scan_keys(self, pattern: str = "*", batch_size: int = 500) -> AsyncIterator[List[str]]:
+        """Iterate over keys matching pattern with SCAN"""
+        if not self.client:
+            return
+        
+        cursor = 0
+        while True:
+            try:
+                cursor, keys = await self.client.scan(cursor=cursor, match=pattern, count=batch_size)
+            except Exception as e:
+                logger.error(f"??Failed to scan keys with pattern {pattern}: {e}")
+                return
+            
+            if keys:
+                yield [_decode_key(key) for key in keys]
+            if cursor == 0:
+                return
+    
+    async def retrieve_many(self, keys: List[str]) -> List[Optional[Any]]:
+        """Retrieve several values with one MGET"""
+        if not self.client or not keys:
+            return [None] * len(keys)
+        
+        try:
+            values = await self.client.mget(keys)
+        except Exception as e:
+            logger.error(f"??Failed to retrieve {len(keys)} keys: {e}")
+            return [None] * len(keys)
+        
+        results = []
+        for key, value in zip(keys, values):
+            try:
+                results.append(self.codec.decode(value) if value is not None else None)
+            except ValueError as e:
+                logger.error(f"??Failed to decode key {key}: {e}")
+                results.append(None)
+        return results
+    
+    async def store_many(self, items: List[Tuple[str, Any, Optional[int]]]) -> int:
+        """Store several (key, value, ttl) items in one non-transactional pipeline"""
+        if not self.client or not items:
+            return 0
+        
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            for key, value, ttl in items:
+                serialized = self.codec.encode(value)
+                if ttl:
+                    pipe.setex(key, ttl, serialized)
+                else:
+                    pipe.set(key, serialized)
+            results = await pipe.execute(raise_on_error=False)
+            return sum(1 for result in results if result is True)
+        except Exception as e:
+            logger.error(f"??Failed to store {len(items)} keys: {e}")
+            return 0
+    
+    async def delete_many(self, keys: List[str]) -> int:
+        """Delete several keys with one UNLINK"""
+        if not self.client or not keys:
+            return 0
+        
+        try:
+            return await self.client.unlink(*keys)
+        except Exception as e:
+            logger.error(f"??Failed to delete {len(keys)} keys: {e}")
+            return 0
+
+
+class RedisMemoryBackend(_RedisBatchOperations, MemoryBackend):
     """Redis-based memory backend for local development"""
     
-    def __init__(self, host: str = "localhost", port: int = 6379, db: int = 0, password: Optional[str] = None):
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 6379,
+        db: int = 0,
+        password: Optional[str] = None,
+        codec: Optional[MemoryCodec] = None
+    ):
         """
         Initialize Redis backend.
         
@@ -190,11 +358,13 @@ class RedisMemoryBackend(MemoryBackend):
             port: Redis port
             db: Redis database number
             password: Optional Redis password
+            codec: Value codec (defaults to the shared MemoryCodec)
         """
         self.host = host
         self.port = port
         self.db = db
         self.password = password
+        self.codec = codec or get_memory_codec()
         self.client: Optional[redis.Redis] = None
         
     async def connect(self) -> bool:
@@ -205,7 +375,7 @@ class RedisMemoryBackend(MemoryBackend):
                 port=self.port,
                 db=self.db,
                 password=self.password,
-                decode_responses=True
+                decode_responses=False  # Values are binary-encoded
             )
             
             # Test connection
@@ -230,7 +400,7 @@ class RedisMemoryBackend(MemoryBackend):
                 return False
             
             # Serialize value
-            serialized_value = json.dumps(value, default=str)
+            serialized_value = self.codec.encode(value)
             
             if ttl:
                 await self.client.setex(key, ttl, serialized_value)
@@ -253,7 +423,7 @@ class RedisMemoryBackend(MemoryBackend):
             if value is None:
                 return None
             
-            return json.loads(value)
+            return self.codec.decode(value)
             
         except Exception as e:
             logger.error(f"??Failed to retrieve key {key}: {e}")
@@ -290,7 +460,7 @@ class RedisMemoryBackend(MemoryBackend):
             if not self.client:
                 return []
             
-            return await self.client.keys(pattern)
+            return [_decode_key(key) for key in await self.client.keys(pattern)]
             
         except Exception as e:
             logger.error(f"??Failed to get keys with pattern {pattern}: {e}")
@@ -309,19 +479,21 @@ class RedisMemoryBackend(MemoryBackend):
             return False
 
 
-class ElastiCacheMemoryBackend(MemoryBackend):
+class ElastiCacheMemoryBackend(_RedisBatchOperations, MemoryBackend):
     """ElastiCache-based memory backend for production"""
     
-    def __init__(self, cluster_endpoint: str, port: int = 6379):
+    def __init__(self, cluster_endpoint: str, port: int = 6379, codec: Optional[MemoryCodec] = None):
         """
         Initialize ElastiCache backend.
         
         Args:
             cluster_endpoint: ElastiCache cluster endpoint
             port: ElastiCache port
+            codec: Value codec (defaults to the shared MemoryCodec)
         """
         self.cluster_endpoint = cluster_endpoint
         self.port = port
+        self.codec = codec or get_memory_codec()
         self.client: Optional[redis.Redis] = None
         
     async def connect(self) -> bool:
@@ -330,7 +502,7 @@ class ElastiCacheMemoryBackend(MemoryBackend):
             self.client = redis.Redis(
                 host=self.cluster_endpoint,
                 port=self.port,
-                decode_responses=True,
+                decode_responses=False,  # Values are binary-encoded
                 ssl=True,  # ElastiCache typically uses SSL
                 ssl_cert_reqs=None
             )
@@ -357,7 +529,7 @@ class ElastiCacheMemoryBackend(MemoryBackend):
                 return False
             
             # Serialize value
-            serialized_value = json.dumps(value, default=str)
+            serialized_value = self.codec.encode(value)
             
             if ttl:
                 await self.client.setex(key, ttl, serialized_value)
@@ -380,7 +552,7 @@ class ElastiCacheMemoryBackend(MemoryBackend):
             if value is None:
                 return None
             
-            return json.loads(value)
+            return self.codec.decode(value)
             
         except Exception as e:
             logger.error(f"??Failed to retrieve key {key}: {e}")
@@ -417,7 +589,7 @@ class ElastiCacheMemoryBackend(MemoryBackend):
             if not self.client:
                 return []
             
-            return await self.client.keys(pattern)
+            return [_decode_key(key) for key in await self.client.keys(pattern)]
             
         except Exception as e:
             logger.error(f"??Failed to get keys with pattern {pattern}: {e}")
@@ -437,44 +609,39 @@ class ElastiCacheMemoryBackend(MemoryBackend):
 
 
 class SQSMessageQueue:
-    """AWS SQS-based message queue for cross-agent knowledge sharing"""
+    """
+    AWS SQS-based message queue for cross-agent knowledge sharing.
+    
+    Each registered agent gets its own inbox queue (``<queue_name>-<agent>``),
+    so agents only receive and acknowledge messages addressed to them; calls
+    without an agent use the shared queue. Sends and deletes are batched with
+    SendMessageBatch/DeleteMessageBatch (10 entries, 256 KiB per call).
+    """
+    
+    MAX_BATCH_ENTRIES = 10
+    MAX_BATCH_BYTES = 256 * 1024
+    AGENT_DISCOVERY_INTERVAL = 60.0
     
     def __init__(self, queue_name: str, region: str = "us-east-1"):
         """
         Initialize SQS message queue.
         
         Args:
-            queue_name: SQS queue name
+            queue_name: SQS queue name (also the prefix of per-agent inboxes)
             region: AWS region
         """
         self.queue_name = queue_name
         self.region = region
         self.sqs_client = None
         self.queue_url = None
+        self._agent_queue_urls: Dict[str, str] = {}
+        self._agents_discovered_at = 0.0
         
     async def connect(self) -> bool:
         """Connect to SQS"""
         try:
             self.sqs_client = boto3.client('sqs', region_name=self.region)
-            
-            # Get or create queue
-            try:
-                response = self.sqs_client.get_queue_url(QueueName=self.queue_name)
-                self.queue_url = response['QueueUrl']
-            except ClientError as e:
-                if e.response['Error']['Code'] == 'AWS.SimpleQueueService.NonExistentQueue':
-                    # Create queue
-                    response = self.sqs_client.create_queue(
-                        QueueName=self.queue_name,
-                        Attributes={
-                            'VisibilityTimeoutSeconds': '300',
-                            'MessageRetentionPeriod': '1209600',  # 14 days
-                            'DelaySeconds': '0'
-                        }
-                    )
-                    self.queue_url = response['QueueUrl']
-                else:
-                    raise
+            self.queue_url = self._get_or_create_queue(self.queue_name)
             
             logger.info(f"??Connected to SQS queue: {self.queue_name}")
             return True
@@ -483,14 +650,49 @@ class SQSMessageQueue:
             logger.error(f"??Failed to connect to SQS: {e}")
             return False
     
-    async def send_message(self, message: Dict[str, Any], delay_seconds: int = 0) -> bool:
-        """Send message to SQS queue"""
+    async def register_agent(self, agent_id: str) -> bool:
+        """Create (or look up) the inbox queue of an agent"""
         try:
-            if not self.sqs_client or not self.queue_url:
+            if not self.sqs_client:
+                return False
+            
+            if agent_id not in self._agent_queue_urls:
+                self._agent_queue_urls[agent_id] = self._get_or_create_queue(self._agent_queue_name(agent_id))
+            return True
+            
+        except Exception as e:
+            logger.error(f"??Failed to register SQS inbox for agent {agent_id}: {e}")
+            return False
+    
+    async def registered_agents(self) -> List[str]:
+        """Agents with an inbox, including those registered by other processes"""
+        if self.sqs_client and time.monotonic() - self._agents_discovered_at > self.AGENT_DISCOVERY_INTERVAL:
+            try:
+                prefix = f"{self.queue_name}-"
+                response = self.sqs_client.list_queues(QueueNamePrefix=prefix)
+                for queue_url in response.get('QueueUrls', []):
+                    agent_id = queue_url.rsplit('/', 1)[-1][len(prefix):]
+                    self._agent_queue_urls.setdefault(agent_id, queue_url)
+                self._agents_discovered_at = time.monotonic()
+            except Exception as e:
+                logger.error(f"??Failed to discover SQS agent inboxes: {e}")
+        
+        return list(self._agent_queue_urls)
+    
+    async def send_message(
+        self,
+        message: Dict[str, Any],
+        delay_seconds: int = 0,
+        agent_id: Optional[str] = None
+    ) -> bool:
+        """Send message to the shared queue or an agent's inbox"""
+        try:
+            queue_url = await self._queue_url(agent_id)
+            if not self.sqs_client or not queue_url:
                 return False
             
             response = self.sqs_client.send_message(
-                QueueUrl=self.queue_url,
+                QueueUrl=queue_url,
                 MessageBody=json.dumps(message, default=str),
                 DelaySeconds=delay_seconds
             )
@@ -501,14 +703,62 @@ class SQSMessageQueue:
             logger.error(f"??Failed to send SQS message: {e}")
             return False
     
-    async def receive_messages(self, max_messages: int = 10, wait_time: int = 20) -> List[Dict[str, Any]]:
-        """Receive messages from SQS queue"""
+    async def send_message_batch(
+        self,
+        messages: List[Dict[str, Any]],
+        agent_id: Optional[str] = None,
+        delay_seconds: int = 0
+    ) -> int:
+        """
+        Send several messages with as few SendMessageBatch calls as possible.
+        
+        Args:
+            messages: Message bodies
+            agent_id: Recipient inbox (None for the shared queue)
+            delay_seconds: Delivery delay applied to every message
+            
+        Returns:
+            int: Number of messages accepted by SQS
+        """
+        try:
+            queue_url = await self._queue_url(agent_id)
+            if not self.sqs_client or not queue_url or not messages:
+                return 0
+            
+            bodies = [json.dumps(message, default=str) for message in messages]
+            sent = 0
+            for chunk in self._chunk_by_size(bodies):
+                response = self.sqs_client.send_message_batch(
+                    QueueUrl=queue_url,
+                    Entries=[
+                        {'Id': str(index), 'MessageBody': body, 'DelaySeconds': delay_seconds}
+                        for index, body in enumerate(chunk)
+                    ]
+                )
+                sent += len(response.get('Successful', []))
+                for failure in response.get('Failed', []):
+                    logger.error(f"??SQS batch entry {failure.get('Id')} failed: {failure.get('Message')}")
+            
+            return sent
+            
+        except Exception as e:
+            logger.error(f"??Failed to send SQS message batch: {e}")
+            return 0
+    
+    async def receive_messages(
+        self,
+        max_messages: int = 10,
+        wait_time: int = 20,
+        agent_id: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Receive messages from the shared queue or an agent's inbox"""
         try:
-            if not self.sqs_client or not self.queue_url:
+            queue_url = await self._queue_url(agent_id)
+            if not self.sqs_client or not queue_url:
                 return []
             
             response = self.sqs_client.receive_message(
-                QueueUrl=self.queue_url,
+                QueueUrl=queue_url,
                 MaxNumberOfMessages=max_messages,
                 WaitTimeSeconds=wait_time,
                 AttributeNames=['All']
@@ -533,14 +783,15 @@ class SQSMessageQueue:
             logger.error(f"??Failed to receive SQS messages: {e}")
             return []
     
-    async def delete_message(self, receipt_handle: str) -> bool:
-        """Delete message from SQS queue"""
+    async def delete_message(self, receipt_handle: str, agent_id: Optional[str] = None) -> bool:
+        """Delete message from the shared queue or an agent's inbox"""
         try:
-            if not self.sqs_client or not self.queue_url:
+            queue_url = await self._queue_url(agent_id)
+            if not self.sqs_client or not queue_url:
                 return False
             
             self.sqs_client.delete_message(
-                QueueUrl=self.queue_url,
+                QueueUrl=queue_url,
                 ReceiptHandle=receipt_handle
             )
             
@@ -549,14 +800,106 @@ class SQSMessageQueue:
         except Exception as e:
             logger.error(f"??Failed to delete SQS message: {e}")
             return False
+    
+    async def delete_message_batch(self, receipt_handles: List[str], agent_id: Optional[str] = None) -> int:
+        """
+        Acknowledge several messages with DeleteMessageBatch.
+        
+        Args:
+            receipt_handles: Receipt handles from receive_messages
+            agent_id: Inbox the messages were received from (None for the shared queue)
+            
+        Returns:
+            int: Number of messages deleted
+        """
+        try:
+            queue_url = await self._queue_url(agent_id)
+            if not self.sqs_client or not queue_url or not receipt_handles:
+                return 0
+            
+            deleted = 0
+            for start in range(0, len(receipt_handles), self.MAX_BATCH_ENTRIES):
+                chunk = receipt_handles[start:start + self.MAX_BATCH_ENTRIES]
+                response = self.sqs_client.delete_message_batch(
+                    QueueUrl=queue_url,
+                    Entries=[
+                        {'Id': str(index), 'ReceiptHandle': receipt_handle}
+                        for index, receipt_handle in enumerate(chunk)
+                    ]
+                )
+                deleted += len(response.get('Successful', []))
+                for failure in response.get('Failed', []):
+                    logger.error(f"??SQS delete entry {failure.get('Id')} failed: {failure.get('Message')}")
+            
+            return deleted
+            
+        except Exception as e:
+            logger.error(f"??Failed to delete SQS message batch: {e}")
+            return 0
+    
+    def _get_or_create_queue(self, queue_name: str) -> str:
+        """Get the URL of a queue, creating it if needed"""
+        try:
+            response = self.sqs_client.get_queue_url(QueueName=queue_name)
+            return response['QueueUrl']
+        except ClientError as e:
+            if e.response['Error']['Code'] != 'AWS.SimpleQueueService.NonExistentQueue':
+                raise
+        
+        response = self.sqs_client.create_queue(
+            QueueName=queue_name,
+            Attributes={
+                'VisibilityTimeout': '300',
+                'MessageRetentionPeriod': '1209600',  # 14 days
+                'DelaySeconds': '0'
+            }
+        )
+        return response['QueueUrl']
+    
+    def _agent_queue_name(self, agent_id: str) -> str:
+        """SQS-safe inbox name (80 characters of [A-Za-z0-9_-])"""
+        safe_agent_id = re.sub(r"[^A-Za-z0-9_-]", "-", agent_id)
+        return f"{self.queue_name}-{safe_agent_id}"[:80]
+    
+    async def _queue_url(self, agent_id: Optional[str]) -> Optional[str]:
+        if agent_id is None:
+            return self.queue_url
+        if agent_id not in self._agent_queue_urls:
+            await self.register_agent(agent_id)
+        return self._agent_queue_urls.get(agent_id)
+    
+    def _chunk_by_size(self, bodies: List[str]) -> List[List[str]]:
+        """Split message bodies into batches within the SQS entry and size limits"""
+        chunks: List[List[str]] = []
+        current: List[str] = []
+        current_bytes = 0
+        for body in bodies:
+            body_bytes = len(body.encode("utf-8"))
+            if current and (
+                len(current) == self.MAX_BATCH_ENTRIES or current_bytes + body_bytes > self.MAX_BATCH_BYTES
+            ):
+                chunks.append(current)
+                current, current_bytes = [], 0
+            current.append(body)
+            current_bytes += body_bytes
+        if current:
+            chunks.append(current)
+        return chunks
 
 
 class InMemoryMessageQueue:
-    """In-memory message queue for local development"""
+    """
+    In-memory message queue for local development.
+    
+    Mirrors SQSMessageQueue: a shared queue plus one inbox per registered
+    agent, with batch send and delete. Messages are consumed on receive, so
+    deletes are no-ops.
+    """
     
     def __init__(self):
         """Initialize in-memory queue"""
         self.queue: asyncio.Queue = asyncio.Queue()
+        self.agent_queues: Dict[str, asyncio.Queue] = {}
         self.message_id_counter = 0
         
     async def connect(self) -> bool:
@@ -564,8 +907,22 @@ class InMemoryMessageQueue:
         logger.info("??Connected to in-memory message queue")
         return True
     
-    async def send_message(self, message: Dict[str, Any], delay_seconds: int = 0) -> bool:
-        """Send message to in-memory queue"""
+    async def register_agent(self, agent_id: str) -> bool:
+        """Create the inbox of an agent"""
+        self.agent_queues.setdefault(agent_id, asyncio.Queue())
+        return True
+    
+    async def registered_agents(self) -> List[str]:
+        """Agents with an inbox"""
+        return list(self.agent_queues)
+    
+    async def send_message(
+        self,
+        message: Dict[str, Any],
+        delay_seconds: int = 0,
+        agent_id: Optional[str] = None
+    ) -> bool:
+        """Send message to the shared queue or an agent's inbox"""
         try:
             self.message_id_counter += 1
             message_wrapper = {
@@ -574,12 +931,13 @@ class InMemoryMessageQueue:
                 'body': message,
                 'timestamp': datetime.now(timezone.utc).isoformat()
             }
+            queue = self._queue(agent_id)
             
             if delay_seconds > 0:
                 # Schedule delayed message
-                asyncio.create_task(self._delayed_send(message_wrapper, delay_seconds))
+                asyncio.create_task(self._delayed_send(message_wrapper, delay_seconds, queue))
             else:
-                await self.queue.put(message_wrapper)
+                await queue.put(message_wrapper)
             
             return True
             
@@ -587,15 +945,35 @@ class InMemoryMessageQueue:
             logger.error(f"??Failed to send in-memory message: {e}")
             return False
     
-    async def receive_messages(self, max_messages: int = 10, wait_time: int = 20) -> List[Dict[str, Any]]:
-        """Receive messages from in-memory queue"""
+    async def send_message_batch(
+        self,
+        messages: List[Dict[str, Any]],
+        agent_id: Optional[str] = None,
+        delay_seconds: int = 0
+    ) -> int:
+        """Send several messages to the shared queue or an agent's inbox"""
+        sent = 0
+        for message in messages:
+            if await self.send_message(message, delay_seconds, agent_id):
+                sent += 1
+        return sent
+    
+    async def receive_messages(
+        self,
+        max_messages: int = 10,
+        wait_time: int = 20,
+        agent_id: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Receive messages from the shared queue or an agent's inbox"""
         messages = []
         
         try:
+            queue = self._queue(agent_id)
+            
             # Get available messages up to max_messages
             for _ in range(max_messages):
                 try:
-                    message = await asyncio.wait_for(self.queue.get(), timeout=wait_time if not messages else 0.1)
+                    message = await asyncio.wait_for(queue.get(), timeout=wait_time if not messages else 0.1)
                     messages.append(message)
                 except asyncio.TimeoutError:
                     break
@@ -605,14 +983,295 @@ class InMemoryMessageQueue:
         
         return messages
     
-    async def delete_message(self, receipt_handle: str) -> bool:
+    async def delete_message(self, receipt_handle: str, agent_id: Optional[str] = None) -> bool:
         """Delete message (no-op for in-memory as messages are consumed)"""
         return True
     
-    async def _delayed_send(self, message: Dict[str, Any], delay_seconds: int) -> None:
+    async def delete_message_batch(self, receipt_handles: List[str], agent_id: Optional[str] = None) -> int:
+        """Delete several messages (no-op for in-memory as messages are consumed)"""
+        return len(receipt_handles)
+    
+    def _queue(self, agent_id: Optional[str]) -> asyncio.Queue:
+        if agent_id is None:
+            return self.queue
+        return self.agent_queues.setdefault(agent_id, asyncio.Queue())
+    
+    async def _delayed_send(self, message: Dict[str, Any], delay_seconds: int, queue: asyncio.Queue) -> None:
         """Send message after delay"""
         await asyncio.sleep(delay_seconds)
-        await self.queue.put(message)
+        await queue.put(message)
+
+
+class MemoryCache:
+    """
+    Size- and byte-bounded in-process cache of memory entries.
+    
+    Evicts by least recently used (``lru``) or least frequently used
+    (``lfu``, ties broken by recency) order. Entries with an expiry are also
+    kept in a deadline heap, so expired entries are dropped without scanning
+    the whole cache.
+    
+    Supports the mapping operations ``in``, ``[]``, ``del``, ``len`` and
+    ``items``; ``get`` additionally checks expiry, updates the eviction order
+    and records hit/miss statistics. An entry larger than ``max_bytes`` is
+    never cached, so ``cache[key] = entry`` is then followed by ``key not in
+    cache`` (see ``put``).
+    """
+    
+    EVICTION_POLICIES = ("lru", "lfu")
+    
+    def __init__(
+        self,
+        max_entries: int = 10000,
+        max_bytes: int = 64 * 1024 * 1024,
+        eviction_policy: str = "lru"
+    ):
+        """
+        Initialize memory cache.
+        
+        Args:
+            max_entries: Maximum number of cached entries
+            max_bytes: Maximum estimated size of cached entries in bytes
+            eviction_policy: "lru" or "lfu"
+        """
+        if eviction_policy not in self.EVICTION_POLICIES:
+            raise ValueError(f"Unknown eviction policy: {eviction_policy}")
+        
+        self.max_entries = max(1, max_entries)
+        self.max_bytes = max(1, max_bytes)
+        self.eviction_policy = eviction_policy
+        self.current_bytes = 0
+        
+        # key -> (entry, estimated size); order is recency for LRU
+        self._entries: "OrderedDict[str, Tuple[MemoryEntry, int]]" = OrderedDict()
+        
+        # LFU bookkeeping: key -> use count, and use count -> keys in recency order
+        self._frequencies: Dict[str, int] = {}
+        self._frequency_buckets: Dict[int, "OrderedDict[str, None]"] = {}
+        self._min_frequency = 0
+        
+        # Expiry index of (deadline, sequence, key); superseded items are skipped
+        self._expiry_heap: List[Tuple[float, int, str]] = []
+        self._deadlines: Dict[str, Tuple[float, int]] = {}
+        self._sequence = 0
+        
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "expirations": 0,
+            "oversized": 0
+        }
+    
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+    
+    def __getitem__(self, key: str) -> MemoryEntry:
+        return self._entries[key][0]
+    
+    def __setitem__(self, key: str, entry: MemoryEntry) -> None:
+        self.put(key, entry)
+    
+    def __delitem__(self, key: str) -> None:
+        if not self.pop(key):
+            raise KeyError(key)
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def items(self) -> List[Tuple[str, MemoryEntry]]:
+        """Snapshot of cached (key, entry) pairs"""
+        return [(key, entry) for key, (entry, _) in self._entries.items()]
+    
+    def get(self, key: str) -> Optional[MemoryEntry]:
+        """
+        Get a live entry and mark it as used.
+        
+        Args:
+            key: Storage key
+            
+        Returns:
+            MemoryEntry if cached and not expired, None otherwise
+        """
+        cached = self._entries.get(key)
+        if cached is None:
+            self.stats["misses"] += 1
+            return None
+        
+        deadline = self._deadlines.get(key)
+        if deadline and deadline[0] <= datetime.now(timezone.utc).timestamp():
+            self._remove(key)
+            self.stats["expirations"] += 1
+            self.stats["misses"] += 1
+            return None
+        
+        self._touch(key)
+        self.stats["hits"] += 1
+        return cached[0]
+    
+    def put(self, key: str, entry: MemoryEntry, size: Optional[int] = None) -> bool:
+        """
+        Cache an entry, evicting others first if a bound would be exceeded.
+        
+        Args:
+            key: Storage key
+            entry: Memory entry to cache
+            size: Estimated size in bytes (computed if omitted)
+            
+        Returns:
+            bool: False if the entry is larger than max_bytes on its own and
+            was not cached (any older entry under the key is dropped)
+        """
+        if key in self._entries:
+            self._remove(key)
+        
+        size = size if size is not None else self._estimate_size(entry)
+        if size > self.max_bytes:
+            # Caching it would flush everything else
+            self.stats["oversized"] += 1
+            logger.warning(f"??Not caching memory entry {key}: {size} bytes exceeds max_bytes {self.max_bytes}")
+            return False
+        
+        # Make room before inserting, so the new entry is never its own victim
+        if len(self._entries) >= self.max_entries or self.current_bytes + size > self.max_bytes:
+            # Reclaim expired entries before evicting live ones
+            self.purge_expired()
+        while self._entries and (
+            len(self._entries) >= self.max_entries or self.current_bytes + size > self.max_bytes
+        ):
+            self._remove(self._eviction_candidate())
+            self.stats["evictions"] += 1
+        
+        self._entries[key] = (entry, size)
+        self.current_bytes += size
+        
+        if self.eviction_policy == "lfu":
+            self._frequencies[key] = 1
+            self._frequency_buckets.setdefault(1, OrderedDict())[key] = None
+            self._min_frequency = 1
+        
+        expires_at = getattr(entry, "expires_at", None)
+        if isinstance(expires_at, datetime):
+            self._sequence += 1
+            deadline = (expires_at.timestamp(), self._sequence)
+            self._deadlines[key] = deadline
+            heapq.heappush(self._expiry_heap, (*deadline, key))
+        
+        return True
+    
+    def pop(self, key: str) -> Optional[MemoryEntry]:
+        """Remove and return an entry"""
+        if key not in self._entries:
+            return None
+        return self._remove(key)
+    
+    def purge_expired(self, now: Optional[datetime] = None) -> List[str]:
+        """
+        Drop every entry whose expiry has passed.
+        
+        Args:
+            now: Reference time (defaults to current time)
+            
+        Returns:
+            List of removed keys
+        """
+        timestamp = (now or datetime.now(timezone.utc)).timestamp()
+        expired = []
+        
+        while self._expiry_heap and self._expiry_heap[0][0] <= timestamp:
+            deadline, sequence, key = heapq.heappop(self._expiry_heap)
+            if self._deadlines.get(key) != (deadline, sequence):
+                continue  # Entry was replaced or removed since
+            self._remove(key)
+            expired.append(key)
+        
+        self.stats["expirations"] += len(expired)
+        return expired
+    
+    def clear(self) -> None:
+        """Remove all entries"""
+        self._entries.clear()
+        self._frequencies.clear()
+        self._frequency_buckets.clear()
+        self._expiry_heap.clear()
+        self._deadlines.clear()
+        self._min_frequency = 0
+        self.current_bytes = 0
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        return {
+            **self.stats,
+            "entries": len(self._entries),
+            "bytes": self.current_bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "eviction_policy": self.eviction_policy
+        }
+    
+    def _touch(self, key: str) -> None:
+        if self.eviction_policy == "lru":
+            self._entries.move_to_end(key)
+            return
+        
+        frequency = self._frequencies[key]
+        bucket = self._frequency_buckets[frequency]
+        del bucket[key]
+        if not bucket:
+            del self._frequency_buckets[frequency]
+            if self._min_frequency == frequency:
+                self._min_frequency = frequency + 1
+        
+        self._frequencies[key] = frequency + 1
+        self._frequency_buckets.setdefault(frequency + 1, OrderedDict())[key] = None
+    
+    def _eviction_candidate(self) -> str:
+        if self.eviction_policy == "lru":
+            return next(iter(self._entries))
+        
+        while self._min_frequency not in self._frequency_buckets:
+            self._min_frequency += 1
+        return next(iter(self._frequency_buckets[self._min_frequency]))
+    
+    def _remove(self, key: str) -> MemoryEntry:
+        entry, size = self._entries.pop(key)
+        self.current_bytes -= size
+        self._deadlines.pop(key, None)
+        
+        frequency = self._frequencies.pop(key, None)
+        if frequency is not None:
+            bucket = self._frequency_buckets[frequency]
+            del bucket[key]
+            if not bucket:
+                del self._frequency_buckets[frequency]
+        
+        return entry
+    
+    @classmethod
+    def _estimate_size(cls, entry: MemoryEntry) -> int:
+        """Approximate footprint of the entry's value and metadata, without serializing"""
+        return (
+            cls._estimate_value_size(getattr(entry, "value", None))
+            + cls._estimate_value_size(getattr(entry, "metadata", None))
+            + 256  # Fixed overhead for ids, timestamps and bookkeeping
+        )
+    
+    @classmethod
+    def _estimate_value_size(cls, value: Any, depth: int = 0) -> int:
+        if isinstance(value, (str, bytes, bytearray)):
+            return len(value)
+        if value is None or isinstance(value, (bool, int, float)):
+            return 8
+        if depth >= 8:
+            return sys.getsizeof(value)
+        if isinstance(value, dict):
+            return sum(
+                cls._estimate_value_size(k, depth + 1) + cls._estimate_value_size(v, depth + 1)
+                for k, v in value.items()
+            )
+        if isinstance(value, (list, tuple, set, frozenset)):
+            return sum(cls._estimate_value_size(item, depth + 1) for item in value) + 8
+        return sys.getsizeof(value)
 
 
 class AgentMemoryManager:
@@ -627,9 +1286,27 @@ class AgentMemoryManager:
         self.settings = get_settings()
         self.backend: Optional[MemoryBackend] = None
         self.message_queue = None
-        self.memory_cache: Dict[str, MemoryEntry] = {}
+        self.memory_cache = MemoryCache(
+            max_entries=int(os.getenv("AGENT_MEMORY_CACHE_MAX_ENTRIES", "10000")),
+            max_bytes=int(os.getenv("AGENT_MEMORY_CACHE_MAX_BYTES", str(64 * 1024 * 1024))),
+            eviction_policy=os.getenv("AGENT_MEMORY_CACHE_POLICY", "lru")
+        )
         self.validation_patterns: Dict[str, ValidationPattern] = {}
         
+        # Similarity index over validation patterns (concept embeddings and target market)
+        self.pattern_index = PatternEmbeddingIndex()
+        self.pattern_similarity_threshold = 0.3
+        self._patterns_by_market: Dict[str, Dict[str, None]] = {}
+        self._patterns_by_hash: Dict[str, Dict[str, None]] = {}
+        self._indexed_patterns: Optional[Dict[str, ValidationPattern]] = None
+        self._indexed_pattern_count = 0
+        
+        # Write-behind state: entries and patterns changed since the last flush
+        self.write_behind_interval = float(os.getenv("AGENT_MEMORY_WRITE_BEHIND_SECONDS", "5"))
+        self.write_behind_batch_size = 500
+        self._dirty_entries: Dict[str, MemoryEntry] = {}
+        self._dirty_patterns: Set[str] = set()
+        
         # Memory statistics
         self.stats = {
             "entries_stored": 0,
@@ -637,12 +1314,16 @@ class AgentMemoryManager:
             "cache_hits": 0,
             "cache_misses": 0,
             "patterns_learned": 0,
-            "patterns_applied": 0
+            "patterns_applied": 0,
+            "write_behind_flushes": 0,
+            "write_behind_entries": 0,
+            "patterns_saved": 0
         }
         
         # Background tasks
         self._cleanup_task: Optional[asyncio.Task] = None
         self._pattern_learning_task: Optional[asyncio.Task] = None
+        self._write_behind_task: Optional[asyncio.Task] = None
         
     async def initialize(self) -> bool:
         """Initialize memory system with environment-specific backend"""
@@ -718,7 +1399,15 @@ class AgentMemoryManager:
                 except asyncio.CancelledError:
                     pass
             
-            # Save validation patterns
+            if self._write_behind_task:
+                self._write_behind_task.cancel()
+                try:
+                    await self._write_behind_task
+                except asyncio.CancelledError:
+                    pass
+            
+            # Flush pending writes and changed validation patterns
+            await self.flush_pending_writes()
             await self._save_validation_patterns()
             
             # Disconnect from backend
@@ -780,11 +1469,12 @@ class AgentMemoryManager:
             storage_key = self._generate_storage_key(agent_id, memory_type, scope, key)
             
             # Store in backend
-            success = await self.backend.store(storage_key, entry.to_dict(), ttl)
+            success = await self.backend.store(storage_key, entry.to_record(), ttl)
             
             if success:
-                # Cache locally
+                # Cache locally; this write supersedes any pending write-behind
                 self.memory_cache[storage_key] = entry
+                self._dirty_entries.pop(storage_key, None)
                 
                 # Share knowledge if appropriate
                 if scope in [MemoryScope.AGENT_SHARED, MemoryScope.WORKFLOW_SHARED, MemoryScope.GLOBAL_SHARED]:
@@ -822,19 +1512,22 @@ class AgentMemoryManager:
         try:
             storage_key = self._generate_storage_key(agent_id, memory_type, scope, key)
             
-            # Check local cache first
+            # Expired cached entries are removed from the backend as well
             if storage_key in self.memory_cache:
-                entry = self.memory_cache[storage_key]
-                
-                # Check if expired
-                if entry.expires_at and entry.expires_at < datetime.now(timezone.utc):
-                    del self.memory_cache[storage_key]
+                cached = self.memory_cache[storage_key]
+                if cached.expires_at and cached.expires_at < datetime.now(timezone.utc):
+                    self.memory_cache.pop(storage_key)
+                    self._dirty_entries.pop(storage_key, None)
                     await self.backend.delete(storage_key)
                     return None
-                
-                # Update access count
+            
+            # Check local cache first
+            entry = self.memory_cache.get(storage_key)
+            if entry is not None:
+                # Update access count (persisted by the write-behind flusher)
                 entry.access_count += 1
                 entry.updated_at = datetime.now(timezone.utc)
+                self._dirty_entries[storage_key] = entry
                 
                 self.stats["cache_hits"] += 1
                 self.stats["entries_retrieved"] += 1
@@ -857,8 +1550,8 @@ class AgentMemoryManager:
                 # Cache locally
                 self.memory_cache[storage_key] = entry
                 
-                # Update in backend
-                await self.backend.store(storage_key, entry.to_dict())
+                # Access statistics are written back in batches
+                self._dirty_entries[storage_key] = entry
                 
                 self.stats["cache_misses"] += 1
                 self.stats["entries_retrieved"] += 1
@@ -876,7 +1569,7 @@ class AgentMemoryManager:
         memory_type: Optional[MemoryType] = None,
         scope: Optional[MemoryScope] = None,
         pattern: str = "*",
-        limit: int = 100
+        limit: Optional[int] = 100
     ) -> List[MemoryEntry]:
         """
         Search for memory entries matching criteria.
@@ -886,7 +1579,7 @@ class AgentMemoryManager:
             memory_type: Optional memory type filter
             scope: Optional scope filter
             pattern: Key pattern to match
-            limit: Maximum number of results
+            limit: Maximum number of results (None for all matches)
             
         Returns:
             List of matching memory entries
@@ -906,25 +1599,40 @@ class AgentMemoryManager:
             
             search_pattern += pattern
             
-            # Get matching keys
-            keys = await self.backend.keys(search_pattern)
-            
-            # Retrieve entries
             entries = []
-            for key in keys[:limit]:
-                data = await self.backend.retrieve(key)
-                if data:
-                    try:
-                        entry = MemoryEntry.from_dict(data)
+            now = datetime.now(timezone.utc)
+            if limit is None:
+                limit = sys.maxsize
+            
+            # Walk the keyspace incrementally and stop as soon as we have enough
+            async with aclosing(self.backend.scan_keys(search_pattern)) as key_batches:
+                async for keys in key_batches:
+                    while keys and len(entries) < limit:
+                        # Fetch only as many as could still be needed
+                        needed = limit - len(entries)
+                        chunk, keys = keys[:needed], keys[needed:]
                         
-                        # Check if expired
-                        if entry.expires_at and entry.expires_at < datetime.now(timezone.utc):
-                            await self.backend.delete(key)
-                            continue
+                        expired_keys = []
+                        for key, data in zip(chunk, await self.backend.retrieve_many(chunk)):
+                            if not data:
+                                continue
+                            try:
+                                entry = MemoryEntry.from_dict(data)
+                                
+                                # Check if expired
+                                if entry.expires_at and entry.expires_at < now:
+                                    expired_keys.append(key)
+                                    continue
+                                
+                                entries.append(entry)
+                            except Exception as e:
+                                logger.error(f"??Failed to parse memory entry {key}: {e}")
                         
-                        entries.append(entry)
-                    except Exception as e:
-                        logger.error(f"??Failed to parse memory entry {key}: {e}")
+                        if expired_keys:
+                            await self.backend.delete_many(expired_keys)
+                    
+                    if len(entries) >= limit:
+                        break
             
             return entries
             
@@ -957,9 +1665,9 @@ class AgentMemoryManager:
             # Delete from backend
             success = await self.backend.delete(storage_key)
             
-            # Remove from cache
-            if storage_key in self.memory_cache:
-                del self.memory_cache[storage_key]
+            # Remove from cache and drop any pending write-behind
+            self.memory_cache.pop(storage_key)
+            self._dirty_entries.pop(storage_key, None)
             
             if success:
                 logger.debug(f"??Deleted memory entry {storage_key}")
@@ -1030,11 +1738,14 @@ class AgentMemoryManager:
                 confidence_score=validation_result.confidence_level,
                 usage_count=0,
                 created_at=now,
-                last_used=now
+                last_used=now,
+                business_concept=validation_request.business_concept
             )
             
             # Store pattern
+            self._sync_pattern_index()
             self.validation_patterns[pattern_id] = pattern
+            self._index_pattern(pattern)
             
             # Store in persistent memory
             await self.store_memory(
@@ -1042,7 +1753,7 @@ class AgentMemoryManager:
                 memory_type=MemoryType.PATTERN,
                 scope=MemoryScope.GLOBAL_SHARED,
                 key=f"validation_pattern_{concept_hash}",
-                value=pattern.to_dict(),
+                value=pattern.to_record(),
                 metadata={
                     "target_market": validation_request.target_market,
                     "analysis_scope": validation_request.analysis_scope,
@@ -1080,10 +1791,13 @@ class AgentMemoryManager:
                 business_concept.lower().encode()
             ).hexdigest()[:16]
             
+            self._sync_pattern_index()
+            
             # Search for exact match first
             exact_matches = [
-                pattern for pattern in self.validation_patterns.values()
-                if pattern.business_concept_hash == concept_hash
+                self.validation_patterns[pattern_id]
+                for pattern_id in self._patterns_by_hash.get(concept_hash, ())
+                if pattern_id in self.validation_patterns
             ]
             
             if exact_matches:
@@ -1094,19 +1808,32 @@ class AgentMemoryManager:
                 )
                 return exact_matches[:limit]
             
-            # Search for similar target markets
-            similar_patterns = [
-                pattern for pattern in self.validation_patterns.values()
-                if pattern.target_market.lower() == target_market.lower()
-            ]
-            
-            # Sort by confidence and usage
-            similar_patterns.sort(
-                key=lambda p: (p.confidence_score, p.usage_count),
-                reverse=True
-            )
+            # Nearest concepts by embedding similarity
+            similar_patterns = []
+            for pattern_id, _ in self.pattern_index.search(
+                business_concept, k=limit, min_score=self.pattern_similarity_threshold
+            ):
+                pattern = self.validation_patterns.get(pattern_id)
+                if pattern:
+                    similar_patterns.append(pattern)
+            
+            if len(similar_patterns) < limit:
+                # Fill up with patterns from the same target market
+                found = {pattern.pattern_id for pattern in similar_patterns}
+                market_patterns = [
+                    self.validation_patterns[pattern_id]
+                    for pattern_id in self._patterns_by_market.get(target_market.lower(), ())
+                    if pattern_id not in found and pattern_id in self.validation_patterns
+                ]
+                
+                # Sort by confidence and usage
+                market_patterns.sort(
+                    key=lambda p: (p.confidence_score, p.usage_count),
+                    reverse=True
+                )
+                similar_patterns.extend(market_patterns[:limit - len(similar_patterns)])
             
-            return similar_patterns[:limit]
+            return similar_patterns
             
         except Exception as e:
             logger.error(f"??Failed to find similar patterns: {e}")
@@ -1131,6 +1858,7 @@ class AgentMemoryManager:
             # Update pattern usage
             pattern.usage_count += 1
             pattern.last_used = datetime.now(timezone.utc)
+            self._dirty_patterns.add(pattern.pattern_id)
             
             # Extract insights
             insights = {
@@ -1178,6 +1906,25 @@ class AgentMemoryManager:
             logger.error(f"??Failed to apply pattern insights: {e}")
             return {}
     
+    async def register_agent(self, agent_id: str) -> bool:
+        """
+        Create the knowledge inbox of an agent.
+        
+        Broadcasts are delivered to registered inboxes only, so agents should
+        register before others start sharing with them.
+        
+        Args:
+            agent_id: Agent to register
+            
+        Returns:
+            bool: True if the inbox exists
+        """
+        try:
+            return await self.message_queue.register_agent(agent_id)
+        except Exception as e:
+            logger.error(f"??Failed to register agent {agent_id} for knowledge sharing: {e}")
+            return False
+    
     async def share_knowledge(
         self,
         sender_agent_id: str,
@@ -1198,17 +1945,11 @@ class AgentMemoryManager:
             bool: True if sharing successful
         """
         try:
-            message = {
-                "type": "knowledge_sharing",
-                "sender_agent_id": sender_agent_id,
-                "knowledge_type": knowledge_type,
-                "knowledge_data": knowledge_data,
-                "target_agents": target_agents,
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-                "message_id": str(uuid.uuid4())
-            }
+            message = self._knowledge_message(sender_agent_id, knowledge_type, knowledge_data, target_agents)
             
-            success = await self.message_queue.send_message(message)
+            success = True
+            for recipient in await self._knowledge_recipients(sender_agent_id, target_agents):
+                success = await self.message_queue.send_message(message, agent_id=recipient) and success
             
             if success:
                 logger.info(f"??Knowledge shared by {sender_agent_id}: {knowledge_type}")
@@ -1219,10 +1960,49 @@ class AgentMemoryManager:
             logger.error(f"??Failed to share knowledge: {e}")
             return False
     
+    async def share_knowledge_batch(
+        self,
+        sender_agent_id: str,
+        knowledge_items: List[Tuple[str, Dict[str, Any]]],
+        target_agents: Optional[List[str]] = None
+    ) -> int:
+        """
+        Share several pieces of knowledge with one batched send per recipient.
+        
+        Args:
+            sender_agent_id: Agent sharing the knowledge
+            knowledge_items: (knowledge_type, knowledge_data) pairs
+            target_agents: Optional list of target agents (None for broadcast)
+            
+        Returns:
+            int: Number of messages delivered
+        """
+        try:
+            messages = [
+                self._knowledge_message(sender_agent_id, knowledge_type, knowledge_data, target_agents)
+                for knowledge_type, knowledge_data in knowledge_items
+            ]
+            if not messages:
+                return 0
+            
+            delivered = 0
+            for recipient in await self._knowledge_recipients(sender_agent_id, target_agents):
+                delivered += await self.message_queue.send_message_batch(messages, agent_id=recipient)
+            
+            logger.info(f"??Knowledge batch shared by {sender_agent_id}: {len(messages)} items")
+            return delivered
+            
+        except Exception as e:
+            logger.error(f"??Failed to share knowledge batch: {e}")
+            return 0
+    
     async def receive_shared_knowledge(self, agent_id: str) -> List[Dict[str, Any]]:
         """
         Receive shared knowledge for an agent.
         
+        Messages come from the agent's own inbox and are acknowledged with a
+        single batch delete.
+        
         Args:
             agent_id: Agent receiving knowledge
             
@@ -1230,19 +2010,24 @@ class AgentMemoryManager:
             List of knowledge messages
         """
         try:
-            messages = await self.message_queue.receive_messages(max_messages=10, wait_time=1)
+            await self.message_queue.register_agent(agent_id)
+            messages = await self.message_queue.receive_messages(max_messages=10, wait_time=1, agent_id=agent_id)
             
             relevant_messages = []
+            receipt_handles = []
             for message in messages:
                 body = message['body']
+                receipt_handles.append(message['receipt_handle'])
                 
-                # Check if message is relevant to this agent
+                # Inboxes only hold messages routed to this agent; drop anything else
                 target_agents = body.get('target_agents')
                 if target_agents is None or agent_id in target_agents:
                     relevant_messages.append(body)
-                
-                # Delete processed message
-                await self.message_queue.delete_message(message['receipt_handle'])
+                else:
+                    logger.warning(f"??Discarding knowledge message not addressed to {agent_id}: {body.get('message_id')}")
+            
+            if receipt_handles:
+                await self.message_queue.delete_message_batch(receipt_handles, agent_id=agent_id)
             
             return relevant_messages
             
@@ -1260,12 +2045,40 @@ class AgentMemoryManager:
         return {
             **self.stats,
             "cached_entries": len(self.memory_cache),
+            "pending_writes": len(self._dirty_entries),
+            "pending_pattern_saves": len(self._dirty_patterns),
+            "cache_evictions": self.memory_cache.stats["evictions"],
+            "memory_cache": self.memory_cache.get_stats(),
             "validation_patterns": len(self.validation_patterns),
             "cache_hit_rate": (
                 self.stats["cache_hits"] / max(1, self.stats["cache_hits"] + self.stats["cache_misses"])
             ) * 100
         }
     
+    def _knowledge_message(
+        self,
+        sender_agent_id: str,
+        knowledge_type: str,
+        knowledge_data: Dict[str, Any],
+        target_agents: Optional[List[str]]
+    ) -> Dict[str, Any]:
+        """Build a knowledge sharing message"""
+        return {
+            "type": "knowledge_sharing",
+            "sender_agent_id": sender_agent_id,
+            "knowledge_type": knowledge_type,
+            "knowledge_data": knowledge_data,
+            "target_agents": target_agents,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "message_id": str(uuid.uuid4())
+        }
+    
+    async def _knowledge_recipients(self, sender_agent_id: str, target_agents: Optional[List[str]]) -> List[str]:
+        """Inboxes a knowledge message is routed to (registered agents for broadcasts)"""
+        if target_agents is not None:
+            return list(dict.fromkeys(target_agents))
+        return [agent_id for agent_id in await self.message_queue.registered_agents() if agent_id != sender_agent_id]
+    
     def _generate_storage_key(
         self,
         agent_id: str,
@@ -1309,13 +2122,16 @@ class AgentMemoryManager:
                 agent_id="system",
                 memory_type=MemoryType.PATTERN,
                 scope=MemoryScope.GLOBAL_SHARED,
-                pattern="validation_pattern_*"
+                pattern="validation_pattern_*",
+                limit=None
             )
             
+            self._sync_pattern_index()
             for entry in pattern_entries:
                 try:
                     pattern = ValidationPattern.from_dict(entry.value)
                     self.validation_patterns[pattern.pattern_id] = pattern
+                    self._index_pattern(pattern)
                 except Exception as e:
                     logger.error(f"??Failed to load validation pattern {entry.id}: {e}")
             
@@ -1324,27 +2140,120 @@ class AgentMemoryManager:
         except Exception as e:
             logger.error(f"??Failed to load validation patterns: {e}")
     
+    def _index_pattern(self, pattern: ValidationPattern) -> None:
+        """Add a pattern to the similarity, concept hash and target market indexes"""
+        if pattern.business_concept:
+            self.pattern_index.add(pattern.pattern_id, pattern.business_concept)
+        self._patterns_by_hash.setdefault(pattern.business_concept_hash, {})[pattern.pattern_id] = None
+        self._patterns_by_market.setdefault(pattern.target_market.lower(), {})[pattern.pattern_id] = None
+        self._indexed_pattern_count = len(self.validation_patterns)
+    
+    def _unindex_pattern(self, pattern: ValidationPattern) -> None:
+        """Remove a pattern from the similarity, concept hash and target market indexes"""
+        self.pattern_index.remove(pattern.pattern_id)
+        self._patterns_by_hash.get(pattern.business_concept_hash, {}).pop(pattern.pattern_id, None)
+        self._patterns_by_market.get(pattern.target_market.lower(), {}).pop(pattern.pattern_id, None)
+        self._indexed_pattern_count = len(self.validation_patterns)
+    
+    def _sync_pattern_index(self) -> None:
+        """Rebuild the pattern indexes if validation_patterns was replaced or changed directly"""
+        if (
+            self._indexed_patterns is self.validation_patterns
+            and self._indexed_pattern_count == len(self.validation_patterns)
+        ):
+            return
+        
+        self.pattern_index.clear()
+        self._patterns_by_hash.clear()
+        self._patterns_by_market.clear()
+        self._indexed_patterns = self.validation_patterns
+        for pattern in self.validation_patterns.values():
+            self._index_pattern(pattern)
+        self._indexed_pattern_count = len(self.validation_patterns)
+    
+    async def flush_pending_writes(self) -> int:
+        """
+        Write back entries whose access statistics changed since the last flush.
+        
+        Updates to the same key are coalesced; the latest state is sent in
+        pipelined batches with each entry's remaining TTL.
+        
+        Returns:
+            int: Number of entries written
+        """
+        if not self._dirty_entries or not self.backend:
+            return 0
+        
+        dirty, self._dirty_entries = self._dirty_entries, {}
+        now = datetime.now(timezone.utc)
+        items = []
+        for storage_key, entry in dirty.items():
+            ttl = None
+            if entry.expires_at:
+                ttl = int((entry.expires_at - now).total_seconds())
+                if ttl <= 0:
+                    continue  # Expired; nothing worth writing back
+            items.append((storage_key, entry.to_record(), ttl))
+        
+        written = 0
+        try:
+            for start in range(0, len(items), self.write_behind_batch_size):
+                written += await self.backend.store_many(items[start:start + self.write_behind_batch_size])
+        except Exception as e:
+            logger.error(f"??Failed to flush memory writes: {e}")
+            # Keep unsent updates for the next flush unless newer ones arrived
+            for storage_key, entry in dirty.items():
+                self._dirty_entries.setdefault(storage_key, entry)
+            return written
+        
+        self.stats["write_behind_flushes"] += 1
+        self.stats["write_behind_entries"] += written
+        return written
+    
     async def _save_validation_patterns(self) -> None:
-        """Save validation patterns to storage"""
+        """Save validation patterns changed since the last save in pipelined batches"""
+        if not self._dirty_patterns or not self.backend:
+            return
+        
+        dirty, self._dirty_patterns = self._dirty_patterns, set()
         try:
-            for pattern in self.validation_patterns.values():
-                concept_hash = pattern.business_concept_hash
-                await self.store_memory(
+            now = datetime.now(timezone.utc)
+            items = []
+            for pattern_id in dirty:
+                pattern = self.validation_patterns.get(pattern_id)
+                if pattern is None:
+                    continue
+                
+                key = f"validation_pattern_{pattern.business_concept_hash}"
+                entry = MemoryEntry(
+                    id=str(uuid.uuid4()),
                     agent_id="system",
                     memory_type=MemoryType.PATTERN,
                     scope=MemoryScope.GLOBAL_SHARED,
-                    key=f"validation_pattern_{concept_hash}",
-                    value=pattern.to_dict(),
+                    key=key,
+                    value=pattern.to_record(),
                     metadata={
                         "target_market": pattern.target_market,
                         "usage_count": pattern.usage_count,
                         "last_used": pattern.last_used.isoformat()
-                    }
+                    },
+                    created_at=now,
+                    updated_at=now
+                )
+                storage_key = self._generate_storage_key(
+                    "system", MemoryType.PATTERN, MemoryScope.GLOBAL_SHARED, key
                 )
+                items.append((storage_key, entry.to_record(), None))
             
-            logger.info(f"??Saved {len(self.validation_patterns)} validation patterns")
+            saved = 0
+            for start in range(0, len(items), self.write_behind_batch_size):
+                saved += await self.backend.store_many(items[start:start + self.write_behind_batch_size])
+            
+            self.stats["patterns_saved"] += saved
+            logger.info(f"??Saved {saved} changed validation patterns")
             
         except Exception as e:
+            self._dirty_patterns.update(dirty)
             logger.error(f"??Failed to save validation patterns: {e}")
     
     async def _start_background_tasks(self) -> None:
@@ -1356,6 +2265,9 @@ class AgentMemoryManager:
             # Start pattern learning task
             self._pattern_learning_task = asyncio.create_task(self._pattern_learning_worker())
             
+            # Start write-behind flusher
+            self._write_behind_task = asyncio.create_task(self._write_behind_worker())
+            
             logger.info("??Memory system background tasks started")
             
         except Exception as e:
@@ -1365,18 +2277,12 @@ class AgentMemoryManager:
         """Background task to cleanup expired memory entries"""
         while True:
             try:
-                current_time = datetime.now(timezone.utc)
-                expired_keys = []
-                
-                # Check cached entries
-                for key, entry in list(self.memory_cache.items()):
-                    if entry.expires_at and entry.expires_at < current_time:
-                        expired_keys.append(key)
+                # Drop expired cached entries via the expiry index
+                expired_keys = self.memory_cache.purge_expired()
                 
                 # Remove expired entries
-                for key in expired_keys:
-                    del self.memory_cache[key]
-                    await self.backend.delete(key)
+                if expired_keys:
+                    await self.backend.delete_many(expired_keys)
                 
                 if expired_keys:
                     logger.debug(f"?§¹ Cleaned up {len(expired_keys)} expired memory entries")
@@ -1390,6 +2296,19 @@ class AgentMemoryManager:
                 logger.error(f"??Error in cleanup task: {e}")
                 await asyncio.sleep(60)
     
+    async def _write_behind_worker(self) -> None:
+        """Background task that flushes coalesced writes on an interval"""
+        while True:
+            try:
+                await asyncio.sleep(self.write_behind_interval)
+                await self.flush_pending_writes()
+                await self._save_validation_patterns()
+                
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"??Error in write-behind flusher: {e}")
+    
     async def _pattern_learning_worker(self) -> None:
         """Background task for pattern learning and optimization"""
         while True:
@@ -1400,10 +2319,13 @@ class AgentMemoryManager:
                     days_since_use = (datetime.now(timezone.utc) - pattern.last_used).days
                     if days_since_use > 30:
                         pattern.confidence_score *= 0.95  # Decay confidence
+                        self._dirty_patterns.add(pattern.pattern_id)
                         
                         # Remove patterns with very low confidence
                         if pattern.confidence_score < 0.1:
                             del self.validation_patterns[pattern.pattern_id]
+                            self._dirty_patterns.discard(pattern.pattern_id)
+                            self._unindex_pattern(pattern)
                             logger.debug(f"??ï¸?Removed low-confidence pattern {pattern.pattern_id}")
                 
                 # Sleep for 1 hour
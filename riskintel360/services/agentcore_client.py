@@ -16,11 +16,10 @@ for multi-agent coordination in production environments.
 import asyncio
 import json
 import logging
-from typing import Dict, Any, Optional, List, Union, Callable
+from typing import Dict, Any, Optional, List, Union, Callable, Set, Tuple
 from enum import Enum
 from dataclasses import dataclass
 from datetime import datetime, UTC
-import boto3
 from botocore.exceptions import ClientError, BotoCoreError
 from tenacity import (
     retry,
@@ -32,6 +31,10 @@ from tenacity import (
 
 from ..config.settings import get_settings
 from ..models.agent_models import AgentMessage, MessageType, Priority, AgentType
+from ..utils.lazy_imports import lazy_import
+from .shared_memory import LocalSharedMemory, SharedMemoryBackend
+
+boto3 = lazy_import("boto3")
 
 logger = logging.getLogger(__name__)
 
@@ -93,7 +96,8 @@ class AgentCoreClient:
         aws_access_key_id: Optional[str] = None,
         aws_secret_access_key: Optional[str] = None,
         aws_session_token: Optional[str] = None,
-        enable_real_bedrock_agents: bool = False
+        enable_real_bedrock_agents: bool = False,
+        shared_memory: Optional[SharedMemoryBackend] = None
     ):
         """
         Initialize AgentCore client with AWS credentials.
@@ -104,6 +108,8 @@ class AgentCoreClient:
             aws_secret_access_key: AWS secret key (optional, uses default credential chain)
             aws_session_token: AWS session token (optional, for temporary credentials)
             enable_real_bedrock_agents: Enable actual Bedrock Agents API calls (requires setup)
+            shared_memory: Shared memory backend (process-local if omitted; use
+                RedisSharedMemory to share state between workers)
         """
         self.region_name = region_name
         self.settings = get_settings()
@@ -141,7 +147,8 @@ class AgentCoreClient:
         self._message_handlers: Dict[str, Callable] = {}
         self._agent_registry: Dict[str, Dict[str, Any]] = {}
         self._workflow_states: Dict[str, Dict[str, Any]] = {}
-        self._shared_memory: Dict[str, Any] = {}
+        self.shared_memory: SharedMemoryBackend = shared_memory or LocalSharedMemory()
+        self._background_tasks: Set[asyncio.Task] = set()
         
         # Bedrock Agent IDs (for real API integration)
         self._bedrock_agent_ids: Dict[str, str] = {}
@@ -467,6 +474,28 @@ class AgentCoreClient:
                 "message_id": message_data.get("message_id")
             }
         
+        elif request.operation == "route_batch":
+            message_data = request.parameters.get("message", {})
+            recipient_ids = request.parameters.get("recipient_ids", [])
+            
+            # Deliver to every recipient concurrently; each gets a shallow
+            # per-recipient view of the one serialized message
+            handled = [recipient_id for recipient_id in recipient_ids if recipient_id in self._message_handlers]
+            results = await asyncio.gather(
+                *[
+                    self._message_handlers[recipient_id]({**message_data, "recipient_id": recipient_id})
+                    for recipient_id in handled
+                ],
+                return_exceptions=True
+            )
+            failed = [recipient_id for recipient_id, result in zip(handled, results) if isinstance(result, Exception)]
+            
+            return {
+                "routed": [recipient_id for recipient_id in recipient_ids if recipient_id not in failed],
+                "failed": failed,
+                "message_id": message_data.get("message_id")
+            }
+        
         return {"operation": request.operation, "status": "completed"}
     
     async def _handle_task_distribution(self, request: AgentCoreRequest) -> Dict[str, Any]:
@@ -517,6 +546,7 @@ class AgentCoreClient:
                 "supervisor_id": request.agent_id,
                 "data": workflow_data
             }
+            await self._mirror_workflow_state(workflow_id)
             
             return {
                 "orchestrated": True,
@@ -572,6 +602,38 @@ class AgentCoreClient:
         
         return await self._execute_primitive(request)
     
+    async def route_message_batch(
+        self,
+        sender_id: str,
+        recipient_ids: List[str],
+        message: AgentMessage,
+        correlation_id: Optional[str] = None
+    ) -> AgentCoreResponse:
+        """
+        Route one message to many agents in a single AgentCore call.
+        
+        Args:
+            sender_id: Sender agent ID
+            recipient_ids: Recipient agent IDs
+            message: Message to route (serialized once for all recipients)
+            correlation_id: Optional correlation ID
+            
+        Returns:
+            AgentCoreResponse: Response whose result lists ``routed`` and ``failed`` recipients
+        """
+        request = AgentCoreRequest(
+            primitive=AgentCorePrimitive.MESSAGE_ROUTING,
+            operation="route_batch",
+            parameters={
+                "message": message.to_dict(),
+                "recipient_ids": list(recipient_ids)
+            },
+            agent_id=sender_id,
+            correlation_id=correlation_id
+        )
+        
+        return await self._execute_primitive(request)
+    
     async def distribute_task(
         self,
         supervisor_id: str,
@@ -702,7 +764,7 @@ class AgentCoreClient:
     
     def get_workflow_state(self, workflow_id: str) -> Optional[Dict[str, Any]]:
         """
-        Get workflow state.
+        Get workflow state known to this process.
         
         Args:
             workflow_id: Workflow identifier
@@ -712,6 +774,20 @@ class AgentCoreClient:
         """
         return self._workflow_states.get(workflow_id)
     
+    async def fetch_workflow_state(self, workflow_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get workflow state from this process or, failing that, shared memory.
+        
+        Args:
+            workflow_id: Workflow identifier
+            
+        Returns:
+            Dict containing workflow state or None if not found
+        """
+        if workflow_id in self._workflow_states:
+            return self._workflow_states[workflow_id]
+        return await self.get_shared_memory(f"workflow_state:{workflow_id}")
+    
     def update_workflow_state(self, workflow_id: str, state_update: Dict[str, Any]) -> bool:
         """
         Update workflow state.
@@ -726,9 +802,24 @@ class AgentCoreClient:
         if workflow_id in self._workflow_states:
             self._workflow_states[workflow_id].update(state_update)
             self._workflow_states[workflow_id]["last_updated"] = datetime.now(UTC).isoformat()
+            try:
+                task = asyncio.get_running_loop().create_task(self._mirror_workflow_state(workflow_id))
+            except RuntimeError:
+                pass  # No event loop: the next async update mirrors the state
+            else:
+                # Keep a reference until done so the task is not garbage collected
+                self._background_tasks.add(task)
+                task.add_done_callback(self._background_tasks.discard)
             return True
         return False
     
+    async def _mirror_workflow_state(self, workflow_id: str) -> None:
+        """Publish a workflow's state to shared memory for other workers"""
+        try:
+            await self.set_shared_memory(f"workflow_state:{workflow_id}", self._workflow_states[workflow_id])
+        except Exception as e:
+            logger.warning(f"Failed to share workflow state {workflow_id}: {e}")
+    
     async def get_shared_memory(self, key: str) -> Optional[Any]:
         """
         Get value from shared memory across agents.
@@ -739,18 +830,39 @@ class AgentCoreClient:
         Returns:
             Value from shared memory or None
         """
-        return self._shared_memory.get(key)
+        entry = await self.shared_memory.get(key)
+        return entry[1] if entry is not None else None
+    
+    async def get_shared_memory_versioned(self, key: str) -> Optional[Tuple[int, Any]]:
+        """
+        Get a value together with its version stamp.
+        
+        Args:
+            key: Memory key
+            
+        Returns:
+            (version, value) or None
+        """
+        return await self.shared_memory.get(key)
     
-    async def set_shared_memory(self, key: str, value: Any) -> None:
+    async def set_shared_memory(self, key: str, value: Any, expected_version: Optional[int] = None) -> int:
         """
         Set value in shared memory across agents.
         
         Args:
             key: Memory key
             value: Value to store
+            expected_version: Only write if the key is still at this version
+            
+        Returns:
+            int: Version stamp of the stored value
+            
+        Raises:
+            SharedMemoryConflict: ``expected_version`` is no longer current
         """
-        self._shared_memory[key] = value
-        logger.debug(f"📝 Shared memory updated: {key}")
+        version = await self.shared_memory.set(key, value, expected_version)
+        logger.debug(f"📝 Shared memory updated: {key} (v{version})")
+        return version
     
     def get_coordination_stats(self) -> Dict[str, Any]:
         """
@@ -759,11 +871,15 @@ class AgentCoreClient:
         Returns:
             Dict containing coordination metrics
         """
+        shared_memory_stats = self.shared_memory.get_stats()
         return {
             "registered_agents": len(self._agent_registry),
             "active_workflows": len(self._workflow_states),
             "bedrock_agents_linked": len(self._bedrock_agent_ids),
-            "shared_memory_keys": len(self._shared_memory),
+            # Only backends that hold every key report a count (None for Redis,
+            # whose near-cache size is in the backend stats below)
+            "shared_memory_keys": shared_memory_stats.get("keys"),
+            "shared_memory": shared_memory_stats,
             "message_handlers": len(self._message_handlers),
             "real_bedrock_enabled": self.enable_real_bedrock_agents,
             "region": self.region_name
@@ -776,7 +892,8 @@ def create_agentcore_client(
     aws_access_key_id: Optional[str] = None,
     aws_secret_access_key: Optional[str] = None,
     aws_session_token: Optional[str] = None,
-    enable_real_bedrock_agents: bool = False
+    enable_real_bedrock_agents: bool = False,
+    shared_memory: Optional[SharedMemoryBackend] = None
 ) -> AgentCoreClient:
     """
     Create a new AgentCore client instance.
@@ -787,6 +904,7 @@ def create_agentcore_client(
         aws_secret_access_key: AWS secret key (optional)
         aws_session_token: AWS session token (optional)
         enable_real_bedrock_agents: Enable actual Bedrock Agents API calls (default: False)
+        shared_memory: Shared memory backend (process-local if omitted)
         
     Returns:
         AgentCoreClient: Configured AgentCore client instance
@@ -796,5 +914,6 @@ def create_agentcore_client(
         aws_access_key_id=aws_access_key_id,
         aws_secret_access_key=aws_secret_access_key,
         aws_session_token=aws_session_token,
-        enable_real_bedrock_agents=enable_real_bedrock_agents
+        enable_real_bedrock_agents=enable_real_bedrock_agents,
+        shared_memory=shared_memory
     )
@@ -8,10 +8,12 @@ import logging
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass
 from datetime import datetime, timezone, timedelta
-import boto3
 from botocore.exceptions import ClientError, BotoCoreError
 
 from riskintel360.config.settings import get_settings
+from riskintel360.utils.lazy_imports import lazy_import
+
+boto3 = lazy_import("boto3")
 
 logger = logging.getLogger(__name__)
 
@@ -8,11 +8,13 @@ import logging
 from datetime import datetime, timezone, timedelta
 from typing import Dict, List, Optional, Any, Union
 from dataclasses import dataclass
-import boto3
 from botocore.exceptions import ClientError, NoCredentialsError
 
 from riskintel360.config.settings import get_settings
 from riskintel360.auth.models import SecurityContext, AuditAction, ResourceType
+from riskintel360.utils.lazy_imports import lazy_import
+
+boto3 = lazy_import("boto3")
 
 logger = logging.getLogger(__name__)
 
@@ -9,7 +9,6 @@ import logging
 from typing import Dict, Any, Optional, List, Union
 from enum import Enum
 from dataclasses import dataclass
-import boto3
 from botocore.exceptions import ClientError, BotoCoreError
 from tenacity import (
     retry,
@@ -21,6 +20,9 @@ from tenacity import (
 
 from ..config.settings import get_settings
 from ..models.agent_models import AgentType
+from ..utils.lazy_imports import lazy_import
+
+boto3 = lazy_import("boto3")
 
 logger = logging.getLogger(__name__)
 
@@ -4,11 +4,17 @@ Implements caching strategies using AWS ElastiCache and Python decorators.
 """
 
 import asyncio
+import fnmatch
 import json
 import logging
 import hashlib
+import math
+import os
 import pickle
-from typing import Any, Optional, Dict, List, Callable, Union
+import random
+import uuid
+from collections import OrderedDict
+from typing import Any, Awaitable, Optional, Dict, List, Callable, Set, Union, Tuple
 from functools import wraps
 from datetime import datetime, timezone, timedelta
 import time
@@ -18,6 +24,18 @@ from riskintel360.config.settings import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Marks values stored by CachingService.get_or_compute together with their
+# recompute time and logical expiry
+_ENVELOPE_MARKER = "__riskintel360_cached__"
+
+# Compare-and-delete so a lock is only released by the holder that set it
+_RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
 
 class CacheStats:
     """Cache statistics tracking"""
@@ -30,6 +48,14 @@ class CacheStats:
         self.errors = 0
         self.total_time = 0.0
         self.start_time = time.time()
+        
+        # Per-tier counters (L1: in-process, L2: Redis)
+        self.l1_hits = 0
+        self.l1_misses = 0
+        self.l2_hits = 0
+        self.l2_misses = 0
+        self.l1_evictions = 0
+        self.invalidations_received = 0
     
     @property
     def hit_rate(self) -> float:
@@ -37,6 +63,18 @@ class CacheStats:
         total = self.hits + self.misses
         return (self.hits / total * 100) if total > 0 else 0.0
     
+    @property
+    def l1_hit_rate(self) -> float:
+        """Calculate in-process cache hit rate"""
+        total = self.l1_hits + self.l1_misses
+        return (self.l1_hits / total * 100) if total > 0 else 0.0
+    
+    @property
+    def l2_hit_rate(self) -> float:
+        """Calculate Redis hit rate for reads that missed L1"""
+        total = self.l2_hits + self.l2_misses
+        return (self.l2_hits / total * 100) if total > 0 else 0.0
+    
     @property
     def avg_response_time(self) -> float:
         """Calculate average response time"""
@@ -52,11 +90,93 @@ class CacheStats:
             'deletes': self.deletes,
             'errors': self.errors,
             'hit_rate': self.hit_rate,
+            'l1_hits': self.l1_hits,
+            'l1_misses': self.l1_misses,
+            'l1_hit_rate': self.l1_hit_rate,
+            'l1_evictions': self.l1_evictions,
+            'l2_hits': self.l2_hits,
+            'l2_misses': self.l2_misses,
+            'l2_hit_rate': self.l2_hit_rate,
+            'invalidations_received': self.invalidations_received,
             'avg_response_time': self.avg_response_time,
             'uptime_seconds': time.time() - self.start_time
         }
 
 
+class LocalCache:
+    """
+    Bounded in-process LRU cache of serialized values with per-entry expiry.
+    
+    Values are kept as the raw bytes read from Redis and deserialized on every
+    hit, so callers never share (and mutate) a cached object.
+    """
+    
+    def __init__(self, max_entries: int = 10000, max_bytes: int = 32 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[str, Tuple[Union[bytes, str], float]]" = OrderedDict()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+    
+    def get(self, key: str) -> Optional[Union[bytes, str]]:
+        """Get raw value if present and not expired"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        
+        raw, expires_at = entry
+        if expires_at <= time.monotonic():
+            self.pop(key)
+            return None
+        
+        self._entries.move_to_end(key)
+        return raw
+    
+    def put(self, key: str, raw: Union[bytes, str], ttl_seconds: float) -> bool:
+        """Store raw value for ttl_seconds, evicting least recently used entries"""
+        size = len(raw)
+        if ttl_seconds <= 0 or size > self.max_bytes:
+            return False
+        
+        self.pop(key)
+        while self._entries and (
+            len(self._entries) >= self.max_entries or self.current_bytes + size > self.max_bytes
+        ):
+            _, (evicted, _) = self._entries.popitem(last=False)
+            self.current_bytes -= len(evicted)
+            self.evictions += 1
+        
+        self._entries[key] = (raw, time.monotonic() + ttl_seconds)
+        self.current_bytes += size
+        return True
+    
+    def pop(self, key: str) -> bool:
+        """Remove a key"""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        self.current_bytes -= len(entry[0])
+        return True
+    
+    def pop_pattern(self, pattern: str) -> int:
+        """Remove keys matching a Redis-style glob pattern"""
+        matched = [key for key in self._entries if fnmatch.fnmatchcase(key, pattern)]
+        for key in matched:
+            self.pop(key)
+        return len(matched)
+    
+    def clear(self) -> None:
+        """Remove all keys"""
+        self._entries.clear()
+        self.current_bytes = 0
+
+
 class CacheKey:
     """Cache key generator and manager"""
     
@@ -82,13 +202,39 @@ class CacheKey:
 
 
 class CachingService:
-    """Main caching service with ElastiCache integration"""
+    """
+    Main caching service with ElastiCache integration.
+    
+    An optional in-process L1 cache sits in front of Redis. It only serves
+    reads while the invalidation listener is subscribed to the Redis pub/sub
+    channel on which every replica announces set, delete and clear_pattern,
+    and entries never outlive the remote TTL (or ``l1_max_ttl``).
+    """
+    
+    INVALIDATION_CHANNEL = "riskintel360:cache:invalidate"
     
     def __init__(self):
         self.settings = get_settings()
         self.pool_manager = get_connection_pool_manager()
         self.stats = CacheStats()
         
+        # In-process L1 cache
+        self.l1_enabled = os.getenv("CACHE_L1_ENABLED", "true").lower() == "true"
+        self.l1_max_ttl = float(os.getenv("CACHE_L1_MAX_TTL_SECONDS", "60"))
+        self.l1 = LocalCache(
+            max_entries=int(os.getenv("CACHE_L1_MAX_ENTRIES", "10000")),
+            max_bytes=int(os.getenv("CACHE_L1_MAX_BYTES", str(32 * 1024 * 1024)))
+        )
+        self.instance_id = str(uuid.uuid4())
+        self._l1_active = False
+        self._invalidation_epoch = 0
+        self._invalidation_task: Optional[asyncio.Task] = None
+        
+        # Stampede protection for get_or_compute
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._refreshing: Set[str] = set()
+        self._background_tasks: Set[asyncio.Task] = set()
+        
         # Default TTL values (in seconds)
         self.default_ttl = self.settings.database.redis_ttl_seconds
         self.ttl_config = {
@@ -105,22 +251,37 @@ class CachingService:
         start_time = time.time()
         
         try:
-            async with self.pool_manager.redis_pool.get_connection() as redis:
-                cached_data = await redis.get(key)
-                
-                if cached_data:
+            use_l1 = self._l1_active
+            if use_l1:
+                local_data = self.l1.get(key)
+                if local_data is not None:
                     self.stats.hits += 1
-                    # Try to deserialize as JSON first, then pickle
-                    try:
-                        return json.loads(cached_data)
-                    except (json.JSONDecodeError, TypeError):
-                        try:
-                            return pickle.loads(cached_data)
-                        except (pickle.PickleError, TypeError):
-                            return cached_data.decode('utf-8') if isinstance(cached_data, bytes) else cached_data
+                    self.stats.l1_hits += 1
+                    return self._deserialize(local_data)
+                self.stats.l1_misses += 1
+            
+            epoch = self._invalidation_epoch
+            async with self.pool_manager.redis_pool.get_connection() as redis:
+                if use_l1:
+                    pipe = redis.pipeline(transaction=False)
+                    pipe.get(key)
+                    pipe.pttl(key)
+                    cached_data, ttl_ms = await pipe.execute()
                 else:
-                    self.stats.misses += 1
-                    return None
+                    cached_data = await redis.get(key)
+                    ttl_ms = None
+            
+            if cached_data:
+                self.stats.hits += 1
+                self.stats.l2_hits += 1
+                # Skip L1 if an invalidation arrived while the read was in flight
+                if use_l1 and self._l1_active and epoch == self._invalidation_epoch:
+                    self._store_local(key, cached_data, ttl_ms)
+                return self._deserialize(cached_data)
+            else:
+                self.stats.misses += 1
+                self.stats.l2_misses += 1
+                return None
                     
         except Exception as e:
             self.stats.errors += 1
@@ -150,6 +311,7 @@ class CachingService:
             async with self.pool_manager.redis_pool.get_connection() as redis:
                 result = await redis.set(key, serialized_value, ex=ttl)
                 self.stats.sets += 1
+                await self._invalidate(redis, keys=[key])
                 return bool(result)
                 
         except Exception as e:
@@ -167,6 +329,7 @@ class CachingService:
             async with self.pool_manager.redis_pool.get_connection() as redis:
                 result = await redis.delete(key)
                 self.stats.deletes += 1
+                await self._invalidate(redis, keys=[key])
                 return bool(result)
                 
         except Exception as e:
@@ -190,11 +353,12 @@ class CachingService:
         try:
             async with self.pool_manager.redis_pool.get_connection() as redis:
                 keys = await redis.keys(pattern)
+                deleted = 0
                 if keys:
                     deleted = await redis.delete(*keys)
                     self.stats.deletes += deleted
-                    return deleted
-                return 0
+                await self._invalidate(redis, pattern=pattern)
+                return deleted
         except Exception as e:
             self.stats.errors += 1
             logger.error(f"Cache clear pattern error for {pattern}: {e}")
@@ -218,28 +382,335 @@ class CachingService:
             logger.error(f"Cache extend TTL error for key {key}: {e}")
             return False
     
+    async def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+        ttl: Optional[int] = None,
+        beta: float = 1.0,
+        stale_ttl: Optional[int] = None,
+        lock_timeout: float = 10.0
+    ) -> Any:
+        """
+        Get a cached value, computing it at most once per key on a miss.
+        
+        Concurrent misses in this process share one computation, and a short
+        Redis lock makes other processes wait for its result instead of
+        recomputing. Hot entries are refreshed in the background before they
+        expire (XFetch: the closer to expiry and the slower the computation,
+        the likelier a read triggers the refresh). With ``stale_ttl`` expired
+        entries are kept that much longer and served while a refresh runs.
+        
+        Args:
+            key: Cache key
+            compute: Coroutine function producing the value
+            ttl: Time to live in seconds
+            beta: Early refresh aggressiveness (0 disables refresh-ahead)
+            stale_ttl: Seconds an expired value may still be served (stale-while-revalidate)
+            lock_timeout: Lifetime of the distributed lock and maximum wait for its holder
+            
+        Returns:
+            Cached or freshly computed value (None results are not cached)
+        """
+        if ttl is None:
+            ttl = self.default_ttl
+        
+        stored = await self.get(key)
+        if stored is not None:
+            value, delta, expires_at = self._unwrap_cached(stored)
+            if expires_at is None:
+                return value
+            
+            now = time.time()
+            if now < expires_at:
+                if beta > 0 and delta > 0 and now - delta * beta * math.log(1.0 - random.random()) >= expires_at:
+                    self._refresh_in_background(key, compute, ttl, stale_ttl, lock_timeout)
+                return value
+            
+            if stale_ttl:
+                self._refresh_in_background(key, compute, ttl, stale_ttl, lock_timeout)
+                return value
+        
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._load(key, compute, ttl, stale_ttl, lock_timeout, wait=True))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _, key=key: self._inflight.pop(key, None))
+        
+        # Shield so a cancelled caller does not cancel the computation others are awaiting
+        return await asyncio.shield(task)
+    
+    async def acquire_lock(self, name: str, timeout: float) -> Optional[str]:
+        """
+        Acquire a short-lived distributed lock.
+        
+        Args:
+            name: Lock name
+            timeout: Lock lifetime in seconds
+            
+        Returns:
+            Lock token to pass to release_lock, or None if the lock is held elsewhere
+        """
+        token = str(uuid.uuid4())
+        async with self.pool_manager.redis_pool.get_connection() as redis:
+            acquired = await redis.set(f"lock:{name}", token, nx=True, px=max(1, int(timeout * 1000)))
+        return token if acquired else None
+    
+    async def release_lock(self, name: str, token: str) -> bool:
+        """Release a lock acquired with acquire_lock"""
+        try:
+            async with self.pool_manager.redis_pool.get_connection() as redis:
+                return bool(await redis.eval(_RELEASE_LOCK_SCRIPT, 1, f"lock:{name}", token))
+        except Exception as e:
+            logger.error(f"Cache lock release error for {name}: {e}")
+            return False
+    
+    async def _load(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+        ttl: int,
+        stale_ttl: Optional[int],
+        lock_timeout: float,
+        wait: bool
+    ) -> Any:
+        """Compute and store a value under the distributed lock"""
+        token = await self._try_acquire_lock(key, lock_timeout)
+        if token is None:
+            if not wait:
+                return None
+            
+            # Another process is computing: wait for its result or for the lock
+            deadline = time.monotonic() + lock_timeout
+            delay = 0.05
+            while time.monotonic() < deadline:
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 0.5)
+                
+                stored = await self.get(key)
+                if stored is not None:
+                    value, _, expires_at = self._unwrap_cached(stored)
+                    if expires_at is None or time.time() < expires_at:
+                        return value
+                
+                token = await self._try_acquire_lock(key, lock_timeout)
+                if token is not None:
+                    break
+            else:
+                logger.warning(f"Timed out waiting for cache lock on {key}; computing anyway")
+        
+        try:
+            start_time = time.monotonic()
+            value = await compute()
+            delta = time.monotonic() - start_time
+            
+            if value is not None:
+                await self.set(
+                    key,
+                    self._wrap_cached(value, delta, time.time() + ttl),
+                    ttl + (stale_ttl or 0)
+                )
+            return value
+        finally:
+            if token:
+                await self.release_lock(key, token)
+    
+    async def _try_acquire_lock(self, key: str, lock_timeout: float) -> Optional[str]:
+        """Acquire the computation lock, failing open when Redis is unavailable"""
+        try:
+            return await self.acquire_lock(key, lock_timeout)
+        except Exception as e:
+            logger.warning(f"Cache lock unavailable for {key}, computing without it: {e}")
+            return ""
+    
+    def _refresh_in_background(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+        ttl: int,
+        stale_ttl: Optional[int],
+        lock_timeout: float
+    ) -> None:
+        if key in self._refreshing or key in self._inflight:
+            return
+        
+        self._refreshing.add(key)
+        task = asyncio.ensure_future(self._load(key, compute, ttl, stale_ttl, lock_timeout, wait=False))
+        self._background_tasks.add(task)
+        task.add_done_callback(lambda done, key=key: self._refresh_done(key, done))
+    
+    def _refresh_done(self, key: str, task: asyncio.Task) -> None:
+        self._refreshing.discard(key)
+        self._background_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Cache refresh failed for key {key}: {task.exception()}")
+    
+    @staticmethod
+    def _wrap_cached(value: Any, delta: float, expires_at: float) -> Any:
+        """Attach refresh metadata to JSON-serializable values; other values are stored as-is"""
+        if not isinstance(value, (dict, list, str, int, float, bool)):
+            return value
+        return {_ENVELOPE_MARKER: 1, 'value': value, 'delta': delta, 'expires_at': expires_at}
+    
+    @staticmethod
+    def _unwrap_cached(stored: Any) -> Tuple[Any, float, Optional[float]]:
+        """Split a stored value into (value, recompute seconds, logical expiry)"""
+        if isinstance(stored, dict) and stored.get(_ENVELOPE_MARKER) == 1:
+            return stored.get('value'), float(stored.get('delta', 0.0)), stored.get('expires_at')
+        return stored, 0.0, None
+    
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics"""
-        return self.stats.to_dict()
+        self.stats.l1_evictions = self.l1.evictions
+        return {
+            **self.stats.to_dict(),
+            'l1_active': self._l1_active,
+            'l1_entries': len(self.l1),
+            'l1_bytes': self.l1.current_bytes
+        }
     
     def reset_stats(self) -> None:
         """Reset cache statistics"""
         self.stats = CacheStats()
+        self.l1.evictions = 0
+    
+    async def start_invalidation_listener(self) -> None:
+        """Start the pub/sub listener that enables the L1 cache"""
+        if not self.l1_enabled or (self._invalidation_task and not self._invalidation_task.done()):
+            return
+        self._invalidation_task = asyncio.create_task(self._invalidation_listener())
+    
+    async def stop_invalidation_listener(self) -> None:
+        """Stop the pub/sub listener and drop the L1 cache"""
+        task, self._invalidation_task = self._invalidation_task, None
+        if task:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._deactivate_l1()
+    
+    async def _invalidation_listener(self) -> None:
+        """Apply invalidations published by other replicas, resubscribing on failure"""
+        backoff = 1.0
+        while True:
+            pubsub = None
+            try:
+                async with self.pool_manager.redis_pool.get_connection() as redis:
+                    pubsub = redis.pubsub(ignore_subscribe_messages=True)
+                await pubsub.subscribe(self.INVALIDATION_CHANNEL)
+                
+                # Anything cached before subscribing may have missed invalidations
+                self.l1.clear()
+                self._l1_active = True
+                backoff = 1.0
+                logger.info("L1 cache enabled; listening for cache invalidations")
+                
+                async for message in pubsub.listen():
+                    if message.get('type') == 'message':
+                        self._handle_invalidation_message(message.get('data'))
+                        
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Cache invalidation listener error, L1 cache disabled: {e}")
+            finally:
+                self._deactivate_l1()
+                if pubsub is not None:
+                    try:
+                        await pubsub.aclose()
+                    except Exception:
+                        pass
+            
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, 30.0)
+    
+    def _handle_invalidation_message(self, data: Union[bytes, str, None]) -> None:
+        """Apply one invalidation message from the pub/sub channel"""
+        try:
+            message = json.loads(data)
+        except (json.JSONDecodeError, TypeError):
+            logger.warning(f"Ignoring malformed cache invalidation message: {data!r}")
+            return
+        
+        if message.get('origin') == self.instance_id:
+            return
+        
+        self.stats.invalidations_received += 1
+        self._invalidate_local(keys=message.get('keys'), pattern=message.get('pattern'))
+    
+    async def _invalidate(self, redis: Any, keys: Optional[List[str]] = None, pattern: Optional[str] = None) -> None:
+        """Drop keys from this replica's L1 and announce the change to the others"""
+        self._invalidate_local(keys=keys, pattern=pattern)
+        if not self.l1_enabled:
+            return
+        
+        message = {'origin': self.instance_id}
+        if keys is not None:
+            message['keys'] = keys
+        if pattern is not None:
+            message['pattern'] = pattern
+        
+        try:
+            await redis.publish(self.INVALIDATION_CHANNEL, json.dumps(message))
+        except Exception as e:
+            logger.error(f"Cache invalidation publish error: {e}")
+    
+    def _invalidate_local(self, keys: Optional[List[str]] = None, pattern: Optional[str] = None) -> None:
+        self._invalidation_epoch += 1
+        for key in keys or []:
+            self.l1.pop(key)
+        if pattern is not None:
+            self.l1.pop_pattern(pattern)
+    
+    def _deactivate_l1(self) -> None:
+        self._l1_active = False
+        self._invalidation_epoch += 1
+        self.l1.clear()
+    
+    def _store_local(self, key: str, raw: Union[bytes, str], ttl_ms: Optional[int]) -> None:
+        """Cache a Redis value in L1 for no longer than its remaining TTL"""
+        if ttl_ms is None or ttl_ms == -2:
+            return
+        ttl_seconds = self.l1_max_ttl if ttl_ms == -1 else min(ttl_ms / 1000.0, self.l1_max_ttl)
+        self.l1.put(key, raw, ttl_seconds)
+    
+    @staticmethod
+    def _deserialize(cached_data: Union[bytes, str]) -> Any:
+        # Try to deserialize as JSON first, then pickle
+        try:
+            return json.loads(cached_data)
+        except (json.JSONDecodeError, TypeError):
+            try:
+                return pickle.loads(cached_data)
+            except (pickle.PickleError, TypeError):
+                return cached_data.decode('utf-8') if isinstance(cached_data, bytes) else cached_data
 
 
 # Caching decorators
 def cached(
     prefix: str,
     ttl: Optional[int] = None,
-    key_func: Optional[Callable] = None
+    key_func: Optional[Callable] = None,
+    beta: float = 1.0,
+    stale_ttl: Optional[int] = None,
+    lock_timeout: float = 10.0
 ):
     """
     Decorator for caching function results
     
+    Concurrent misses for the same key run the function once (see
+    CachingService.get_or_compute), and hot entries are refreshed before
+    they expire.
+    
     Args:
         prefix: Cache key prefix
         ttl: Time to live in seconds
         key_func: Custom function to generate cache key
+        beta: Early refresh aggressiveness (0 disables refresh-ahead)
+        stale_ttl: Serve expired results this many seconds longer while refreshing
+        lock_timeout: Distributed lock lifetime in seconds
     """
     def decorator(func: Callable) -> Callable:
         @wraps(func)
@@ -252,21 +723,15 @@ def cached(
             else:
                 cache_key = CacheKey.generate(prefix, *args, **kwargs)
             
-            # Try to get from cache
-            cached_result = await cache_service.get(cache_key)
-            if cached_result is not None:
-                logger.debug(f"Cache hit for key: {cache_key}")
-                return cached_result
-            
-            # Execute function
-            logger.debug(f"Cache miss for key: {cache_key}")
-            result = await func(*args, **kwargs)
-            
-            # Cache the result
             cache_ttl = ttl or cache_service.ttl_config.get(prefix, cache_service.default_ttl)
-            await cache_service.set(cache_key, result, cache_ttl)
-            
-            return result
+            return await cache_service.get_or_compute(
+                cache_key,
+                lambda: func(*args, **kwargs),
+                ttl=cache_ttl,
+                beta=beta,
+                stale_ttl=stale_ttl,
+                lock_timeout=lock_timeout
+            )
         
         return wrapper
     return decorator
@@ -394,8 +859,14 @@ class CacheManager:
     async def initialize(self) -> None:
         """Initialize cache manager"""
         await self.cache_service.pool_manager.initialize_all()
+        await self.cache_service.start_invalidation_listener()
         logger.info("Cache manager initialized")
     
+    async def shutdown(self) -> None:
+        """Stop background cache work"""
+        await self.cache_service.stop_invalidation_listener()
+        logger.info("Cache manager shutdown completed")
+    
     async def health_check(self) -> Dict[str, Any]:
         """Perform cache health check"""
         try:
@@ -14,7 +14,6 @@ from enum import Enum
 import logging
 
 from ..models.core import ValidationRequest, ValidationResult, Priority, Recommendation
-from ..services.workflow_orchestrator import WorkflowOrchestrator
 from ..services.bedrock_client import BedrockClient
 from ..services.agentcore_client import AgentCoreClient
 
@@ -98,7 +97,7 @@ class CompetitionDemoService:
                 )
                 
                 # Initialize workflow orchestrator with supervisor agent
-                from .workflow_orchestrator import SupervisorAgent, WorkflowConfig
+                from .workflow_orchestrator import SupervisorAgent, WorkflowConfig, WorkflowOrchestrator
                 supervisor_agent = SupervisorAgent(
                     agentcore_client=self.agentcore_client,
                     bedrock_client=self.bedrock_client,
@@ -148,7 +147,7 @@ class CompetitionDemoService:
                 )
                 
                 # Initialize workflow orchestrator with supervisor agent
-                from .workflow_orchestrator import SupervisorAgent, WorkflowConfig
+                from .workflow_orchestrator import SupervisorAgent, WorkflowConfig, WorkflowOrchestrator
                 supervisor_agent = SupervisorAgent(
                     agentcore_client=self.agentcore_client,
                     bedrock_client=self.bedrock_client,
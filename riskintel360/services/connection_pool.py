@@ -11,8 +11,6 @@ import time
 from dataclasses import dataclass
 from datetime import datetime, timezone, timedelta
 
-import boto3
-import aioboto3
 from botocore.exceptions import ClientError
 import asyncpg
 from asyncpg import Pool as AsyncPGPool
@@ -20,6 +18,10 @@ import redis.asyncio as aioredis
 from redis.asyncio import Redis
 
 from riskintel360.config.settings import get_settings
+from riskintel360.utils.lazy_imports import lazy_import
+
+aioboto3 = lazy_import("aioboto3")
+boto3 = lazy_import("boto3")
 
 logger = logging.getLogger(__name__)
 
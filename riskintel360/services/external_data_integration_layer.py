@@ -25,14 +25,16 @@ from enum import Enum
 from typing import Any, Dict, List, Optional, Union, Callable, Tuple
 from urllib.parse import urljoin
 
-import aiohttp
-import boto3
 from botocore.exceptions import ClientError, NoCredentialsError
 from pydantic import BaseModel, Field, field_validator
 
 from riskintel360.config.settings import get_settings
 from riskintel360.config.environment import get_environment_config, is_cloud_deployment
 from riskintel360.config.aws_config import get_aws_client_manager
+from riskintel360.services.http_client import get_http_client
+from riskintel360.utils.lazy_imports import lazy_import
+
+boto3 = lazy_import("boto3")
 
 logger = logging.getLogger(__name__)
 
@@ -759,14 +761,14 @@ class ExternalDataSource(ABC):
         
         # Make HTTP request
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, params=params, headers=request_headers) as response:
-                    if response.status == 200:
-                        self.rate_limiter.record_success()
-                        return await response.json()
-                    else:
-                        self.rate_limiter.record_failure()
-                        raise Exception(f"HTTP {response.status}: {await response.text()}")
+            # Shared keep-alive pool; the rate limiter above owns retry pacing
+            response = await get_http_client().get(url, params=params, headers=request_headers, retries=0)
+            if response.status == 200:
+                self.rate_limiter.record_success()
+                return response.json()
+            else:
+                self.rate_limiter.record_failure()
+                raise Exception(f"HTTP {response.status}: {response.text}")
         except Exception as e:
             self.rate_limiter.record_failure()
             logger.error(f"Request failed for {self.name}: {e}")
@@ -0,0 +1,208 @@
+"""
+Shared HTTP Client for RiskIntel360 Platform
+Pooled aiohttp session with keep-alive, per-host connection limits,
+timeouts and retries for outbound HTTP calls.
+"""
+
+import asyncio
+import json
+import logging
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class HTTPClientConfig:
+    """Configuration for the pooled HTTP client"""
+    total_timeout: float = 30.0
+    connect_timeout: float = 5.0
+    max_connections: int = 100
+    max_connections_per_host: int = 10  # Each AgentCore agent is its own host:port
+    keepalive_timeout: float = 30.0
+    max_retries: int = 2
+    backoff_base: float = 0.25
+    retry_statuses: Tuple[int, ...] = (429, 502, 503, 504)
+    # Methods safe to resend after the request may have reached the server
+    idempotent_methods: Tuple[str, ...] = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE")
+
+
+@dataclass
+class HTTPResponse:
+    """Fully read HTTP response; the connection is already back in the pool"""
+    status: int
+    body: bytes
+    headers: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def status_code(self) -> int:
+        return self.status
+
+    @property
+    def text(self) -> str:
+        return self.body.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        return json.loads(self.body)
+
+
+class PooledHTTPClient:
+    """
+    Async HTTP client sharing one connection pool across callers.
+
+    The session is created lazily on first use (and again if the event loop
+    changes), so the client can be constructed at import time.
+    """
+
+    def __init__(self, config: Optional[HTTPClientConfig] = None):
+        """
+        Initialize the HTTP client.
+
+        Args:
+            config: Client configuration
+        """
+        self.config = config or HTTPClientConfig()
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        self.stats = {
+            "requests": 0,
+            "retries": 0,
+            "failures": 0,
+            "total_time": 0.0,
+        }
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            connector = aiohttp.TCPConnector(
+                limit=self.config.max_connections,
+                limit_per_host=self.config.max_connections_per_host,
+                keepalive_timeout=self.config.keepalive_timeout
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(
+                    total=self.config.total_timeout,
+                    connect=self.config.connect_timeout
+                )
+            )
+            self._session_loop = loop
+        return self._session
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        timeout: Optional[float] = None,
+        retries: Optional[int] = None,
+        **kwargs: Any
+    ) -> HTTPResponse:
+        """
+        Send a request, retrying connection errors, timeouts and retryable statuses.
+
+        Non-idempotent requests (e.g. POST) are not retried unless the caller
+        passes ``retries``, and even then only when the connection could not
+        be established, so a request the server may have processed is never
+        sent twice.
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            timeout: Total timeout in seconds for each attempt (client default if omitted)
+            retries: Retry budget (client default for idempotent methods, 0 otherwise)
+            **kwargs: Passed to ``aiohttp.ClientSession.request`` (json, params, headers, ...)
+
+        Returns:
+            HTTPResponse with the body read
+
+        Raises:
+            aiohttp.ClientError or asyncio.TimeoutError once retries are exhausted
+        """
+        idempotent = method.upper() in self.config.idempotent_methods
+        if retries is not None:
+            max_retries = retries
+        else:
+            max_retries = self.config.max_retries if idempotent else 0
+        retryable_errors = (
+            (aiohttp.ClientConnectionError, asyncio.TimeoutError) if idempotent
+            else (aiohttp.ClientConnectorError,)
+        )
+        if timeout is not None:
+            kwargs["timeout"] = aiohttp.ClientTimeout(total=timeout, connect=min(timeout, self.config.connect_timeout))
+
+        session = await self._get_session()
+        start_time = time.time()
+        attempt = 0
+
+        try:
+            while True:
+                try:
+                    async with session.request(method, url, **kwargs) as response:
+                        body = await response.read()
+                        result = HTTPResponse(response.status, body, dict(response.headers))
+
+                    if not idempotent or result.status not in self.config.retry_statuses or attempt >= max_retries:
+                        return result
+
+                except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                    if attempt >= max_retries or not isinstance(e, retryable_errors):
+                        self.stats["failures"] += 1
+                        raise
+
+                attempt += 1
+                self.stats["retries"] += 1
+                # Exponential backoff with jitter so retries from parallel agents spread out
+                await asyncio.sleep(self.config.backoff_base * (2 ** (attempt - 1)) * (0.5 + random.random()))
+        finally:
+            self.stats["requests"] += 1
+            self.stats["total_time"] += time.time() - start_time
+
+    async def get(self, url: str, **kwargs: Any) -> HTTPResponse:
+        """Send a GET request"""
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs: Any) -> HTTPResponse:
+        """Send a POST request"""
+        return await self.request("POST", url, **kwargs)
+
+    async def close(self) -> None:
+        """Close the pooled session"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get client statistics"""
+        requests = self.stats["requests"]
+        return {
+            **self.stats,
+            "avg_request_time": self.stats["total_time"] / requests if requests else 0.0,
+        }
+
+
+# Global HTTP client instance
+_http_client: Optional[PooledHTTPClient] = None
+
+
+def get_http_client() -> PooledHTTPClient:
+    """Get the shared HTTP client"""
+    global _http_client
+
+    if _http_client is None:
+        _http_client = PooledHTTPClient()
+
+    return _http_client
+
+
+async def shutdown_http_client() -> None:
+    """Close the shared HTTP client"""
+    global _http_client
+
+    if _http_client:
+        await _http_client.close()
+        _http_client = None
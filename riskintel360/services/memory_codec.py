@@ -0,0 +1,175 @@
+"""
+Memory Codec for RiskIntel360 Platform
+Versioned binary encoding of agent memory records (MessagePack with optional
+zstd/zlib compression) that still reads values stored as plain JSON.
+"""
+
+import json
+import logging
+import zlib
+from typing import Any, Optional, Union
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - exercised only without msgpack installed
+    msgpack = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+# Header: MAGIC, version, flags. 0xC1 is never used by MessagePack and can
+# never start a JSON document, so legacy values are recognised unambiguously.
+MAGIC = b"\xc1"
+CODEC_VERSION = 1
+
+FORMAT_MSGPACK = 0x01
+FORMAT_JSON = 0x02
+FORMAT_MASK = 0x0F
+
+COMPRESSION_ZLIB = 0x10
+COMPRESSION_ZSTD = 0x20
+COMPRESSION_MASK = 0xF0
+
+
+class MemoryCodecError(ValueError):
+    """Raised when a stored value cannot be decoded"""
+
+
+class MemoryCodec:
+    """
+    Encoder/decoder for values kept in the memory backends.
+
+    Values are packed with MessagePack (JSON when msgpack is not installed)
+    behind a three-byte header. Payloads above ``compression_threshold``
+    bytes are compressed with zstd when available, otherwise zlib, and kept
+    compressed only if that actually saves space. ``decode`` also accepts
+    headerless JSON written before the codec existed.
+    """
+
+    def __init__(
+        self,
+        compression_threshold: int = 1024,
+        compression: str = "auto",
+        compression_level: int = 3
+    ):
+        """
+        Initialize the codec.
+
+        Args:
+            compression_threshold: Minimum payload size in bytes before compressing
+            compression: "auto" (zstd if installed, else zlib), "zstd", "zlib" or "none"
+            compression_level: Compression level passed to the compressor
+        """
+        if compression == "auto":
+            compression = "zstd" if zstandard is not None else "zlib"
+        if compression not in ("zstd", "zlib", "none"):
+            raise ValueError(f"Unknown compression: {compression}")
+        if compression == "zstd" and zstandard is None:
+            raise ValueError("zstd compression requires the zstandard package")
+
+        self.compression_threshold = compression_threshold
+        self.compression = compression
+        self.compression_level = compression_level
+
+    def encode(self, value: Any) -> bytes:
+        """
+        Encode a value.
+
+        Args:
+            value: JSON-like value (unknown types are stringified)
+
+        Returns:
+            Header-prefixed encoded bytes
+        """
+        if msgpack is not None:
+            flags = FORMAT_MSGPACK
+            payload = msgpack.packb(value, use_bin_type=True, default=str)
+        else:
+            flags = FORMAT_JSON
+            payload = json.dumps(value, default=str, separators=(",", ":")).encode("utf-8")
+
+        if self.compression != "none" and len(payload) >= self.compression_threshold:
+            if self.compression == "zstd":
+                compressed = zstandard.ZstdCompressor(level=self.compression_level).compress(payload)
+                compression_flag = COMPRESSION_ZSTD
+            else:
+                compressed = zlib.compress(payload, self.compression_level)
+                compression_flag = COMPRESSION_ZLIB
+
+            if len(compressed) < len(payload):
+                flags |= compression_flag
+                payload = compressed
+
+        return MAGIC + bytes((CODEC_VERSION, flags)) + payload
+
+    def decode(self, raw: Union[bytes, bytearray, str]) -> Any:
+        """
+        Decode a value written by ``encode`` or as legacy JSON.
+
+        Args:
+            raw: Stored bytes (or a legacy JSON string)
+
+        Returns:
+            Decoded value
+
+        Raises:
+            MemoryCodecError: If the value is malformed or needs an unavailable decoder
+        """
+        if isinstance(raw, str) or raw[:1] != MAGIC:
+            try:
+                return json.loads(raw)
+            except ValueError as e:
+                raise MemoryCodecError(f"Invalid legacy JSON value: {e}") from e
+
+        if len(raw) < 3:
+            raise MemoryCodecError("Truncated memory value header")
+
+        version, flags = raw[1], raw[2]
+        if version > CODEC_VERSION:
+            raise MemoryCodecError(f"Unsupported memory codec version {version}")
+
+        payload = bytes(raw[3:])
+        compression = flags & COMPRESSION_MASK
+        try:
+            if compression == COMPRESSION_ZSTD:
+                if zstandard is None:
+                    raise MemoryCodecError("Value is zstd-compressed but zstandard is not installed")
+                payload = zstandard.ZstdDecompressor().decompress(payload)
+            elif compression == COMPRESSION_ZLIB:
+                payload = zlib.decompress(payload)
+            elif compression:
+                raise MemoryCodecError(f"Unknown compression flag {compression:#x}")
+
+            value_format = flags & FORMAT_MASK
+            if value_format == FORMAT_MSGPACK:
+                if msgpack is None:
+                    raise MemoryCodecError("Value is MessagePack-encoded but msgpack is not installed")
+                return msgpack.unpackb(payload, raw=False, strict_map_key=False)
+            if value_format == FORMAT_JSON:
+                return json.loads(payload)
+            raise MemoryCodecError(f"Unknown value format {value_format:#x}")
+
+        except MemoryCodecError:
+            raise
+        except Exception as e:
+            raise MemoryCodecError(f"Failed to decode memory value: {e}") from e
+
+
+_default_codec: Optional[MemoryCodec] = None
+
+
+def get_memory_codec() -> MemoryCodec:
+    """
+    Get the process-wide default codec.
+
+    Returns:
+        MemoryCodec: Codec with default settings
+    """
+    global _default_codec
+    if _default_codec is None:
+        _default_codec = MemoryCodec()
+    return _default_codec
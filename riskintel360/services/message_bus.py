@@ -0,0 +1,434 @@
+"""
+Agent Message Bus for RiskIntel360 Platform
+Cross-process transport for AgentCommunicationManager: per-agent inboxes,
+a shared agent directory and topic subscriptions, so agents hosted by
+different worker processes or nodes can message each other.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, List, Optional, Set, Tuple
+
+import redis.asyncio as redis
+from redis.exceptions import ResponseError
+
+from ..models.agent_models import AgentMessage
+
+logger = logging.getLogger(__name__)
+
+# (agent_id, delivery_id, message) as returned by receive()
+BusDelivery = Tuple[str, str, AgentMessage]
+
+
+def encode_message(message: AgentMessage) -> str:
+    """Serialize a message for the wire"""
+    return json.dumps(message.to_dict(), default=str)
+
+
+def decode_message(payload: str) -> AgentMessage:
+    """Deserialize a message read from the wire"""
+    return AgentMessage(**json.loads(payload))
+
+
+class MessageBusTransport(ABC):
+    """
+    Transport carrying agent messages between processes.
+
+    Every agent has an inbox. ``send`` writes each message to its
+    ``recipient_id`` inbox; the process hosting that agent reads it with
+    ``receive`` and must ``ack`` it once it is queued locally. Deliveries
+    that are not acknowledged within ``visibility_timeout`` seconds are
+    handed out again (at-least-once). Senders are slowed down while a
+    recipient's inbox is above ``max_inbox_length``.
+    """
+
+    def __init__(self, visibility_timeout: float = 30.0, max_inbox_length: int = 10000):
+        self.visibility_timeout = visibility_timeout
+        self.max_inbox_length = max_inbox_length
+        self.node_id = uuid.uuid4().hex
+        self.stats = {
+            "sent": 0,
+            "send_batches": 0,
+            "received": 0,
+            "redelivered": 0,
+            "acked": 0,
+            "throttled": 0,
+        }
+
+    @abstractmethod
+    async def connect(self) -> bool:
+        """Connect to the transport"""
+        pass
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Release connections"""
+        pass
+
+    @abstractmethod
+    async def register_agent(self, agent_id: str) -> None:
+        """Announce that this process hosts ``agent_id`` and create its inbox"""
+        pass
+
+    @abstractmethod
+    async def unregister_agent(self, agent_id: str) -> None:
+        """Remove ``agent_id`` from the directory and its topic subscriptions"""
+        pass
+
+    @abstractmethod
+    async def registered_agents(self) -> Set[str]:
+        """All agents registered by any process"""
+        pass
+
+    @abstractmethod
+    async def subscribe(self, agent_id: str, topic: str) -> None:
+        """Add ``agent_id`` to a topic's subscribers"""
+        pass
+
+    @abstractmethod
+    async def unsubscribe(self, agent_id: str, topic: str) -> None:
+        """Remove ``agent_id`` from a topic's subscribers"""
+        pass
+
+    @abstractmethod
+    async def subscribers(self, topic: str) -> Set[str]:
+        """Subscribers of a topic across all processes"""
+        pass
+
+    @abstractmethod
+    async def send(self, messages: List[AgentMessage]) -> None:
+        """Write a batch of messages to their recipients' inboxes"""
+        pass
+
+    @abstractmethod
+    async def receive(self, agent_ids: Iterable[str], count: int = 100, block_ms: int = 1000) -> List[BusDelivery]:
+        """Read up to ``count`` messages for the given local agents"""
+        pass
+
+    @abstractmethod
+    async def ack(self, deliveries: List[Tuple[str, str]]) -> None:
+        """Acknowledge (agent_id, delivery_id) pairs in one batch"""
+        pass
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Transport statistics"""
+        return {**self.stats, "node_id": self.node_id}
+
+
+class InMemoryMessageBus(MessageBusTransport):
+    """
+    In-process transport for tests and single-node development.
+
+    Transports created with the same ``hub`` behave like processes sharing
+    one bus. Messages are serialized exactly as on the wire.
+    """
+
+    class Hub:
+        """State shared by every transport attached to one in-memory bus"""
+
+        def __init__(self):
+            self.agents: Set[str] = set()
+            self.topics: Dict[str, Set[str]] = {}
+            self.inboxes: Dict[str, Deque[Tuple[str, str]]] = {}
+            # agent_id -> delivery_id -> (payload, redelivery deadline)
+            self.pending: Dict[str, Dict[str, Tuple[str, float]]] = {}
+            self.event = asyncio.Event()
+
+    def __init__(self, hub: Optional["InMemoryMessageBus.Hub"] = None, **kwargs: Any):
+        super().__init__(**kwargs)
+        self.hub = hub or InMemoryMessageBus.Hub()
+
+    async def connect(self) -> bool:
+        return True
+
+    async def close(self) -> None:
+        pass
+
+    async def register_agent(self, agent_id: str) -> None:
+        self.hub.agents.add(agent_id)
+        self.hub.inboxes.setdefault(agent_id, deque())
+        self.hub.pending.setdefault(agent_id, {})
+
+    async def unregister_agent(self, agent_id: str) -> None:
+        self.hub.agents.discard(agent_id)
+        for subscribers in self.hub.topics.values():
+            subscribers.discard(agent_id)
+
+    async def registered_agents(self) -> Set[str]:
+        return set(self.hub.agents)
+
+    async def subscribe(self, agent_id: str, topic: str) -> None:
+        self.hub.topics.setdefault(topic, set()).add(agent_id)
+
+    async def unsubscribe(self, agent_id: str, topic: str) -> None:
+        self.hub.topics.get(topic, set()).discard(agent_id)
+
+    async def subscribers(self, topic: str) -> Set[str]:
+        return set(self.hub.topics.get(topic, set()))
+
+    async def send(self, messages: List[AgentMessage]) -> None:
+        if not messages:
+            return
+        longest = 0
+        for message in messages:
+            inbox = self.hub.inboxes.setdefault(message.recipient_id, deque())
+            inbox.append((uuid.uuid4().hex, encode_message(message)))
+            longest = max(longest, len(inbox))
+        self.stats["sent"] += len(messages)
+        self.stats["send_batches"] += 1
+        self.hub.event.set()
+
+        if longest > self.max_inbox_length:
+            self.stats["throttled"] += 1
+            await asyncio.sleep(0.01 * longest / self.max_inbox_length)
+
+    async def receive(self, agent_ids: Iterable[str], count: int = 100, block_ms: int = 1000) -> List[BusDelivery]:
+        agent_ids = list(agent_ids)
+        deadline = time.monotonic() + block_ms / 1000
+
+        while True:
+            self.hub.event.clear()
+            deliveries = self._take(agent_ids, count)
+            remaining = deadline - time.monotonic()
+            if deliveries or remaining <= 0:
+                return deliveries
+            try:
+                await asyncio.wait_for(self.hub.event.wait(), timeout=remaining)
+            except asyncio.TimeoutError:
+                pass
+
+    def _take(self, agent_ids: List[str], count: int) -> List[BusDelivery]:
+        now = time.monotonic()
+        deliveries: List[BusDelivery] = []
+
+        for agent_id in agent_ids:
+            if len(deliveries) >= count:
+                break
+            pending = self.hub.pending.setdefault(agent_id, {})
+            # Hand out deliveries whose consumer never acknowledged them
+            for delivery_id, (payload, expires) in list(pending.items()):
+                if len(deliveries) >= count:
+                    break
+                if expires <= now:
+                    pending[delivery_id] = (payload, now + self.visibility_timeout)
+                    deliveries.append((agent_id, delivery_id, decode_message(payload)))
+                    self.stats["redelivered"] += 1
+
+            inbox = self.hub.inboxes.get(agent_id)
+            while inbox and len(deliveries) < count:
+                delivery_id, payload = inbox.popleft()
+                pending[delivery_id] = (payload, now + self.visibility_timeout)
+                deliveries.append((agent_id, delivery_id, decode_message(payload)))
+
+        self.stats["received"] += len(deliveries)
+        return deliveries
+
+    async def ack(self, deliveries: List[Tuple[str, str]]) -> None:
+        for agent_id, delivery_id in deliveries:
+            self.hub.pending.get(agent_id, {}).pop(delivery_id, None)
+        self.stats["acked"] += len(deliveries)
+
+
+class RedisMessageBus(MessageBusTransport):
+    """
+    Redis Streams transport.
+
+    Each agent's inbox is a stream read through one consumer group, so
+    several processes hosting the same agent share its traffic. Entries idle
+    in the pending list past the visibility timeout are reclaimed with
+    XAUTOCLAIM. Sends and acks are pipelined per batch, and the agent
+    directory is cached for ``directory_ttl`` seconds.
+    """
+
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 6379,
+        db: int = 0,
+        password: Optional[str] = None,
+        prefix: str = "riskintel360:agent_bus",
+        group: str = "agents",
+        visibility_timeout: float = 30.0,
+        max_inbox_length: int = 10000,
+        directory_ttl: float = 2.0,
+        client: Optional[Any] = None
+    ):
+        super().__init__(visibility_timeout, max_inbox_length)
+        self.host = host
+        self.port = port
+        self.db = db
+        self.password = password
+        self.prefix = prefix
+        self.group = group
+        self.directory_ttl = directory_ttl
+        self.client = client
+
+        self._directory: Optional[Set[str]] = None
+        self._directory_loaded_at = 0.0
+        self._topic_cache: Dict[str, Tuple[float, Set[str]]] = {}
+        self._last_autoclaim = 0.0
+
+    def _inbox(self, agent_id: str) -> str:
+        return f"{self.prefix}:inbox:{agent_id}"
+
+    def _topic_key(self, topic: str) -> str:
+        return f"{self.prefix}:topic:{topic}"
+
+    async def connect(self) -> bool:
+        try:
+            if self.client is None:
+                self.client = redis.Redis(
+                    host=self.host,
+                    port=self.port,
+                    db=self.db,
+                    password=self.password,
+                    decode_responses=True
+                )
+            await self.client.ping()
+            logger.info(f"??Agent message bus connected to Redis ({self.prefix})")
+            return True
+
+        except Exception as e:
+            logger.error(f"??Failed to connect agent message bus: {e}")
+            return False
+
+    async def close(self) -> None:
+        if self.client:
+            await self.client.close()
+
+    async def register_agent(self, agent_id: str) -> None:
+        try:
+            await self.client.xgroup_create(self._inbox(agent_id), self.group, id="0", mkstream=True)
+        except ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+        await self.client.sadd(f"{self.prefix}:agents", agent_id)
+        self._directory = None
+
+    async def unregister_agent(self, agent_id: str) -> None:
+        await self.client.srem(f"{self.prefix}:agents", agent_id)
+        self._directory = None
+
+    async def registered_agents(self) -> Set[str]:
+        now = time.monotonic()
+        if self._directory is None or now - self._directory_loaded_at > self.directory_ttl:
+            self._directory = set(await self.client.smembers(f"{self.prefix}:agents"))
+            self._directory_loaded_at = now
+        return set(self._directory)
+
+    async def subscribe(self, agent_id: str, topic: str) -> None:
+        await self.client.sadd(self._topic_key(topic), agent_id)
+        self._topic_cache.pop(topic, None)
+
+    async def unsubscribe(self, agent_id: str, topic: str) -> None:
+        await self.client.srem(self._topic_key(topic), agent_id)
+        self._topic_cache.pop(topic, None)
+
+    async def subscribers(self, topic: str) -> Set[str]:
+        now = time.monotonic()
+        cached = self._topic_cache.get(topic)
+        if cached is None or now - cached[0] > self.directory_ttl:
+            cached = (now, set(await self.client.smembers(self._topic_key(topic))))
+            self._topic_cache[topic] = cached
+        return set(cached[1])
+
+    async def send(self, messages: List[AgentMessage]) -> None:
+        if not messages:
+            return
+
+        pipe = self.client.pipeline(transaction=False)
+        recipients = []
+        for message in messages:
+            pipe.xadd(self._inbox(message.recipient_id), {"payload": encode_message(message)})
+            recipients.append(message.recipient_id)
+        for recipient_id in dict.fromkeys(recipients):
+            pipe.xlen(self._inbox(recipient_id))
+        results = await pipe.execute()
+
+        self.stats["sent"] += len(messages)
+        self.stats["send_batches"] += 1
+
+        # Back off while a recipient is not keeping up with its inbox
+        longest = max(results[len(messages):], default=0)
+        if longest > self.max_inbox_length:
+            self.stats["throttled"] += 1
+            await asyncio.sleep(0.01 * longest / self.max_inbox_length)
+
+    async def receive(self, agent_ids: Iterable[str], count: int = 100, block_ms: int = 1000) -> List[BusDelivery]:
+        agent_ids = list(agent_ids)
+        deliveries: List[BusDelivery] = []
+        if not agent_ids:
+            await asyncio.sleep(block_ms / 1000)
+            return deliveries
+
+        # Reclaim entries left unacknowledged by consumers that went away
+        now = time.monotonic()
+        if now - self._last_autoclaim >= self.visibility_timeout / 2:
+            self._last_autoclaim = now
+            for agent_id in agent_ids:
+                _, entries, *_ = await self.client.xautoclaim(
+                    self._inbox(agent_id), self.group, self.node_id,
+                    min_idle_time=int(self.visibility_timeout * 1000),
+                    start_id="0-0", count=count
+                )
+                for delivery_id, fields in entries:
+                    if fields:
+                        deliveries.append((agent_id, delivery_id, decode_message(fields["payload"])))
+                        self.stats["redelivered"] += 1
+
+        if len(deliveries) < count:
+            response = await self.client.xreadgroup(
+                self.group, self.node_id,
+                {self._inbox(agent_id): ">" for agent_id in agent_ids},
+                count=count - len(deliveries), block=block_ms
+            )
+            inbox_prefix = len(self._inbox(""))
+            for stream, entries in response or []:
+                agent_id = stream[inbox_prefix:]
+                for delivery_id, fields in entries:
+                    deliveries.append((agent_id, delivery_id, decode_message(fields["payload"])))
+
+        self.stats["received"] += len(deliveries)
+        return deliveries
+
+    async def ack(self, deliveries: List[Tuple[str, str]]) -> None:
+        if not deliveries:
+            return
+
+        by_agent: Dict[str, List[str]] = {}
+        for agent_id, delivery_id in deliveries:
+            by_agent.setdefault(agent_id, []).append(delivery_id)
+
+        pipe = self.client.pipeline(transaction=False)
+        for agent_id, delivery_ids in by_agent.items():
+            pipe.xack(self._inbox(agent_id), self.group, *delivery_ids)
+            pipe.xdel(self._inbox(agent_id), *delivery_ids)
+        await pipe.execute()
+        self.stats["acked"] += len(deliveries)
+
+
+def create_message_bus() -> MessageBusTransport:
+    """
+    Create the agent message bus configured by the environment.
+
+    ``AGENT_BUS_BACKEND=redis`` selects Redis Streams (using the usual
+    ``REDIS_*`` connection variables); anything else uses the in-memory bus.
+
+    Returns:
+        Message bus transport (not yet connected)
+    """
+    if os.getenv("AGENT_BUS_BACKEND", "memory").lower() == "redis":
+        return RedisMessageBus(
+            host=os.getenv("REDIS_HOST", "localhost"),
+            port=int(os.getenv("REDIS_PORT", "6379")),
+            db=int(os.getenv("REDIS_DB", "0")),
+            password=os.getenv("REDIS_PASSWORD")
+        )
+
+    return InMemoryMessageBus()
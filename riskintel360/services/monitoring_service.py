@@ -12,10 +12,12 @@ from datetime import datetime, timezone, timedelta
 from typing import Dict, List, Optional, Any, Callable
 from dataclasses import dataclass, field
 from enum import Enum
-import boto3
 from botocore.exceptions import ClientError
 
 from riskintel360.config.settings import get_settings
+from riskintel360.utils.lazy_imports import lazy_import
+
+boto3 = lazy_import("boto3")
 
 logger = logging.getLogger(__name__)
 
@@ -0,0 +1,213 @@
+"""
+Pattern Embedding Index for RiskIntel360 Platform
+Local top-k cosine search over business concepts using hashed n-gram TF-IDF
+embeddings, so similar validation patterns are found without an external service.
+"""
+
+import logging
+import math
+import re
+import zlib
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def _bucket(feature: str, dimensions: int) -> Tuple[int, float]:
+    """Stable hash bucket and sign for a feature (signs reduce collision bias)"""
+    value = zlib.crc32(feature.encode("utf-8"))
+    return value % dimensions, 1.0 if value & 0x80000000 else -1.0
+
+
+class PatternEmbeddingIndex:
+    """
+    Incremental hashed n-gram TF-IDF index with cosine top-k search.
+
+    Each text is tokenized into words, word bigrams and character n-grams of
+    every word; features are hashed into a fixed number of dimensions, so the
+    vocabulary never has to be stored. Raw term frequencies are kept per row
+    and IDF weights are re-applied to the whole matrix only when the corpus
+    has grown by ``reweight_growth`` since the last weighting, which keeps
+    ``add`` amortized O(dimensions). Search is a single matrix-vector product.
+    """
+
+    def __init__(
+        self,
+        dimensions: int = 256,
+        char_ngram_range: Tuple[int, int] = (3, 5),
+        reweight_growth: float = 0.25
+    ):
+        """
+        Initialize the index.
+
+        Args:
+            dimensions: Embedding size (hash buckets)
+            char_ngram_range: Inclusive range of character n-gram lengths
+            reweight_growth: Corpus growth fraction that triggers IDF reweighting
+        """
+        self.dimensions = dimensions
+        self.char_ngram_range = char_ngram_range
+        self.reweight_growth = reweight_growth
+
+        self._ids: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self._term_frequencies = np.zeros((0, dimensions), dtype=np.float32)
+        self._vectors = np.zeros((0, dimensions), dtype=np.float32)
+        self._document_frequency = np.zeros(dimensions, dtype=np.float64)
+        self._idf = np.ones(dimensions, dtype=np.float32)
+        self._weighted_size = 0
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, item_id: str) -> bool:
+        return item_id in self._rows
+
+    def ids(self) -> List[str]:
+        """IDs of indexed items"""
+        return list(self._ids)
+
+    def add(self, item_id: str, text: str) -> None:
+        """
+        Index or re-index a text.
+
+        Args:
+            item_id: Item identifier (pattern ID)
+            text: Text to embed (business concept)
+        """
+        if item_id in self._rows:
+            self.remove(item_id)
+
+        term_frequencies = self._term_frequency_vector(text)
+        self._document_frequency += term_frequencies != 0
+
+        row = len(self._ids)
+        self._ids.append(item_id)
+        self._rows[item_id] = row
+        self._term_frequencies = self._append_row(self._term_frequencies, row, term_frequencies)
+
+        if len(self._ids) > max(8, self._weighted_size * (1.0 + self.reweight_growth)):
+            self._reweight()
+        else:
+            self._vectors = self._append_row(self._vectors, row, self._weigh(term_frequencies))
+
+    def remove(self, item_id: str) -> bool:
+        """
+        Remove an item, moving the last row into its slot.
+
+        Args:
+            item_id: Item identifier
+
+        Returns:
+            bool: True if the item was indexed
+        """
+        row = self._rows.pop(item_id, None)
+        if row is None:
+            return False
+
+        self._document_frequency -= self._term_frequencies[row] != 0
+        last = len(self._ids) - 1
+        if row != last:
+            moved_id = self._ids[last]
+            self._ids[row] = moved_id
+            self._rows[moved_id] = row
+            self._term_frequencies[row] = self._term_frequencies[last]
+            self._vectors[row] = self._vectors[last]
+        self._ids.pop()
+        return True
+
+    def clear(self) -> None:
+        """Remove all items"""
+        self._ids.clear()
+        self._rows.clear()
+        self._term_frequencies = np.zeros((0, self.dimensions), dtype=np.float32)
+        self._vectors = np.zeros((0, self.dimensions), dtype=np.float32)
+        self._document_frequency[:] = 0
+        self._idf[:] = 1.0
+        self._weighted_size = 0
+
+    def search(self, text: str, k: int = 5, min_score: float = 0.0) -> List[Tuple[str, float]]:
+        """
+        Find the most similar indexed items.
+
+        Args:
+            text: Query text
+            k: Maximum number of results
+            min_score: Minimum cosine similarity
+
+        Returns:
+            List of (item_id, cosine similarity), best first
+        """
+        count = len(self._ids)
+        if count == 0 or k <= 0:
+            return []
+
+        query = self._weigh(self._term_frequency_vector(text))
+        if not query.any():
+            return []
+
+        scores = self._vectors[:count] @ query
+        if k < count:
+            candidates = np.argpartition(scores, -k)[-k:]
+        else:
+            candidates = np.arange(count)
+        candidates = candidates[np.argsort(scores[candidates])[::-1]]
+
+        return [
+            (self._ids[row], float(scores[row]))
+            for row in candidates
+            if scores[row] > min_score
+        ]
+
+    def _tokens(self, text: str) -> List[str]:
+        words = _TOKEN_PATTERN.findall(text.lower())
+        features = [f"w:{word}" for word in words]
+        features.extend(f"b:{first} {second}" for first, second in zip(words, words[1:]))
+
+        low, high = self.char_ngram_range
+        for word in words:
+            padded = f"<{word}>"
+            for size in range(low, high + 1):
+                features.extend(f"c:{padded[start:start + size]}" for start in range(len(padded) - size + 1))
+        return features
+
+    def _term_frequency_vector(self, text: str) -> np.ndarray:
+        counts: Dict[Tuple[int, float], int] = {}
+        for feature in self._tokens(text):
+            bucket = _bucket(feature, self.dimensions)
+            counts[bucket] = counts.get(bucket, 0) + 1
+
+        vector = np.zeros(self.dimensions, dtype=np.float32)
+        for (index, sign), count in counts.items():
+            # Sublinear term frequency
+            vector[index] += sign * (1.0 + math.log(count))
+        return vector
+
+    def _weigh(self, term_frequencies: np.ndarray) -> np.ndarray:
+        weighted = term_frequencies * self._idf
+        norm = float(np.linalg.norm(weighted))
+        return weighted / norm if norm else weighted
+
+    def _reweight(self) -> None:
+        count = len(self._ids)
+        self._idf = (np.log((1.0 + count) / (1.0 + self._document_frequency)) + 1.0).astype(np.float32)
+
+        weighted = self._term_frequencies[:count] * self._idf
+        norms = np.linalg.norm(weighted, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        self._vectors = (weighted / norms).astype(np.float32)
+        self._weighted_size = count
+
+    @staticmethod
+    def _append_row(matrix: np.ndarray, row: int, values: np.ndarray) -> np.ndarray:
+        """Write a row, growing capacity geometrically so appends stay amortized O(1)"""
+        if row >= matrix.shape[0]:
+            grown = np.zeros((max(16, matrix.shape[0] * 2), matrix.shape[1]), dtype=matrix.dtype)
+            grown[:matrix.shape[0]] = matrix
+            matrix = grown
+        matrix[row] = values
+        return matrix
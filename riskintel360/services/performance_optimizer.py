@@ -12,11 +12,13 @@ from datetime import datetime, timedelta
 from concurrent.futures import ThreadPoolExecutor
 import json
 
-import boto3
 from botocore.exceptions import ClientError
 
 from riskintel360.config.settings import get_settings
 from riskintel360.services.caching_service import get_caching_service, cached
+from riskintel360.utils.lazy_imports import lazy_import
+
+boto3 = lazy_import("boto3")
 
 logger = logging.getLogger(__name__)
 
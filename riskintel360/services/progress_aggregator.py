@@ -0,0 +1,205 @@
+"""
+Progress Aggregator for RiskIntel360 Platform
+Coalesces workflow and agent progress updates and flushes them to WebSocket
+and status sinks at a bounded rate, batched across workflows.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+# Receives {key: latest state} for every key flushed in one pass
+ProgressSink = Callable[[Dict[str, Dict[str, Any]]], Awaitable[None]]
+
+
+class ProgressAggregator:
+    """
+    Holds the latest progress state per workflow and flushes it at most
+    ``max_rate_hz`` times per second per workflow.
+
+    Updates merge into the held state (nested dicts such as per-agent
+    progress are merged one level deep), so intermediate updates are
+    coalesced instead of sent. Terminal updates are flushed immediately and
+    the workflow's state is then dropped. Every flush pass hands all due
+    workflows to each sink in a single call.
+    """
+
+    def __init__(self, max_rate_hz: float = 4.0, sinks: Optional[List[ProgressSink]] = None):
+        """
+        Initialize the progress aggregator.
+
+        Args:
+            max_rate_hz: Maximum flushes per second per workflow
+            sinks: Async callables receiving each flushed batch
+        """
+        self.min_interval = 1.0 / max_rate_hz if max_rate_hz > 0 else 0.0
+        self.sinks: List[ProgressSink] = list(sinks or [])
+
+        self._states: Dict[str, Dict[str, Any]] = {}
+        self._dirty: Set[str] = set()
+        self._terminal: Set[str] = set()
+        self._last_flush: Dict[str, float] = {}
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._flush_lock: Optional[asyncio.Lock] = None
+        self._task: Optional[asyncio.Task] = None
+
+        self.stats = {
+            "submitted": 0,
+            "coalesced": 0,
+            "flushed": 0,
+            "batches": 0,
+        }
+
+    def add_sink(self, sink: ProgressSink) -> None:
+        """Register a sink for flushed batches"""
+        self.sinks.append(sink)
+
+    def submit(self, key: str, update: Dict[str, Any], terminal: bool = False) -> None:
+        """
+        Record a progress update; safe to call from synchronous code.
+
+        Args:
+            key: Workflow identifier
+            update: Fields to merge into the held state
+            terminal: Whether the workflow has finished (flushed immediately)
+        """
+        state = self._states.setdefault(key, {})
+        for field, value in update.items():
+            if isinstance(value, dict) and isinstance(state.get(field), dict):
+                state[field] = {**state[field], **value}
+            else:
+                state[field] = value
+
+        self.stats["submitted"] += 1
+        if key in self._dirty:
+            self.stats["coalesced"] += 1
+            if not terminal:
+                return
+
+        self._dirty.add(key)
+        if terminal:
+            self._terminal.add(key)
+        self._ensure_flusher()
+        if self._wake is not None:
+            self._wake.set()
+
+    async def flush(self, keys: Optional[Iterable[str]] = None) -> None:
+        """
+        Flush pending updates now, regardless of rate limits.
+
+        Args:
+            keys: Workflows to flush (all pending when omitted)
+        """
+        self._bind_loop()
+        await self._flush(set(keys) & self._dirty if keys is not None else set(self._dirty))
+
+    def forget(self, key: str) -> None:
+        """Drop a workflow's held state without flushing it"""
+        self._states.pop(key, None)
+        self._dirty.discard(key)
+        self._terminal.discard(key)
+        self._last_flush.pop(key, None)
+
+    async def stop(self) -> None:
+        """Stop the background flusher after flushing everything pending"""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        await self.flush()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get aggregation statistics"""
+        return {**self.stats, "pending": len(self._dirty), "tracked": len(self._states)}
+
+    def _bind_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Event loop changed (e.g. a new test loop): rebuild loop-bound primitives
+            self._loop = loop
+            self._wake = asyncio.Event()
+            self._flush_lock = asyncio.Lock()
+            self._task = None
+
+    def _ensure_flusher(self) -> None:
+        try:
+            self._bind_loop()
+        except RuntimeError:
+            # No running loop; the update is flushed by the next async caller
+            return
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                self._wake.clear()
+                delay = self._next_due_in()
+                if delay is None:
+                    await self._wake.wait()
+                elif delay > 0:
+                    try:
+                        await asyncio.wait_for(self._wake.wait(), timeout=delay)
+                    except asyncio.TimeoutError:
+                        pass
+
+                await self._flush(self._due_keys())
+
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Progress flusher error: {e}")
+                await asyncio.sleep(self.min_interval or 0.1)
+
+    def _next_due_in(self) -> Optional[float]:
+        if not self._dirty:
+            return None
+        if self._terminal & self._dirty:
+            return 0.0
+        now = time.monotonic()
+        return max(0.0, min(
+            self._last_flush.get(key, float("-inf")) + self.min_interval - now for key in self._dirty
+        ))
+
+    def _due_keys(self) -> Set[str]:
+        now = time.monotonic()
+        return {
+            key for key in self._dirty
+            if key in self._terminal or now - self._last_flush.get(key, float("-inf")) >= self.min_interval
+        }
+
+    async def _flush(self, keys: Set[str]) -> None:
+        if not keys:
+            return
+
+        async with self._flush_lock:
+            now = time.monotonic()
+            batch = {}
+            for key in keys:
+                if key not in self._dirty:
+                    continue
+                self._dirty.discard(key)
+                if key in self._terminal:
+                    self._terminal.discard(key)
+                    self._last_flush.pop(key, None)
+                    batch[key] = self._states.pop(key, {})
+                else:
+                    self._last_flush[key] = now
+                    batch[key] = dict(self._states[key])
+
+            if not batch:
+                return
+
+            for sink in self.sinks:
+                try:
+                    await sink(dict(batch))
+                except Exception as e:
+                    logger.error(f"Progress sink failed: {e}")
+
+            self.stats["flushed"] += len(batch)
+            self.stats["batches"] += 1
@@ -0,0 +1,332 @@
+"""
+Shared Agent Memory for RiskIntel360 Platform
+Versioned key-value memory shared by agents across processes: Redis is the
+source of truth, with a process-local near-cache kept coherent over pub/sub.
+"""
+
+import asyncio
+import copy
+import json
+import logging
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class SharedMemoryConflict(Exception):
+    """Raised when a compare-and-set write finds a newer version"""
+    pass
+
+
+class SharedMemoryBackend(ABC):
+    """Versioned shared memory; every write returns a new, increasing version per key"""
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[Tuple[int, Any]]:
+        """Return (version, value) or None when the key is absent"""
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, value: Any, expected_version: Optional[int] = None) -> int:
+        """
+        Store a value and return its version.
+
+        Raises:
+            SharedMemoryConflict: ``expected_version`` is given and is not current
+        """
+        pass
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """Remove a key"""
+        pass
+
+    async def close(self) -> None:
+        """Release background resources"""
+        pass
+
+    @abstractmethod
+    def get_stats(self) -> Dict[str, Any]:
+        """Backend statistics"""
+        pass
+
+
+class LocalSharedMemory(SharedMemoryBackend):
+    """Single-process shared memory, the default for development and tests"""
+
+    def __init__(self):
+        self._entries: Dict[str, Tuple[int, Any]] = {}
+
+    async def get(self, key: str) -> Optional[Tuple[int, Any]]:
+        return self._entries.get(key)
+
+    async def set(self, key: str, value: Any, expected_version: Optional[int] = None) -> int:
+        current = self._entries.get(key, (0, None))[0]
+        if expected_version is not None and expected_version != current:
+            raise SharedMemoryConflict(f"{key} is at version {current}, expected {expected_version}")
+        self._entries[key] = (current + 1, value)
+        return current + 1
+
+    async def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {"backend": "local", "keys": len(self._entries)}
+
+
+# Atomically bump the version, store the value and announce the new version.
+# Returns -1 when a compare-and-set precondition fails.
+_SET_SCRIPT = """
+local current = tonumber(redis.call('HGET', KEYS[1], 'v') or '0')
+if ARGV[2] ~= '' and tonumber(ARGV[2]) ~= current then
+    return -1
+end
+local version = current + 1
+redis.call('HSET', KEYS[1], 'v', version, 'data', ARGV[1])
+if ARGV[5] ~= '' then
+    redis.call('EXPIRE', KEYS[1], tonumber(ARGV[5]))
+end
+redis.call('PUBLISH', ARGV[3], cjson.encode({key = ARGV[4], version = version, origin = ARGV[6]}))
+return version
+"""
+
+
+class RedisSharedMemory(SharedMemoryBackend):
+    """
+    Redis-backed shared memory with a process-local near-cache.
+
+    Each key is a hash holding the value and a version stamp. Writes bump the
+    version atomically and publish it; every process drops near-cache entries
+    older than the announced version. A process's own writes are cached with
+    their version, so it always reads what it wrote. If the invalidation
+    channel drops, the near-cache is cleared because messages may have been
+    missed, and ``near_cache_ttl`` bounds staleness in the meantime.
+    """
+
+    def __init__(
+        self,
+        redis_manager: Optional[Any] = None,
+        prefix: str = "riskintel360:shared_memory",
+        near_cache_size: int = 1024,
+        near_cache_ttl: float = 30.0,
+        key_ttl: Optional[int] = None
+    ):
+        """
+        Initialize Redis shared memory.
+
+        Args:
+            redis_manager: RedisConnectionManager (the global one if omitted)
+            prefix: Key and channel prefix
+            near_cache_size: Maximum entries cached in-process
+            near_cache_ttl: Seconds a cached entry is trusted without a re-read
+            key_ttl: Optional expiry for keys in Redis
+        """
+        self.redis_manager = redis_manager
+        self.prefix = prefix
+        self.channel = f"{prefix}:invalidate"
+        self.near_cache_size = max(1, near_cache_size)
+        self.near_cache_ttl = near_cache_ttl
+        self.key_ttl = key_ttl
+        self.node_id = uuid.uuid4().hex
+
+        self._near_cache: "OrderedDict[str, Tuple[int, Any, float]]" = OrderedDict()
+        # Latest version announced by other processes, so a slow read that
+        # races an invalidation cannot re-cache the older value
+        self._announced: "OrderedDict[str, int]" = OrderedDict()
+        # Versions restart after a delete, so deletions are tracked by a
+        # sequence number instead: a read overlapping a deletion of its key
+        # (or an evicted/unknown deletion) is not cached
+        self._deletion_seq = 0
+        self._deletions: "OrderedDict[str, int]" = OrderedDict()
+        self._deletion_floor = 0
+        self._listener: Optional[asyncio.Task] = None
+        self._set_script = None
+        self.stats = {
+            "near_hits": 0,
+            "near_misses": 0,
+            "invalidations": 0,
+            "stale_invalidations_ignored": 0,
+            "resets": 0,
+        }
+
+    async def _get_manager(self):
+        if self.redis_manager is None:
+            # Import here to avoid circular imports
+            from .redis_manager import get_redis_manager
+            self.redis_manager = await get_redis_manager()
+        return self.redis_manager
+
+    def _redis_key(self, key: str) -> str:
+        return f"{self.prefix}:{key}"
+
+    async def get(self, key: str) -> Optional[Tuple[int, Any]]:
+        await self._ensure_listener()
+
+        entry = self._near_cache.get(key)
+        if entry is not None and time.monotonic() - entry[2] < self.near_cache_ttl:
+            self._near_cache.move_to_end(key)
+            self.stats["near_hits"] += 1
+            return entry[0], copy.deepcopy(entry[1])
+
+        self.stats["near_misses"] += 1
+        read_seq = self._deletion_seq
+        manager = await self._get_manager()
+        async with manager.get_client() as client:
+            version, data = await client.hmget(self._redis_key(key), "v", "data")
+
+        if version is None:
+            self._near_cache.pop(key, None)
+            return None
+
+        value = json.loads(data)
+        if not self._deleted_since(key, read_seq):
+            self._cache(key, int(version), value)
+        return int(version), copy.deepcopy(value)
+
+    async def set(self, key: str, value: Any, expected_version: Optional[int] = None) -> int:
+        await self._ensure_listener()
+
+        encoded = json.dumps(value, default=str)
+        manager = await self._get_manager()
+        async with manager.get_client() as client:
+            if self._set_script is None:
+                self._set_script = client.register_script(_SET_SCRIPT)
+            version = await self._set_script(
+                keys=[self._redis_key(key)],
+                args=[
+                    encoded,
+                    "" if expected_version is None else str(expected_version),
+                    self.channel,
+                    key,
+                    "" if self.key_ttl is None else str(self.key_ttl),
+                    self.node_id
+                ],
+                client=client
+            )
+
+        if int(version) < 0:
+            self._near_cache.pop(key, None)
+            raise SharedMemoryConflict(f"{key} changed since version {expected_version}")
+
+        # Read-your-writes: cache our own write, as other processes will decode it
+        self._cache(key, int(version), json.loads(encoded))
+        return int(version)
+
+    async def delete(self, key: str) -> None:
+        manager = await self._get_manager()
+        async with manager.get_client() as client:
+            pipe = client.pipeline()
+            pipe.delete(self._redis_key(key))
+            # A deletion is newer than any version
+            pipe.publish(self.channel, json.dumps({"key": key, "version": None, "origin": self.node_id}))
+            await pipe.execute()
+        self._record_deletion(key)
+        self._near_cache.pop(key, None)
+
+    async def close(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            await asyncio.gather(self._listener, return_exceptions=True)
+            self._listener = None
+        self._near_cache.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "backend": "redis",
+            "near_cache_entries": len(self._near_cache),
+            "listening": self._listener is not None and not self._listener.done(),
+        }
+
+    def apply_invalidation(self, key: str, version: Optional[int]) -> None:
+        """
+        Drop a near-cache entry older than an announced version.
+
+        Args:
+            key: Shared memory key
+            version: Announced version (None for deletion)
+        """
+        if version is None:
+            # Versions restart after a delete; in-flight reads are guarded by
+            # the deletion record instead
+            self._announced.pop(key, None)
+            self._record_deletion(key)
+        else:
+            self._announced[key] = max(version, self._announced.get(key, 0))
+            self._announced.move_to_end(key)
+            while len(self._announced) > self.near_cache_size:
+                self._announced.popitem(last=False)
+
+        entry = self._near_cache.get(key)
+        if entry is None:
+            return
+        if version is not None and entry[0] >= version:
+            self.stats["stale_invalidations_ignored"] += 1
+            return
+        del self._near_cache[key]
+        self.stats["invalidations"] += 1
+
+    def _record_deletion(self, key: str) -> None:
+        self._deletion_seq += 1
+        self._deletions[key] = self._deletion_seq
+        self._deletions.move_to_end(key)
+        while len(self._deletions) > self.near_cache_size:
+            _, evicted_seq = self._deletions.popitem(last=False)
+            self._deletion_floor = max(self._deletion_floor, evicted_seq)
+
+    def _deleted_since(self, key: str, seq: int) -> bool:
+        """Whether the key may have been deleted after deletion sequence ``seq``"""
+        return self._deletions.get(key, 0) > seq or self._deletion_floor > seq
+
+    def _cache(self, key: str, version: int, value: Any) -> None:
+        entry = self._near_cache.get(key)
+        if (entry is not None and entry[0] > version) or self._announced.get(key, 0) > version:
+            # A newer version already exists; never go backwards
+            return
+        self._near_cache[key] = (version, value, time.monotonic())
+        self._near_cache.move_to_end(key)
+        while len(self._near_cache) > self.near_cache_size:
+            self._near_cache.popitem(last=False)
+
+    async def _ensure_listener(self) -> None:
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.create_task(self._listen())
+
+    async def _listen(self) -> None:
+        while True:
+            pubsub = None
+            try:
+                manager = await self._get_manager()
+                async with manager.get_client() as client:
+                    pubsub = client.pubsub()
+                    await pubsub.subscribe(self.channel)
+                    while True:
+                        message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                        if message is None:
+                            continue
+                        payload = json.loads(message["data"])
+                        if payload.get("origin") != self.node_id:
+                            self.apply_invalidation(payload["key"], payload.get("version"))
+
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                # Invalidations may have been missed while disconnected
+                logger.warning(f"Shared memory invalidation channel lost: {e}")
+                self._near_cache.clear()
+                self._announced.clear()
+                # Reads in flight may have missed a deletion too
+                self._deletion_seq += 1
+                self._deletion_floor = self._deletion_seq
+                self.stats["resets"] += 1
+                await asyncio.sleep(1)
+            finally:
+                if pubsub is not None:
+                    try:
+                        await pubsub.close()
+                    except Exception:
+                        pass
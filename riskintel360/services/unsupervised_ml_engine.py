@@ -7,10 +7,6 @@ import asyncio
 import logging
 import numpy as np
 from typing import Dict, Any, List, Optional
-from sklearn.ensemble import IsolationForest
-from sklearn.cluster import DBSCAN
-from sklearn.preprocessing import StandardScaler
-from sklearn.neural_network import MLPRegressor
 import warnings
 
 # Suppress sklearn warnings for cleaner output
@@ -31,6 +27,13 @@ class UnsupervisedMLEngine:
     
     def __init__(self):
         """Initialize ML engine with unsupervised algorithms"""
+        # sklearn is imported here so that importing the fraud detection agent
+        # does not load it; the cost is paid when the first engine is built
+        from sklearn.ensemble import IsolationForest
+        from sklearn.cluster import DBSCAN
+        from sklearn.preprocessing import StandardScaler
+        from sklearn.neural_network import MLPRegressor
+        
         # Isolation Forest for anomaly detection (optimized for real-time)
         self.isolation_forest = IsolationForest(
             contamination=0.1,  # Expect 10% anomalies
@@ -0,0 +1,377 @@
+"""
+Workflow Admission Scheduler for RiskIntel360 Platform
+Weighted-fair admission of workflows across tenants, with priority classes
+within a tenant and a global concurrency limit sized to model quotas.
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional, Tuple
+
+from ..models.agent_models import Priority
+
+logger = logging.getLogger(__name__)
+
+
+# Admission order of priority classes within a tenant
+PRIORITY_ORDER = (Priority.CRITICAL, Priority.HIGH, Priority.MEDIUM, Priority.LOW)
+
+# Request priorities from other models that map onto a different class
+# (``models.core.Priority.URGENT`` is the API's highest priority)
+PRIORITY_ALIASES: Dict[str, Priority] = {"urgent": Priority.CRITICAL}
+
+
+def parse_priority(value: Any, default: Priority = Priority.MEDIUM) -> Priority:
+    """
+    Coerce a request priority (enum, enum value or name) to ``Priority``.
+
+    Values listed in ``PRIORITY_ALIASES`` (e.g. "urgent") map to their class.
+
+    Args:
+        value: Priority from a request payload
+        default: Priority used when the value is missing or unknown
+
+    Returns:
+        Priority class
+    """
+    if isinstance(value, Priority):
+        return value
+    name = str(getattr(value, "value", value)).lower()
+    if name in PRIORITY_ALIASES:
+        return PRIORITY_ALIASES[name]
+    try:
+        return Priority(name)
+    except ValueError:
+        return default
+
+
+@dataclass
+class AdmissionTicket:
+    """Grant to run one workflow; must be released when the workflow ends"""
+    tenant_id: str
+    priority: Priority
+    enqueued_at: float
+    admitted_at: float
+    released: bool = False
+
+    @property
+    def wait_seconds(self) -> float:
+        return self.admitted_at - self.enqueued_at
+
+
+@dataclass
+class _PendingAdmission:
+    tenant_id: str
+    priority: Priority
+    enqueued_at: float
+    future: asyncio.Future
+
+
+@dataclass
+class _TenantQueue:
+    weight: float
+    virtual_pass: float = 0.0
+    queues: Dict[Priority, Deque[_PendingAdmission]] = field(
+        default_factory=lambda: {priority: deque() for priority in PRIORITY_ORDER}
+    )
+
+    def depth(self) -> int:
+        return sum(len(queue) for queue in self.queues.values())
+
+    def head(self) -> Optional[_PendingAdmission]:
+        for priority in PRIORITY_ORDER:
+            if self.queues[priority]:
+                return self.queues[priority][0]
+        return None
+
+
+class AdmissionScheduler:
+    """
+    Admission control in front of workflow execution.
+
+    Tenants share capacity in proportion to their weight (stride scheduling:
+    each admission advances the tenant's virtual pass by ``1 / weight`` and
+    the tenant with the lowest pass goes next). Within a tenant, higher
+    priority classes are admitted first. ``reserved_critical_slots`` of the
+    global limit are only used by CRITICAL work, so it is admitted promptly
+    even when lower classes have saturated the rest.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = 8,
+        reserved_critical_slots: int = 1,
+        tenant_weights: Optional[Dict[str, float]] = None,
+        default_weight: float = 1.0,
+        wait_sample_size: int = 500
+    ):
+        """
+        Initialize the admission scheduler.
+
+        Args:
+            max_concurrent: Workflows allowed to run at once
+            reserved_critical_slots: Slots held back for CRITICAL workflows
+            tenant_weights: Relative capacity share per tenant
+            default_weight: Weight of tenants without an explicit entry
+            wait_sample_size: Recent wait times kept per priority for percentiles
+        """
+        self.max_concurrent = max(1, max_concurrent)
+        self.reserved_critical_slots = min(max(0, reserved_critical_slots), self.max_concurrent - 1)
+        self.tenant_weights = dict(tenant_weights or {})
+        self.default_weight = default_weight
+
+        self._tenants: Dict[str, _TenantQueue] = {}
+        self._virtual_time = 0.0
+        self._running = 0
+        self._running_by_priority: Dict[Priority, int] = {priority: 0 for priority in PRIORITY_ORDER}
+        self._admitted: Dict[Priority, int] = {priority: 0 for priority in PRIORITY_ORDER}
+        self._waits: Dict[Priority, Deque[float]] = {
+            priority: deque(maxlen=wait_sample_size) for priority in PRIORITY_ORDER
+        }
+
+    @property
+    def running(self) -> int:
+        """Workflows currently admitted"""
+        return self._running
+
+    async def acquire(self, tenant_id: str, priority: Priority = Priority.MEDIUM) -> AdmissionTicket:
+        """
+        Wait until a workflow may run.
+
+        Args:
+            tenant_id: Tenant submitting the workflow
+            priority: Priority class of the workflow
+
+        Returns:
+            AdmissionTicket to pass to ``release``
+        """
+        pending = _PendingAdmission(
+            tenant_id=tenant_id,
+            priority=priority,
+            enqueued_at=time.monotonic(),
+            future=asyncio.get_running_loop().create_future()
+        )
+
+        tenant = self._tenants.get(tenant_id)
+        if tenant is None:
+            tenant = self._tenants[tenant_id] = _TenantQueue(
+                weight=max(1e-6, self.tenant_weights.get(tenant_id, self.default_weight))
+            )
+        if tenant.depth() == 0:
+            # A tenant returning from idle must not claim the capacity it did not use
+            tenant.virtual_pass = max(tenant.virtual_pass, self._virtual_time)
+        tenant.queues[priority].append(pending)
+
+        self._dispatch()
+
+        try:
+            return await pending.future
+        except asyncio.CancelledError:
+            if pending.future.done() and not pending.future.cancelled():
+                self.release(pending.future.result())
+            else:
+                self._discard(pending)
+            raise
+
+    def release(self, ticket: AdmissionTicket) -> None:
+        """
+        Return a slot after the workflow finished.
+
+        Args:
+            ticket: Ticket returned by ``acquire``
+        """
+        if ticket.released:
+            return
+        ticket.released = True
+        self._running -= 1
+        self._running_by_priority[ticket.priority] -= 1
+        self._dispatch()
+
+    @asynccontextmanager
+    async def admit(self, tenant_id: str, priority: Priority = Priority.MEDIUM) -> AsyncIterator[AdmissionTicket]:
+        """Hold an admission slot for the duration of the block"""
+        ticket = await self.acquire(tenant_id, priority)
+        try:
+            yield ticket
+        finally:
+            self.release(ticket)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Queue depth, running and wait-time metrics per priority class"""
+        by_priority = {}
+        for priority in PRIORITY_ORDER:
+            waits = sorted(self._waits[priority])
+            by_priority[priority.value] = {
+                "queued": sum(len(tenant.queues[priority]) for tenant in self._tenants.values()),
+                "running": self._running_by_priority[priority],
+                "admitted": self._admitted[priority],
+                "avg_wait_seconds": sum(waits) / len(waits) if waits else 0.0,
+                "p95_wait_seconds": waits[min(len(waits) - 1, int(len(waits) * 0.95))] if waits else 0.0,
+                "max_wait_seconds": waits[-1] if waits else 0.0,
+            }
+
+        return {
+            "max_concurrent": self.max_concurrent,
+            "reserved_critical_slots": self.reserved_critical_slots,
+            "running": self._running,
+            "queued": sum(tenant.depth() for tenant in self._tenants.values()),
+            "queued_by_tenant": {
+                tenant_id: tenant.depth() for tenant_id, tenant in self._tenants.items() if tenant.depth()
+            },
+            "by_priority": by_priority,
+        }
+
+    def _dispatch(self) -> None:
+        while self._running < self.max_concurrent:
+            critical_only = self._running >= self.max_concurrent - self.reserved_critical_slots
+
+            chosen = None
+            for tenant in self._tenants.values():
+                head = tenant.head()
+                if head is None or (critical_only and head.priority != Priority.CRITICAL):
+                    continue
+                if chosen is None or tenant.virtual_pass < chosen.virtual_pass:
+                    chosen = tenant
+            if chosen is None:
+                break
+
+            pending = chosen.queues[chosen.head().priority].popleft()
+            self._virtual_time = max(self._virtual_time, chosen.virtual_pass)
+            chosen.virtual_pass += 1.0 / chosen.weight
+
+            if pending.future.done():
+                continue
+
+            now = time.monotonic()
+            ticket = AdmissionTicket(
+                tenant_id=pending.tenant_id,
+                priority=pending.priority,
+                enqueued_at=pending.enqueued_at,
+                admitted_at=now
+            )
+            self._running += 1
+            self._running_by_priority[pending.priority] += 1
+            self._admitted[pending.priority] += 1
+            self._waits[pending.priority].append(ticket.wait_seconds)
+            pending.future.set_result(ticket)
+
+        self._prune_idle_tenants()
+
+    def _discard(self, pending: _PendingAdmission) -> None:
+        tenant = self._tenants.get(pending.tenant_id)
+        if tenant is not None:
+            try:
+                tenant.queues[pending.priority].remove(pending)
+            except ValueError:
+                pass
+
+    def _prune_idle_tenants(self) -> None:
+        # Idle tenants below the virtual clock would be reset on return anyway
+        for tenant_id in [
+            tenant_id for tenant_id, tenant in self._tenants.items()
+            if tenant.depth() == 0 and tenant.virtual_pass <= self._virtual_time
+        ]:
+            del self._tenants[tenant_id]
+
+
+class PrioritySemaphore:
+    """
+    Counting semaphore that hands free slots to the highest priority waiter.
+
+    Waiters of the same priority are served in arrival order, so under
+    contention a CRITICAL task queued after several MEDIUM ones runs next.
+    """
+
+    def __init__(self, value: int = 1):
+        """
+        Initialize the semaphore.
+
+        Args:
+            value: Number of slots
+        """
+        self._value = max(1, value)
+        self._waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+
+    def locked(self) -> bool:
+        """True when no slot is free"""
+        return self._value == 0
+
+    async def acquire(self, priority: Priority = Priority.MEDIUM) -> None:
+        """
+        Wait for a slot.
+
+        Args:
+            priority: Priority of the caller
+        """
+        if self._value > 0 and not self._waiters:
+            self._value -= 1
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (PRIORITY_ORDER.index(priority), next(self._sequence), future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # The slot was granted just as the waiter was cancelled
+                self.release()
+            raise
+
+    def release(self) -> None:
+        """Return a slot"""
+        self._value += 1
+        while self._value > 0 and self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if future.done():
+                continue
+            self._value -= 1
+            future.set_result(None)
+
+    @asynccontextmanager
+    async def slot(self, priority: Priority = Priority.MEDIUM) -> AsyncIterator[None]:
+        """Hold a slot for the duration of the block"""
+        await self.acquire(priority)
+        try:
+            yield
+        finally:
+            self.release()
+
+
+_admission_schedulers: Dict[Tuple[Any, ...], AdmissionScheduler] = {}
+
+
+def get_admission_scheduler(
+    max_concurrent: int = 8,
+    reserved_critical_slots: int = 1,
+    tenant_weights: Optional[Dict[str, float]] = None
+) -> AdmissionScheduler:
+    """
+    Get the process-wide admission scheduler for the given limits.
+
+    Every supervisor configured with the same limits shares one scheduler,
+    so the workflow concurrency limit holds for the whole process rather
+    than per supervisor.
+
+    Args:
+        max_concurrent: Workflows allowed to run at once
+        reserved_critical_slots: Slots held back for CRITICAL workflows
+        tenant_weights: Relative capacity share per tenant
+
+    Returns:
+        AdmissionScheduler: Shared scheduler
+    """
+    key = (max_concurrent, reserved_critical_slots, tuple(sorted((tenant_weights or {}).items())))
+    if key not in _admission_schedulers:
+        _admission_schedulers[key] = AdmissionScheduler(
+            max_concurrent=max_concurrent,
+            reserved_critical_slots=reserved_critical_slots,
+            tenant_weights=tenant_weights
+        )
+    return _admission_schedulers[key]
@@ -5,23 +5,30 @@ Multi-agent coordination using LangGraph StateGraph and AgentCore primitives.
 
 import asyncio
 import logging
-from typing import Dict, Any, List, Optional, Callable, TypedDict, Annotated
+import os
+from typing import Dict, Any, List, Optional, Callable, Tuple, TypedDict, Annotated
 from enum import Enum
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timezone, timedelta, UTC
 import uuid
 import json
+import hashlib
+import statistics
+from collections import OrderedDict
 
-from langgraph.graph import StateGraph, END
-from langgraph.prebuilt import ToolNode
 from langchain_core.messages import BaseMessage, HumanMessage, AIMessage
 
 from .agentcore_client import AgentCoreClient, AgentCorePrimitive
 from .bedrock_client import BedrockClient, AgentType as BedrockAgentType
+from .workflow_result_cache import WorkflowResultCache, scopes_for_agents
+from .workflow_queue import WorkflowQueueBackend, WorkflowWorkerPool, create_workflow_queue
+from .workflow_admission import PRIORITY_ORDER, PrioritySemaphore, get_admission_scheduler, parse_priority
+from .progress_aggregator import ProgressAggregator
 from ..models.agent_models import (
     AgentMessage, MessageType, Priority, AgentType, 
     WorkflowState, SessionStatus, TaskAssignment
 )
+from ..utils.error_handling import FileCheckpointStorage, WorkflowStateManager
 
 logger = logging.getLogger(__name__)
 
@@ -60,6 +67,20 @@ class WorkflowConfig:
     parallel_execution: bool = True
     quality_threshold: float = 0.8
     enable_cross_agent_communication: bool = True
+    agent_timeout_seconds: float = 120.0  # Per-agent deadline, overridable per assignment
+    max_concurrent_agents: int = 6  # Global cap across workflows to protect Bedrock quota
+    enable_result_cache: bool = True  # Memoize fintech workflow and agent results
+    result_cache_freshness_seconds: Optional[Dict[str, float]] = None  # Per analysis scope overrides
+    # Persist agent checkpoints here to survive restarts; set WORKFLOW_CHECKPOINT_DIR="" to keep them in memory only
+    checkpoint_dir: Optional[str] = field(
+        default_factory=lambda: os.getenv("WORKFLOW_CHECKPOINT_DIR", ".RiskIntel360_checkpoints") or None
+    )
+    quality_uncertainty_band: float = 0.05  # Escalate to LLM review within +/- this of quality_threshold
+    enable_llm_quality_escalation: bool = True
+    max_concurrent_workflows: int = 8  # Workflows admitted at once, sized to model quotas
+    reserved_critical_workflow_slots: int = 1  # Held back so CRITICAL work is never queued behind bulk runs
+    tenant_weights: Optional[Dict[str, float]] = None  # Relative capacity share per tenant
+    progress_updates_per_second: float = 4.0  # Per-workflow cap on WebSocket/status progress flushes
 
 
 class SupervisorAgent:
@@ -68,11 +89,23 @@ class SupervisorAgent:
     Uses LangGraph StateGraph and AgentCore primitives for coordination.
     """
     
+    # Baseline per-agent run times (seconds) used for critical-path planning
+    # until observed execution times are available
+    DEFAULT_AGENT_DURATIONS: Dict[str, float] = {
+        'regulatory_compliance': 30.0,
+        'fraud_detection': 45.0,
+        'market_analysis': 40.0,
+        'risk_assessment': 35.0,
+        'kyc_verification': 25.0,
+        'customer_behavior_intelligence': 35.0
+    }
+    
     def __init__(
         self,
         agentcore_client: AgentCoreClient,
         bedrock_client: BedrockClient,
-        config: Optional[WorkflowConfig] = None
+        config: Optional[WorkflowConfig] = None,
+        work_queue: Optional[WorkflowQueueBackend] = None
     ):
         """
         Initialize supervisor agent with AgentCore and Bedrock clients.
@@ -81,6 +114,8 @@ class SupervisorAgent:
             agentcore_client: AgentCore client for coordination
             bedrock_client: Bedrock client for LLM interactions
             config: Workflow configuration
+            work_queue: Shared work queue; when set, started workflows are
+                enqueued for any replica's worker pool instead of run in-process
         """
         self.agentcore_client = agentcore_client
         self.bedrock_client = bedrock_client
@@ -93,18 +128,58 @@ class SupervisorAgent:
         # Message queues for agent communication
         self.message_queues: Dict[str, asyncio.Queue] = {}
         
+        # Shared by every workflow on this supervisor so concurrent workflows
+        # cannot exceed the Bedrock concurrency budget between them
+        self._agent_semaphore = PrioritySemaphore(max(1, self.config.max_concurrent_agents))
+        
+        # Smoothed observed run time per agent, refines critical-path estimates
+        self._agent_duration_estimates: Dict[str, float] = dict(self.DEFAULT_AGENT_DURATIONS)
+        
+        # Per-agent checkpoints so retries and restarts rerun only unfinished agents
+        self.state_manager = WorkflowStateManager(
+            FileCheckpointStorage(self.config.checkpoint_dir) if self.config.checkpoint_dir else None
+        )
+        
+        # Memoized results for repeated fintech requests
+        self.result_cache: Optional[WorkflowResultCache] = (
+            WorkflowResultCache(self.config.result_cache_freshness_seconds)
+            if self.config.enable_result_cache else None
+        )
+        
+        # Tenant-fair, priority-aware admission in front of workflow execution,
+        # shared with every other supervisor in the process using the same limits
+        self.admission_scheduler = get_admission_scheduler(
+            max_concurrent=self.config.max_concurrent_workflows,
+            reserved_critical_slots=self.config.reserved_critical_workflow_slots,
+            tenant_weights=self.config.tenant_weights
+        )
+        
+        # Shared queue and status store for multi-replica deployments
+        self.work_queue = work_queue
+        
+        # Coalesces workflow and agent progress into rate-limited, batched sends
+        self.progress_aggregator = ProgressAggregator(
+            self.config.progress_updates_per_second,
+            sinks=[self._deliver_progress_batch]
+        )
+        
         # Initialize LangGraph workflow
         self.workflow_graph = self._create_workflow_graph()
         
         logger.info("??SupervisorAgent initialized with AgentCore integration")
     
-    def _create_workflow_graph(self) -> StateGraph:
+    def _create_workflow_graph(self) -> Any:
         """
         Create LangGraph StateGraph for multi-agent workflow orchestration.
         
+        LangGraph is imported here rather than at module level so the API
+        process only pays for it when the first supervisor is built.
+        
         Returns:
-            StateGraph: Configured workflow graph
+            Compiled StateGraph workflow
         """
+        from langgraph.graph import StateGraph, END
+        
         # Define the workflow graph
         workflow = StateGraph(AgentWorkflowState)
         
@@ -204,24 +279,8 @@ class SupervisorAgent:
             workflow_id = str(uuid.uuid4())
         
         try:
-            # Initialize workflow state
-            initial_state: AgentWorkflowState = {
-                "workflow_id": workflow_id,
-                "user_id": user_id,
-                "validation_request": validation_request,
-                "current_phase": WorkflowPhase.INITIALIZATION,
-                "agent_assignments": {},
-                "agent_results": {},
-                "shared_context": {},
-                "messages": [HumanMessage(content=f"Starting validation workflow for: {validation_request.get('business_concept', 'Unknown')}")],
-                "errors": [],
-                "progress": 0.0,
-                "started_at": datetime.now(UTC),
-                "last_updated": datetime.now(UTC)
-            }
-            
             # Store workflow state
-            self.active_workflows[workflow_id] = initial_state
+            self.active_workflows[workflow_id] = self._build_initial_state(workflow_id, user_id, validation_request)
             
             # Use AgentCore workflow orchestration primitive
             orchestration_response = await self.agentcore_client.orchestrate_workflow(
@@ -235,6 +294,14 @@ class SupervisorAgent:
             )
             
             if orchestration_response.success:
+                if self.work_queue is not None:
+                    # Hand the workflow to whichever replica's worker claims it
+                    state = self.active_workflows.pop(workflow_id)
+                    await self._publish_status(state, status="queued")
+                    await self.work_queue.enqueue(workflow_id, user_id, validation_request)
+                    logger.info(f"??Workflow {workflow_id} queued for distributed execution")
+                    return workflow_id
+                
                 logger.info(f"??Workflow {workflow_id} started with AgentCore orchestration")
                 
                 # Execute workflow using LangGraph
@@ -248,12 +315,114 @@ class SupervisorAgent:
             logger.error(f"??Failed to start workflow {workflow_id}: {e}")
             raise
     
-    async def _execute_workflow(self, workflow_id: str) -> None:
+    def _build_initial_state(
+        self,
+        workflow_id: str,
+        user_id: str,
+        validation_request: Dict[str, Any]
+    ) -> AgentWorkflowState:
+        """Build the initial LangGraph state for a workflow"""
+        return {
+            "workflow_id": workflow_id,
+            "user_id": user_id,
+            "validation_request": validation_request,
+            "current_phase": WorkflowPhase.INITIALIZATION,
+            "agent_assignments": {},
+            "agent_results": {},
+            "shared_context": {},
+            "messages": [HumanMessage(content=f"Starting validation workflow for: {validation_request.get('business_concept', 'Unknown')}")],
+            "errors": [],
+            "progress": 0.0,
+            "started_at": datetime.now(UTC),
+            "last_updated": datetime.now(UTC)
+        }
+    
+    async def execute_queued_workflow(
+        self,
+        workflow_id: str,
+        user_id: str,
+        validation_request: Dict[str, Any]
+    ) -> None:
         """
-        Execute workflow using LangGraph StateGraph.
+        Run a workflow claimed from the work queue on this replica.
+        
+        The final status published to the shared store is the real outcome:
+        "completed", "timeout" or "failed". Checkpoints live in this
+        replica's ``checkpoint_dir``, so a job reclaimed by another replica
+        reruns all agents unless that directory is on shared storage.
         
         Args:
             workflow_id: Workflow identifier
+            user_id: User that started the workflow
+            validation_request: Validation request data
+        """
+        self.active_workflows[workflow_id] = self._build_initial_state(workflow_id, user_id, validation_request)
+        try:
+            await self._publish_status(self.active_workflows[workflow_id], status="running")
+            try:
+                outcome = await self._execute_workflow(workflow_id)
+            except Exception:
+                await self._publish_status(self.active_workflows[workflow_id], status="failed")
+                raise
+            await self._publish_status(self.active_workflows[workflow_id], status=outcome, include_results=True)
+        finally:
+            # The shared store is now the source of truth for this workflow
+            self.active_workflows.pop(workflow_id, None)
+    
+    async def _execute_workflow(self, workflow_id: str) -> Optional[str]:
+        """
+        Execute workflow using LangGraph StateGraph once admitted.
+        
+        Args:
+            workflow_id: Workflow identifier
+            
+        Returns:
+            Outcome of the run ("completed", "timeout" or "failed"), None if unknown
+        """
+        state = self.active_workflows.get(workflow_id)
+        if state is None:
+            return None
+        
+        tenant_id, priority = self._admission_class(state)
+        state["shared_context"]["admission"] = {
+            "status": "queued",
+            "tenant_id": tenant_id,
+            "priority": priority.value
+        }
+        
+        ticket = await self.admission_scheduler.acquire(tenant_id, priority)
+        try:
+            state["shared_context"]["admission"].update(
+                status="admitted",
+                wait_seconds=ticket.wait_seconds
+            )
+            return await self._run_workflow_graph(workflow_id)
+        finally:
+            self.admission_scheduler.release(ticket)
+            # Deliver anything still held back, then stop tracking the workflow
+            await self.progress_aggregator.flush([workflow_id])
+            self.progress_aggregator.forget(workflow_id)
+    
+    def _admission_class(self, state: AgentWorkflowState) -> Tuple[str, Priority]:
+        """
+        Tenant and priority class used to admit a workflow.
+        
+        Requests without a tenant are treated as their own tenant per user so
+        a single heavy user cannot starve the others either.
+        """
+        request = state["validation_request"]
+        tenant_id = request.get("tenant_id") or f"user:{state['user_id']}"
+        return str(tenant_id), parse_priority(request.get("priority"))
+    
+    async def _run_workflow_graph(self, workflow_id: str) -> str:
+        """
+        Run the LangGraph StateGraph for an admitted workflow.
+        
+        Args:
+            workflow_id: Workflow identifier
+            
+        Returns:
+            Outcome of the run: "completed", "timeout" or "failed"
         """
         try:
             state = self.active_workflows[workflow_id]
@@ -269,6 +438,7 @@ class SupervisorAgent:
                 self.active_workflows[workflow_id] = result
                 
                 logger.info(f"??Workflow {workflow_id} completed successfully")
+                return "completed"
                 
             except asyncio.TimeoutError:
                 logger.error(f"??Workflow {workflow_id} timed out after 5 minutes")
@@ -281,6 +451,8 @@ class SupervisorAgent:
                     })
                     self.active_workflows[workflow_id]["current_phase"] = WorkflowPhase.COMPLETION
                     self.active_workflows[workflow_id]["progress"] = 1.0
+                await self._discard_checkpoints(workflow_id)
+                return "timeout"
             
         except Exception as e:
             logger.error(f"??Workflow {workflow_id} execution failed: {e}")
@@ -293,6 +465,8 @@ class SupervisorAgent:
                 })
                 self.active_workflows[workflow_id]["current_phase"] = WorkflowPhase.COMPLETION
                 self.active_workflows[workflow_id]["progress"] = 1.0
+            await self._discard_checkpoints(workflow_id)
+            return "failed"
     
     async def _initialize_workflow_node(self, state: AgentWorkflowState) -> AgentWorkflowState:
         """Initialize workflow node for LangGraph"""
@@ -316,6 +490,10 @@ class SupervisorAgent:
         """Distribute tasks to agents using AgentCore task distribution"""
         logger.info(f"?? Distributing tasks for workflow {state['workflow_id']}")
         
+        # Re-entry from the quality check is a retry; count it so retries stay bounded
+        if state["current_phase"] == WorkflowPhase.QUALITY_ASSURANCE:
+            state["shared_context"]["retry_count"] = state["shared_context"].get("retry_count", 0) + 1
+        
         state["current_phase"] = WorkflowPhase.TASK_DISTRIBUTION
         state["progress"] = 0.2
         
@@ -402,6 +580,15 @@ class SupervisorAgent:
                         }
                     }
             
+            # Record inter-agent dependencies so execution can follow the DAG,
+            # and task priorities so contended agent slots go to urgent work first
+            for agent_id, assignment in agent_assignments.items():
+                assignment["dependencies"] = [
+                    dep for dep in self._get_task_dependencies(agent_id)
+                    if dep in agent_assignments
+                ]
+                assignment["priority"] = self._fintech_task_priority(agent_id).value
+            
             # Use AgentCore task distribution primitive
             for agent_id, assignment in agent_assignments.items():
                 task_data = {
@@ -453,7 +640,10 @@ class SupervisorAgent:
             from ..models.agent_models import AgentType as ModelAgentType
             
             agent_factory = get_agent_factory(self.bedrock_client)
-            agent_results = {}
+            
+            # Agents that already completed in an earlier attempt (or before a
+            # restart) keep their results; only failed or timed-out agents rerun
+            agent_results = await self._restore_completed_agent_results(state)
             
             # Create agent type mapping (6 fintech agents)
             agent_type_mapping = {
@@ -466,60 +656,121 @@ class SupervisorAgent:
                 "kyc_verification": ModelAgentType.KYC_VERIFICATION
             }
             
-            # Execute agents in parallel with timeout
-            agent_tasks = []
+            # Only agents we can build are scheduled; dependencies on agents
+            # outside this workflow are dropped so they cannot stall the DAG
+            assignments = {
+                agent_id: assignment
+                for agent_id, assignment in state["agent_assignments"].items()
+                if agent_id in agent_type_mapping
+            }
+            dependency_graph = self._build_dependency_graph(assignments)
+            critical_path, expected_makespan = self._compute_critical_path(
+                dependency_graph,
+                {agent_id: self._expected_agent_duration(agent_id) for agent_id in assignments}
+            )
+            
+            # Each agent starts as soon as all of its upstream agents have
+            # finished; the shared semaphore bounds how many call Bedrock at once
+            loop = asyncio.get_event_loop()
+            schedule_start = loop.time()
+            waiting = {
+                agent_id: upstream for agent_id, upstream in dependency_graph.items()
+                if agent_id not in agent_results
+            }
+            running: set = set()
+            agent_timings: Dict[str, Dict[str, float]] = {}
             
-            for agent_id, assignment in state["agent_assignments"].items():
-                agent_type = agent_type_mapping.get(agent_id)
-                if agent_type:
-                    # Create agent task
-                    task = self._execute_single_agent(
-                        agent_factory, agent_type, agent_id, assignment, state["workflow_id"]
+            # Memoized fintech workflows reuse agents whose inputs are unchanged
+            validation_request = state["validation_request"]
+            cache_enabled = self.result_cache is not None and "result_cache_key" in validation_request
+            reuse_cached = cache_enabled and not validation_request.get("force_recompute", False)
+            agent_input_keys: Dict[str, str] = {}
+            
+            def launch_ready_agents() -> None:
+                ready = sorted(
+                    (agent_id for agent_id, upstream in waiting.items()
+                     if all(dep in agent_results for dep in upstream)),
+                    key=lambda agent_id: PRIORITY_ORDER.index(
+                        parse_priority(assignments[agent_id].get("priority"))
                     )
-                    agent_tasks.append((agent_id, task))
+                )
+                for agent_id in ready:
+                    upstream = waiting.pop(agent_id)
+                    agent_timings[agent_id] = {"started_at": loop.time() - schedule_start}
+                    assignment = self._with_upstream_results(assignments[agent_id], upstream, agent_results)
+                    
+                    cached_result = None
+                    if cache_enabled:
+                        agent_input_keys[agent_id] = WorkflowResultCache.agent_input_key(
+                            assignment, state["user_id"], validation_request.get("tenant_id")
+                        )
+                        if reuse_cached:
+                            cached_result = self.result_cache.get_agent_result(
+                                agent_id, agent_input_keys[agent_id]
+                            )
+                    
+                    if cached_result is not None:
+                        logger.info(f"?? Reusing cached result for {agent_id}")
+                        agent_run = self._reuse_cached_agent_result(agent_id, cached_result)
+                    else:
+                        agent_run = self._run_agent_with_deadline(
+                            agent_factory,
+                            agent_type_mapping[agent_id],
+                            agent_id,
+                            assignment,
+                            state["workflow_id"]
+                        )
+                    running.add(asyncio.create_task(agent_run, name=f"{state['workflow_id']}_{agent_id}"))
             
-            # Wait for all agents to complete with timeout
-            logger.info(f"?? Starting {len(agent_tasks)} agents in parallel")
+            logger.info(f"?? Scheduling {len(assignments)} agents "
+                        f"(concurrency cap {self.config.max_concurrent_agents}, "
+                        f"critical path {' -> '.join(critical_path) or 'none'})")
             
-            # Update progress as agents complete
-            completed_agents = 0
-            total_agents = len(agent_tasks)
+            # Update progress as agents complete, in completion order
+            completed_agents = len(agent_results)
+            total_agents = len(assignments)
             
-            for agent_id, task in agent_tasks:
-                try:
-                    # Wait for individual agent with timeout
-                    result = await asyncio.wait_for(task, timeout=120)  # 2 minutes per agent
-                    agent_results[agent_id] = result
-                    completed_agents += 1
-                    
-                    # Update progress
-                    progress = 0.3 + (0.4 * completed_agents / total_agents)
-                    state["progress"] = progress
-                    await self._send_progress_update(state)
-                    
-                    logger.info(f"??Agent {agent_id} completed ({completed_agents}/{total_agents})")
-                    
-                except asyncio.TimeoutError:
-                    logger.error(f"??Agent {agent_id} timed out after 2 minutes")
-                    agent_results[agent_id] = {
-                        "status": "timeout",
-                        "result": f"Agent {agent_id} execution timed out",
-                        "confidence": 0.0,
-                        "execution_time": 120.0,
-                        "error": "Execution timeout"
-                    }
-                    completed_agents += 1
+            try:
+                launch_ready_agents()
+                while running:
+                    done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                    for finished in done:
+                        running.discard(finished)
+                        agent_id, result = finished.result()
+                        agent_results[agent_id] = result
+                        agent_timings[agent_id]["finished_at"] = loop.time() - schedule_start
+                        completed_agents += 1
+                        
+                        if result.get("status") == "completed" and not result.get("cached"):
+                            self._record_agent_duration(agent_id, result.get("execution_time"))
+                            if cache_enabled and not result.get("mock_data"):
+                                self.result_cache.put_agent_result(agent_id, agent_input_keys[agent_id], result)
+                        
+                        state["agent_results"] = agent_results
+                        state["progress"] = 0.3 + (0.4 * completed_agents / total_agents)
+                        await self._checkpoint_agent_results(state)
+                        await self._send_progress_update(state)
+                        
+                        logger.info(f"??Agent {agent_id} finished with status {result.get('status')} "
+                                    f"({completed_agents}/{total_agents})")
                     
-                except Exception as agent_error:
-                    logger.error(f"??Agent {agent_id} execution failed: {agent_error}")
-                    agent_results[agent_id] = {
-                        "status": "failed",
-                        "result": f"Agent execution failed: {agent_error}",
-                        "confidence": 0.0,
-                        "execution_time": 0.0,
-                        "error": str(agent_error)
-                    }
-                    completed_agents += 1
+                    launch_ready_agents()
+            finally:
+                # Workflow-level cancellation or timeout must not leave agents running
+                for task in running:
+                    if not task.done():
+                        task.cancel()
+            
+            actual_makespan = loop.time() - schedule_start
+            state["shared_context"]["execution_schedule"] = {
+                "dependencies": dependency_graph,
+                "critical_path": critical_path,
+                "expected_makespan_seconds": expected_makespan,
+                "actual_makespan_seconds": actual_makespan,
+                "agent_timings": agent_timings
+            }
+            logger.info(f"?? Workflow {state['workflow_id']} makespan {actual_makespan:.1f}s "
+                        f"(expected {expected_makespan:.1f}s)")
             
             state["agent_results"] = agent_results
             state["progress"] = 0.7
@@ -550,15 +801,20 @@ class SupervisorAgent:
         self,
         user_id: str,
         risk_analysis_request: Dict[str, Any],
-        workflow_id: Optional[str] = None
+        workflow_id: Optional[str] = None,
+        force_recompute: bool = False
     ) -> str:
         """
         Start fintech-specific workflow for risk intelligence analysis.
         
+        Identical requests completed within their freshness window are served
+        from the result cache without running any agents.
+        
         Args:
             user_id: User initiating the workflow
             risk_analysis_request: Fintech risk analysis request data
             workflow_id: Optional workflow ID (generated if not provided)
+            force_recompute: Ignore cached results and run every agent again
             
         Returns:
             str: Workflow ID
@@ -577,6 +833,17 @@ class SupervisorAgent:
                 'fintech_workflow': True
             }
             
+            if self.result_cache is not None:
+                request_key = WorkflowResultCache.request_key(enhanced_request, user_id)
+                enhanced_request['result_cache_key'] = request_key
+                enhanced_request['force_recompute'] = force_recompute
+                
+                cached = None if force_recompute else self.result_cache.get_workflow(request_key)
+                if cached is not None:
+                    logger.info(f"🏦 Serving fintech workflow {workflow_id} from cache")
+                    await self._complete_from_cache(workflow_id, user_id, enhanced_request, cached)
+                    return workflow_id
+            
             logger.info(f"🏦 Starting fintech workflow {workflow_id} for user {user_id}")
             
             # Use existing workflow start logic with enhancements
@@ -586,6 +853,50 @@ class SupervisorAgent:
             logger.error(f"❌ Failed to start fintech workflow {workflow_id}: {e}")
             raise
     
+    async def _complete_from_cache(
+        self,
+        workflow_id: str,
+        user_id: str,
+        validation_request: Dict[str, Any],
+        cached: Dict[str, Any]
+    ) -> None:
+        """
+        Register a workflow that is fully satisfied by a cached result.
+        
+        Args:
+            workflow_id: Workflow identifier
+            user_id: User initiating the workflow
+            validation_request: Enhanced fintech request
+            cached: Cached workflow entry from the result cache
+        """
+        now = datetime.now(UTC)
+        agent_results = {
+            agent_id: {**result, "cached": True}
+            for agent_id, result in cached["agent_results"].items()
+        }
+        state: AgentWorkflowState = {
+            "workflow_id": workflow_id,
+            "user_id": user_id,
+            "validation_request": validation_request,
+            "current_phase": WorkflowPhase.COMPLETION,
+            "agent_assignments": {agent_id: {"cached": True} for agent_id in agent_results},
+            "agent_results": agent_results,
+            "shared_context": {
+                **cached["shared_context"],
+                "cache_hit": True,
+                "cached_at": cached["cached_at"]
+            },
+            "messages": [AIMessage(content="Workflow served from cached results")],
+            "errors": [],
+            "progress": 1.0,
+            "started_at": now,
+            "last_updated": now
+        }
+        self.active_workflows[workflow_id] = state
+        # Other replicas serve status (and results) from the shared store
+        await self._publish_status(state, status="completed", include_results=True)
+        await self._send_progress_update(state)
+    
     async def _ai_fintech_task_prioritization(self, workflow_state: AgentWorkflowState) -> List[TaskAssignment]:
         """
         Enhanced task prioritization for fintech workflows using AI reasoning.
@@ -635,6 +946,18 @@ class SupervisorAgent:
             # Fallback to default prioritization
             return self._default_fintech_task_prioritization(workflow_state)
     
+    def _fintech_task_priority(self, agent_id: str) -> Priority:
+        """Priority of an agent's task based on fintech requirements"""
+        fintech_priority_map = {
+            'regulatory_compliance': Priority.CRITICAL,  # Compliance violations are critical
+            'fraud_detection': Priority.HIGH,           # Fraud threats are high priority
+            'risk_assessment': Priority.HIGH,           # Risk analysis is high priority
+            'market_analysis': Priority.MEDIUM,         # Market analysis is medium priority
+            'customer_behavior_intelligence': Priority.MEDIUM,  # Customer analysis is medium priority
+            'kyc_verification': Priority.HIGH           # KYC compliance is high priority
+        }
+        return fintech_priority_map.get(agent_id, Priority.MEDIUM)
+    
     def _parse_fintech_task_priorities(self, priority_analysis: str, workflow_state: AgentWorkflowState) -> List[TaskAssignment]:
         """
         Parse AI-generated task priorities into TaskAssignment objects.
@@ -649,19 +972,9 @@ class SupervisorAgent:
         try:
             task_assignments = []
             
-            # Define priority mapping based on fintech requirements
-            fintech_priority_map = {
-                'regulatory_compliance': Priority.CRITICAL,  # Compliance violations are critical
-                'fraud_detection': Priority.HIGH,           # Fraud threats are high priority
-                'risk_assessment': Priority.HIGH,           # Risk analysis is high priority
-                'market_analysis': Priority.MEDIUM,         # Market analysis is medium priority
-                'customer_behavior_intelligence': Priority.MEDIUM,  # Customer analysis is medium priority
-                'kyc_verification': Priority.HIGH           # KYC compliance is high priority
-            }
-            
             # Create task assignments based on agent assignments
             for agent_id, assignment in workflow_state['agent_assignments'].items():
-                priority = fintech_priority_map.get(agent_id, Priority.MEDIUM)
+                priority = self._fintech_task_priority(agent_id)
                 
                 task_assignment = TaskAssignment(
                     assigned_to=agent_id,
@@ -707,6 +1020,260 @@ class SupervisorAgent:
         
         return dependencies.get(agent_id, [])
     
+    def _build_dependency_graph(self, assignments: Dict[str, Dict[str, Any]]) -> Dict[str, List[str]]:
+        """
+        Build the agent dependency graph for a set of assignments.
+        
+        Dependencies on agents that are not part of the workflow are dropped.
+        If the remaining graph contains a cycle, all dependencies are ignored
+        and the agents run fully in parallel rather than deadlocking.
+        
+        Args:
+            assignments: Agent assignments keyed by agent ID
+            
+        Returns:
+            Mapping of agent ID to the agent IDs it waits for
+        """
+        graph = {
+            agent_id: [dep for dep in assignment.get("dependencies", []) if dep in assignments and dep != agent_id]
+            for agent_id, assignment in assignments.items()
+        }
+        
+        # Kahn's algorithm: every node must eventually become ready
+        remaining = {agent_id: len(deps) for agent_id, deps in graph.items()}
+        ready = [agent_id for agent_id, count in remaining.items() if count == 0]
+        resolved = 0
+        while ready:
+            current = ready.pop()
+            resolved += 1
+            for agent_id, deps in graph.items():
+                if current in deps:
+                    remaining[agent_id] -= 1
+                    if remaining[agent_id] == 0:
+                        ready.append(agent_id)
+        
+        if resolved != len(graph):
+            logger.warning(f"⚠️ Cyclic agent dependencies {graph}; running agents without ordering")
+            return {agent_id: [] for agent_id in graph}
+        
+        return graph
+    
+    def _compute_critical_path(
+        self,
+        dependency_graph: Dict[str, List[str]],
+        durations: Dict[str, float]
+    ) -> Tuple[List[str], float]:
+        """
+        Compute the critical path of an acyclic agent dependency graph.
+        
+        Args:
+            dependency_graph: Mapping of agent ID to its upstream agent IDs
+            durations: Expected run time per agent in seconds
+            
+        Returns:
+            Tuple of the agent IDs on the critical path (in execution order)
+            and the expected makespan in seconds
+        """
+        finish_times: Dict[str, float] = {}
+        predecessor: Dict[str, Optional[str]] = {}
+        
+        def earliest_finish(agent_id: str) -> float:
+            if agent_id not in finish_times:
+                upstream = dependency_graph.get(agent_id, [])
+                slowest = max(upstream, key=earliest_finish, default=None)
+                predecessor[agent_id] = slowest
+                start = earliest_finish(slowest) if slowest else 0.0
+                finish_times[agent_id] = start + durations.get(agent_id, 0.0)
+            return finish_times[agent_id]
+        
+        if not dependency_graph:
+            return [], 0.0
+        
+        last = max(dependency_graph, key=earliest_finish)
+        path = []
+        node: Optional[str] = last
+        while node:
+            path.append(node)
+            node = predecessor[node]
+        
+        return list(reversed(path)), finish_times[last]
+    
+    def _expected_agent_duration(self, agent_id: str) -> float:
+        """Expected run time for an agent, based on observed history when available"""
+        return self._agent_duration_estimates.get(agent_id, self.config.agent_timeout_seconds / 4)
+    
+    def _record_agent_duration(self, agent_id: str, execution_time: Optional[float]) -> None:
+        """Fold an observed run time into the agent's smoothed duration estimate"""
+        if not execution_time or execution_time <= 0:
+            return
+        previous = self._agent_duration_estimates.get(agent_id)
+        self._agent_duration_estimates[agent_id] = (
+            execution_time if previous is None else 0.7 * previous + 0.3 * execution_time
+        )
+    
+    def _with_upstream_results(
+        self,
+        assignment: Dict[str, Any],
+        upstream: List[str],
+        agent_results: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Return a copy of an assignment with upstream agent outputs as inputs.
+        
+        Only successful upstream results are passed on; a failed upstream agent
+        does not block its dependents, they simply run without its output.
+        
+        Args:
+            assignment: Task assignment for the downstream agent
+            upstream: Agent IDs the downstream agent depends on
+            agent_results: Results collected so far in this workflow
+            
+        Returns:
+            Assignment whose parameters include ``upstream_results``
+        """
+        if not upstream:
+            return assignment
+        
+        upstream_results = {
+            dep: agent_results[dep].get("result")
+            for dep in upstream
+            if agent_results.get(dep, {}).get("status") == "completed"
+        }
+        return {
+            **assignment,
+            "parameters": {**assignment.get("parameters", {}), "upstream_results": upstream_results}
+        }
+    
+    async def _restore_completed_agent_results(self, state: AgentWorkflowState) -> Dict[str, Any]:
+        """
+        Collect completed agent results from the current state and the latest checkpoint.
+        
+        Args:
+            state: Current workflow state
+            
+        Returns:
+            Completed results keyed by agent ID, limited to assigned agents
+        """
+        completed = {}
+        
+        try:
+            checkpoint = await self.state_manager.get_latest_checkpoint(state["workflow_id"])
+        except Exception as e:
+            logger.error(f"??Failed to load checkpoint for workflow {state['workflow_id']}: {e}")
+            checkpoint = None
+        
+        if checkpoint is not None:
+            completed.update(checkpoint.state_data.get("agent_results", {}))
+        completed.update(state.get("agent_results", {}))
+        
+        completed = {
+            agent_id: result for agent_id, result in completed.items()
+            if agent_id in state["agent_assignments"] and result.get("status") == "completed"
+        }
+        if completed:
+            logger.info(f"?? Resuming workflow {state['workflow_id']} with "
+                        f"{len(completed)} completed agents: {sorted(completed)}")
+        return completed
+    
+    async def _checkpoint_agent_results(self, state: AgentWorkflowState) -> None:
+        """
+        Checkpoint the completed agent results of a workflow.
+        
+        Checkpointing is best effort: a storage failure is logged and the
+        workflow carries on without it.
+        
+        Args:
+            state: Current workflow state
+        """
+        completed = {
+            agent_id: result for agent_id, result in state["agent_results"].items()
+            if result.get("status") == "completed"
+        }
+        
+        try:
+            # One checkpoint per workflow, overwritten as agents complete, so
+            # storage stays linear in the number of agents
+            await self.state_manager.create_checkpoint(
+                workflow_id=state["workflow_id"],
+                state_data={"agent_results": completed},
+                completed_steps=sorted(completed),
+                current_step=WorkflowPhase.PARALLEL_EXECUTION.value,
+                metadata={
+                    "user_id": state["user_id"],
+                    "validation_request": state["validation_request"]
+                },
+                checkpoint_id=f"{state['workflow_id']}_latest"
+            )
+        except Exception as e:
+            logger.error(f"??Failed to checkpoint workflow {state['workflow_id']}: {e}")
+    
+    async def _discard_checkpoints(self, workflow_id: str) -> None:
+        """Delete the checkpoints of a workflow that reached a terminal state"""
+        try:
+            await self.state_manager.delete_checkpoints(workflow_id)
+        except Exception as e:
+            logger.error(f"??Failed to delete checkpoints for workflow {workflow_id}: {e}")
+    
+    async def resume_workflow(self, workflow_id: str) -> bool:
+        """
+        Resume a workflow from its latest checkpoint, e.g. after a restart.
+        
+        Only agents without a completed result in the checkpoint are executed.
+        
+        Args:
+            workflow_id: Workflow identifier
+            
+        Returns:
+            bool: True if the workflow was resumed
+        """
+        if workflow_id in self.active_workflows:
+            return False
+        
+        checkpoint = await self.state_manager.get_latest_checkpoint(workflow_id)
+        if checkpoint is None:
+            logger.warning(f"No checkpoint found for workflow {workflow_id}")
+            return False
+        
+        await self.start_workflow(
+            checkpoint.metadata.get("user_id", "unknown"),
+            checkpoint.metadata.get("validation_request", {}),
+            workflow_id
+        )
+        return True
+    
+    async def resume_unfinished_workflows(self) -> List[str]:
+        """
+        Resume every checkpointed workflow that is not running, e.g. on start-up.
+        
+        In queue mode the work queue reclaims interrupted jobs itself, so
+        nothing is resumed here.
+        
+        Returns:
+            List of resumed workflow IDs
+        """
+        if self.work_queue is not None:
+            return []
+        
+        resumed = []
+        for workflow_id in await self.state_manager.list_workflow_ids():
+            try:
+                if await self.resume_workflow(workflow_id):
+                    resumed.append(workflow_id)
+            except Exception as e:
+                logger.error(f"??Failed to resume workflow {workflow_id}: {e}")
+        
+        if resumed:
+            logger.info(f"?? Resumed {len(resumed)} unfinished workflows from checkpoints")
+        return resumed
+    
+    async def _reuse_cached_agent_result(
+        self,
+        agent_id: str,
+        cached_result: Dict[str, Any]
+    ) -> Tuple[str, Dict[str, Any]]:
+        """Stand-in for an agent run that is satisfied from the result cache"""
+        return agent_id, {**cached_result, "cached": True}
+    
     def _default_fintech_task_prioritization(self, workflow_state: AgentWorkflowState) -> List[TaskAssignment]:
         """
         Default fintech task prioritization when AI prioritization fails.
@@ -993,45 +1560,50 @@ class SupervisorAgent:
         
         return average_score
     
-    def _extract_fintech_quality_score(self, quality_analysis: str, agent_results: Dict[str, Any]) -> float:
+    def _rule_based_quality_assessment(self, agent_results: Dict[str, Any]) -> Dict[str, float]:
         """
-        Extract quality score from AI analysis.
+        Deterministic quality score from agent statistics (no LLM call).
+        
+        Combines mean confidence of completed agents with completeness,
+        cross-agent consistency (spread of confidences) and the timeout rate:
+        ``score = confidence * (0.6 + 0.4 * completeness)
+        * (0.8 + 0.2 * consistency) * (1 - 0.1 * timeout_rate)``.
         
         Args:
-            quality_analysis: AI-generated quality analysis
-            agent_results: Agent results for fallback calculation
+            agent_results: Results from all agents
             
         Returns:
-            Quality score (0-1)
+            Dict with ``score`` and its components, all in 0-1
         """
-        try:
-            # Try to extract numerical score from AI response
-            import re
-            
-            # Look for patterns like "0.85", "87%", "8.2/10"
-            score_patterns = [
-                r'(?:score|quality):\s*(\d+\.?\d*)',  # "Quality score: 0.85"
-                r'quality\s+is\s+(\d+)%',             # "The quality is 87%"
-                r'rating:\s*(\d+\.?\d*)/10',          # "Rating: 8.2/10"
-                r'(\d+\.?\d*)\s+achieved',            # "Score of 0.91 achieved"
-                r'(?:score|quality).*?(\d+\.?\d*)',   # General fallback
-            ]
-            
-            for pattern in score_patterns:
-                matches = re.findall(pattern, quality_analysis.lower())
-                if matches:
-                    score = float(matches[0])
-                    # Normalize to 0-1 range
-                    if score > 1.0:
-                        score = score / 100.0 if score <= 100 else score / 10.0
-                    return min(max(score, 0.0), 1.0)
-            
-            # Fallback to basic assessment
-            return self._basic_fintech_quality_assessment(agent_results)
-            
-        except Exception as e:
-            logger.error(f"❌ Failed to extract quality score: {e}")
-            return self._basic_fintech_quality_assessment(agent_results)
+        results = [result for result in agent_results.values() if isinstance(result, dict)]
+        confidences = [
+            float(result.get("confidence", 0.0) or 0.0)
+            for result in results if result.get("status") == "completed"
+        ]
+        
+        if not confidences:
+            return {"score": 0.0, "confidence": 0.0, "completeness": 0.0,
+                    "consistency": 0.0, "timeout_rate": 0.0}
+        
+        confidence = statistics.fmean(confidences)
+        completeness = len(confidences) / len(results)
+        consistency = 1.0 - min(1.0, 2.0 * statistics.pstdev(confidences))
+        timeout_rate = sum(1 for result in results if result.get("status") == "timeout") / len(results)
+        
+        score = (
+            confidence
+            * (0.6 + 0.4 * completeness)
+            * (0.8 + 0.2 * consistency)
+            * (1.0 - 0.1 * timeout_rate)
+        )
+        
+        return {
+            "score": min(max(score, 0.0), 1.0),
+            "confidence": confidence,
+            "completeness": completeness,
+            "consistency": consistency,
+            "timeout_rate": timeout_rate
+        }
     
     def _create_fintech_agent_assignments(self, validation_request: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
         """
@@ -1143,6 +1715,61 @@ class SupervisorAgent:
         logger.info(f"🏦 Created {len(agent_assignments)} fintech agent assignments")
         return agent_assignments
     
+    async def _run_agent_with_deadline(
+        self,
+        agent_factory,
+        agent_type,
+        agent_id: str,
+        assignment: Dict[str, Any],
+        workflow_id: str
+    ) -> Tuple[str, Dict[str, Any]]:
+        """
+        Run a single agent under the global concurrency cap and its own deadline.
+        
+        The deadline starts once the agent holds a concurrency slot, so time
+        spent queued behind other workflows does not count against it.
+        
+        Args:
+            agent_factory: Agent factory instance
+            agent_type: Type of agent to create
+            agent_id: Agent identifier
+            assignment: Task assignment (may override ``timeout_seconds``)
+            workflow_id: Workflow identifier
+            
+        Returns:
+            Tuple of agent ID and its result dictionary
+        """
+        timeout = assignment.get("timeout_seconds", self.config.agent_timeout_seconds)
+        
+        async with self._agent_semaphore.slot(parse_priority(assignment.get("priority"))):
+            try:
+                result = await asyncio.wait_for(
+                    self._execute_single_agent(
+                        agent_factory, agent_type, agent_id, assignment, workflow_id
+                    ),
+                    timeout=timeout
+                )
+            except asyncio.TimeoutError:
+                logger.error(f"??Agent {agent_id} timed out after {timeout:.0f}s")
+                result = {
+                    "status": "timeout",
+                    "result": f"Agent {agent_id} execution timed out",
+                    "confidence": 0.0,
+                    "execution_time": float(timeout),
+                    "error": "Execution timeout"
+                }
+            except Exception as agent_error:
+                logger.error(f"??Agent {agent_id} execution failed: {agent_error}")
+                result = {
+                    "status": "failed",
+                    "result": f"Agent execution failed: {agent_error}",
+                    "confidence": 0.0,
+                    "execution_time": 0.0,
+                    "error": str(agent_error)
+                }
+        
+        return agent_id, result
+    
     async def _execute_single_agent(
         self, 
         agent_factory, 
@@ -1173,9 +1800,10 @@ class SupervisorAgent:
             agent = agent_factory.create_agent(
                 agent_type=agent_type,
                 agent_id=f"{workflow_id}_{agent_id}",
-                timeout_seconds=120,
+                timeout_seconds=int(assignment.get("timeout_seconds", self.config.agent_timeout_seconds)),
                 max_retries=2
             )
+            agent.progress_reporter = self._agent_progress_reporter(workflow_id, agent_id)
             
             # Start the agent
             await agent.start()
@@ -1533,27 +2161,24 @@ class SupervisorAgent:
         state["progress"] = 0.9
         
         try:
-            # Calculate quality score based on agent results
-            total_confidence = 0.0
-            completed_agents = 0
+            # Fast deterministic score first; the LLM review is only worth its
+            # latency when the score is too close to the threshold to call
+            assessment = self._rule_based_quality_assessment(state["agent_results"])
+            quality_score = assessment["score"]
+            quality_method = "rules"
             
-            for agent_id, result in state["agent_results"].items():
-                if result.get("status") == "completed":
-                    total_confidence += result.get("confidence", 0.0)
-                    completed_agents += 1
+            uncertain = abs(quality_score - self.config.quality_threshold) <= self.config.quality_uncertainty_band
+            if uncertain and assessment["completeness"] > 0 and self.config.enable_llm_quality_escalation:
+                logger.info(f"Quality score {quality_score:.2f} within uncertainty band, escalating to LLM review")
+                quality_score = await self._ai_fintech_quality_assessment(state["agent_results"])
+                quality_method = "llm"
             
-            if completed_agents > 0:
-                average_confidence = total_confidence / completed_agents
-                state["shared_context"]["quality_score"] = average_confidence
-                
-                # Check if quality meets threshold
-                quality_passed = average_confidence >= self.config.quality_threshold
-                state["shared_context"]["quality_passed"] = quality_passed
-                
-                logger.info(f"Quality score: {average_confidence:.2f}, Passed: {quality_passed}")
-            else:
-                state["shared_context"]["quality_score"] = 0.0
-                state["shared_context"]["quality_passed"] = False
+            quality_passed = quality_score >= self.config.quality_threshold
+            state["shared_context"]["quality_score"] = quality_score
+            state["shared_context"]["quality_passed"] = quality_passed
+            state["shared_context"]["quality_assessment"] = {**assessment, "method": quality_method}
+            
+            logger.info(f"Quality score: {quality_score:.2f} ({quality_method}), Passed: {quality_passed}")
             
             state["messages"].append(
                 AIMessage(content=f"Quality check completed. Score: {state['shared_context']['quality_score']:.2f}")
@@ -1582,15 +2207,44 @@ class SupervisorAgent:
             AIMessage(content="Workflow completed successfully")
         )
         
+        # Checkpoints are only needed while the workflow can still be retried
+        await self._discard_checkpoints(state["workflow_id"])
+        
+        # Only fully successful runs are memoized for identical requests
+        request_key = state["validation_request"].get("result_cache_key")
+        agent_results = state["agent_results"]
+        if (self.result_cache is not None and request_key and agent_results
+                and all(result.get("status") == "completed" and not result.get("mock_data")
+                        for result in agent_results.values())):
+            self.result_cache.put_workflow(
+                request_key,
+                scopes_for_agents(agent_results),
+                agent_results,
+                {
+                    key: value for key, value in state["shared_context"].items()
+                    if key in ("synthesis_result", "quality_score", "quality_passed", "quality_assessment")
+                }
+            )
+        
         # Send final progress update
         await self._send_progress_update(state)
         
         return state
     
     def _should_retry_workflow(self, state: AgentWorkflowState) -> str:
-        """Determine if workflow should retry or complete"""
+        """
+        Determine if workflow should retry or complete.
+        
+        A retry only reruns agents without a completed result, so it is
+        pointless once every assigned agent has completed; retries are also
+        capped at ``max_retries`` per workflow.
+        """
         quality_passed = state["shared_context"].get("quality_passed", False)
-        error_count = len(state["errors"])
+        retry_count = state["shared_context"].get("retry_count", 0)
+        unfinished_agents = [
+            agent_id for agent_id in state["agent_assignments"]
+            if state["agent_results"].get(agent_id, {}).get("status") != "completed"
+        ]
         
         # Check if errors are credential-related (don't retry for these)
         credential_errors = any("credential" in str(error).lower() or "boto3" in str(error).lower() 
@@ -1606,8 +2260,13 @@ class SupervisorAgent:
         if quality_passed or quality_acceptable or credential_errors or mock_data_results:
             logger.info(f"Workflow {state['workflow_id']} completing (quality_passed={quality_passed}, quality_acceptable={quality_acceptable}, credential_errors={credential_errors}, mock_data={mock_data_results})")
             return "complete"
-        elif error_count < self.config.max_retries:
-            logger.info(f"Workflow {state['workflow_id']} will retry due to quality/errors")
+        elif not unfinished_agents:
+            logger.info(f"Workflow {state['workflow_id']} completing below quality threshold, "
+                        f"no failed or timed-out agents left to rerun")
+            return "complete"
+        elif retry_count < self.config.max_retries:
+            logger.info(f"Workflow {state['workflow_id']} will retry agents {unfinished_agents} "
+                        f"(retry {retry_count + 1}/{self.config.max_retries})")
             return "retry"
         else:
             logger.warning(f"Workflow {state['workflow_id']} exceeded max retries")
@@ -1662,7 +2321,7 @@ class SupervisorAgent:
     
     def get_workflow_status(self, workflow_id: str) -> Optional[Dict[str, Any]]:
         """
-        Get current status of a workflow.
+        Get current status of a workflow running on this replica.
         
         Args:
             workflow_id: Workflow identifier
@@ -1671,52 +2330,168 @@ class SupervisorAgent:
             Dict containing workflow status or None if not found
         """
         if workflow_id in self.active_workflows:
-            state = self.active_workflows[workflow_id]
-            return {
-                "workflow_id": workflow_id,
-                "current_phase": state["current_phase"],
-                "progress": state["progress"],
-                "started_at": state["started_at"],
-                "last_updated": state["last_updated"],
-                "agent_count": len(state["agent_assignments"]),
-                "error_count": len(state["errors"]),
-                "quality_score": state["shared_context"].get("quality_score")
-            }
+            return self._workflow_status_summary(self.active_workflows[workflow_id])
         return None
     
     def get_active_workflows(self) -> List[str]:
         """
-        Get list of active workflow IDs.
+        Get list of active workflow IDs on this replica.
         
         Returns:
             List of active workflow IDs
         """
         return list(self.active_workflows.keys())
     
+    async def fetch_workflow_status(self, workflow_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get workflow status from this replica or, failing that, the shared store.
+        
+        Args:
+            workflow_id: Workflow identifier
+            
+        Returns:
+            Dict containing workflow status or None if not found
+        """
+        status = self.get_workflow_status(workflow_id)
+        if status is not None or self.work_queue is None:
+            return status
+        
+        stored = await self.work_queue.get_status(workflow_id)
+        if stored is None:
+            return None
+        
+        # Restore the types returned for local workflows; records written
+        # outside a workflow run (e.g. abandoned jobs) may lack a phase
+        if stored.get("current_phase"):
+            stored["current_phase"] = WorkflowPhase(stored["current_phase"])
+        for field in ("started_at", "last_updated"):
+            if stored.get(field):
+                stored[field] = datetime.fromisoformat(stored[field])
+        return stored
+    
+    async def fetch_active_workflows(self) -> List[str]:
+        """
+        Get IDs of workflows known to this replica or the shared store.
+        
+        Returns:
+            List of workflow IDs
+        """
+        workflow_ids = self.get_active_workflows()
+        if self.work_queue is not None:
+            known = set(workflow_ids)
+            workflow_ids.extend(wid for wid in await self.work_queue.list_workflow_ids() if wid not in known)
+        return workflow_ids
+    
+    def _workflow_status_summary(self, state: AgentWorkflowState) -> Dict[str, Any]:
+        """Status fields reported for a workflow state"""
+        return {
+            "workflow_id": state["workflow_id"],
+            "current_phase": state["current_phase"],
+            "progress": state["progress"],
+            "started_at": state["started_at"],
+            "last_updated": state["last_updated"],
+            "agent_count": len(state["agent_assignments"]),
+            "error_count": len(state["errors"]),
+            "quality_score": state["shared_context"].get("quality_score"),
+            "admission": state["shared_context"].get("admission")
+        }
+    
+    def _serialize_status(self, state: AgentWorkflowState, status: Optional[str] = None) -> Dict[str, Any]:
+        """JSON-ready status record for the shared status store"""
+        summary = self._workflow_status_summary(state)
+        summary["current_phase"] = state["current_phase"].value
+        summary["started_at"] = state["started_at"].isoformat()
+        summary["last_updated"] = state["last_updated"].isoformat()
+        summary["status"] = status or ("running" if state["progress"] < 1.0 else "completed")
+        return summary
+    
+    async def _publish_status(
+        self,
+        state: AgentWorkflowState,
+        status: Optional[str] = None,
+        include_results: bool = False
+    ) -> None:
+        """
+        Publish workflow status to the shared store so any replica can serve it.
+        
+        Args:
+            state: Current workflow state
+            status: Explicit status; derived from progress when omitted
+            include_results: Also store agent results (for finished workflows)
+        """
+        if self.work_queue is None:
+            return
+        
+        try:
+            summary = self._serialize_status(state, status)
+            if include_results:
+                summary["agent_results"] = state.get("agent_results", {})
+            await self.work_queue.set_status(state["workflow_id"], summary)
+        except Exception as e:
+            logger.error(f"Failed to publish status for workflow {state['workflow_id']}: {e}")
+    
     async def _send_progress_update(self, state: AgentWorkflowState) -> None:
         """
-        Send progress update via WebSocket.
+        Queue a progress update for WebSocket clients and the status store.
+        
+        Updates are coalesced per workflow and flushed at a bounded rate;
+        the final update of a workflow is flushed immediately.
         
         Args:
             state: Current workflow state
         """
         try:
-            # Import here to avoid circular imports
-            from riskintel360.api.websockets import send_validation_progress_update
-            
-            progress_data = {
-                "status": "running" if state["progress"] < 1.0 else "completed",
+            finished = state["progress"] >= 1.0
+            update = {
+                "status": "running" if not finished else "completed",
                 "progress_percentage": state["progress"] * 100,
                 "current_phase": state["current_phase"].value,
                 "message": f"Phase: {state['current_phase'].value.replace('_', ' ').title()}",
                 "agent_results": state.get("agent_results", {}),
                 "error_count": len(state.get("errors", []))
             }
+            if self.work_queue is not None:
+                update["status_record"] = self._serialize_status(state)
             
-            await send_validation_progress_update(state["workflow_id"], progress_data)
+            self.progress_aggregator.submit(state["workflow_id"], update, terminal=finished)
             
         except Exception as e:
             logger.error(f"Failed to send progress update: {e}")
+    
+    def _agent_progress_reporter(self, workflow_id: str, agent_id: str) -> Callable[[str, float], None]:
+        """Callback routing an agent's ``update_progress`` into the workflow's progress"""
+        def report(_: str, progress: float) -> None:
+            self.progress_aggregator.submit(workflow_id, {"agent_progress": {agent_id: progress}})
+        return report
+    
+    async def _deliver_progress_batch(self, batch: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Deliver one flush of coalesced progress for many workflows.
+        
+        Args:
+            batch: Latest progress per workflow ID
+        """
+        status_records = {}
+        try:
+            # Import here to avoid circular imports
+            from riskintel360.api.websockets import send_validation_progress_update
+            
+            for workflow_id, update in batch.items():
+                if "status_record" in update:
+                    status_records[workflow_id] = update["status_record"]
+                await send_validation_progress_update(
+                    workflow_id,
+                    {key: value for key, value in update.items() if key != "status_record"}
+                )
+                
+        except Exception as e:
+            logger.error(f"Failed to send progress update: {e}")
+        
+        if status_records and self.work_queue is not None:
+            try:
+                await self.work_queue.set_statuses(status_records)
+            except Exception as e:
+                logger.error(f"Failed to publish workflow statuses: {e}")
 
 
 @dataclass
@@ -1743,6 +2518,100 @@ class AlertEvent:
     affected_workflows: List[str]
     created_at: datetime
     resolved_at: Optional[datetime] = None
+    fingerprint: Optional[str] = None  # Set for alerts that must not repeat while open
+
+
+class MarketConditionStore:
+    """
+    Bounded, deduplicating store of detected market conditions.
+    
+    Conditions are keyed by a fingerprint of what was observed (type, source,
+    sectors, description), so re-detecting the same condition refreshes the
+    existing entry instead of adding a new one. Entries expire after ``ttl``
+    and the store never holds more than ``max_conditions`` entries, evicting
+    the least recently seen first.
+    """
+    
+    def __init__(self, max_conditions: int = 500, ttl: timedelta = timedelta(hours=24)):
+        self.max_conditions = max(1, max_conditions)
+        self.ttl = ttl
+        # Ordered oldest-seen first, which makes expiry and eviction O(1) each
+        self._conditions: "OrderedDict[str, MarketCondition]" = OrderedDict()
+        self.deduplicated = 0
+        self.evicted = 0
+    
+    @staticmethod
+    def fingerprint(condition_data: Dict[str, Any]) -> str:
+        """Stable fingerprint of a condition, independent of when it was seen"""
+        identity = {
+            "condition_type": condition_data.get("condition_type"),
+            "source": condition_data.get("source"),
+            "affected_sectors": sorted(condition_data.get("affected_sectors", [])),
+            "description": condition_data.get("description"),
+        }
+        return hashlib.sha1(json.dumps(identity, sort_keys=True).encode("utf-8")).hexdigest()
+    
+    def upsert(self, condition_data: Dict[str, Any], detected_at: datetime) -> Tuple[MarketCondition, bool]:
+        """
+        Record a detected condition.
+        
+        Args:
+            condition_data: Raw condition fields
+            detected_at: Detection time
+            
+        Returns:
+            Tuple of the stored condition and whether it is new
+        """
+        self.prune(detected_at)
+        
+        fingerprint = self.fingerprint(condition_data)
+        existing = self._conditions.get(fingerprint)
+        if existing is not None:
+            existing.detected_at = detected_at
+            existing.impact_level = condition_data.get("impact_level", existing.impact_level)
+            existing.confidence = condition_data.get("confidence", existing.confidence)
+            self._conditions.move_to_end(fingerprint)
+            self.deduplicated += 1
+            return existing, False
+        
+        condition = MarketCondition(
+            condition_id=f"{condition_data['condition_type']}_{fingerprint[:12]}",
+            condition_type=condition_data["condition_type"],
+            description=condition_data["description"],
+            impact_level=condition_data["impact_level"],
+            affected_sectors=condition_data["affected_sectors"],
+            detected_at=detected_at,
+            source=condition_data["source"],
+            confidence=condition_data["confidence"]
+        )
+        self._conditions[fingerprint] = condition
+        
+        while len(self._conditions) > self.max_conditions:
+            self._conditions.popitem(last=False)
+            self.evicted += 1
+        
+        return condition, True
+    
+    def prune(self, now: datetime) -> int:
+        """Drop conditions not seen within the TTL"""
+        expired = 0
+        while self._conditions:
+            oldest = next(iter(self._conditions.values()))
+            if now - oldest.detected_at <= self.ttl:
+                break
+            self._conditions.popitem(last=False)
+            expired += 1
+        return expired
+    
+    def values(self) -> List[MarketCondition]:
+        """All stored conditions, oldest-seen first"""
+        return list(self._conditions.values())
+    
+    def __len__(self) -> int:
+        return len(self._conditions)
+    
+    def __contains__(self, fingerprint: str) -> bool:
+        return fingerprint in self._conditions
 
 
 class WorkflowOrchestrator:
@@ -1751,10 +2620,29 @@ class WorkflowOrchestrator:
     Provides market condition monitoring, proactive alerting, and validation assumption tracking.
     """
     
+    # Workflow request fields that describe which sectors a workflow covers
+    SECTOR_REQUEST_FIELDS = ("target_market", "industry", "business_type", "market_segments", "sectors")
+    
+    # Unresolved alerts are auto-resolved after this age, per severity; unknown
+    # severities use the longest window so no alert stays open forever
+    ALERT_AUTO_RESOLVE_AFTER: Dict[str, timedelta] = {
+        "info": timedelta(hours=1),
+        "warning": timedelta(hours=4),
+        "error": timedelta(hours=24),
+        "critical": timedelta(hours=72)
+    }
+    
+    # Shared-store statuses after which a workflow no longer changes
+    TERMINAL_WORKFLOW_STATUSES = ("completed", "failed", "timeout")
+    
     def __init__(
         self,
         supervisor_agent: Optional[SupervisorAgent] = None,
-        monitoring_interval: int = 300  # 5 minutes
+        monitoring_interval: int = 300,  # 5 minutes
+        max_market_conditions: int = 500,
+        market_condition_ttl: timedelta = timedelta(hours=24),
+        resolved_alert_retention: timedelta = timedelta(hours=24),
+        work_queue: Optional[WorkflowQueueBackend] = None
     ):
         """
         Initialize workflow orchestrator with monitoring capabilities.
@@ -1762,6 +2650,10 @@ class WorkflowOrchestrator:
         Args:
             supervisor_agent: Optional supervisor agent for workflow management (created if not provided)
             monitoring_interval: Monitoring interval in seconds
+            max_market_conditions: Maximum market conditions kept in memory
+            market_condition_ttl: How long a condition is kept after it was last seen
+            resolved_alert_retention: How long resolved alerts are kept before being dropped
+            work_queue: Shared work queue for the default supervisor (ignored if one is provided)
         """
         if supervisor_agent is None:
             # Try to create default supervisor agent, but handle failures gracefully
@@ -1771,7 +2663,7 @@ class WorkflowOrchestrator:
                 
                 agentcore_client = create_agentcore_client()
                 bedrock_client = create_bedrock_client()
-                supervisor_agent = SupervisorAgent(agentcore_client, bedrock_client)
+                supervisor_agent = SupervisorAgent(agentcore_client, bedrock_client, work_queue=work_queue)
                 logger.info("??Created default supervisor agent with real clients")
                 
             except Exception as e:
@@ -1791,7 +2683,7 @@ class WorkflowOrchestrator:
                     mock_bedrock = Mock()
                     mock_bedrock.invoke_for_agent = Mock(return_value=Mock(content="Mock agent response"))
                     
-                    supervisor_agent = SupervisorAgent(mock_agentcore, mock_bedrock)
+                    supervisor_agent = SupervisorAgent(mock_agentcore, mock_bedrock, work_queue=work_queue)
                     logger.info("??Created mock supervisor agent for testing")
                     
                 except Exception as mock_error:
@@ -1806,9 +2698,15 @@ class WorkflowOrchestrator:
         self.monitoring_task: Optional[asyncio.Task] = None
         
         # Market conditions and alerts
-        self.market_conditions: Dict[str, MarketCondition] = {}
+        self.market_conditions = MarketConditionStore(max_market_conditions, market_condition_ttl)
         self.active_alerts: Dict[str, AlertEvent] = {}
         self.alert_handlers: List[Callable[[AlertEvent], None]] = []
+        self.resolved_alert_retention = resolved_alert_retention
+        self._open_alert_fingerprints: Dict[str, str] = {}
+        
+        # Inverted index: sector -> workflows, so condition impact is a lookup
+        self._sector_workflows: Dict[str, set] = {}
+        self._workflow_sectors: Dict[str, set] = {}
         
         # Validation assumptions tracking
         self.validation_assumptions: Dict[str, Dict[str, Any]] = {}
@@ -1836,11 +2734,13 @@ class WorkflowOrchestrator:
         if self.supervisor is None:
             raise RuntimeError("No supervisor agent available")
         
-        return await self.supervisor.start_workflow(
+        workflow_id = await self.supervisor.start_workflow(
             user_id=user_id,
             validation_request=validation_request,
             workflow_id=workflow_id
         )
+        self.track_workflow_sectors(workflow_id, self._extract_request_sectors(validation_request))
+        return workflow_id
     
     def get_workflow_status(self, workflow_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -1869,6 +2769,33 @@ class WorkflowOrchestrator:
         
         return self.supervisor.get_active_workflows()
     
+    async def fetch_workflow_status(self, workflow_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get workflow status from any replica via the shared status store.
+        
+        Args:
+            workflow_id: Workflow identifier
+            
+        Returns:
+            Dict containing workflow status or None if not found
+        """
+        if self.supervisor is None:
+            return None
+        
+        return await self.supervisor.fetch_workflow_status(workflow_id)
+    
+    async def fetch_active_workflows(self) -> List[str]:
+        """
+        Get workflow IDs known to any replica via the shared status store.
+        
+        Returns:
+            List of workflow IDs
+        """
+        if self.supervisor is None:
+            return []
+        
+        return await self.supervisor.fetch_active_workflows()
+    
     async def start_monitoring(self) -> None:
         """Start real-time monitoring system"""
         if self.is_monitoring:
@@ -1950,22 +2877,10 @@ class WorkflowOrchestrator:
             ]
             
             for condition_data in market_conditions:
-                condition_id = f"{condition_data['condition_type']}_{current_time.timestamp()}"
+                # Re-detections of a known condition only refresh it
+                condition, is_new = self.market_conditions.upsert(condition_data, current_time)
                 
-                if condition_id not in self.market_conditions:
-                    condition = MarketCondition(
-                        condition_id=condition_id,
-                        condition_type=condition_data["condition_type"],
-                        description=condition_data["description"],
-                        impact_level=condition_data["impact_level"],
-                        affected_sectors=condition_data["affected_sectors"],
-                        detected_at=current_time,
-                        source=condition_data["source"],
-                        confidence=condition_data["confidence"]
-                    )
-                    
-                    self.market_conditions[condition_id] = condition
-                    
+                if is_new:
                     # Create alert for significant market conditions
                     if condition.impact_level in ["high", "critical"]:
                         await self._create_alert(
@@ -1998,7 +2913,8 @@ class WorkflowOrchestrator:
                             title=f"Workflow Stuck: {workflow_id}",
                             description=f"Workflow has not updated for {time_since_update}",
                             severity="warning",
-                            affected_workflows=[workflow_id]
+                            affected_workflows=[workflow_id],
+                            fingerprint=f"workflow_stuck:{workflow_id}"
                         )
                     
                     # Check for high error rates
@@ -2008,12 +2924,24 @@ class WorkflowOrchestrator:
                             title=f"High Error Rate: {workflow_id}",
                             description=f"Workflow has {status['error_count']} errors",
                             severity="error",
-                            affected_workflows=[workflow_id]
+                            affected_workflows=[workflow_id],
+                            fingerprint=f"high_error_rate:{workflow_id}"
                         )
+            
+            # Finished workflows no longer need sector matching; queued and
+            # remote workflows are looked up in the shared status store
+            for workflow_id in list(self._workflow_sectors):
+                status = await self.supervisor.fetch_workflow_status(workflow_id)
+                if status is None or self._is_terminal_status(status):
+                    self.untrack_workflow(workflow_id)
         
         except Exception as e:
             logger.error(f"??System health check failed: {e}")
     
+    def _is_terminal_status(self, status: Dict[str, Any]) -> bool:
+        """Whether a workflow status (local or from the shared store) is final"""
+        return status.get("status") in self.TERMINAL_WORKFLOW_STATUSES or status.get("progress", 0.0) >= 1.0
+    
     async def _check_validation_assumptions(self) -> None:
         """Check for changes in validation assumptions"""
         try:
@@ -2051,7 +2979,8 @@ class WorkflowOrchestrator:
                         title=f"Validation Assumptions Changed: {validation_id}",
                         description=f"Detected changes in {len(assumption_changes)} assumptions",
                         severity="info",
-                        affected_workflows=[validation_id]
+                        affected_workflows=[validation_id],
+                        fingerprint=f"validation_assumption_change:{validation_id}"
                     )
                     
                     logger.info(f"?? Assumption changes detected for validation {validation_id}")
@@ -2089,19 +3018,26 @@ class WorkflowOrchestrator:
         try:
             current_time = datetime.now(UTC)
             
-            # Auto-resolve old alerts
-            alerts_to_resolve = []
-            for alert_id, alert in self.active_alerts.items():
-                if alert.resolved_at is None:
-                    # Auto-resolve info alerts after 1 hour
-                    if alert.severity == "info" and (current_time - alert.created_at) > timedelta(hours=1):
-                        alerts_to_resolve.append(alert_id)
-                    # Auto-resolve warning alerts after 4 hours
-                    elif alert.severity == "warning" and (current_time - alert.created_at) > timedelta(hours=4):
-                        alerts_to_resolve.append(alert_id)
+            # Auto-resolve old alerts of every severity; a condition that
+            # persists raises a fresh alert on the next check
+            longest_window = max(self.ALERT_AUTO_RESOLVE_AFTER.values())
+            alerts_to_resolve = [
+                alert_id for alert_id, alert in self.active_alerts.items()
+                if alert.resolved_at is None
+                and (current_time - alert.created_at) > self.ALERT_AUTO_RESOLVE_AFTER.get(alert.severity, longest_window)
+            ]
             
             for alert_id in alerts_to_resolve:
                 await self._resolve_alert(alert_id)
+            
+            # Drop resolved alerts past retention so the alert map stays bounded
+            expired_alerts = [
+                alert_id for alert_id, alert in self.active_alerts.items()
+                if alert.resolved_at is not None
+                and (current_time - alert.resolved_at) > self.resolved_alert_retention
+            ]
+            for alert_id in expired_alerts:
+                del self.active_alerts[alert_id]
         
         except Exception as e:
             logger.error(f"??Alert processing failed: {e}")
@@ -2112,9 +3048,19 @@ class WorkflowOrchestrator:
         title: str,
         description: str,
         severity: str,
-        affected_workflows: List[str]
+        affected_workflows: List[str],
+        fingerprint: Optional[str] = None
     ) -> str:
-        """Create a new alert event"""
+        """
+        Create a new alert event.
+        
+        Alerts with a fingerprint are deduplicated: while an alert with the
+        same fingerprint is unresolved, its ID is returned and no new alert
+        is raised.
+        """
+        if fingerprint and fingerprint in self._open_alert_fingerprints:
+            return self._open_alert_fingerprints[fingerprint]
+        
         alert_id = str(uuid.uuid4())
         
         alert = AlertEvent(
@@ -2124,10 +3070,13 @@ class WorkflowOrchestrator:
             description=description,
             severity=severity,
             affected_workflows=affected_workflows,
-            created_at=datetime.now(UTC)
+            created_at=datetime.now(UTC),
+            fingerprint=fingerprint
         )
         
         self.active_alerts[alert_id] = alert
+        if fingerprint:
+            self._open_alert_fingerprints[fingerprint] = alert_id
         
         # Notify alert handlers
         for handler in self.alert_handlers:
@@ -2142,16 +3091,61 @@ class WorkflowOrchestrator:
     async def _resolve_alert(self, alert_id: str) -> bool:
         """Resolve an active alert"""
         if alert_id in self.active_alerts:
-            self.active_alerts[alert_id].resolved_at = datetime.now(UTC)
+            alert = self.active_alerts[alert_id]
+            alert.resolved_at = datetime.now(UTC)
+            if alert.fingerprint:
+                self._open_alert_fingerprints.pop(alert.fingerprint, None)
             logger.info(f"??Alert resolved: {alert_id}")
             return True
         return False
     
     def _get_affected_workflows(self, affected_sectors: List[str]) -> List[str]:
-        """Get workflows affected by market condition changes"""
-        # In a real implementation, this would match sectors to active workflows
-        active_workflows = self.supervisor.get_active_workflows()
-        return active_workflows[:2]  # Return first 2 as example
+        """Get workflows affected by market condition changes via the sector index"""
+        affected: set = set()
+        for sector in affected_sectors:
+            affected.update(self._sector_workflows.get(self._normalize_sector(sector), ()))
+        return sorted(affected)
+    
+    @staticmethod
+    def _normalize_sector(sector: str) -> str:
+        """Normalize a sector label for index lookups"""
+        return str(sector).strip().lower().replace(" ", "_").replace("-", "_")
+    
+    def _extract_request_sectors(self, validation_request: Dict[str, Any]) -> List[str]:
+        """Collect sector labels from a workflow request"""
+        sectors: List[str] = []
+        for field_name in self.SECTOR_REQUEST_FIELDS:
+            value = validation_request.get(field_name)
+            if isinstance(value, str):
+                sectors.append(value)
+            elif isinstance(value, (list, tuple, set)):
+                sectors.extend(str(item) for item in value)
+        return sectors
+    
+    def track_workflow_sectors(self, workflow_id: str, sectors: List[str]) -> None:
+        """
+        Index a workflow under the sectors it covers.
+        
+        Args:
+            workflow_id: Workflow identifier
+            sectors: Sector labels, e.g. target market and market segments
+        """
+        normalized = {self._normalize_sector(sector) for sector in sectors if sector}
+        if not normalized:
+            return
+        
+        self._workflow_sectors.setdefault(workflow_id, set()).update(normalized)
+        for sector in normalized:
+            self._sector_workflows.setdefault(sector, set()).add(workflow_id)
+    
+    def untrack_workflow(self, workflow_id: str) -> None:
+        """Remove a workflow from the sector index"""
+        for sector in self._workflow_sectors.pop(workflow_id, ()):
+            workflows = self._sector_workflows.get(sector)
+            if workflows is not None:
+                workflows.discard(workflow_id)
+                if not workflows:
+                    del self._sector_workflows[sector]
     
     def add_alert_handler(self, handler: Callable[[AlertEvent], None]) -> None:
         """Add an alert handler function"""
@@ -2170,7 +3164,7 @@ class WorkflowOrchestrator:
     
     def get_market_conditions(self) -> List[MarketCondition]:
         """Get current market conditions"""
-        return list(self.market_conditions.values())
+        return self.market_conditions.values()
     
     def get_active_alerts(self) -> List[AlertEvent]:
         """Get active alerts"""
@@ -2182,6 +3176,11 @@ class WorkflowOrchestrator:
             "is_monitoring": self.is_monitoring,
             "monitoring_interval": self.monitoring_interval,
             "market_conditions_count": len(self.market_conditions),
+            "market_conditions_capacity": self.market_conditions.max_conditions,
+            "deduplicated_conditions_count": self.market_conditions.deduplicated,
+            "evicted_conditions_count": self.market_conditions.evicted,
+            "indexed_workflows_count": len(self._workflow_sectors),
+            "admission": self.supervisor.admission_scheduler.get_stats() if self.supervisor else None,
             "active_alerts_count": len(self.get_active_alerts()),
             "total_alerts_count": len(self.active_alerts),
             "tracked_validations_count": len(self.validation_assumptions),
@@ -2194,7 +3193,8 @@ class WorkflowOrchestrator:
 def create_workflow_orchestrator(
     agentcore_client: AgentCoreClient,
     bedrock_client: BedrockClient,
-    config: Optional[WorkflowConfig] = None
+    config: Optional[WorkflowConfig] = None,
+    work_queue: Optional[WorkflowQueueBackend] = None
 ) -> SupervisorAgent:
     """
     Create a new workflow orchestrator instance.
@@ -2203,18 +3203,20 @@ def create_workflow_orchestrator(
         agentcore_client: AgentCore client for coordination
         bedrock_client: Bedrock client for LLM interactions
         config: Optional workflow configuration
+        work_queue: Optional shared work queue for multi-replica execution
         
     Returns:
         SupervisorAgent: Configured workflow orchestrator
     """
-    return SupervisorAgent(agentcore_client, bedrock_client, config)
+    return SupervisorAgent(agentcore_client, bedrock_client, config, work_queue)
 
 
 def create_enhanced_workflow_orchestrator(
     agentcore_client: AgentCoreClient,
     bedrock_client: BedrockClient,
     config: Optional[WorkflowConfig] = None,
-    monitoring_interval: int = 300
+    monitoring_interval: int = 300,
+    work_queue: Optional[WorkflowQueueBackend] = None
 ) -> WorkflowOrchestrator:
     """
     Create a new enhanced workflow orchestrator with monitoring capabilities.
@@ -2224,9 +3226,96 @@ def create_enhanced_workflow_orchestrator(
         bedrock_client: Bedrock client for LLM interactions
         config: Optional workflow configuration
         monitoring_interval: Monitoring interval in seconds
+        work_queue: Optional shared work queue for multi-replica execution
         
     Returns:
         WorkflowOrchestrator: Enhanced workflow orchestrator with monitoring
     """
-    supervisor = SupervisorAgent(agentcore_client, bedrock_client, config)
+    supervisor = SupervisorAgent(agentcore_client, bedrock_client, config, work_queue)
     return WorkflowOrchestrator(supervisor, monitoring_interval)
+
+
+# Global workflow orchestrator instance
+_workflow_orchestrator: Optional[WorkflowOrchestrator] = None
+_workflow_queue: Optional[WorkflowQueueBackend] = None
+_workflow_worker_pool: Optional[WorkflowWorkerPool] = None
+
+
+def get_workflow_orchestrator() -> WorkflowOrchestrator:
+    """
+    Get the process-wide workflow orchestrator.
+    
+    API requests share one orchestrator so the result cache, admission
+    scheduler and agent concurrency cap apply across all of them.
+    
+    Returns:
+        WorkflowOrchestrator: Shared orchestrator
+    """
+    global _workflow_orchestrator
+    
+    if _workflow_orchestrator is None:
+        _workflow_orchestrator = WorkflowOrchestrator()
+    
+    return _workflow_orchestrator
+
+
+async def start_workflow_orchestrator() -> WorkflowOrchestrator:
+    """
+    Create the process-wide workflow orchestrator at application start-up.
+    
+    With ``WORKFLOW_QUEUE_ENABLED=true`` started workflows go through the
+    shared work queue from ``create_workflow_queue`` and this process runs
+    ``WORKFLOW_WORKER_CONCURRENCY`` queue workers (0 for enqueue-only API
+    replicas). Otherwise workflows run in-process and workflows left
+    unfinished by the previous process are resumed from their checkpoints.
+    
+    Returns:
+        WorkflowOrchestrator: Shared orchestrator
+    """
+    global _workflow_orchestrator, _workflow_queue, _workflow_worker_pool
+    
+    if _workflow_orchestrator is not None:
+        return _workflow_orchestrator
+    
+    work_queue = None
+    if os.getenv("WORKFLOW_QUEUE_ENABLED", "false").lower() == "true":
+        work_queue = create_workflow_queue()
+        if not await work_queue.connect():
+            raise RuntimeError("Failed to connect to the workflow queue")
+        _workflow_queue = work_queue
+    
+    _workflow_orchestrator = WorkflowOrchestrator(work_queue=work_queue)
+    supervisor = _workflow_orchestrator.supervisor
+    if supervisor is None:
+        return _workflow_orchestrator
+    
+    if work_queue is not None:
+        concurrency = int(os.getenv("WORKFLOW_WORKER_CONCURRENCY", "2"))
+        if concurrency > 0:
+            _workflow_worker_pool = WorkflowWorkerPool(work_queue, supervisor, concurrency)
+            await _workflow_worker_pool.start()
+        logger.info(f"??Workflow queue mode enabled ({concurrency} local workers)")
+    else:
+        await supervisor.resume_unfinished_workflows()
+    
+    return _workflow_orchestrator
+
+
+async def shutdown_workflow_orchestrator() -> None:
+    """Stop workers and monitoring and flush pending progress of the global orchestrator"""
+    global _workflow_orchestrator, _workflow_queue, _workflow_worker_pool
+    
+    if _workflow_worker_pool:
+        # Unacknowledged jobs are reclaimed by workers on other replicas
+        await _workflow_worker_pool.stop()
+        _workflow_worker_pool = None
+    
+    if _workflow_orchestrator:
+        await _workflow_orchestrator.stop_monitoring()
+        if _workflow_orchestrator.supervisor is not None:
+            await _workflow_orchestrator.supervisor.progress_aggregator.stop()
+        _workflow_orchestrator = None
+    
+    if _workflow_queue:
+        await _workflow_queue.disconnect()
+        _workflow_queue = None
@@ -0,0 +1,477 @@
+"""
+Distributed Workflow Queue for RiskIntel360 Platform
+Queue-backed workflow execution so several API replicas and worker processes
+share orchestration load, with workflow status kept in a shared store.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import socket
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections import deque
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+import redis.asyncio as redis
+from redis.exceptions import ResponseError
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class QueuedWorkflow:
+    """Workflow job claimed from the queue"""
+    message_id: str
+    workflow_id: str
+    user_id: str
+    validation_request: Dict[str, Any]
+    attempts: int = 1
+
+
+class WorkflowQueueBackend(ABC):
+    """
+    Abstract workflow work-queue with a shared status store.
+
+    Claimed jobs stay invisible to other consumers for ``visibility_timeout``
+    seconds. A consumer that dies without acknowledging its job loses the
+    claim and the job is handed to another consumer.
+    """
+
+    def __init__(self, visibility_timeout: float = 60.0, status_ttl: int = 86400):
+        self.visibility_timeout = visibility_timeout
+        self.status_ttl = status_ttl
+
+    @abstractmethod
+    async def connect(self) -> bool:
+        """Connect to the backend"""
+        pass
+
+    @abstractmethod
+    async def disconnect(self) -> None:
+        """Disconnect from the backend"""
+        pass
+
+    @abstractmethod
+    async def enqueue(self, workflow_id: str, user_id: str, validation_request: Dict[str, Any]) -> str:
+        """Add a workflow job, returning its message ID"""
+        pass
+
+    @abstractmethod
+    async def claim(self, consumer: str, count: int = 1, block_ms: int = 1000) -> List[QueuedWorkflow]:
+        """Claim up to ``count`` jobs, including jobs whose claim has expired"""
+        pass
+
+    @abstractmethod
+    async def extend(self, message_id: str, consumer: str) -> None:
+        """Renew the visibility timeout of a job the consumer is still working on"""
+        pass
+
+    @abstractmethod
+    async def ack(self, message_id: str) -> None:
+        """Acknowledge and remove a finished job"""
+        pass
+
+    @abstractmethod
+    async def set_status(self, workflow_id: str, status: Dict[str, Any]) -> None:
+        """Publish workflow status to the shared store"""
+        pass
+
+    async def set_statuses(self, statuses: Dict[str, Dict[str, Any]]) -> None:
+        """Publish the status of several workflows in one write where supported"""
+        for workflow_id, status in statuses.items():
+            await self.set_status(workflow_id, status)
+
+    @abstractmethod
+    async def get_status(self, workflow_id: str) -> Optional[Dict[str, Any]]:
+        """Read workflow status from the shared store"""
+        pass
+
+    @abstractmethod
+    async def list_workflow_ids(self) -> List[str]:
+        """IDs of all workflows with a live status entry"""
+        pass
+
+    @abstractmethod
+    async def get_queue_stats(self) -> Dict[str, Any]:
+        """Queue depth and in-flight counts"""
+        pass
+
+
+class InMemoryWorkflowQueue(WorkflowQueueBackend):
+    """Single-process stand-in for development and tests"""
+
+    def __init__(self, visibility_timeout: float = 60.0, status_ttl: int = 86400):
+        super().__init__(visibility_timeout, status_ttl)
+        self._messages: Dict[str, QueuedWorkflow] = {}
+        self._ready: Deque[str] = deque()
+        self._in_flight: Dict[str, Tuple[str, float]] = {}
+        self._statuses: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._ready_event = asyncio.Event()
+
+    async def connect(self) -> bool:
+        return True
+
+    async def disconnect(self) -> None:
+        pass
+
+    async def enqueue(self, workflow_id: str, user_id: str, validation_request: Dict[str, Any]) -> str:
+        message_id = str(uuid.uuid4())
+        self._messages[message_id] = QueuedWorkflow(
+            message_id=message_id,
+            workflow_id=workflow_id,
+            user_id=user_id,
+            validation_request=validation_request
+        )
+        self._ready.append(message_id)
+        self._ready_event.set()
+        return message_id
+
+    async def claim(self, consumer: str, count: int = 1, block_ms: int = 1000) -> List[QueuedWorkflow]:
+        deadline = time.monotonic() + block_ms / 1000.0
+
+        while True:
+            self._requeue_expired()
+
+            claimed = []
+            while self._ready and len(claimed) < count:
+                message_id = self._ready.popleft()
+                self._in_flight[message_id] = (consumer, time.monotonic() + self.visibility_timeout)
+                claimed.append(self._messages[message_id])
+            if claimed:
+                return claimed
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return []
+
+            self._ready_event.clear()
+            try:
+                await asyncio.wait_for(self._ready_event.wait(), timeout=min(remaining, self.visibility_timeout))
+            except asyncio.TimeoutError:
+                pass
+
+    async def extend(self, message_id: str, consumer: str) -> None:
+        owner = self._in_flight.get(message_id)
+        if owner is not None and owner[0] == consumer:
+            self._in_flight[message_id] = (consumer, time.monotonic() + self.visibility_timeout)
+
+    async def ack(self, message_id: str) -> None:
+        self._in_flight.pop(message_id, None)
+        self._messages.pop(message_id, None)
+
+    async def set_status(self, workflow_id: str, status: Dict[str, Any]) -> None:
+        # Round-trip through JSON so callers see the same shape as with Redis
+        self._statuses[workflow_id] = (time.time() + self.status_ttl, json.loads(json.dumps(status, default=str)))
+
+    async def get_status(self, workflow_id: str) -> Optional[Dict[str, Any]]:
+        entry = self._statuses.get(workflow_id)
+        if entry is None or entry[0] <= time.time():
+            self._statuses.pop(workflow_id, None)
+            return None
+        return entry[1]
+
+    async def list_workflow_ids(self) -> List[str]:
+        now = time.time()
+        for workflow_id in [wid for wid, (expires_at, _) in self._statuses.items() if expires_at <= now]:
+            del self._statuses[workflow_id]
+        return list(self._statuses)
+
+    async def get_queue_stats(self) -> Dict[str, Any]:
+        self._requeue_expired()
+        return {"queued": len(self._ready), "in_flight": len(self._in_flight)}
+
+    def _requeue_expired(self) -> None:
+        now = time.monotonic()
+        for message_id in [mid for mid, (_, deadline) in self._in_flight.items() if deadline <= now]:
+            del self._in_flight[message_id]
+            self._messages[message_id].attempts += 1
+            self._ready.append(message_id)
+
+
+class RedisStreamsWorkflowQueue(WorkflowQueueBackend):
+    """
+    Redis Streams backend using a consumer group.
+
+    Jobs are stream entries read with XREADGROUP; entries idle in the pending
+    list for longer than the visibility timeout are taken over with XAUTOCLAIM.
+    Status lives in per-workflow keys with a TTL plus a sorted-set index.
+    """
+
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 6379,
+        db: int = 0,
+        password: Optional[str] = None,
+        prefix: str = "riskintel360:workflows",
+        group: str = "workflow-workers",
+        visibility_timeout: float = 60.0,
+        status_ttl: int = 86400,
+        max_stream_length: int = 100000,
+        client: Optional[Any] = None
+    ):
+        super().__init__(visibility_timeout, status_ttl)
+        self.host = host
+        self.port = port
+        self.db = db
+        self.password = password
+        self.stream = f"{prefix}:stream"
+        self.status_prefix = f"{prefix}:status"
+        self.index_key = f"{prefix}:index"
+        self.group = group
+        self.max_stream_length = max_stream_length
+        self.client = client
+
+    async def connect(self) -> bool:
+        try:
+            if self.client is None:
+                self.client = redis.Redis(
+                    host=self.host,
+                    port=self.port,
+                    db=self.db,
+                    password=self.password,
+                    decode_responses=True
+                )
+            await self.client.ping()
+
+            try:
+                await self.client.xgroup_create(self.stream, self.group, id="0", mkstream=True)
+            except ResponseError as e:
+                if "BUSYGROUP" not in str(e):
+                    raise
+
+            logger.info(f"??Workflow queue connected to Redis stream {self.stream}")
+            return True
+
+        except Exception as e:
+            logger.error(f"??Failed to connect workflow queue: {e}")
+            return False
+
+    async def disconnect(self) -> None:
+        if self.client:
+            await self.client.close()
+
+    async def enqueue(self, workflow_id: str, user_id: str, validation_request: Dict[str, Any]) -> str:
+        payload = json.dumps({
+            "workflow_id": workflow_id,
+            "user_id": user_id,
+            "validation_request": validation_request
+        }, default=str)
+        return await self.client.xadd(
+            self.stream, {"payload": payload},
+            maxlen=self.max_stream_length, approximate=True
+        )
+
+    async def claim(self, consumer: str, count: int = 1, block_ms: int = 1000) -> List[QueuedWorkflow]:
+        claimed: List[QueuedWorkflow] = []
+
+        # Take over jobs from consumers that stopped renewing their claim
+        autoclaimed = await self.client.xautoclaim(
+            self.stream, self.group, consumer,
+            min_idle_time=int(self.visibility_timeout * 1000),
+            start_id="0-0", count=count
+        )
+        for message_id, fields in autoclaimed[1]:
+            if fields:
+                claimed.append(self._decode(message_id, fields, await self._delivery_count(message_id)))
+
+        if len(claimed) < count:
+            response = await self.client.xreadgroup(
+                self.group, consumer, {self.stream: ">"},
+                count=count - len(claimed), block=block_ms
+            )
+            for _, entries in response or []:
+                for message_id, fields in entries:
+                    claimed.append(self._decode(message_id, fields, 1))
+
+        return claimed
+
+    async def extend(self, message_id: str, consumer: str) -> None:
+        # Re-claiming our own entry resets its idle time
+        await self.client.xclaim(
+            self.stream, self.group, consumer,
+            min_idle_time=0, message_ids=[message_id], justid=True
+        )
+
+    async def ack(self, message_id: str) -> None:
+        pipe = self.client.pipeline()
+        pipe.xack(self.stream, self.group, message_id)
+        pipe.xdel(self.stream, message_id)
+        await pipe.execute()
+
+    async def set_status(self, workflow_id: str, status: Dict[str, Any]) -> None:
+        pipe = self.client.pipeline()
+        pipe.set(f"{self.status_prefix}:{workflow_id}", json.dumps(status, default=str), ex=self.status_ttl)
+        pipe.zadd(self.index_key, {workflow_id: time.time()})
+        await pipe.execute()
+
+    async def set_statuses(self, statuses: Dict[str, Dict[str, Any]]) -> None:
+        if not statuses:
+            return
+        pipe = self.client.pipeline()
+        for workflow_id, status in statuses.items():
+            pipe.set(f"{self.status_prefix}:{workflow_id}", json.dumps(status, default=str), ex=self.status_ttl)
+        pipe.zadd(self.index_key, {workflow_id: time.time() for workflow_id in statuses})
+        await pipe.execute()
+
+    async def get_status(self, workflow_id: str) -> Optional[Dict[str, Any]]:
+        data = await self.client.get(f"{self.status_prefix}:{workflow_id}")
+        return json.loads(data) if data else None
+
+    async def list_workflow_ids(self) -> List[str]:
+        await self.client.zremrangebyscore(self.index_key, 0, time.time() - self.status_ttl)
+        return list(await self.client.zrange(self.index_key, 0, -1))
+
+    async def get_queue_stats(self) -> Dict[str, Any]:
+        length = await self.client.xlen(self.stream)
+        pending = await self.client.xpending(self.stream, self.group)
+        in_flight = pending.get("pending", 0) if isinstance(pending, dict) else 0
+        return {"queued": max(0, length - in_flight), "in_flight": in_flight}
+
+    async def _delivery_count(self, message_id: str) -> int:
+        entries = await self.client.xpending_range(self.stream, self.group, min=message_id, max=message_id, count=1)
+        return int(entries[0]["times_delivered"]) if entries else 1
+
+    @staticmethod
+    def _decode(message_id: str, fields: Dict[str, str], attempts: int) -> QueuedWorkflow:
+        payload = json.loads(fields["payload"])
+        return QueuedWorkflow(
+            message_id=message_id,
+            workflow_id=payload["workflow_id"],
+            user_id=payload["user_id"],
+            validation_request=payload["validation_request"],
+            attempts=attempts
+        )
+
+
+class WorkflowWorkerPool:
+    """
+    Pool of workers that claim queued workflows and run them on a supervisor.
+
+    Each replica runs its own pool; throughput scales with the number of
+    workers across all replicas because every worker competes for the same
+    consumer group.
+    """
+
+    def __init__(
+        self,
+        queue: WorkflowQueueBackend,
+        supervisor: Any,
+        concurrency: int = 2,
+        consumer_name: Optional[str] = None,
+        max_attempts: int = 3
+    ):
+        """
+        Initialize the worker pool.
+
+        Args:
+            queue: Shared workflow queue
+            supervisor: SupervisorAgent executing the workflows
+            concurrency: Workflows run concurrently by this pool
+            consumer_name: Consumer name prefix (defaults to hostname and a random suffix)
+            max_attempts: Deliveries after which a job is abandoned as failed
+        """
+        self.queue = queue
+        self.supervisor = supervisor
+        self.concurrency = max(1, concurrency)
+        self.consumer_name = consumer_name or f"{socket.gethostname()}-{uuid.uuid4().hex[:6]}"
+        self.max_attempts = max_attempts
+        self.is_running = False
+        self._tasks: List[asyncio.Task] = []
+        self.processed = 0
+        self.abandoned = 0
+
+    async def start(self) -> None:
+        """Start the worker loops"""
+        if self.is_running:
+            return
+        self.is_running = True
+        self._tasks = [
+            asyncio.create_task(self._worker_loop(f"{self.consumer_name}-{index}"))
+            for index in range(self.concurrency)
+        ]
+        logger.info(f"?? Workflow worker pool {self.consumer_name} started with {self.concurrency} workers")
+
+    async def stop(self) -> None:
+        """Stop the worker loops; unacknowledged jobs are picked up by other workers"""
+        self.is_running = False
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def _worker_loop(self, consumer: str) -> None:
+        while self.is_running:
+            try:
+                for job in await self.queue.claim(consumer, count=1, block_ms=1000):
+                    await self._process(job, consumer)
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"??Workflow worker {consumer} error: {e}")
+                await asyncio.sleep(1)
+
+    async def _process(self, job: QueuedWorkflow, consumer: str) -> None:
+        if job.attempts > self.max_attempts:
+            logger.error(f"??Abandoning workflow {job.workflow_id} after {job.attempts - 1} attempts")
+            # Same fields as a status published by the supervisor
+            await self.queue.set_status(job.workflow_id, {
+                "workflow_id": job.workflow_id,
+                "status": "failed",
+                "current_phase": "completion",
+                "progress": 1.0,
+                "error_count": job.attempts - 1,
+                "last_updated": datetime.now(UTC).isoformat()
+            })
+            await self.queue.ack(job.message_id)
+            self.abandoned += 1
+            return
+
+        heartbeat = asyncio.create_task(self._heartbeat(job.message_id, consumer))
+        try:
+            await self.supervisor.execute_queued_workflow(
+                job.workflow_id, job.user_id, job.validation_request
+            )
+        finally:
+            heartbeat.cancel()
+
+        await self.queue.ack(job.message_id)
+        self.processed += 1
+
+    async def _heartbeat(self, message_id: str, consumer: str) -> None:
+        """Keep the claim alive while a long workflow runs"""
+        while True:
+            await asyncio.sleep(self.queue.visibility_timeout / 3)
+            try:
+                await self.queue.extend(message_id, consumer)
+            except Exception as e:
+                logger.warning(f"Failed to extend claim on {message_id}: {e}")
+
+
+def create_workflow_queue() -> WorkflowQueueBackend:
+    """
+    Create the workflow queue configured by the environment.
+
+    ``WORKFLOW_QUEUE_BACKEND=redis`` selects Redis Streams (using the usual
+    ``REDIS_*`` connection variables); anything else uses the in-memory queue.
+
+    Returns:
+        Workflow queue backend (not yet connected)
+    """
+    visibility_timeout = float(os.getenv("WORKFLOW_QUEUE_VISIBILITY_TIMEOUT", "60"))
+
+    if os.getenv("WORKFLOW_QUEUE_BACKEND", "memory").lower() == "redis":
+        return RedisStreamsWorkflowQueue(
+            host=os.getenv("REDIS_HOST", "localhost"),
+            port=int(os.getenv("REDIS_PORT", "6379")),
+            db=int(os.getenv("REDIS_DB", "0")),
+            password=os.getenv("REDIS_PASSWORD"),
+            visibility_timeout=visibility_timeout
+        )
+
+    return InMemoryWorkflowQueue(visibility_timeout=visibility_timeout)
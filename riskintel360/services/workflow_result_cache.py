@@ -0,0 +1,268 @@
+"""
+Workflow Result Cache for RiskIntel360 Platform
+Memoizes completed fintech workflows and individual agent results so repeated
+requests (dashboards, demos) skip work whose inputs have not changed.
+"""
+
+import copy
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+# Analysis scope handled by each fintech agent
+AGENT_ANALYSIS_SCOPES: Dict[str, str] = {
+    "regulatory_compliance": "regulatory",
+    "fraud_detection": "fraud",
+    "market_analysis": "market",
+    "risk_assessment": "risk",
+    "kyc_verification": "kyc",
+    "customer_behavior_intelligence": "customer",
+}
+
+# How long (seconds) results stay fresh per analysis scope; fast-moving
+# market and fraud signals expire sooner than regulatory or KYC findings
+DEFAULT_FRESHNESS_SECONDS: Dict[str, float] = {
+    "regulatory": 3600.0,
+    "kyc": 3600.0,
+    "risk": 1800.0,
+    "customer": 1800.0,
+    "market": 600.0,
+    "fraud": 300.0,
+}
+
+# Request fields that describe how a workflow was requested, not what it computes
+VOLATILE_REQUEST_FIELDS = frozenset({
+    "force_recompute",
+    "result_cache_key",
+    "request_id",
+    "requested_at",
+    "timestamp",
+})
+
+
+def canonical_hash(data: Any) -> str:
+    """
+    Stable SHA-256 hash of JSON-like data, independent of key order.
+
+    Args:
+        data: Value to hash (non-JSON types are stringified)
+
+    Returns:
+        Hex digest
+    """
+    encoded = json.dumps(data, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class WorkflowResultCache:
+    """
+    In-process, size-bounded cache of workflow and per-agent results.
+
+    Workflow entries are keyed by a canonical hash of the request and expire
+    after the shortest freshness window among the requested analysis scopes.
+    Agent entries are keyed by agent ID and a hash of the agent's task inputs
+    (including upstream results), so a changed request can still reuse the
+    agents whose inputs are identical.
+    """
+
+    def __init__(
+        self,
+        freshness_seconds: Optional[Dict[str, float]] = None,
+        default_freshness_seconds: float = 600.0,
+        max_entries: int = 256
+    ):
+        """
+        Initialize the result cache.
+
+        Args:
+            freshness_seconds: Per analysis scope freshness overrides
+            default_freshness_seconds: Window for scopes without an explicit entry
+            max_entries: Maximum entries kept per tier before LRU eviction
+        """
+        self.freshness_seconds = {**DEFAULT_FRESHNESS_SECONDS, **(freshness_seconds or {})}
+        self.default_freshness_seconds = default_freshness_seconds
+        self.max_entries = max(1, max_entries)
+
+        self._workflows: "OrderedDict[str, Tuple[float, float, Dict[str, Any]]]" = OrderedDict()
+        self._agents: "OrderedDict[Tuple[str, str], Tuple[float, float, Dict[str, Any]]]" = OrderedDict()
+        self.stats = {
+            "workflow_hits": 0,
+            "workflow_misses": 0,
+            "agent_hits": 0,
+            "agent_misses": 0,
+            "evictions": 0,
+        }
+
+    @staticmethod
+    def request_key(request: Dict[str, Any], user_id: Optional[str] = None) -> str:
+        """
+        Canonical cache key for a workflow request.
+
+        Volatile bookkeeping fields are ignored and ``analysis_scope`` is
+        treated as a set, so reordered scopes map to the same key. The key is
+        scoped to the requesting user and tenant, so results are never served
+        across them.
+
+        Args:
+            request: Workflow request data
+            user_id: User requesting the workflow
+
+        Returns:
+            Request hash
+        """
+        canonical = {
+            key: value for key, value in request.items()
+            if key not in VOLATILE_REQUEST_FIELDS
+        }
+        if isinstance(canonical.get("analysis_scope"), (list, tuple, set)):
+            canonical["analysis_scope"] = sorted(canonical["analysis_scope"])
+        canonical["__scope__"] = {"user_id": user_id, "tenant_id": request.get("tenant_id")}
+        return canonical_hash(canonical)
+
+    @staticmethod
+    def agent_input_key(
+        assignment: Dict[str, Any],
+        user_id: Optional[str] = None,
+        tenant_id: Optional[str] = None
+    ) -> str:
+        """
+        Cache key for an agent's inputs (task type and parameters).
+
+        Args:
+            assignment: Agent task assignment
+            user_id: User the workflow runs for
+            tenant_id: Tenant the workflow runs for
+
+        Returns:
+            Input hash
+        """
+        return canonical_hash({
+            "task": assignment.get("task"),
+            "parameters": assignment.get("parameters", {}),
+            "scope": {"user_id": user_id, "tenant_id": tenant_id},
+        })
+
+    def freshness_window(self, analysis_scope: Iterable[str]) -> float:
+        """Freshness window for a set of scopes: the most volatile scope wins"""
+        windows = [
+            self.freshness_seconds.get(scope, self.default_freshness_seconds)
+            for scope in analysis_scope
+        ]
+        return min(windows) if windows else self.default_freshness_seconds
+
+    def get_workflow(self, request_key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a fresh cached workflow result.
+
+        Args:
+            request_key: Key from ``request_key``
+
+        Returns:
+            Copy of the cached result (``agent_results``, ``shared_context``,
+            ``cached_at``) or None on a miss
+        """
+        value = self._get(self._workflows, request_key)
+        self.stats["workflow_hits" if value is not None else "workflow_misses"] += 1
+        return value
+
+    def put_workflow(
+        self,
+        request_key: str,
+        analysis_scope: Iterable[str],
+        agent_results: Dict[str, Any],
+        shared_context: Dict[str, Any]
+    ) -> None:
+        """
+        Cache a completed workflow result.
+
+        Args:
+            request_key: Key from ``request_key``
+            analysis_scope: Scopes covered, determines freshness
+            agent_results: Per-agent results
+            shared_context: Synthesis and quality results
+        """
+        self._put(self._workflows, request_key, self.freshness_window(analysis_scope), {
+            "agent_results": agent_results,
+            "shared_context": shared_context,
+        })
+
+    def get_agent_result(self, agent_id: str, input_key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a fresh cached agent result for identical inputs.
+
+        Args:
+            agent_id: Agent identifier
+            input_key: Key from ``agent_input_key``
+
+        Returns:
+            Copy of the cached agent result or None on a miss
+        """
+        value = self._get(self._agents, (agent_id, input_key))
+        self.stats["agent_hits" if value is not None else "agent_misses"] += 1
+        return value["result"] if value is not None else None
+
+    def put_agent_result(self, agent_id: str, input_key: str, result: Dict[str, Any]) -> None:
+        """
+        Cache a completed agent result.
+
+        Args:
+            agent_id: Agent identifier
+            input_key: Key from ``agent_input_key``
+            result: Agent result dictionary
+        """
+        scope = AGENT_ANALYSIS_SCOPES.get(agent_id)
+        window = self.freshness_window([scope] if scope else [])
+        self._put(self._agents, (agent_id, input_key), window, {"result": result})
+
+    def invalidate(self, request_key: Optional[str] = None) -> None:
+        """
+        Drop one workflow entry, or everything when no key is given.
+
+        Args:
+            request_key: Workflow key to drop
+        """
+        if request_key is None:
+            self._workflows.clear()
+            self._agents.clear()
+        else:
+            self._workflows.pop(request_key, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        return {
+            **self.stats,
+            "workflow_entries": len(self._workflows),
+            "agent_entries": len(self._agents),
+        }
+
+    def _get(self, store: OrderedDict, key: Any) -> Optional[Dict[str, Any]]:
+        entry = store.get(key)
+        if entry is None:
+            return None
+
+        cached_at, expires_at, value = entry
+        if time.time() >= expires_at:
+            del store[key]
+            return None
+
+        store.move_to_end(key)
+        return {**copy.deepcopy(value), "cached_at": cached_at}
+
+    def _put(self, store: OrderedDict, key: Any, window: float, value: Dict[str, Any]) -> None:
+        now = time.time()
+        store[key] = (now, now + window, copy.deepcopy(value))
+        store.move_to_end(key)
+        while len(store) > self.max_entries:
+            store.popitem(last=False)
+            self.stats["evictions"] += 1
+
+
+def scopes_for_agents(agent_ids: Iterable[str]) -> List[str]:
+    """Analysis scopes covered by a set of agents"""
+    return [AGENT_ANALYSIS_SCOPES[agent_id] for agent_id in agent_ids if agent_id in AGENT_ANALYSIS_SCOPES]
@@ -10,6 +10,7 @@ This module provides comprehensive error handling capabilities including:
 
 import asyncio
 import logging
+import os
 import time
 from enum import Enum
 from typing import Any, Callable, Dict, List, Optional, Type, Union
@@ -208,6 +209,117 @@ class WorkflowCheckpoint:
     completed_steps: List[str]
     current_step: str
     metadata: Dict[str, Any] = field(default_factory=dict)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert checkpoint to a JSON-serializable dictionary."""
+        return {
+            'checkpoint_id': self.checkpoint_id,
+            'workflow_id': self.workflow_id,
+            'timestamp': self.timestamp.isoformat(),
+            'state_data': self.state_data,
+            'completed_steps': self.completed_steps,
+            'current_step': self.current_step,
+            'metadata': self.metadata
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'WorkflowCheckpoint':
+        """Create checkpoint from a dictionary produced by ``to_dict``."""
+        return cls(
+            checkpoint_id=data['checkpoint_id'],
+            workflow_id=data['workflow_id'],
+            timestamp=datetime.fromisoformat(data['timestamp']),
+            state_data=data.get('state_data', {}),
+            completed_steps=data.get('completed_steps', []),
+            current_step=data.get('current_step', ''),
+            metadata=data.get('metadata', {})
+        )
+
+
+class FileCheckpointStorage:
+    """
+    Checkpoint storage backend writing one JSON file per checkpoint.
+    
+    Files are written atomically (temp file + rename) so a crash mid-write
+    never leaves a truncated checkpoint behind for the next process.
+    """
+    
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+    
+    def _path(self, checkpoint_id: str) -> str:
+        safe_id = checkpoint_id.replace(os.sep, '_').replace('/', '_')
+        return os.path.join(self.directory, f"{safe_id}.json")
+    
+    async def save_checkpoint(self, checkpoint: WorkflowCheckpoint) -> None:
+        """Persist a checkpoint."""
+        await asyncio.to_thread(self._write, checkpoint)
+    
+    async def load_checkpoint(self, checkpoint_id: str) -> Optional[WorkflowCheckpoint]:
+        """Load a checkpoint by ID."""
+        return await asyncio.to_thread(self._read, self._path(checkpoint_id))
+    
+    async def list_checkpoints(self, workflow_id: str) -> List[WorkflowCheckpoint]:
+        """Load all checkpoints of a workflow."""
+        return await asyncio.to_thread(self._read_workflow, workflow_id)
+    
+    async def delete_checkpoints(self, workflow_id: str) -> int:
+        """Delete all checkpoints of a workflow."""
+        return await asyncio.to_thread(self._delete_workflow, workflow_id)
+    
+    async def list_workflow_ids(self) -> List[str]:
+        """IDs of workflows that have at least one checkpoint."""
+        return await asyncio.to_thread(self._read_workflow_ids)
+    
+    def _write(self, checkpoint: WorkflowCheckpoint) -> None:
+        path = self._path(checkpoint.checkpoint_id)
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'w') as f:
+            json.dump(checkpoint.to_dict(), f, default=str)
+        os.replace(temp_path, path)
+    
+    def _read(self, path: str) -> Optional[WorkflowCheckpoint]:
+        try:
+            with open(path, 'r') as f:
+                return WorkflowCheckpoint.from_dict(json.load(f))
+        except FileNotFoundError:
+            return None
+        except (ValueError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable checkpoint {path}: {e}")
+            return None
+    
+    def _workflow_paths(self, workflow_id: str) -> List[str]:
+        prefix = self._path(f"{workflow_id}_")[:-len('.json')]
+        return [
+            os.path.join(self.directory, name)
+            for name in os.listdir(self.directory)
+            if name.endswith('.json') and os.path.join(self.directory, name).startswith(prefix)
+        ]
+    
+    def _read_workflow(self, workflow_id: str) -> List[WorkflowCheckpoint]:
+        checkpoints = [self._read(path) for path in self._workflow_paths(workflow_id)]
+        # The filename prefix can also match longer workflow IDs
+        return [cp for cp in checkpoints if cp is not None and cp.workflow_id == workflow_id]
+    
+    def _read_workflow_ids(self) -> List[str]:
+        workflow_ids = set()
+        for name in os.listdir(self.directory):
+            if name.endswith('.json'):
+                checkpoint = self._read(os.path.join(self.directory, name))
+                if checkpoint is not None:
+                    workflow_ids.add(checkpoint.workflow_id)
+        return sorted(workflow_ids)
+    
+    def _delete_workflow(self, workflow_id: str) -> int:
+        deleted = 0
+        for checkpoint in self._read_workflow(workflow_id):
+            try:
+                os.remove(self._path(checkpoint.checkpoint_id))
+                deleted += 1
+            except FileNotFoundError:
+                pass
+        return deleted
 
 
 class WorkflowStateManager:
@@ -228,10 +340,17 @@ class WorkflowStateManager:
         state_data: Dict[str, Any],
         completed_steps: List[str],
         current_step: str,
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        checkpoint_id: Optional[str] = None
     ) -> str:
-        """Create a workflow checkpoint."""
-        checkpoint_id = f"{workflow_id}_{int(time.time())}"
+        """
+        Create a workflow checkpoint.
+        
+        Passing an existing ``checkpoint_id`` overwrites that checkpoint, so a
+        workflow can keep a single latest checkpoint instead of a history.
+        """
+        # Nanosecond suffix keeps IDs unique for several checkpoints per second
+        checkpoint_id = checkpoint_id or f"{workflow_id}_{time.time_ns()}"
         checkpoint = WorkflowCheckpoint(
             checkpoint_id=checkpoint_id,
             workflow_id=workflow_id,
@@ -273,20 +392,54 @@ class WorkflowStateManager:
             if cp.workflow_id == workflow_id
         ]
         
+        # After a restart the in-memory index is empty; fall back to storage
+        if not workflow_checkpoints and self.storage_backend:
+            try:
+                workflow_checkpoints = await self.storage_backend.list_checkpoints(workflow_id)
+            except Exception as e:
+                logger.error(f"Failed to load checkpoints for workflow {workflow_id}: {e}")
+            for checkpoint in workflow_checkpoints:
+                self.checkpoints[checkpoint.checkpoint_id] = checkpoint
+        
         if not workflow_checkpoints:
             return None
         
-        return max(workflow_checkpoints, key=lambda cp: cp.timestamp)
+        return max(workflow_checkpoints, key=lambda cp: (cp.timestamp, cp.checkpoint_id))
+    
+    async def list_workflow_ids(self) -> List[str]:
+        """IDs of workflows with checkpoints in memory or in storage."""
+        workflow_ids = {cp.workflow_id for cp in self.checkpoints.values()}
+        if self.storage_backend and hasattr(self.storage_backend, 'list_workflow_ids'):
+            try:
+                workflow_ids.update(await self.storage_backend.list_workflow_ids())
+            except Exception as e:
+                logger.error(f"Failed to list checkpointed workflows: {e}")
+        return sorted(workflow_ids)
+    
+    async def delete_checkpoints(self, workflow_id: str) -> int:
+        """Delete all checkpoints of a finished workflow."""
+        checkpoint_ids = [
+            checkpoint_id for checkpoint_id, cp in self.checkpoints.items()
+            if cp.workflow_id == workflow_id
+        ]
+        for checkpoint_id in checkpoint_ids:
+            del self.checkpoints[checkpoint_id]
+        
+        if self.storage_backend:
+            try:
+                return await self.storage_backend.delete_checkpoints(workflow_id)
+            except Exception as e:
+                logger.error(f"Failed to delete checkpoints for workflow {workflow_id}: {e}")
+        
+        return len(checkpoint_ids)
     
     async def _persist_checkpoint(self, checkpoint: WorkflowCheckpoint):
         """Persist checkpoint to storage backend."""
-        # Implementation depends on storage backend
-        pass
+        await self.storage_backend.save_checkpoint(checkpoint)
     
     async def _load_checkpoint(self, checkpoint_id: str) -> Optional[WorkflowCheckpoint]:
         """Load checkpoint from storage backend."""
-        # Implementation depends on storage backend
-        return None
+        return await self.storage_backend.load_checkpoint(checkpoint_id)
 
 
 class GracefulDegradationManager:
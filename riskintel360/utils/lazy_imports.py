@@ -0,0 +1,86 @@
+"""
+Lazy Import Utilities for RiskIntel360 Platform
+Defers loading of heavy optional modules until they are first used.
+"""
+
+import importlib
+import threading
+from types import ModuleType
+from typing import Any, Dict, List, Optional
+
+
+class LazyModule:
+    """
+    Module proxy that performs the real import on first attribute access.
+
+    Lets module-level code keep the familiar ``boto3.client(...)`` style while
+    keeping heavy packages (boto3, sklearn, yfinance, ...) off the import path
+    of the API process until a request actually needs them.
+    """
+
+    def __init__(self, module_name: str):
+        self._module_name = module_name
+        self._module: Optional[ModuleType] = None
+        self._lock = threading.Lock()
+
+    def _load(self) -> ModuleType:
+        """Import the wrapped module once and cache it"""
+        if self._module is None:
+            with self._lock:
+                if self._module is None:
+                    self._module = importlib.import_module(self._module_name)
+        return self._module
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the wrapped module has been imported yet"""
+        return self._module is not None
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._load(), name)
+
+    def __dir__(self) -> List[str]:
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.is_loaded else "not loaded"
+        return f"<LazyModule '{self._module_name}' ({state})>"
+
+
+def lazy_import(module_name: str) -> Any:
+    """
+    Return a proxy for ``module_name`` that imports it on first use.
+
+    Args:
+        module_name: Fully qualified module name, e.g. ``"boto3"``
+
+    Returns:
+        LazyModule proxy behaving like the imported module
+    """
+    return LazyModule(module_name)
+
+
+def lazy_attribute_loader(
+    package: str,
+    attribute_map: Dict[str, str]
+):
+    """
+    Build a PEP 562 ``__getattr__`` for package ``__init__`` re-exports.
+
+    Args:
+        package: Name of the package defining ``__getattr__``
+        attribute_map: Exported name -> relative submodule that defines it
+
+    Returns:
+        Callable suitable for assignment to a module-level ``__getattr__``
+    """
+    def __getattr__(name: str) -> Any:
+        submodule = attribute_map.get(name)
+        if submodule is None:
+            raise AttributeError(f"module '{package}' has no attribute '{name}'")
+        value = getattr(importlib.import_module(submodule, package), name)
+        # Cache on the package so later lookups skip this hook
+        setattr(importlib.import_module(package), name, value)
+        return value
+
+    return __getattr__
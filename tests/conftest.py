@@ -33,3 +33,11 @@ def demo_credentials() -> dict:
         "email": "demo@riskintel360.com",
         "password": "demo123"
     }
+
+
+@pytest.fixture(autouse=True)
+def workflow_checkpoint_dir(tmp_path, monkeypatch):
+    """Keep workflow checkpoints written by tests out of the working tree"""
+    checkpoint_dir = tmp_path / "workflow_checkpoints"
+    monkeypatch.setenv("WORKFLOW_CHECKPOINT_DIR", str(checkpoint_dir))
+    return checkpoint_dir
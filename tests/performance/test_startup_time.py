@@ -0,0 +1,115 @@
+"""
+API Start-up Time Regression Tests
+Guards the cold-start cost of importing riskintel360.api.main.
+Target: import within the budget from config/performance_benchmarks.json and
+no heavy optional modules (sklearn, matplotlib, plotly, yfinance, langgraph,
+boto3) loaded before the first request.
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+BENCHMARKS_FILE = PROJECT_ROOT / "config" / "performance_benchmarks.json"
+
+# Modules that must only be loaded when an endpoint or agent first needs them
+DEFERRED_MODULES = [
+    "sklearn",
+    "matplotlib",
+    "plotly",
+    "yfinance",
+    "langgraph",
+    "boto3",
+]
+
+
+def _load_import_budget_ms() -> float:
+    """Load the import budget, allowing an environment override for slow CI hosts"""
+    override = os.environ.get("RISKINTEL360_IMPORT_BUDGET_MS")
+    if override:
+        return float(override)
+
+    with open(BENCHMARKS_FILE, "r") as f:
+        benchmarks = json.load(f)
+    return float(benchmarks["startup"]["api_import_max_milliseconds"])
+
+
+def _run_importtime(module: str) -> List[Tuple[int, int, str]]:
+    """
+    Import a module in a fresh interpreter with ``-X importtime``.
+
+    Returns:
+        List of (self_us, cumulative_us, raw_name) rows; raw_name keeps the
+        leading indentation that encodes nesting depth.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert result.returncode == 0, f"Importing {module} failed:\n{result.stderr[-2000:]}"
+
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        # Row format: "import time: <self> | <cumulative> | <indent><name>"
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        rows.append((int(self_us), int(cumulative_us), name[1:]))
+    return rows
+
+
+def _package_import_ms(rows: List[Tuple[int, int, str]], package: str) -> float:
+    """Total time spent in top-level imports belonging to ``package``"""
+    total_us = sum(
+        cumulative_us
+        for _, cumulative_us, name in rows
+        if not name.startswith(" ") and name.split(".")[0] == package
+    )
+    return total_us / 1000.0
+
+
+def _loaded_roots(rows: List[Tuple[int, int, str]]) -> Dict[str, int]:
+    """Map every top-level package that was imported to its row count"""
+    roots: Dict[str, int] = {}
+    for _, _, name in rows:
+        root = name.strip().split(".")[0]
+        roots[root] = roots.get(root, 0) + 1
+    return roots
+
+
+@pytest.fixture(scope="module")
+def api_importtime_rows():
+    """Import rows for a cold import of the API application"""
+    return _run_importtime("riskintel360.api.main")
+
+
+@pytest.mark.performance
+def test_api_import_within_budget(api_importtime_rows):
+    """Cold import of riskintel360.api.main must stay within the configured budget"""
+    budget_ms = _load_import_budget_ms()
+    import_ms = _package_import_ms(api_importtime_rows, "riskintel360")
+
+    assert import_ms <= budget_ms, (
+        f"Importing riskintel360.api.main took {import_ms:.0f}ms, "
+        f"exceeding the {budget_ms:.0f}ms start-up budget"
+    )
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("module", DEFERRED_MODULES)
+def test_heavy_modules_deferred(api_importtime_rows, module):
+    """Heavy optional modules must not be imported until first use"""
+    loaded = _loaded_roots(api_importtime_rows)
+    assert module not in loaded, (
+        f"{module} is imported at API start-up; move the import to first use "
+        f"(see riskintel360.utils.lazy_imports)"
+    )
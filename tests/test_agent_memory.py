@@ -17,6 +17,7 @@ from riskintel360.services.agent_memory import (
     MemoryScope,
     MemoryEntry,
     ValidationPattern,
+    MemoryCache,
     RedisMemoryBackend,
     ElastiCacheMemoryBackend,
     InMemoryMessageQueue,
@@ -85,6 +86,27 @@ class TestMemoryEntry:
         assert restored_entry.scope == entry.scope
 
 
+class TestMemoryEntryRecord:
+    """Test MemoryEntry storage records"""
+    
+    def test_record_round_trip(self):
+        """Records use epoch-microsecond timestamps and read back losslessly"""
+        now = datetime.now(timezone.utc)
+        entry = MemoryEntry(
+            id="test-id", agent_id="test-agent", memory_type=MemoryType.SHORT_TERM,
+            scope=MemoryScope.AGENT_PRIVATE, key="test-key", value={"data": "test"},
+            metadata={}, created_at=now, updated_at=now, expires_at=now + timedelta(hours=1)
+        )
+        
+        record = entry.to_record()
+        restored = MemoryEntry.from_dict(record)
+        
+        assert isinstance(record["created_at"], int)
+        assert restored.created_at == now
+        assert restored.expires_at == entry.expires_at
+        assert MemoryEntry.from_dict(entry.to_dict()).created_at == now
+
+
 class TestValidationPattern:
     """Test ValidationPattern data model"""
     
@@ -135,6 +157,71 @@ class TestValidationPattern:
         assert restored_pattern.confidence_score == pattern.confidence_score
 
 
+class TestMemoryCache:
+    """Test bounded memory cache"""
+    
+    def make_entry(self, key, ttl=None, value=None):
+        now = datetime.now(timezone.utc)
+        return MemoryEntry(
+            id=key, agent_id="test-agent", memory_type=MemoryType.SHORT_TERM,
+            scope=MemoryScope.AGENT_PRIVATE, key=key, value=value, metadata={},
+            created_at=now, updated_at=now,
+            expires_at=now + timedelta(seconds=ttl) if ttl is not None else None
+        )
+    
+    def test_lru_eviction(self):
+        """Least recently used entry is evicted past max_entries"""
+        cache = MemoryCache(max_entries=2)
+        cache["a"] = self.make_entry("a")
+        cache["b"] = self.make_entry("b")
+        cache.get("a")
+        cache["c"] = self.make_entry("c")
+        
+        assert "a" in cache and "c" in cache
+        assert "b" not in cache
+        assert cache.get_stats()["evictions"] == 1
+    
+    def test_lfu_eviction(self):
+        """Least frequently used entry is evicted under the LFU policy"""
+        cache = MemoryCache(max_entries=2, eviction_policy="lfu")
+        cache["a"] = self.make_entry("a")
+        cache["b"] = self.make_entry("b")
+        cache.get("a")
+        cache.get("b")
+        cache.get("b")
+        cache["c"] = self.make_entry("c")
+        
+        assert "b" in cache and "c" in cache
+        assert "a" not in cache
+    
+    def test_byte_bound(self):
+        """Estimated bytes stay under max_bytes and oversized entries are skipped"""
+        cache = MemoryCache(max_bytes=2000)
+        for index in range(10):
+            cache[str(index)] = self.make_entry(str(index), value="x" * 500)
+        cache["huge"] = self.make_entry("huge", value="x" * 5000)
+        
+        assert cache.current_bytes <= 2000
+        assert "9" in cache
+        assert "huge" not in cache
+        assert cache.get_stats()["oversized"] == 1
+    
+    def test_expired_entries_dropped(self):
+        """Expired entries miss on get and are purged before live entries are evicted"""
+        cache = MemoryCache(max_entries=2)
+        cache["expired"] = self.make_entry("expired", ttl=-1)
+        cache["live"] = self.make_entry("live", ttl=3600)
+        cache["new"] = self.make_entry("new")
+        
+        assert "expired" not in cache
+        assert "live" in cache
+        assert cache.get("missing") is None
+        stats = cache.get_stats()
+        assert stats["expirations"] == 1
+        assert stats["evictions"] == 0
+        assert stats["misses"] == 1
+
+
 class TestRedisMemoryBackend:
     """Test Redis memory backend"""
     
@@ -182,10 +269,14 @@ class TestRedisMemoryBackend:
             assert success is True
             mock_client.set.assert_called_once()
             
-            # Test retrieve
+            # Test retrieve (legacy JSON and the binary codec)
             mock_client.get.return_value = json.dumps(test_data)
             result = await redis_backend.retrieve("test-key")
             assert result == test_data
+            
+            mock_client.get.return_value = mock_client.set.call_args[0][1]
+            result = await redis_backend.retrieve("test-key")
+            assert result == test_data
     
     @pytest.mark.asyncio
     async def test_redis_store_with_ttl(self, redis_backend):
@@ -201,7 +292,7 @@ class TestRedisMemoryBackend:
             mock_client.setex.return_value = True
             success = await redis_backend.store("test-key", test_data, ttl=3600)
             assert success is True
-            mock_client.setex.assert_called_once_with("test-key", 3600, json.dumps(test_data, default=str))
+            mock_client.setex.assert_called_once_with("test-key", 3600, redis_backend.codec.encode(test_data))
     
     @pytest.mark.asyncio
     async def test_redis_delete_exists(self, redis_backend):
@@ -232,6 +323,33 @@ class TestRedisMemoryBackend:
             mock_client.keys.return_value = ["key1", "key2", "key3"]
             keys = await redis_backend.keys("test-*")
             assert keys == ["key1", "key2", "key3"]
+    
+    @pytest.mark.asyncio
+    async def test_redis_batch_operations(self, redis_backend):
+        """Test Redis SCAN, MGET and UNLINK batch operations"""
+        mock_client = AsyncMock()
+        redis_backend.client = mock_client
+        
+        mock_client.scan.side_effect = [(17, ["key1", "key2"]), (0, ["key3"])]
+        batches = [batch async for batch in redis_backend.scan_keys("test-*", batch_size=2)]
+        assert batches == [["key1", "key2"], ["key3"]]
+        mock_client.scan.assert_called_with(cursor=17, match="test-*", count=2)
+        mock_client.keys.assert_not_called()
+        
+        mock_client.mget.return_value = [json.dumps({"a": 1}).encode(), None]
+        assert await redis_backend.retrieve_many(["key1", "key2"]) == [{"a": 1}, None]
+        
+        mock_client.unlink.return_value = 2
+        assert await redis_backend.delete_many(["key1", "key2"]) == 2
+        mock_client.unlink.assert_called_once_with("key1", "key2")
+        
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(return_value=[True, True])
+        mock_client.pipeline = Mock(return_value=pipe)
+        assert await redis_backend.store_many([("key1", {"a": 1}, 60), ("key2", {"b": 2}, None)]) == 2
+        pipe.setex.assert_called_once_with("key1", 60, redis_backend.codec.encode({"a": 1}))
+        pipe.set.assert_called_once_with("key2", redis_backend.codec.encode({"b": 2}))
+        pipe.execute.assert_called_once()
 
 
 class TestInMemoryMessageQueue:
@@ -285,6 +403,71 @@ class TestInMemoryMessageQueue:
         assert len(messages) == 1
 
 
+class TestSQSMessageQueue:
+    """Test SQS message queue batching and routing"""
+    
+    @pytest.fixture
+    def sqs_queue(self):
+        """Create SQS queue with a mocked client"""
+        queue = SQSMessageQueue("knowledge")
+        queue.sqs_client = Mock()
+        queue.queue_url = "https://sqs/knowledge"
+        queue.sqs_client.get_queue_url.side_effect = lambda QueueName: {"QueueUrl": f"https://sqs/{QueueName}"}
+        return queue
+    
+    @pytest.mark.asyncio
+    async def test_send_message_batch_chunks_entries(self, sqs_queue):
+        """Test sends are split into SendMessageBatch calls of at most 10 entries"""
+        sqs_queue.sqs_client.send_message_batch.side_effect = lambda QueueUrl, Entries: {
+            "Successful": [{"Id": entry["Id"]} for entry in Entries]
+        }
+        
+        sent = await sqs_queue.send_message_batch([{"n": i} for i in range(23)], agent_id="risk agent")
+        
+        assert sent == 23
+        calls = sqs_queue.sqs_client.send_message_batch.call_args_list
+        assert [len(c.kwargs["Entries"]) for c in calls] == [10, 10, 3]
+        assert calls[0].kwargs["QueueUrl"] == "https://sqs/knowledge-risk-agent"
+    
+    @pytest.mark.asyncio
+    async def test_send_message_batch_respects_size_limit(self, sqs_queue):
+        """Test batches stay under the 256 KiB request limit"""
+        sqs_queue.sqs_client.send_message_batch.side_effect = lambda QueueUrl, Entries: {
+            "Successful": [{"Id": entry["Id"]} for entry in Entries]
+        }
+        
+        await sqs_queue.send_message_batch([{"blob": "x" * 100_000} for _ in range(4)])
+        
+        calls = sqs_queue.sqs_client.send_message_batch.call_args_list
+        assert [len(c.kwargs["Entries"]) for c in calls] == [2, 2]
+    
+    @pytest.mark.asyncio
+    async def test_delete_message_batch_counts_failures(self, sqs_queue):
+        """Test batch deletes report only successful entries"""
+        sqs_queue.sqs_client.delete_message_batch.return_value = {
+            "Successful": [{"Id": "0"}],
+            "Failed": [{"Id": "1", "Message": "receipt handle expired"}]
+        }
+        
+        deleted = await sqs_queue.delete_message_batch(["h1", "h2"], agent_id="risk-agent")
+        
+        assert deleted == 1
+        entries = sqs_queue.sqs_client.delete_message_batch.call_args.kwargs["Entries"]
+        assert entries == [{"Id": "0", "ReceiptHandle": "h1"}, {"Id": "1", "ReceiptHandle": "h2"}]
+    
+    @pytest.mark.asyncio
+    async def test_registered_agents_discovers_inboxes(self, sqs_queue):
+        """Test inboxes created by other processes are discovered"""
+        sqs_queue.sqs_client.list_queues.return_value = {
+            "QueueUrls": ["https://sqs/knowledge-market-agent", "https://sqs/knowledge-risk-agent"]
+        }
+        
+        agents = await sqs_queue.registered_agents()
+        
+        assert sorted(agents) == ["market-agent", "risk-agent"]
+        sqs_queue.sqs_client.list_queues.assert_called_once_with(QueueNamePrefix="knowledge-")
+
+
 class TestAgentMemoryManager:
     """Test Agent Memory Manager"""
     
@@ -423,6 +606,31 @@ class TestAgentMemoryManager:
         assert retrieved_entry.access_count == 1
         assert memory_manager.stats["cache_hits"] == 1
     
+    @pytest.mark.asyncio
+    async def test_retrieve_memory_cached_entry_expired(self, memory_manager, mock_backend):
+        """Test an expired cached entry is removed locally and from the backend"""
+        memory_manager.backend = mock_backend
+        
+        now = datetime.now(timezone.utc)
+        entry = MemoryEntry(
+            id="test-id", agent_id="test-agent", memory_type=MemoryType.SHORT_TERM,
+            scope=MemoryScope.AGENT_PRIVATE, key="test-key", value={}, metadata={},
+            created_at=now, updated_at=now, expires_at=now - timedelta(seconds=1)
+        )
+        storage_key = memory_manager._generate_storage_key(
+            "test-agent", MemoryType.SHORT_TERM, MemoryScope.AGENT_PRIVATE, "test-key"
+        )
+        memory_manager.memory_cache[storage_key] = entry
+        
+        result = await memory_manager.retrieve_memory(
+            "test-agent", MemoryType.SHORT_TERM, MemoryScope.AGENT_PRIVATE, "test-key"
+        )
+        
+        assert result is None
+        assert storage_key not in memory_manager.memory_cache
+        mock_backend.delete.assert_called_once_with(storage_key)
+        mock_backend.retrieve.assert_not_called()
+    
     @pytest.mark.asyncio
     async def test_retrieve_memory_cache_miss(self, memory_manager, mock_backend):
         """Test retrieving memory from backend (cache miss)"""
@@ -459,13 +667,71 @@ class TestAgentMemoryManager:
         assert retrieved_entry.access_count == 1
         assert memory_manager.stats["cache_misses"] == 1
     
+    @pytest.mark.asyncio
+    async def test_retrieve_memory_defers_write_back(self, memory_manager, mock_backend):
+        """Test backend hits are written back once, in a batch, by the flusher"""
+        memory_manager.backend = mock_backend
+        
+        now = datetime.now(timezone.utc)
+        mock_backend.retrieve.return_value = MemoryEntry(
+            id="test-id", agent_id="test-agent", memory_type=MemoryType.SHORT_TERM,
+            scope=MemoryScope.AGENT_PRIVATE, key="test-key", value={}, metadata={},
+            created_at=now, updated_at=now, expires_at=now + timedelta(hours=1)
+        ).to_dict()
+        mock_backend.store_many.return_value = 1
+        
+        for _ in range(3):
+            await memory_manager.retrieve_memory(
+                "test-agent", MemoryType.SHORT_TERM, MemoryScope.AGENT_PRIVATE, "test-key"
+            )
+        
+        mock_backend.store.assert_not_called()
+        assert memory_manager.get_memory_stats()["pending_writes"] == 1
+        
+        assert await memory_manager.flush_pending_writes() == 1
+        
+        (items,), _ = mock_backend.store_many.call_args
+        storage_key, value, ttl = items[0]
+        assert len(items) == 1
+        assert value["access_count"] == 3
+        assert 0 < ttl <= 3600
+        assert memory_manager.get_memory_stats()["pending_writes"] == 0
+    
+    @pytest.mark.asyncio
+    async def test_save_validation_patterns_only_dirty(self, memory_manager, mock_backend):
+        """Test only patterns changed since the last save are written"""
+        memory_manager.backend = mock_backend
+        mock_backend.store_many.return_value = 1
+        
+        now = datetime.now(timezone.utc)
+        memory_manager.validation_patterns = {
+            pattern_id: ValidationPattern(
+                pattern_id=pattern_id, business_concept_hash=pattern_id, target_market="fintech",
+                analysis_results={}, success_indicators=[], failure_indicators=[],
+                confidence_score=0.8, usage_count=0, created_at=now, last_used=now
+            )
+            for pattern_id in ("pattern-1", "pattern-2")
+        }
+        request = Mock(id="request-1")
+        
+        await memory_manager.apply_pattern_insights(memory_manager.validation_patterns["pattern-2"], request)
+        await memory_manager._save_validation_patterns()
+        await memory_manager._save_validation_patterns()
+        
+        mock_backend.store_many.assert_called_once()
+        (items,), _ = mock_backend.store_many.call_args
+        assert [value["value"]["pattern_id"] for _, value, _ in items] == ["pattern-2"]
+        mock_backend.store.assert_not_called()
+    
     @pytest.mark.asyncio
     async def test_search_memories(self, memory_manager, mock_backend):
         """Test searching for memory entries"""
         memory_manager.backend = mock_backend
         
-        # Mock backend keys and retrieve
-        mock_backend.keys.return_value = ["memory:test-agent:short_term:agent_private:key1"]
+        # Mock backend scan and batch retrieve
+        async def scan_keys(pattern, batch_size=500):
+            yield ["memory:test-agent:short_term:agent_private:key1"]
+        mock_backend.scan_keys = scan_keys
         
         now = datetime.now(timezone.utc)
         entry_data = {
@@ -482,7 +748,7 @@ class TestAgentMemoryManager:
             "access_count": 0,
             "confidence_score": 1.0
         }
-        mock_backend.retrieve.return_value = entry_data
+        mock_backend.retrieve_many.return_value = [entry_data]
         
         # Search memories
         entries = await memory_manager.search_memories(
@@ -495,6 +761,38 @@ class TestAgentMemoryManager:
         assert len(entries) == 1
         assert entries[0].id == "test-id"
     
+    @pytest.mark.asyncio
+    async def test_search_memories_stops_at_limit(self, memory_manager, mock_backend):
+        """Search stops scanning once enough entries are found and batch-deletes expired ones"""
+        memory_manager.backend = mock_backend
+        scanned_batches = []
+        
+        async def scan_keys(pattern, batch_size=500):
+            for batch in (["k0", "k1", "k2"], ["k3", "k4"], ["k5"]):
+                scanned_batches.append(batch)
+                yield batch
+        mock_backend.scan_keys = scan_keys
+        
+        now = datetime.now(timezone.utc)
+        
+        def make_entry(key, expired=False):
+            return MemoryEntry(
+                id=key, agent_id="test-agent", memory_type=MemoryType.SHORT_TERM,
+                scope=MemoryScope.AGENT_PRIVATE, key=key, value={}, metadata={},
+                created_at=now, updated_at=now,
+                expires_at=now - timedelta(minutes=1) if expired else None
+            ).to_dict()
+        
+        data = {"k0": make_entry("k0"), "k1": make_entry("k1", expired=True), "k2": None,
+                "k3": make_entry("k3"), "k4": make_entry("k4"), "k5": make_entry("k5")}
+        mock_backend.retrieve_many.side_effect = lambda keys: [data[key] for key in keys]
+        
+        entries = await memory_manager.search_memories(agent_id="test-agent", limit=3)
+        
+        assert [entry.id for entry in entries] == ["k0", "k3", "k4"]
+        assert len(scanned_batches) == 2
+        mock_backend.delete_many.assert_called_once_with(["k1"])
+    
     @pytest.mark.asyncio
     async def test_delete_memory(self, memory_manager, mock_backend):
         """Test deleting memory entries"""
@@ -600,6 +898,39 @@ class TestAgentMemoryManager:
         # Should be sorted by confidence and usage
         assert similar_patterns[0].pattern_id == "pattern-1"
     
+    @pytest.mark.asyncio
+    async def test_find_similar_patterns_by_embedding(self, memory_manager):
+        """Test reworded concepts are matched through the embedding index"""
+        now = datetime.now(timezone.utc)
+        
+        def make_pattern(pattern_id, concept, market, confidence):
+            return ValidationPattern(
+                pattern_id=pattern_id,
+                business_concept_hash=pattern_id,
+                target_market=market,
+                analysis_results={},
+                success_indicators=[],
+                failure_indicators=[],
+                confidence_score=confidence,
+                usage_count=0,
+                created_at=now,
+                last_used=now,
+                business_concept=concept
+            )
+        
+        memory_manager.validation_patterns = {
+            "fraud": make_pattern("fraud", "Fraud detection for mobile payment apps", "payments", 0.5),
+            "lending": make_pattern("lending", "Peer to peer lending marketplace", "fintech", 0.9)
+        }
+        
+        similar_patterns = await memory_manager.find_similar_patterns(
+            business_concept="AI-powered payment fraud detection on mobile",
+            target_market="fintech",
+            limit=2
+        )
+        
+        assert [pattern.pattern_id for pattern in similar_patterns] == ["fraud", "lending"]
+    
     @pytest.mark.asyncio
     async def test_apply_pattern_insights(self, memory_manager):
         """Test applying pattern insights"""
@@ -679,7 +1010,49 @@ class TestAgentMemoryManager:
         
         assert len(knowledge_messages) == 1
         assert knowledge_messages[0]["knowledge_type"] == "market_insight"
-        mock_message_queue.delete_message.assert_called_once_with("handle-1")
+        mock_message_queue.receive_messages.assert_called_once_with(
+            max_messages=10, wait_time=1, agent_id="financial-validation-agent"
+        )
+        mock_message_queue.delete_message_batch.assert_called_once_with(
+            ["handle-1"], agent_id="financial-validation-agent"
+        )
+    
+    @pytest.mark.asyncio
+    async def test_share_knowledge_routes_to_agent_inboxes(self, memory_manager):
+        """Test broadcasts reach every registered agent except the sender"""
+        queue = InMemoryMessageQueue()
+        memory_manager.message_queue = queue
+        for agent_id in ("market-agent", "risk-agent", "compliance-agent"):
+            await memory_manager.register_agent(agent_id)
+        
+        await memory_manager.share_knowledge("market-agent", "market_insight", {"insight": "demand"})
+        await memory_manager.share_knowledge(
+            "market-agent", "risk_flag", {"flag": "fx"}, target_agents=["risk-agent"]
+        )
+        
+        risk_messages = await memory_manager.receive_shared_knowledge("risk-agent")
+        compliance_messages = await memory_manager.receive_shared_knowledge("compliance-agent")
+        
+        assert [m["knowledge_type"] for m in risk_messages] == ["market_insight", "risk_flag"]
+        assert [m["knowledge_type"] for m in compliance_messages] == ["market_insight"]
+        assert queue.agent_queues["market-agent"].empty()
+    
+    @pytest.mark.asyncio
+    async def test_share_knowledge_batch(self, memory_manager):
+        """Test batched knowledge sharing sends one batch per recipient"""
+        queue = AsyncMock()
+        queue.send_message_batch.return_value = 2
+        memory_manager.message_queue = queue
+        
+        delivered = await memory_manager.share_knowledge_batch(
+            "market-agent",
+            [("market_insight", {"a": 1}), ("market_insight", {"b": 2})],
+            target_agents=["risk-agent", "compliance-agent"]
+        )
+        
+        assert delivered == 4
+        assert queue.send_message_batch.call_count == 2
+        assert queue.send_message_batch.call_args.kwargs["agent_id"] == "compliance-agent"
     
     def test_get_memory_stats(self, memory_manager):
         """Test getting memory statistics"""
@@ -574,7 +574,7 @@ class TestAsyncAPIFunctionality:
             created_at=datetime.now(timezone.utc)
         )
         
-        with patch('riskintel360.api.validations.WorkflowOrchestrator') as mock_orchestrator:
+        with patch('riskintel360.services.workflow_orchestrator.WorkflowOrchestrator') as mock_orchestrator:
             with patch('riskintel360.api.validations.data_manager') as mock_data_manager:
                 mock_orchestrator.return_value.execute_validation_workflow = AsyncMock()
                 mock_data_manager.store_validation_result = AsyncMock()
@@ -96,7 +96,7 @@ class TestCompetitionDemoService:
         assert any("AgentCore" in service for service in aws_services)
     
     @pytest.mark.asyncio
-    @patch('riskintel360.services.competition_demo.WorkflowOrchestrator')
+    @patch('riskintel360.services.workflow_orchestrator.WorkflowOrchestrator')
     async def test_run_demo_scenario(self, mock_orchestrator, demo_service, mock_validation_result):
         """Test running a complete demo scenario"""
         # Mock the workflow orchestrator
@@ -192,7 +192,7 @@ class TestCompetitionDemoService:
         assert "82.1%" in improvements["cost_reduced"]
     
     @pytest.mark.asyncio
-    @patch('riskintel360.services.competition_demo.WorkflowOrchestrator')
+    @patch('riskintel360.services.workflow_orchestrator.WorkflowOrchestrator')
     async def test_execute_tracked_workflow(self, mock_orchestrator, demo_service, mock_validation_result):
         """Test workflow execution with comprehensive tracking"""
         # Mock the workflow orchestrator
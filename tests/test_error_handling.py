@@ -18,7 +18,7 @@ from typing import Any, Dict
 from riskintel360.utils.error_handling import (
     CircuitBreaker, CircuitBreakerConfig, CircuitBreakerState,
     RetryHandler, RetryConfig,
-    WorkflowStateManager, WorkflowCheckpoint,
+    WorkflowStateManager, WorkflowCheckpoint, FileCheckpointStorage,
     GracefulDegradationManager,
     ErrorHandlingManager, ErrorContext, ErrorSeverity, RecoveryAction
 )
@@ -240,6 +240,38 @@ class TestWorkflowStateManager:
         assert latest is not None
         assert latest.checkpoint_id == checkpoint2_id
         assert latest.state_data == {"version": 2}
+    
+    @pytest.mark.asyncio
+    async def test_checkpoints_survive_restart(self, tmp_path):
+        """Test that file-backed checkpoints are visible to a new manager."""
+        manager = WorkflowStateManager(FileCheckpointStorage(str(tmp_path)))
+        
+        await manager.create_checkpoint(
+            workflow_id="test_workflow",
+            state_data={"version": 1},
+            completed_steps=["step1"],
+            current_step="step2"
+        )
+        latest_id = await manager.create_checkpoint(
+            workflow_id="test_workflow",
+            state_data={"version": 2},
+            completed_steps=["step1", "step2"],
+            current_step="step3"
+        )
+        
+        # Simulate a process restart with an empty in-memory index
+        restarted = WorkflowStateManager(FileCheckpointStorage(str(tmp_path)))
+        latest = await restarted.get_latest_checkpoint("test_workflow")
+        
+        assert latest is not None
+        assert latest.checkpoint_id == latest_id
+        assert latest.state_data == {"version": 2}
+        assert await restarted.get_latest_checkpoint("test_workflow_other") is None
+        
+        assert await restarted.delete_checkpoints("test_workflow") == 2
+        assert await WorkflowStateManager(
+            FileCheckpointStorage(str(tmp_path))
+        ).get_latest_checkpoint("test_workflow") is None
 
 
 class TestGracefulDegradationManager:
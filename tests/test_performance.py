@@ -310,6 +310,8 @@ class TestCaching:
             
             mock_pool_manager.initialize_all.assert_called_once()
             assert cache_manager.cache_service is not None
+            
+            await cache_manager.shutdown()
     
     @pytest.mark.asyncio
     async def test_cache_set_get_operations(self, cache_manager):
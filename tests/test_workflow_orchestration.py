@@ -13,7 +13,7 @@ from typing import Dict, Any, List
 
 from riskintel360.services.workflow_orchestrator import (
     WorkflowOrchestrator, SupervisorAgent, WorkflowConfig,
-    MarketCondition, AlertEvent, create_enhanced_workflow_orchestrator
+    MarketCondition, MarketConditionStore, AlertEvent, create_enhanced_workflow_orchestrator
 )
 from riskintel360.services.agentcore_client import create_agentcore_client
 from riskintel360.models.agent_models import AgentType, MessageType, Priority
@@ -172,6 +172,343 @@ class TestSupervisorAgent:
         assert success is True
 
 
+def make_parallel_state(agent_ids: List[str]) -> Dict[str, Any]:
+    """Build a minimal workflow state ready for the parallel execution node"""
+    return {
+        "workflow_id": "parallel_test_workflow",
+        "user_id": "test_user",
+        "validation_request": {},
+        "current_phase": None,
+        "agent_assignments": {
+            agent_id: {"task": f"{agent_id}_task", "parameters": {}}
+            for agent_id in agent_ids
+        },
+        "agent_results": {},
+        "shared_context": {},
+        "messages": [],
+        "errors": [],
+        "progress": 0.0,
+        "started_at": datetime.now(UTC),
+        "last_updated": datetime.now(UTC)
+    }
+
+
+class TestParallelExecution:
+    """Test cases for concurrent agent execution in the parallel node"""
+    
+    AGENT_IDS = ["regulatory_compliance", "fraud_detection", "market_analysis"]
+    
+    @pytest.mark.asyncio
+    async def test_agents_run_concurrently(self, agentcore_client, mock_bedrock_client):
+        """Workflow latency should track the slowest agent, not the sum"""
+        supervisor = SupervisorAgent(agentcore_client, mock_bedrock_client, WorkflowConfig())
+        supervisor._send_progress_update = AsyncMock()
+        
+        async def slow_agent(agent_factory, agent_type, agent_id, assignment, workflow_id):
+            await asyncio.sleep(0.2)
+            return {"status": "completed", "confidence": 0.9, "execution_time": 0.2}
+        
+        supervisor._execute_single_agent = slow_agent
+        state = make_parallel_state(self.AGENT_IDS)
+        
+        with patch('riskintel360.agents.agent_factory.get_agent_factory', return_value=Mock()):
+            started = asyncio.get_event_loop().time()
+            state = await supervisor._execute_parallel_node(state)
+            elapsed = asyncio.get_event_loop().time() - started
+        
+        assert elapsed < 0.45  # Sequential execution would take 0.6s
+        assert set(state["agent_results"]) == set(self.AGENT_IDS)
+        assert state["progress"] == 0.7
+        # One progress update at phase start plus one per completed agent
+        assert supervisor._send_progress_update.await_count == 1 + len(self.AGENT_IDS)
+    
+    @pytest.mark.asyncio
+    async def test_concurrency_cap_is_respected(self, agentcore_client, mock_bedrock_client):
+        """No more than max_concurrent_agents agents should execute at once"""
+        supervisor = SupervisorAgent(
+            agentcore_client, mock_bedrock_client, WorkflowConfig(max_concurrent_agents=2)
+        )
+        supervisor._send_progress_update = AsyncMock()
+        running = 0
+        peak = 0
+        
+        async def tracked_agent(agent_factory, agent_type, agent_id, assignment, workflow_id):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.05)
+            running -= 1
+            return {"status": "completed", "confidence": 0.9, "execution_time": 0.05}
+        
+        supervisor._execute_single_agent = tracked_agent
+        state = make_parallel_state(self.AGENT_IDS + ["kyc_verification", "risk_assessment"])
+        
+        with patch('riskintel360.agents.agent_factory.get_agent_factory', return_value=Mock()):
+            state = await supervisor._execute_parallel_node(state)
+        
+        assert peak == 2
+        assert len(state["agent_results"]) == 5
+    
+    @pytest.mark.asyncio
+    async def test_contended_slots_follow_task_priority(self, agentcore_client, mock_bedrock_client):
+        """Under the concurrency cap, higher priority tasks start first"""
+        supervisor = SupervisorAgent(
+            agentcore_client, mock_bedrock_client, WorkflowConfig(max_concurrent_agents=1)
+        )
+        supervisor._send_progress_update = AsyncMock()
+        started = []
+        
+        async def agent(agent_factory, agent_type, agent_id, assignment, workflow_id):
+            started.append(agent_id)
+            await asyncio.sleep(0.01)
+            return {"status": "completed", "confidence": 0.9, "execution_time": 0.01}
+        
+        supervisor._execute_single_agent = agent
+        state = make_parallel_state(["market_analysis", "fraud_detection", "regulatory_compliance"])
+        for agent_id, assignment in state["agent_assignments"].items():
+            assignment["priority"] = supervisor._fintech_task_priority(agent_id).value
+        
+        with patch('riskintel360.agents.agent_factory.get_agent_factory', return_value=Mock()):
+            await supervisor._execute_parallel_node(state)
+        
+        assert started == ["regulatory_compliance", "fraud_detection", "market_analysis"]
+    
+    @pytest.mark.asyncio
+    async def test_per_agent_deadline(self, agentcore_client, mock_bedrock_client):
+        """A slow agent times out without holding back the others"""
+        supervisor = SupervisorAgent(
+            agentcore_client, mock_bedrock_client, WorkflowConfig(agent_timeout_seconds=0.1)
+        )
+        supervisor._send_progress_update = AsyncMock()
+        
+        async def agent(agent_factory, agent_type, agent_id, assignment, workflow_id):
+            await asyncio.sleep(5.0 if agent_id == "market_analysis" else 0.01)
+            return {"status": "completed", "confidence": 0.9, "execution_time": 0.01}
+        
+        supervisor._execute_single_agent = agent
+        state = make_parallel_state(self.AGENT_IDS)
+        
+        with patch('riskintel360.agents.agent_factory.get_agent_factory', return_value=Mock()):
+            state = await supervisor._execute_parallel_node(state)
+        
+        assert state["agent_results"]["market_analysis"]["status"] == "timeout"
+        assert state["agent_results"]["fraud_detection"]["status"] == "completed"
+        assert state["agent_results"]["regulatory_compliance"]["status"] == "completed"
+    
+    @pytest.mark.asyncio
+    async def test_dependent_agent_waits_for_upstream(self, agentcore_client, mock_bedrock_client):
+        """risk_assessment starts only after regulatory_compliance and receives its output"""
+        supervisor = SupervisorAgent(agentcore_client, mock_bedrock_client, WorkflowConfig())
+        supervisor._send_progress_update = AsyncMock()
+        events = []
+        
+        async def agent(agent_factory, agent_type, agent_id, assignment, workflow_id):
+            events.append(("start", agent_id, assignment["parameters"].get("upstream_results")))
+            await asyncio.sleep(0.05)
+            events.append(("end", agent_id, None))
+            return {"status": "completed", "result": {"agent": agent_id}, "confidence": 0.9, "execution_time": 0.05}
+        
+        supervisor._execute_single_agent = agent
+        state = make_parallel_state(self.AGENT_IDS + ["risk_assessment"])
+        state["agent_assignments"]["risk_assessment"]["dependencies"] = ["regulatory_compliance"]
+        
+        with patch('riskintel360.agents.agent_factory.get_agent_factory', return_value=Mock()):
+            state = await supervisor._execute_parallel_node(state)
+        
+        risk_start = events.index(("start", "risk_assessment", {"regulatory_compliance": {"agent": "regulatory_compliance"}}))
+        assert events.index(("end", "regulatory_compliance", None)) < risk_start
+        # Independent agents are not held back by the dependency
+        assert events.index(("start", "market_analysis", None)) < risk_start
+        
+        schedule = state["shared_context"]["execution_schedule"]
+        assert schedule["critical_path"][-1] == "risk_assessment"
+        assert schedule["actual_makespan_seconds"] < 0.2  # Two levels of 0.05s
+    
+    @pytest.mark.asyncio
+    async def test_retry_reruns_only_unfinished_agents(self, agentcore_client, mock_bedrock_client):
+        """Completed agents are restored from checkpoints instead of re-executed"""
+        supervisor = SupervisorAgent(agentcore_client, mock_bedrock_client, WorkflowConfig())
+        supervisor._send_progress_update = AsyncMock()
+        calls = []
+        failing = {"market_analysis"}
+        
+        async def agent(agent_factory, agent_type, agent_id, assignment, workflow_id):
+            calls.append(agent_id)
+            if agent_id in failing:
+                raise RuntimeError("upstream API unavailable")
+            return {"status": "completed", "confidence": 0.9, "execution_time": 0.01}
+        
+        supervisor._execute_single_agent = agent
+        
+        with patch('riskintel360.agents.agent_factory.get_agent_factory', return_value=Mock()):
+            first = await supervisor._execute_parallel_node(make_parallel_state(self.AGENT_IDS))
+            assert first["agent_results"]["market_analysis"]["status"] == "failed"
+            
+            # A fresh state mimics a restart: results come from the checkpoint
+            calls.clear()
+            failing.clear()
+            retried = await supervisor._execute_parallel_node(make_parallel_state(self.AGENT_IDS))
+        
+        assert calls == ["market_analysis"]
+        assert all(result["status"] == "completed" for result in retried["agent_results"].values())
+    
+    @pytest.mark.asyncio
+    async def test_single_checkpoint_resumed_after_restart(
+        self, agentcore_client, mock_bedrock_client, workflow_checkpoint_dir
+    ):
+        """Each workflow keeps one durable checkpoint that a new process resumes from"""
+        supervisor = SupervisorAgent(agentcore_client, mock_bedrock_client, WorkflowConfig())
+        supervisor._send_progress_update = AsyncMock()
+        
+        async def agent(agent_factory, agent_type, agent_id, assignment, workflow_id):
+            if agent_id == "market_analysis":
+                raise RuntimeError("upstream API unavailable")
+            return {"status": "completed", "confidence": 0.9, "execution_time": 0.01}
+        
+        supervisor._execute_single_agent = agent
+        state = make_parallel_state(self.AGENT_IDS)
+        state["validation_request"] = {"business_concept": "neo bank"}
+        with patch('riskintel360.agents.agent_factory.get_agent_factory', return_value=Mock()):
+            await supervisor._execute_parallel_node(state)
+        
+        assert len(supervisor.state_manager.checkpoints) == 1
+        assert len(list(workflow_checkpoint_dir.iterdir())) == 1
+        
+        restarted = SupervisorAgent(agentcore_client, mock_bedrock_client, WorkflowConfig())
+        restarted.start_workflow = AsyncMock()
+        
+        assert await restarted.resume_unfinished_workflows() == ["parallel_test_workflow"]
+        restarted.start_workflow.assert_awaited_once_with(
+            "test_user", {"business_concept": "neo bank"}, "parallel_test_workflow"
+        )
+    
+    @pytest.mark.asyncio
+    async def test_failed_run_deletes_checkpoints(self, agentcore_client, mock_bedrock_client, workflow_checkpoint_dir):
+        """Checkpoints are removed when a workflow times out or fails"""
+        supervisor = SupervisorAgent(agentcore_client, mock_bedrock_client, WorkflowConfig())
+        state = make_parallel_state(self.AGENT_IDS)
+        state["agent_results"] = {"fraud_detection": {"status": "completed"}}
+        supervisor.active_workflows[state["workflow_id"]] = state
+        await supervisor._checkpoint_agent_results(state)
+        
+        supervisor.workflow_graph = Mock(ainvoke=AsyncMock(side_effect=RuntimeError("graph failed")))
+        await supervisor._run_workflow_graph(state["workflow_id"])
+        
+        assert supervisor.state_manager.checkpoints == {}
+        assert list(workflow_checkpoint_dir.iterdir()) == []
+    
+    def test_retries_are_bounded(self, agentcore_client, mock_bedrock_client):
+        """Low quality retries only while unfinished agents remain and retries are left"""
+        supervisor = SupervisorAgent(agentcore_client, mock_bedrock_client, WorkflowConfig(max_retries=2))
+        state = make_parallel_state(self.AGENT_IDS)
+        state["shared_context"] = {"quality_passed": False, "quality_score": 0.3}
+        state["agent_results"] = {
+            "regulatory_compliance": {"status": "completed"},
+            "fraud_detection": {"status": "completed"},
+            "market_analysis": {"status": "timeout"}
+        }
+        
+        assert supervisor._should_retry_workflow(state) == "retry"
+        
+        state["shared_context"]["retry_count"] = 2
+        assert supervisor._should_retry_workflow(state) == "complete"
+        
+        state["shared_context"]["retry_count"] = 0
+        state["agent_results"]["market_analysis"] = {"status": "completed"}
+        assert supervisor._should_retry_workflow(state) == "complete"
+    
+    def test_critical_path_and_cycle_handling(self, agentcore_client, mock_bedrock_client):
+        """Critical path follows the longest chain; cycles fall back to no ordering"""
+        supervisor = SupervisorAgent(agentcore_client, mock_bedrock_client, WorkflowConfig())
+        graph = supervisor._build_dependency_graph({
+            "kyc_verification": {},
+            "customer_behavior_intelligence": {"dependencies": ["kyc_verification"]},
+            "fraud_detection": {"dependencies": ["not_in_workflow"]}
+        })
+        
+        assert graph["fraud_detection"] == []
+        path, makespan = supervisor._compute_critical_path(graph, {
+            "kyc_verification": 10.0, "customer_behavior_intelligence": 20.0, "fraud_detection": 25.0
+        })
+        assert path == ["kyc_verification", "customer_behavior_intelligence"]
+        assert makespan == 30.0
+        
+        cyclic = supervisor._build_dependency_graph({
+            "risk_assessment": {"dependencies": ["regulatory_compliance"]},
+            "regulatory_compliance": {"dependencies": ["risk_assessment"]}
+        })
+        assert cyclic == {"risk_assessment": [], "regulatory_compliance": []}
+
+
+class TestQualityCheck:
+    """Test cases for the rule-based quality check with LLM escalation"""
+    
+    @staticmethod
+    def make_state(confidences: Dict[str, Any]) -> Dict[str, Any]:
+        state = make_parallel_state(list(confidences))
+        state["agent_results"] = {
+            agent_id: (
+                {"status": "completed", "confidence": confidence}
+                if confidence is not None else {"status": "timeout", "confidence": 0.0}
+            )
+            for agent_id, confidence in confidences.items()
+        }
+        return state
+    
+    def test_rule_based_components(self, agentcore_client, mock_bedrock_client):
+        """Completeness, consistency and timeouts all lower the score"""
+        supervisor = SupervisorAgent(agentcore_client, mock_bedrock_client, WorkflowConfig())
+        
+        full = supervisor._rule_based_quality_assessment(
+            self.make_state({"fraud_detection": 0.9, "market_analysis": 0.9})["agent_results"]
+        )
+        partial = supervisor._rule_based_quality_assessment(
+            self.make_state({"fraud_detection": 0.9, "market_analysis": None})["agent_results"]
+        )
+        divergent = supervisor._rule_based_quality_assessment(
+            self.make_state({"fraud_detection": 1.0, "market_analysis": 0.8})["agent_results"]
+        )
+        
+        assert full["score"] == pytest.approx(0.9)
+        assert partial["completeness"] == 0.5
+        assert partial["timeout_rate"] == 0.5
+        assert partial["score"] < full["score"]
+        assert divergent["consistency"] < 1.0
+        assert divergent["score"] < full["score"]
+        assert supervisor._rule_based_quality_assessment({})["score"] == 0.0
+    
+    @pytest.mark.asyncio
+    async def test_clear_result_skips_llm(self, agentcore_client, mock_bedrock_client):
+        """Scores well away from the threshold never call Bedrock"""
+        supervisor = SupervisorAgent(agentcore_client, mock_bedrock_client, WorkflowConfig(quality_threshold=0.7))
+        
+        state = await supervisor._quality_check_node(
+            self.make_state({"fraud_detection": 0.95, "regulatory_compliance": 0.95})
+        )
+        
+        mock_bedrock_client.invoke_for_agent.assert_not_called()
+        assert state["shared_context"]["quality_passed"] is True
+        assert state["shared_context"]["quality_assessment"]["method"] == "rules"
+    
+    @pytest.mark.asyncio
+    async def test_uncertain_result_escalates_to_llm(self, agentcore_client, mock_bedrock_client):
+        """Scores inside the uncertainty band are reviewed by the LLM"""
+        mock_bedrock_client.invoke_for_agent.return_value = Mock(content="Quality score: 0.82")
+        supervisor = SupervisorAgent(
+            agentcore_client, mock_bedrock_client,
+            WorkflowConfig(quality_threshold=0.8, quality_uncertainty_band=0.05)
+        )
+        
+        state = await supervisor._quality_check_node(
+            self.make_state({"fraud_detection": 0.78, "regulatory_compliance": 0.78})
+        )
+        
+        mock_bedrock_client.invoke_for_agent.assert_awaited_once()
+        assert state["shared_context"]["quality_score"] == pytest.approx(0.82)
+        assert state["shared_context"]["quality_passed"] is True
+        assert state["shared_context"]["quality_assessment"]["method"] == "llm"
+
+
 class TestWorkflowOrchestrator:
     """Test cases for WorkflowOrchestrator with monitoring capabilities"""
     
@@ -327,6 +664,101 @@ class TestWorkflowOrchestrator:
         # Check that alert is no longer active
         active_alerts_after = workflow_orchestrator.get_active_alerts()
         assert len(active_alerts_after) == 0
+    
+    @pytest.mark.asyncio
+    async def test_repeated_market_conditions_are_deduplicated(self, workflow_orchestrator):
+        """Re-detecting the same conditions refreshes them instead of growing the store"""
+        for _ in range(5):
+            await workflow_orchestrator._check_market_conditions()
+        
+        assert len(workflow_orchestrator.market_conditions) == 2
+        assert workflow_orchestrator.market_conditions.deduplicated == 8
+        # Only the first detection of the high-impact condition raises an alert
+        assert len(workflow_orchestrator.get_active_alerts()) == 1
+    
+    def test_market_condition_store_is_bounded(self):
+        """The store expires stale conditions and evicts beyond capacity"""
+        store = MarketConditionStore(max_conditions=2, ttl=timedelta(hours=1))
+        now = datetime.now(UTC)
+        
+        def condition(name: str) -> Dict[str, Any]:
+            return {
+                "condition_type": name, "description": name, "impact_level": "low",
+                "affected_sectors": ["fintech"], "source": "test", "confidence": 0.5
+            }
+        
+        store.upsert(condition("a"), now - timedelta(hours=2))
+        store.upsert(condition("b"), now)
+        store.upsert(condition("c"), now)
+        assert [c.condition_type for c in store.values()] == ["b", "c"]
+        
+        store.upsert(condition("d"), now)
+        assert [c.condition_type for c in store.values()] == ["c", "d"]
+        assert store.evicted == 1
+    
+    @pytest.mark.asyncio
+    async def test_affected_workflows_use_sector_index(self, workflow_orchestrator):
+        """Only workflows indexed under an affected sector are returned"""
+        workflow_orchestrator.track_workflow_sectors("wf_saas", ["Enterprise Software"])
+        workflow_orchestrator.track_workflow_sectors("wf_bank", ["digital-banking"])
+        
+        assert workflow_orchestrator._get_affected_workflows(["enterprise_software"]) == ["wf_saas"]
+        assert workflow_orchestrator._get_affected_workflows(["ai_platforms"]) == []
+        
+        workflow_orchestrator.untrack_workflow("wf_saas")
+        assert workflow_orchestrator._get_affected_workflows(["enterprise_software"]) == []
+        assert workflow_orchestrator.get_monitoring_stats()["indexed_workflows_count"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_error_and_critical_alerts_auto_resolve(self, workflow_orchestrator):
+        """Every severity has a resolution window, so open alerts stay bounded"""
+        ages = {"error": timedelta(hours=25), "critical": timedelta(hours=73), "unknown": timedelta(hours=73)}
+        alert_ids = {}
+        for severity, age in ages.items():
+            alert_ids[severity] = await workflow_orchestrator._create_alert(
+                "test_alert", severity, "desc", severity, [], fingerprint=f"test:{severity}"
+            )
+            workflow_orchestrator.active_alerts[alert_ids[severity]].created_at -= age
+        recent = await workflow_orchestrator._create_alert("test_alert", "recent", "desc", "critical", [])
+        
+        await workflow_orchestrator._process_alerts()
+        
+        assert [alert.alert_id for alert in workflow_orchestrator.get_active_alerts()] == [recent]
+        assert workflow_orchestrator._open_alert_fingerprints == {}
+    
+    @pytest.mark.asyncio
+    async def test_health_check_untracks_only_finished_workflows(self, workflow_orchestrator):
+        """Workflows owned by the queue stay indexed until their shared status is terminal"""
+        statuses = {
+            "wf_queued": {"status": "running", "progress": 0.3},
+            "wf_done": {"status": "completed", "progress": 1.0},
+            "wf_failed": {"status": "failed", "error": "abandoned"}
+        }
+        workflow_orchestrator.supervisor.fetch_workflow_status = AsyncMock(side_effect=statuses.get)
+        for workflow_id in list(statuses) + ["wf_expired"]:
+            workflow_orchestrator.track_workflow_sectors(workflow_id, ["digital-banking"])
+        
+        await workflow_orchestrator._check_system_health()
+        
+        assert workflow_orchestrator._get_affected_workflows(["digital_banking"]) == ["wf_queued"]
+    
+    @pytest.mark.asyncio
+    async def test_fingerprinted_alerts_do_not_repeat(self, workflow_orchestrator):
+        """An open alert with the same fingerprint is reused"""
+        first = await workflow_orchestrator._create_alert(
+            "workflow_stuck", "Stuck", "desc", "warning", ["wf"], fingerprint="workflow_stuck:wf"
+        )
+        second = await workflow_orchestrator._create_alert(
+            "workflow_stuck", "Stuck", "desc", "warning", ["wf"], fingerprint="workflow_stuck:wf"
+        )
+        assert first == second
+        assert len(workflow_orchestrator.active_alerts) == 1
+        
+        await workflow_orchestrator._resolve_alert(first)
+        third = await workflow_orchestrator._create_alert(
+            "workflow_stuck", "Stuck", "desc", "warning", ["wf"], fingerprint="workflow_stuck:wf"
+        )
+        assert third != first
 
 
 class TestIntegration:
@@ -0,0 +1,255 @@
+"""
+Unit tests for AgentCommunicationManager queueing.
+
+Tests priority ordering with aging in per-agent queues, the incremental
+queue statistics, deadline-driven message expiry, fan-out delivery and
+request/response calls.
+"""
+
+import asyncio
+import time
+from datetime import timedelta
+
+import pytest
+
+from riskintel360.services.agentcore_client import create_agentcore_client
+from riskintel360.services.agent_communication import (
+    AgentRequestError,
+    CommunicationProtocol,
+    MessageStatus,
+    PriorityMessageQueue,
+    create_communication_manager
+)
+from riskintel360.models.agent_models import AgentMessage, AgentType, MessageType, Priority
+
+
+def make_message(priority: Priority, label: str) -> AgentMessage:
+    return AgentMessage(
+        sender_id="sender",
+        recipient_id="recipient",
+        message_type=MessageType.STATUS_UPDATE,
+        content={"label": label},
+        priority=priority
+    )
+
+
+class TestPriorityMessageQueue:
+    """Test PriorityMessageQueue ordering"""
+
+    def test_higher_priority_served_first(self):
+        """A CRITICAL message overtakes a LOW backlog"""
+        queue = PriorityMessageQueue(aging_interval=60.0)
+        for index in range(3):
+            queue.put_nowait(make_message(Priority.LOW, f"low-{index}"))
+        queue.put_nowait(make_message(Priority.CRITICAL, "critical"))
+
+        labels = [queue.get_nowait().content["label"] for _ in range(4)]
+
+        assert labels == ["critical", "low-0", "low-1", "low-2"]
+
+    @pytest.mark.asyncio
+    async def test_aging_prevents_starvation(self):
+        """A LOW message that waited long enough beats fresh CRITICAL traffic"""
+        queue = PriorityMessageQueue(aging_interval=0.01)
+        queue.put_nowait(make_message(Priority.LOW, "old-low"))
+        await asyncio.sleep(0.1)
+        queue.put_nowait(make_message(Priority.CRITICAL, "critical"))
+
+        assert queue.get_nowait().content["label"] == "old-low"
+        assert queue.metrics.aged_promotions == 1
+
+    @pytest.mark.asyncio
+    async def test_bounded_queue_blocks_producers(self):
+        """maxsize still applies back-pressure like asyncio.Queue"""
+        queue = PriorityMessageQueue(maxsize=1)
+        await queue.put(make_message(Priority.LOW, "first"))
+
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(queue.put(make_message(Priority.HIGH, "second")), timeout=0.05)
+
+
+class TestCommunicationQueueing:
+    """Test priority handling through AgentCommunicationManager"""
+
+    @pytest.fixture
+    def communication_manager(self):
+        return create_communication_manager(create_agentcore_client(region_name="us-east-1"))
+
+    @pytest.mark.asyncio
+    async def test_get_messages_drains_by_priority(self, communication_manager):
+        """Drained messages come back highest priority first, with per-priority stats"""
+        communication_manager.register_agent("supervisor", AgentType.SUPERVISOR)
+        communication_manager.register_agent("analyst", AgentType.MARKET_ANALYSIS)
+
+        for priority in (Priority.LOW, Priority.MEDIUM, Priority.CRITICAL, Priority.HIGH):
+            await communication_manager.send_message(
+                sender_id="supervisor",
+                recipient_id="analyst",
+                message_type=MessageType.STATUS_UPDATE,
+                content={"priority": priority.value},
+                priority=priority
+            )
+
+        stats = communication_manager.get_communication_stats()
+        assert stats["queue_priorities"]["critical"]["depth"] == 1
+        assert stats["queue_priorities"]["low"]["depth"] == 1
+
+        messages = await communication_manager.get_messages("analyst", timeout=0)
+
+        assert [message.priority for message in messages] == [
+            Priority.CRITICAL, Priority.HIGH, Priority.MEDIUM, Priority.LOW
+        ]
+        stats = communication_manager.get_communication_stats()
+        assert stats["pending_messages"] == 0
+        assert stats["queue_priorities"]["low"]["dequeued"] == 1
+
+
+class TestMessageExpiry:
+    """Test heap-scheduled expiry of routes and receipts"""
+
+    @pytest.mark.asyncio
+    async def test_route_expires_at_its_deadline(self):
+        """Expiry fires on time even with a long cleanup interval"""
+        manager = create_communication_manager(create_agentcore_client(region_name="us-east-1"), cleanup_interval=60)
+        await manager.start()
+        try:
+            manager.register_agent("supervisor", AgentType.SUPERVISOR)
+            manager.register_agent("analyst", AgentType.MARKET_ANALYSIS)
+            message_id = await manager.send_message(
+                sender_id="supervisor",
+                recipient_id="analyst",
+                message_type=MessageType.STATUS_UPDATE,
+                content={},
+                expires_in=timedelta(milliseconds=100)
+            )
+
+            await asyncio.sleep(0.3)
+
+            assert message_id not in manager.routing_table
+            assert manager.delivery_receipts[message_id].status == MessageStatus.EXPIRED
+        finally:
+            await manager.stop()
+
+    def test_superseded_receipt_entry_is_skipped(self):
+        """A stale heap entry does not delete a newer receipt"""
+        manager = create_communication_manager(create_agentcore_client(region_name="us-east-1"))
+        manager._record_delivery("message-1")
+        first_deadline = manager._expiry_heap[0][0]
+        manager._record_delivery("message-1")
+        manager.delivery_receipts["message-1"].delivered_at += timedelta(seconds=5)
+
+        manager._expire_due(first_deadline)
+
+        assert "message-1" in manager.delivery_receipts
+
+    @pytest.mark.asyncio
+    async def test_unregistering_drops_queued_depth(self):
+        """Incremental depth metrics stay correct when a queue is discarded"""
+        manager = create_communication_manager(create_agentcore_client(region_name="us-east-1"))
+        manager.register_agent("supervisor", AgentType.SUPERVISOR)
+        manager.register_agent("analyst", AgentType.MARKET_ANALYSIS)
+        await manager.send_message("supervisor", "analyst", MessageType.STATUS_UPDATE, {})
+
+        manager.unregister_agent("analyst")
+
+        assert manager.get_communication_stats()["pending_messages"] == 0
+
+
+class TestFanOut:
+    """Test broadcast and multicast fan-out"""
+
+    @pytest.mark.asyncio
+    async def test_recipients_share_one_payload(self):
+        """Each recipient gets its own envelope around the same content"""
+        manager = create_communication_manager(create_agentcore_client(region_name="us-east-1"))
+        for agent_id in ("supervisor", "analyst_1", "analyst_2"):
+            manager.register_agent(agent_id, AgentType.MARKET_ANALYSIS)
+
+        message_id = await manager.send_message(
+            "supervisor", "all", MessageType.DATA_SHARING, {"rates": [1.0, 2.0]},
+            protocol=CommunicationProtocol.BROADCAST
+        )
+        first = (await manager.get_messages("analyst_1", timeout=0))[0]
+        second = (await manager.get_messages("analyst_2", timeout=0))[0]
+
+        assert (first.recipient_id, second.recipient_id) == ("analyst_1", "analyst_2")
+        assert first.content is second.content
+        assert first.message_id == second.message_id == message_id
+
+    @pytest.mark.asyncio
+    async def test_agentcore_notified_concurrently(self):
+        """Multicast latency does not grow with the number of recipients"""
+        client = create_agentcore_client(region_name="us-east-1")
+        manager = create_communication_manager(client)
+
+        async def slow_handler(message_data):
+            await asyncio.sleep(0.1)
+
+        recipients = [f"analyst_{index}" for index in range(10)]
+        manager.register_agent("supervisor", AgentType.SUPERVISOR)
+        for agent_id in recipients:
+            manager.register_agent(agent_id, AgentType.MARKET_ANALYSIS, message_handler=slow_handler)
+
+        start = time.perf_counter()
+        await manager.send_message(
+            "supervisor", "group", MessageType.DATA_SHARING, {"recipients": recipients},
+            protocol=CommunicationProtocol.MULTICAST
+        )
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.5  # Serial notification would take at least 1.0s
+        assert manager.get_communication_stats()["pending_messages"] == len(recipients)
+
+
+class TestRequestResponse:
+    """Test request() correlation futures"""
+
+    @pytest.fixture
+    def communication_manager(self):
+        manager = create_communication_manager(create_agentcore_client(region_name="us-east-1"))
+        manager.register_agent("supervisor", AgentType.SUPERVISOR)
+        manager.register_agent("analyst", AgentType.MARKET_ANALYSIS)
+        return manager
+
+    @pytest.mark.asyncio
+    async def test_request_resolves_with_response(self, communication_manager):
+        """The reply completes the caller's request and is not left in its queue"""
+        async def answer_one():
+            request = (await communication_manager.get_messages("analyst", timeout=1.0))[0]
+            await communication_manager.respond(request, {"score": request.content["value"] * 2})
+
+        responder = asyncio.create_task(answer_one())
+        response = await communication_manager.request("supervisor", "analyst", {"value": 21}, timeout=1.0)
+        await responder
+
+        assert response.content == {"score": 42}
+        assert response.message_type == MessageType.PROVIDE_DATA
+        assert await communication_manager.get_messages("supervisor", timeout=0) == []
+        assert communication_manager.get_communication_stats()["pending_requests"] == 0
+
+    @pytest.mark.asyncio
+    async def test_request_times_out(self, communication_manager):
+        """An unanswered request raises TimeoutError and is cleaned up"""
+        with pytest.raises(asyncio.TimeoutError):
+            await communication_manager.request("supervisor", "analyst", {}, timeout=0.05)
+
+        stats = communication_manager.get_communication_stats()
+        assert stats["request_timeouts"] == 1
+        assert stats["pending_requests"] == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_request_is_cleaned_up(self, communication_manager):
+        """Cancelling the caller drops its pending future"""
+        task = asyncio.create_task(communication_manager.request("supervisor", "analyst", {}, timeout=5.0))
+        await asyncio.sleep(0.01)
+        task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert communication_manager.get_communication_stats()["pending_requests"] == 0
+
+    @pytest.mark.asyncio
+    async def test_request_to_unknown_agent_fails_fast(self, communication_manager):
+        """Undeliverable requests raise instead of waiting for the timeout"""
+        with pytest.raises(AgentRequestError):
+            await communication_manager.request("supervisor", "nobody", {}, timeout=5.0)
@@ -0,0 +1,309 @@
+"""
+Unit tests for the two-tier CachingService.
+
+Tests the in-process L1 cache in front of Redis: TTL handling, pub/sub
+invalidation between replicas and per-tier statistics; and stampede
+protection in get_or_compute and the @cached decorator.
+"""
+
+import asyncio
+import json
+import time
+import pytest
+from contextlib import asynccontextmanager
+from unittest.mock import Mock, patch
+
+from riskintel360.services.caching_service import CachingService, LocalCache, cached
+
+
+class FakeRedis:
+    """Minimal in-memory stand-in for the Redis commands CachingService uses"""
+
+    def __init__(self):
+        self.data = {}
+        self.ttls = {}
+        self.gets = 0
+        self.published = []
+
+    async def get(self, key):
+        self.gets += 1
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None, nx=False, px=None):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value.encode() if isinstance(value, str) else value
+        self.ttls[key] = px if px else (ex * 1000 if ex else -1)
+        return True
+
+    async def eval(self, script, numkeys, key, token):
+        if self.data.get(key) == token.encode():
+            del self.data[key]
+            return 1
+        return 0
+
+    async def delete(self, *keys):
+        return sum(1 for key in keys if self.data.pop(key, None) is not None)
+
+    async def keys(self, pattern):
+        prefix = pattern.rstrip("*")
+        return [key for key in self.data if key.startswith(prefix)]
+
+    async def publish(self, channel, message):
+        self.published.append((channel, json.loads(message)))
+        return 1
+
+    def pipeline(self, transaction=True):
+        redis = self
+        commands = []
+
+        class Pipeline:
+            def get(self, key):
+                commands.append(("get", key))
+
+            def pttl(self, key):
+                commands.append(("pttl", key))
+
+            async def execute(self):
+                results = []
+                for command, key in commands:
+                    if command == "get":
+                        results.append(await redis.get(key))
+                    else:
+                        results.append(redis.ttls.get(key, -2) if key in redis.data else -2)
+                return results
+
+        return Pipeline()
+
+
+@pytest.fixture
+def redis():
+    return FakeRedis()
+
+
+@pytest.fixture
+def service(redis):
+    service = CachingService()
+
+    @asynccontextmanager
+    async def get_connection():
+        yield redis
+
+    service.pool_manager = Mock()
+    service.pool_manager.redis_pool.get_connection = get_connection
+    service._l1_active = True
+    return service
+
+
+class TestLocalCache:
+    """Test LocalCache bounds and expiry"""
+
+    def test_evicts_least_recently_used(self):
+        """Entry and byte bounds evict the least recently used keys"""
+        cache = LocalCache(max_entries=2, max_bytes=100)
+        cache.put("a", b"1", 10)
+        cache.put("b", b"2", 10)
+        cache.get("a")
+        cache.put("c", b"3", 10)
+
+        assert "a" in cache and "c" in cache and "b" not in cache
+
+        cache.put("big", b"x" * 100, 10)
+        assert len(cache) == 1
+        assert cache.current_bytes == 100
+        assert cache.evictions == 3
+
+    def test_entry_expires(self):
+        """Entries are dropped once their TTL elapses"""
+        cache = LocalCache()
+        cache.put("a", b"1", 0.01)
+        time.sleep(0.02)
+
+        assert cache.get("a") is None
+        assert cache.current_bytes == 0
+
+
+class TestTwoTierCaching:
+    """Test L1 caching in front of Redis"""
+
+    @pytest.mark.asyncio
+    async def test_hot_reads_served_from_l1(self, service, redis):
+        """Only the first read of a key goes to Redis"""
+        await service.set("market_data:1", {"price": 10}, ttl=300)
+
+        for _ in range(5):
+            assert await service.get("market_data:1") == {"price": 10}
+
+        assert redis.gets == 1
+        stats = service.get_stats()
+        assert stats["l1_hits"] == 4
+        assert stats["l2_hits"] == 1
+        assert stats["l1_hit_rate"] == 80.0
+
+    @pytest.mark.asyncio
+    async def test_l1_returns_independent_copies(self, service):
+        """Mutating a returned value does not change the cached one"""
+        await service.set("k", {"items": [1]}, ttl=300)
+        first = await service.get("k")
+        first["items"].append(2)
+
+        assert await service.get("k") == {"items": [1]}
+
+    @pytest.mark.asyncio
+    async def test_l1_honors_remote_ttl(self, service, redis):
+        """L1 entries do not outlive the remaining Redis TTL"""
+        await service.set("k", "v", ttl=300)
+        redis.ttls["k"] = 10  # 10 ms left in Redis
+        await service.get("k")
+        await asyncio.sleep(0.02)
+        await service.get("k")
+
+        assert redis.gets == 2
+
+    @pytest.mark.asyncio
+    async def test_writes_invalidate_l1_and_publish(self, service, redis):
+        """set, delete and clear_pattern drop L1 entries and notify other replicas"""
+        await service.set("market_data:1", "old", ttl=300)
+        await service.get("market_data:1")
+        await service.set("market_data:1", "new", ttl=300)
+
+        assert await service.get("market_data:1") == "new"
+
+        await service.get("market_data:1")
+        await service.clear_pattern("market_data:*")
+        assert "market_data:1" not in service.l1
+
+        channels = {channel for channel, _ in redis.published}
+        assert channels == {CachingService.INVALIDATION_CHANNEL}
+        assert redis.published[-1][1] == {"origin": service.instance_id, "pattern": "market_data:*"}
+
+    @pytest.mark.asyncio
+    async def test_remote_invalidation_evicts_key(self, service):
+        """Invalidations from other replicas evict keys; our own are ignored"""
+        await service.set("k", "v", ttl=300)
+        await service.get("k")
+
+        service._handle_invalidation_message(json.dumps({"origin": service.instance_id, "keys": ["k"]}))
+        assert "k" in service.l1
+
+        service._handle_invalidation_message(json.dumps({"origin": "other-replica", "keys": ["k"]}))
+        assert "k" not in service.l1
+        assert service.get_stats()["invalidations_received"] == 1
+
+    @pytest.mark.asyncio
+    async def test_invalidation_during_read_skips_l1_fill(self, service, redis):
+        """A value read before a concurrent invalidation is not cached locally"""
+        await service.set("k", "old", ttl=300)
+        original_get = redis.get
+
+        async def racing_get(key):
+            value = await original_get(key)
+            service._handle_invalidation_message(json.dumps({"origin": "other-replica", "keys": [key]}))
+            return value
+
+        redis.get = racing_get
+        assert await service.get("k") == "old"
+        assert "k" not in service.l1
+
+    @pytest.mark.asyncio
+    async def test_l1_unused_without_listener(self, service, redis):
+        """Without the invalidation subscription every read goes to Redis"""
+        service._l1_active = False
+        await service.set("k", "v", ttl=300)
+        await service.get("k")
+        await service.get("k")
+
+        assert redis.gets == 2
+        assert len(service.l1) == 0
+
+
+class TestStampedeProtection:
+    """Test single-flight, locking and refresh-ahead in get_or_compute"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_compute_once(self, service, redis):
+        """Concurrent callers share one computation and the lock is released"""
+        calls = 0
+
+        async def compute():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return {"analysis": "ok"}
+
+        results = await asyncio.gather(*(service.get_or_compute("k", compute, ttl=60) for _ in range(10)))
+
+        assert calls == 1
+        assert results == [{"analysis": "ok"}] * 10
+        assert "lock:k" not in redis.data
+        assert await service.get_or_compute("k", compute, ttl=60) == {"analysis": "ok"}
+        assert calls == 1
+
+    @pytest.mark.asyncio
+    async def test_waits_for_lock_holder_in_other_process(self, service, redis):
+        """A caller that cannot take the lock waits for the holder's result"""
+        redis.data["lock:k"] = b"other-process"
+
+        async def other_process():
+            await asyncio.sleep(0.1)
+            await service.set("k", service._wrap_cached("theirs", 0.1, time.time() + 60), 60)
+
+        async def compute():
+            return "ours"
+
+        writer = asyncio.create_task(other_process())
+        assert await service.get_or_compute("k", compute, ttl=60, lock_timeout=2.0) == "theirs"
+        await writer
+
+    @pytest.mark.asyncio
+    async def test_early_refresh_before_expiry(self, service):
+        """XFetch refreshes a slow-to-compute entry in the background before it expires"""
+        await service.set("k", service._wrap_cached("old", 30.0, time.time() + 5), 60)
+
+        async def compute():
+            return "new"
+
+        with patch("riskintel360.services.caching_service.random.random", return_value=0.99):
+            assert await service.get_or_compute("k", compute, ttl=60) == "old"
+        await asyncio.gather(*service._background_tasks)
+
+        assert await service.get_or_compute("k", compute, ttl=60, beta=0) == "new"
+
+    @pytest.mark.asyncio
+    async def test_stale_while_revalidate(self, service, redis):
+        """Expired entries are served while one background refresh runs"""
+        await service.set("k", service._wrap_cached("stale", 0.0, time.time() - 1), 60)
+        calls = 0
+
+        async def compute():
+            nonlocal calls
+            calls += 1
+            return "fresh"
+
+        first = await service.get_or_compute("k", compute, ttl=60, stale_ttl=30)
+        second = await service.get_or_compute("k", compute, ttl=60, stale_ttl=30)
+        await asyncio.gather(*service._background_tasks)
+
+        assert (first, second) == ("stale", "stale")
+        assert calls == 1
+        assert redis.ttls["k"] == 90 * 1000
+        assert await service.get_or_compute("k", compute, ttl=60, stale_ttl=30) == "fresh"
+
+    @pytest.mark.asyncio
+    async def test_cached_decorator(self, service):
+        """The decorator runs the function once and does not cache None"""
+        calls = []
+
+        @cached("market_data", ttl=60)
+        async def analyse(concept):
+            calls.append(concept)
+            await asyncio.sleep(0.01)
+            return None if concept == "missing" else {"concept": concept}
+
+        with patch("riskintel360.services.caching_service.get_caching_service", return_value=service):
+            results = await asyncio.gather(analyse("neo bank"), analyse("neo bank"))
+            await analyse("missing")
+            await analyse("missing")
+
+        assert results == [{"concept": "neo bank"}] * 2
+        assert calls == ["neo bank", "missing", "missing"]
@@ -471,7 +471,7 @@ class TestResultEndpoints(TestFintechEndpoints):
     """Test result retrieval endpoints"""
     
     @pytest.mark.asyncio
-    @patch('riskintel360.api.fintech_endpoints.AgentFactory')
+    @patch('riskintel360.agents.agent_factory.AgentFactory')
     async def test_get_risk_analysis_result_success(self, mock_agent_factory_class, mock_request_state):
         """Test successful risk analysis result retrieval"""
         # Setup mock
@@ -500,7 +500,7 @@ class TestResultEndpoints(TestFintechEndpoints):
         mock_factory.get_analysis_result.assert_called_once_with("analysis_123", "test_user_123")
     
     @pytest.mark.asyncio
-    @patch('riskintel360.api.fintech_endpoints.AgentFactory')
+    @patch('riskintel360.agents.agent_factory.AgentFactory')
     async def test_get_analysis_result_not_found(self, mock_agent_factory_class, mock_request_state):
         """Test analysis result not found"""
         # Setup mock
@@ -568,7 +568,7 @@ class TestBackgroundWorkflows(TestFintechEndpoints):
     """Test background workflow functions"""
     
     @pytest.mark.asyncio
-    @patch('riskintel360.api.fintech_endpoints.AgentFactory')
+    @patch('riskintel360.agents.agent_factory.AgentFactory')
     async def test_start_risk_analysis_workflow_success(self, mock_agent_factory_class):
         """Test successful risk analysis workflow start"""
         # Setup mocks
@@ -603,7 +603,7 @@ class TestBackgroundWorkflows(TestFintechEndpoints):
         assert True  # Workflow function completed without error
     
     @pytest.mark.asyncio
-    @patch('riskintel360.api.fintech_endpoints.AgentFactory')
+    @patch('riskintel360.agents.agent_factory.AgentFactory')
     async def test_start_fraud_detection_workflow_success(self, mock_agent_factory_class):
         """Test successful fraud detection workflow start"""
         # Setup mocks
@@ -1031,7 +1031,7 @@ class TestFintechEndpointsPerformance:
             )
     
     @pytest.mark.asyncio
-    @patch('riskintel360.api.fintech_endpoints.AgentFactory')
+    @patch('riskintel360.agents.agent_factory.AgentFactory')
     async def test_result_retrieval_performance(self, mock_agent_factory_class, mock_request_state):
         """Test result retrieval endpoint performance"""
         # Setup mock factory
@@ -1155,7 +1155,7 @@ class TestFintechEndpointsIntegration:
         return mock_request
     
     @pytest.mark.asyncio
-    @patch('riskintel360.api.fintech_endpoints.AgentFactory')
+    @patch('riskintel360.agents.agent_factory.AgentFactory')
     @patch('riskintel360.api.fintech_endpoints.get_settings')
     async def test_end_to_end_fintech_workflow_simulation(self, mock_settings, mock_agent_factory_class, mock_request_state):
         """Test end-to-end fintech workflow through API endpoints"""
@@ -0,0 +1,135 @@
+"""
+Unit tests for the pooled HTTP client.
+
+Runs against a local aiohttp server to check retries, timeouts and that
+AgentCoreOrchestrator agent invocations now overlap instead of blocking.
+"""
+
+import asyncio
+import time
+
+import aiohttp
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from riskintel360.agentcore.orchestrator import AgentCoreOrchestrator
+from riskintel360.services.http_client import HTTPClientConfig, PooledHTTPClient
+
+
+@pytest_asyncio.fixture
+async def agent_server():
+    """Local server standing in for AgentCore agents"""
+    state = {"flaky_calls": 0, "post_calls": 0}
+
+    async def invocations(request):
+        await asyncio.sleep(0.2)
+        return web.json_response({"agent": "test", "payload": await request.json()})
+
+    async def flaky(request):
+        state["flaky_calls"] += 1
+        if state["flaky_calls"] < 3:
+            return web.Response(status=503)
+        return web.json_response({"ok": True})
+
+    async def slow(request):
+        await asyncio.sleep(1)
+        return web.json_response({})
+
+    async def slow_post(request):
+        state["post_calls"] += 1
+        await asyncio.sleep(1)
+        return web.json_response({})
+
+    async def unavailable_post(request):
+        state["post_calls"] += 1
+        return web.Response(status=503)
+
+    app = web.Application()
+    app.router.add_post("/invocations", invocations)
+    app.router.add_get("/flaky", flaky)
+    app.router.add_get("/slow", slow)
+    app.router.add_post("/slow", slow_post)
+    app.router.add_post("/unavailable", unavailable_post)
+
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    yield port, state
+
+    await runner.cleanup()
+
+
+class TestPooledHTTPClient:
+    """Test PooledHTTPClient behaviour"""
+
+    @pytest.mark.asyncio
+    async def test_retries_retryable_status(self, agent_server):
+        """503 responses are retried until the server recovers"""
+        port, state = agent_server
+        client = PooledHTTPClient(HTTPClientConfig(max_retries=3, backoff_base=0.01))
+
+        response = await client.get(f"http://127.0.0.1:{port}/flaky")
+
+        assert response.status_code == 200
+        assert response.json() == {"ok": True}
+        assert state["flaky_calls"] == 3
+        assert client.get_stats()["retries"] == 2
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_timeout_without_retries_raises(self, agent_server):
+        """A per-request timeout is enforced"""
+        port, _ = agent_server
+        client = PooledHTTPClient()
+
+        with pytest.raises(asyncio.TimeoutError):
+            await client.get(f"http://127.0.0.1:{port}/slow", timeout=0.1, retries=0)
+        assert client.get_stats()["failures"] == 1
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_post_is_not_resent(self, agent_server):
+        """POSTs that may have reached the server are never retried"""
+        port, state = agent_server
+        client = PooledHTTPClient(HTTPClientConfig(max_retries=3, backoff_base=0.01))
+
+        with pytest.raises(asyncio.TimeoutError):
+            await client.post(f"http://127.0.0.1:{port}/slow", timeout=0.1)
+        response = await client.post(f"http://127.0.0.1:{port}/unavailable", retries=2)
+
+        assert response.status_code == 503
+        assert state["post_calls"] == 2
+        assert client.get_stats()["retries"] == 0
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_post_retries_connect_errors_when_opted_in(self):
+        """An opted-in POST is retried only when the connection was refused"""
+        client = PooledHTTPClient(HTTPClientConfig(backoff_base=0.01))
+
+        with pytest.raises(aiohttp.ClientConnectorError):
+            await client.post("http://127.0.0.1:1/invocations", json={}, retries=2)
+        assert client.get_stats()["retries"] == 2
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_agent_invocations_run_concurrently(self, agent_server):
+        """Parallel agent calls overlap instead of running one after another"""
+        port, _ = agent_server
+        client = PooledHTTPClient()
+        orchestrator = AgentCoreOrchestrator(http_client=client)
+
+        start = time.perf_counter()
+        results = await asyncio.gather(*[
+            orchestrator._execute_agent(f"agent_{index}", port, {"index": index})
+            for index in range(5)
+        ])
+        elapsed = time.perf_counter() - start
+
+        assert [result["payload"]["index"] for result in results] == list(range(5))
+        assert elapsed < 0.6  # Five sequential calls would take at least 1.0s
+        await client.close()
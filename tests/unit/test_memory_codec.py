@@ -0,0 +1,55 @@
+"""
+Unit tests for the memory codec.
+
+Tests binary round trips, compression above the size threshold and reading
+values stored as plain JSON before the codec existed.
+"""
+
+import json
+
+import pytest
+
+from riskintel360.services.memory_codec import MAGIC, MemoryCodec, MemoryCodecError
+
+
+class TestMemoryCodec:
+    """Test MemoryCodec encoding"""
+
+    def test_round_trip(self):
+        """Encoded values decode to the original value"""
+        codec = MemoryCodec()
+        value = {"id": "entry-1", "created_at": 1700000000000000, "nested": [1, 2.5, None, True]}
+
+        encoded = codec.encode(value)
+
+        assert encoded[:1] == MAGIC
+        assert codec.decode(encoded) == value
+
+    def test_large_values_are_compressed(self):
+        """Payloads above the threshold are stored compressed"""
+        codec = MemoryCodec(compression_threshold=256)
+        value = {"analysis_results": {"summary": "market trend analysis " * 200}}
+
+        encoded = codec.encode(value)
+
+        assert len(encoded) < len(json.dumps(value)) / 5
+        assert codec.decode(encoded) == value
+
+    def test_small_values_are_not_compressed(self):
+        """Payloads below the threshold skip compression"""
+        codec = MemoryCodec(compression_threshold=1024)
+
+        assert MemoryCodec(compression="none").encode({"a": 1}) == codec.encode({"a": 1})
+
+    def test_reads_legacy_json(self):
+        """Values written as JSON by earlier versions still decode"""
+        codec = MemoryCodec()
+        legacy = json.dumps({"created_at": "2024-01-01T00:00:00+00:00"})
+
+        assert codec.decode(legacy) == {"created_at": "2024-01-01T00:00:00+00:00"}
+        assert codec.decode(legacy.encode()) == {"created_at": "2024-01-01T00:00:00+00:00"}
+
+    def test_rejects_newer_versions(self):
+        """A value written by a newer codec version is reported, not misread"""
+        with pytest.raises(MemoryCodecError):
+            MemoryCodec().decode(MAGIC + bytes((99, 0x01)) + b"\x80")
@@ -0,0 +1,98 @@
+"""
+Unit tests for the agent message bus.
+
+Uses the in-memory transport to check at-least-once delivery and routing
+between two AgentCommunicationManagers standing in for separate processes.
+"""
+
+import asyncio
+
+import pytest
+
+from riskintel360.services.agentcore_client import create_agentcore_client
+from riskintel360.services.agent_communication import CommunicationProtocol, create_communication_manager
+from riskintel360.services.message_bus import InMemoryMessageBus
+from riskintel360.models.agent_models import AgentMessage, AgentType, MessageType, Priority
+
+
+def make_message(recipient_id: str) -> AgentMessage:
+    return AgentMessage(
+        sender_id="sender",
+        recipient_id=recipient_id,
+        message_type=MessageType.DATA_SHARING,
+        content={"value": 1},
+        priority=Priority.HIGH
+    )
+
+
+class TestInMemoryMessageBus:
+    """Test InMemoryMessageBus delivery semantics"""
+
+    @pytest.mark.asyncio
+    async def test_messages_round_trip(self):
+        """Messages survive serialization with enums intact"""
+        bus = InMemoryMessageBus()
+        await bus.register_agent("analyst")
+
+        await bus.send([make_message("analyst"), make_message("analyst")])
+        deliveries = await bus.receive(["analyst"], block_ms=0)
+
+        assert len(deliveries) == 2
+        assert deliveries[0][2].priority == Priority.HIGH
+        assert bus.get_stats()["send_batches"] == 1
+
+    @pytest.mark.asyncio
+    async def test_unacknowledged_messages_are_redelivered(self):
+        """A consumer that dies before acking does not lose the message"""
+        hub = InMemoryMessageBus.Hub()
+        crashed = InMemoryMessageBus(hub, visibility_timeout=0.05)
+        survivor = InMemoryMessageBus(hub, visibility_timeout=0.05)
+        await crashed.register_agent("analyst")
+        await crashed.send([make_message("analyst")])
+
+        assert len(await crashed.receive(["analyst"], block_ms=0)) == 1
+        await asyncio.sleep(0.1)
+        redelivered = await survivor.receive(["analyst"], block_ms=0)
+        await survivor.ack([(agent_id, delivery_id) for agent_id, delivery_id, _ in redelivered])
+
+        assert len(redelivered) == 1
+        await asyncio.sleep(0.1)
+        assert await survivor.receive(["analyst"], block_ms=0) == []
+
+
+class TestCrossProcessRouting:
+    """Test AgentCommunicationManager routing over a shared bus"""
+
+    @pytest.mark.asyncio
+    async def test_agents_in_different_managers_communicate(self):
+        """Direct, broadcast and publish-subscribe messages reach remote agents"""
+        hub = InMemoryMessageBus.Hub()
+        client = create_agentcore_client(region_name="us-east-1")
+        node_a = create_communication_manager(client, transport=InMemoryMessageBus(hub))
+        node_b = create_communication_manager(client, transport=InMemoryMessageBus(hub))
+        node_a.register_agent("supervisor", AgentType.SUPERVISOR)
+        node_b.register_agent("analyst", AgentType.MARKET_ANALYSIS)
+        await node_a.start()
+        await node_b.start()
+
+        try:
+            await node_b.subscribe_to_topic("analyst", "risk_alerts")
+
+            await node_a.send_message("supervisor", "analyst", MessageType.TASK_ASSIGNMENT, {"task": "direct"})
+            await node_a.send_message(
+                "supervisor", "all", MessageType.DATA_SHARING, {"task": "broadcast"},
+                protocol=CommunicationProtocol.BROADCAST
+            )
+            await node_a.send_message(
+                "supervisor", "topic", MessageType.DATA_SHARING, {"task": "publish", "topic": "risk_alerts"},
+                protocol=CommunicationProtocol.PUBLISH_SUBSCRIBE
+            )
+            await asyncio.sleep(0.1)
+
+            messages = await node_b.get_messages("analyst", timeout=0)
+
+            assert sorted(message.content["task"] for message in messages) == ["broadcast", "direct", "publish"]
+            assert node_a.get_communication_stats()["messages_failed"] == 0
+        finally:
+            await node_a.stop()
+            await node_b.stop()
@@ -0,0 +1,43 @@
+"""
+Unit tests for the pattern embedding index.
+
+Tests cosine ranking of reworded concepts, removal and re-indexing.
+"""
+
+from riskintel360.services.pattern_index import PatternEmbeddingIndex
+
+
+class TestPatternEmbeddingIndex:
+    """Test PatternEmbeddingIndex search"""
+
+    def test_reworded_concept_ranks_first(self):
+        """A differently worded concept is matched over unrelated ones"""
+        index = PatternEmbeddingIndex()
+        index.add("fraud", "Fraud detection for mobile payment apps")
+        index.add("lending", "Peer to peer lending marketplace for small businesses")
+        index.add("insurance", "Usage based car insurance pricing")
+
+        results = index.search("AI-powered payment fraud detection on mobile", k=2)
+
+        assert results[0][0] == "fraud"
+        assert results[0][1] > results[1][1]
+
+    def test_min_score_filters_unrelated(self):
+        """Nothing is returned when no indexed text is similar enough"""
+        index = PatternEmbeddingIndex()
+        index.add("lending", "Peer to peer lending marketplace")
+
+        assert index.search("quantum telescope", k=5, min_score=0.3) == []
+
+    def test_remove_and_reindex(self):
+        """Removed items drop out and re-adding an id replaces its text"""
+        index = PatternEmbeddingIndex()
+        for item_id in range(20):
+            index.add(str(item_id), f"concept number {item_id}")
+
+        assert index.remove("3")
+        index.add("5", "crypto wallet custody")
+
+        assert len(index) == 19
+        assert "3" not in index
+        assert index.search("crypto wallet custody", k=1)[0][0] == "5"
@@ -0,0 +1,103 @@
+"""
+Unit tests for ProgressAggregator.
+
+Tests coalescing, the per-workflow flush rate, immediate terminal flushes,
+batching across workflows and the SupervisorAgent progress path.
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import Mock, AsyncMock, patch
+
+from riskintel360.services.progress_aggregator import ProgressAggregator
+from riskintel360.services.workflow_orchestrator import SupervisorAgent, WorkflowConfig, WorkflowPhase
+
+
+class TestProgressAggregator:
+    """Test ProgressAggregator behaviour"""
+
+    @pytest.mark.asyncio
+    async def test_updates_are_coalesced_and_rate_limited(self):
+        """Rapid updates collapse into a bounded number of flushes carrying the latest state"""
+        sink = AsyncMock()
+        aggregator = ProgressAggregator(max_rate_hz=10.0, sinks=[sink])
+
+        for step in range(30):
+            aggregator.submit("wf-1", {"progress": step})
+            await asyncio.sleep(0.01)
+        await aggregator.stop()
+
+        flushed = [call.args[0]["wf-1"]["progress"] for call in sink.await_args_list]
+        assert len(flushed) <= 6
+        assert flushed[-1] == 29
+        assert aggregator.get_stats()["coalesced"] > 20
+
+    @pytest.mark.asyncio
+    async def test_terminal_update_flushed_immediately(self):
+        """Terminal updates bypass the rate limit and release the held state"""
+        sink = AsyncMock()
+        aggregator = ProgressAggregator(max_rate_hz=0.5, sinks=[sink])
+
+        aggregator.submit("wf-1", {"progress": 0.5})
+        await asyncio.sleep(0.01)
+        aggregator.submit("wf-1", {"progress": 1.0}, terminal=True)
+        await asyncio.sleep(0.01)
+
+        assert sink.await_args_list[-1].args[0]["wf-1"]["progress"] == 1.0
+        assert aggregator.get_stats()["tracked"] == 0
+        await aggregator.stop()
+
+    @pytest.mark.asyncio
+    async def test_workflows_batched_into_one_sink_call(self):
+        """Due workflows are delivered together in a single sink call"""
+        sink = AsyncMock()
+        aggregator = ProgressAggregator(max_rate_hz=4.0, sinks=[sink])
+
+        for workflow_id in ("wf-1", "wf-2", "wf-3"):
+            aggregator.submit(workflow_id, {"progress": 0.1})
+        await asyncio.sleep(0.01)
+
+        assert sink.await_count == 1
+        assert set(sink.await_args.args[0]) == {"wf-1", "wf-2", "wf-3"}
+        await aggregator.stop()
+
+    @pytest.mark.asyncio
+    async def test_nested_updates_merge(self):
+        """Per-agent progress accumulates instead of replacing earlier agents"""
+        sink = AsyncMock()
+        aggregator = ProgressAggregator(max_rate_hz=1.0, sinks=[sink])
+
+        aggregator.submit("wf-1", {"agent_progress": {"kyc_verification": 0.5}})
+        aggregator.submit("wf-1", {"agent_progress": {"fraud_detection": 0.2}})
+        await aggregator.flush()
+
+        assert sink.await_args.args[0]["wf-1"]["agent_progress"] == {
+            "kyc_verification": 0.5,
+            "fraud_detection": 0.2
+        }
+        await aggregator.stop()
+
+
+class TestSupervisorProgress:
+    """Test SupervisorAgent progress delivery through the aggregator"""
+
+    @pytest.mark.asyncio
+    async def test_final_progress_reaches_websocket(self):
+        """The completion update is delivered without waiting for the rate limit"""
+        supervisor = SupervisorAgent(Mock(), Mock(), WorkflowConfig(progress_updates_per_second=0.5))
+        state = supervisor._build_initial_state("wf-1", "user", {"business_concept": "Neo bank"})
+
+        with patch("riskintel360.api.websockets.send_validation_progress_update", new_callable=AsyncMock) as send:
+            await supervisor._send_progress_update(state)
+            await asyncio.sleep(0.01)
+            state["progress"] = 0.5
+            await supervisor._send_progress_update(state)
+            state["progress"] = 1.0
+            state["current_phase"] = WorkflowPhase.COMPLETION
+            await supervisor._send_progress_update(state)
+            await asyncio.sleep(0.01)
+
+        assert send.await_count == 2
+        assert send.await_args_list[-1].args[1]["status"] == "completed"
+        await supervisor.progress_aggregator.stop()
@@ -0,0 +1,162 @@
+"""
+Unit tests for shared agent memory.
+
+Tests version stamps and compare-and-set, near-cache coherence under
+out-of-order invalidations, and AgentCoreClient's use of the backend.
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+
+from riskintel360.services.shared_memory import (
+    LocalSharedMemory,
+    RedisSharedMemory,
+    SharedMemoryConflict
+)
+
+
+class TestLocalSharedMemory:
+    """Test LocalSharedMemory behaviour"""
+
+    @pytest.mark.asyncio
+    async def test_versions_increase_per_key(self):
+        """Every write returns the next version for its key"""
+        memory = LocalSharedMemory()
+
+        assert await memory.set("a", 1) == 1
+        assert await memory.set("a", 2) == 2
+        assert await memory.set("b", 1) == 1
+        assert await memory.get("a") == (2, 2)
+        assert await memory.get("missing") is None
+
+    @pytest.mark.asyncio
+    async def test_compare_and_set(self):
+        """A write against a stale version is rejected"""
+        memory = LocalSharedMemory()
+        await memory.set("a", "first")
+
+        assert await memory.set("a", "second", expected_version=1) == 2
+        with pytest.raises(SharedMemoryConflict):
+            await memory.set("a", "third", expected_version=1)
+        assert await memory.get("a") == (2, "second")
+
+
+class TestRedisNearCache:
+    """Test near-cache coherence without a Redis server"""
+
+    def test_invalidation_drops_older_entry(self):
+        """An announced newer version evicts the cached value"""
+        memory = RedisSharedMemory(redis_manager=object())
+        memory._cache("a", 1, "old")
+
+        memory.apply_invalidation("a", 2)
+
+        assert "a" not in memory._near_cache
+        assert memory.stats["invalidations"] == 1
+
+    def test_stale_invalidation_ignored(self):
+        """An invalidation older than our own write keeps the entry"""
+        memory = RedisSharedMemory(redis_manager=object())
+        memory._cache("a", 3, "mine")
+
+        memory.apply_invalidation("a", 2)
+
+        assert memory._near_cache["a"][:2] == (3, "mine")
+        assert memory.stats["stale_invalidations_ignored"] == 1
+
+    def test_slow_read_cannot_recache_older_version(self):
+        """A read racing an invalidation does not cache the superseded value"""
+        memory = RedisSharedMemory(redis_manager=object())
+
+        memory.apply_invalidation("a", 5)
+        memory._cache("a", 4, "stale read")
+
+        assert "a" not in memory._near_cache
+
+    @pytest.mark.asyncio
+    async def test_read_racing_delete_is_not_cached(self):
+        """A value read just before a remote delete is returned but not cached"""
+        memory = RedisSharedMemory(redis_manager=Mock())
+        memory._ensure_listener = AsyncMock()
+
+        async def hmget(*args):
+            memory.apply_invalidation("a", None)
+            return "3", '"deleted"'
+
+        client = Mock(hmget=hmget)
+        memory.redis_manager.get_client = Mock(return_value=Mock(
+            __aenter__=AsyncMock(return_value=client), __aexit__=AsyncMock(return_value=False)
+        ))
+
+        assert await memory.get("a") == (3, "deleted")
+        assert "a" not in memory._near_cache
+
+    def test_near_cache_is_bounded(self):
+        """Least recently used entries are evicted past the size limit"""
+        memory = RedisSharedMemory(redis_manager=object(), near_cache_size=2)
+        for index in range(3):
+            memory._cache(f"k{index}", 1, index)
+
+        assert list(memory._near_cache) == ["k1", "k2"]
+
+
+class TestAgentCoreClientSharedMemory:
+    """Test AgentCoreClient on top of the shared memory backend"""
+
+    @pytest.fixture
+    def client(self):
+        from riskintel360.services.agentcore_client import AgentCoreClient
+
+        with patch("riskintel360.services.agentcore_client.boto3"):
+            return AgentCoreClient(shared_memory=LocalSharedMemory())
+
+    @pytest.mark.asyncio
+    async def test_set_returns_version(self, client):
+        """set_shared_memory returns the version stamp used for CAS"""
+        version = await client.set_shared_memory("market", {"trend": "up"})
+
+        assert await client.get_shared_memory("market") == {"trend": "up"}
+        assert await client.get_shared_memory_versioned("market") == (version, {"trend": "up"})
+        with pytest.raises(SharedMemoryConflict):
+            await client.set_shared_memory("market", {}, expected_version=version + 1)
+
+    @pytest.mark.asyncio
+    async def test_workflow_state_visible_through_shared_memory(self, client):
+        """Workflow state mirrored by one client is readable by another"""
+        from riskintel360.services.agentcore_client import AgentCoreClient
+
+        client._workflow_states["wf-1"] = {"workflow_id": "wf-1", "status": "running"}
+        await client._mirror_workflow_state("wf-1")
+
+        with patch("riskintel360.services.agentcore_client.boto3"):
+            other = AgentCoreClient(shared_memory=client.shared_memory)
+
+        assert other.get_workflow_state("wf-1") is None
+        assert (await other.fetch_workflow_state("wf-1"))["status"] == "running"
+
+    @pytest.mark.asyncio
+    async def test_update_workflow_state_keeps_mirror_task(self, client):
+        """The background mirror task is referenced until it finishes"""
+        client._workflow_states["wf-1"] = {"workflow_id": "wf-1", "status": "running"}
+
+        assert client.update_workflow_state("wf-1", {"status": "completed"})
+        assert len(client._background_tasks) == 1
+        await asyncio.gather(*client._background_tasks)
+
+        assert client._background_tasks == set()
+        assert (await client.get_shared_memory("workflow_state:wf-1"))["status"] == "completed"
+
+    def test_key_count_not_reported_for_near_cache(self):
+        """A Redis backend has no key count, so none is reported"""
+        from riskintel360.services.agentcore_client import AgentCoreClient
+
+        with patch("riskintel360.services.agentcore_client.boto3"):
+            client = AgentCoreClient(shared_memory=RedisSharedMemory(redis_manager=object()))
+        client.shared_memory._cache("a", 1, "value")
+
+        stats = client.get_coordination_stats()
+
+        assert stats["shared_memory_keys"] is None
+        assert stats["shared_memory"]["near_cache_entries"] == 1
@@ -0,0 +1,211 @@
+"""
+Unit tests for the workflow AdmissionScheduler.
+
+Tests the global concurrency limit, weighted fairness across tenants,
+priority order within a tenant, reserved CRITICAL capacity and metrics.
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import Mock, AsyncMock
+
+from riskintel360.models.agent_models import Priority
+from riskintel360.models.core import Priority as RequestPriority, ValidationRequest
+from riskintel360.services.workflow_admission import (
+    AdmissionScheduler, PrioritySemaphore, get_admission_scheduler, parse_priority
+)
+from riskintel360.services.workflow_orchestrator import SupervisorAgent, WorkflowConfig
+
+
+async def _fill(scheduler, requests):
+    """Queue (tenant, priority) requests and return their acquire tasks"""
+    tasks = [asyncio.create_task(scheduler.acquire(tenant, priority)) for tenant, priority in requests]
+    await asyncio.sleep(0)
+    return tasks
+
+
+class TestAdmissionScheduler:
+    """Test AdmissionScheduler behaviour"""
+
+    @pytest.mark.asyncio
+    async def test_global_concurrency_limit(self):
+        """No more than max_concurrent workflows are admitted at once"""
+        scheduler = AdmissionScheduler(max_concurrent=2, reserved_critical_slots=0)
+        tasks = await _fill(scheduler, [("a", Priority.MEDIUM)] * 3)
+
+        assert scheduler.running == 2
+        assert scheduler.get_stats()["queued"] == 1
+
+        scheduler.release(tasks[0].result())
+        await asyncio.sleep(0)
+
+        assert tasks[2].done()
+        assert scheduler.running == 2
+
+    @pytest.mark.asyncio
+    async def test_weighted_fairness_across_tenants(self):
+        """A heavier tenant gets proportionally more slots, a light one is not starved"""
+        scheduler = AdmissionScheduler(max_concurrent=1, reserved_critical_slots=0, tenant_weights={"big": 2.0})
+        blocker = await scheduler.acquire("blocker")
+        tasks = await _fill(scheduler, [("big", Priority.MEDIUM)] * 6 + [("small", Priority.MEDIUM)] * 6)
+
+        admitted = []
+        ticket = blocker
+        for _ in range(6):
+            scheduler.release(ticket)
+            await asyncio.sleep(0)
+            ticket = next(task.result() for task in tasks if task.done() and not task.result().released)
+            admitted.append(ticket.tenant_id)
+
+        assert admitted.count("big") == 4
+        assert admitted.count("small") == 2
+
+    @pytest.mark.asyncio
+    async def test_priority_order_within_tenant(self):
+        """Higher priority work of a tenant is admitted before its older low priority work"""
+        scheduler = AdmissionScheduler(max_concurrent=1, reserved_critical_slots=0)
+        blocker = await scheduler.acquire("a")
+        low, high = await _fill(scheduler, [("a", Priority.LOW), ("a", Priority.HIGH)])
+
+        scheduler.release(blocker)
+        await asyncio.sleep(0)
+
+        assert high.done() and not low.done()
+
+    @pytest.mark.asyncio
+    async def test_critical_uses_reserved_slot(self):
+        """CRITICAL work is admitted even when bulk work saturates the shared slots"""
+        scheduler = AdmissionScheduler(max_concurrent=3, reserved_critical_slots=1)
+        bulk = await _fill(scheduler, [("bulk", Priority.LOW)] * 5)
+        critical, = await _fill(scheduler, [("other", Priority.CRITICAL)])
+
+        assert sum(task.done() for task in bulk) == 2
+        assert critical.done()
+        assert scheduler.get_stats()["by_priority"]["critical"]["admitted"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_wait_leaves_queue(self):
+        """A cancelled waiter is removed and never holds a slot"""
+        scheduler = AdmissionScheduler(max_concurrent=1, reserved_critical_slots=0)
+        ticket = await scheduler.acquire("a")
+        waiter, = await _fill(scheduler, [("b", Priority.MEDIUM)])
+
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+        scheduler.release(ticket)
+
+        assert scheduler.running == 0
+        assert scheduler.get_stats()["queued"] == 0
+
+    def test_parse_priority(self):
+        """Request priorities are accepted as enums, values or names"""
+        assert parse_priority("critical") == Priority.CRITICAL
+        assert parse_priority("HIGH") == Priority.HIGH
+        assert parse_priority(None) == Priority.MEDIUM
+        assert parse_priority("urgent") == Priority.CRITICAL
+        assert parse_priority("unknown") == Priority.MEDIUM
+
+
+class TestPrioritySemaphore:
+    """Test PrioritySemaphore wake-up order"""
+
+    @pytest.mark.asyncio
+    async def test_highest_priority_waiter_gets_next_slot(self):
+        """Freed slots go to waiters by priority, then arrival order"""
+        semaphore = PrioritySemaphore(1)
+        await semaphore.acquire()
+        order = []
+
+        async def waiter(name, priority):
+            async with semaphore.slot(priority):
+                order.append(name)
+
+        tasks = [
+            asyncio.create_task(waiter(name, priority))
+            for name, priority in [
+                ("low", Priority.LOW), ("medium-1", Priority.MEDIUM),
+                ("critical", Priority.CRITICAL), ("medium-2", Priority.MEDIUM)
+            ]
+        ]
+        await asyncio.sleep(0)
+        semaphore.release()
+        await asyncio.gather(*tasks)
+
+        assert order == ["critical", "medium-1", "medium-2", "low"]
+        assert not semaphore.locked()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_leak_slot(self):
+        """A cancelled waiter is skipped and the slot goes to the next one"""
+        semaphore = PrioritySemaphore(1)
+        await semaphore.acquire()
+        cancelled = asyncio.create_task(semaphore.acquire(Priority.CRITICAL))
+        waiting = asyncio.create_task(semaphore.acquire(Priority.LOW))
+        await asyncio.sleep(0)
+
+        cancelled.cancel()
+        await asyncio.sleep(0)
+        semaphore.release()
+        await asyncio.wait_for(waiting, timeout=1)
+
+        assert semaphore.locked()
+
+
+class TestSupervisorAdmission:
+    """Test admission in front of SupervisorAgent workflow execution"""
+
+    @pytest.mark.asyncio
+    async def test_workflows_beyond_limit_wait_for_admission(self):
+        """Workflows over the concurrency limit stay queued until a slot frees"""
+        supervisor = SupervisorAgent(
+            Mock(), Mock(),
+            WorkflowConfig(max_concurrent_workflows=1, reserved_critical_workflow_slots=0)
+        )
+        release = asyncio.Event()
+
+        async def run_graph(workflow_id):
+            await release.wait()
+
+        supervisor._run_workflow_graph = AsyncMock(side_effect=run_graph)
+        for workflow_id in ("wf-1", "wf-2"):
+            supervisor.active_workflows[workflow_id] = supervisor._build_initial_state(
+                workflow_id, "user", {"tenant_id": "tenant", "priority": "high"}
+            )
+
+        tasks = [asyncio.create_task(supervisor._execute_workflow(wid)) for wid in ("wf-1", "wf-2")]
+        await asyncio.sleep(0)
+
+        assert supervisor.get_workflow_status("wf-1")["admission"]["status"] == "admitted"
+        assert supervisor.get_workflow_status("wf-2")["admission"]["status"] == "queued"
+        assert supervisor.get_workflow_status("wf-2")["admission"]["priority"] == "high"
+
+        release.set()
+        await asyncio.gather(*tasks)
+
+        assert supervisor._run_workflow_graph.await_count == 2
+        assert supervisor.admission_scheduler.running == 0
+
+    @pytest.mark.parametrize("mode", ["python", "json"])
+    def test_urgent_validation_request_is_admitted_as_critical(self, mode):
+        """The API's URGENT priority gets the CRITICAL admission class"""
+        request = ValidationRequest(
+            user_id="user-1",
+            business_concept="Instant cross-border payments for SMEs",
+            target_market="European fintech",
+            priority=RequestPriority.URGENT
+        )
+        supervisor = SupervisorAgent(Mock(), Mock(), WorkflowConfig())
+        state = supervisor._build_initial_state("wf-1", "user-1", request.model_dump(mode=mode))
+
+        assert supervisor._admission_class(state) == ("user:user-1", Priority.CRITICAL)
+
+    def test_supervisors_share_admission_scheduler(self):
+        """Supervisors with the same limits draw from one process-wide scheduler"""
+        first = SupervisorAgent(Mock(), Mock(), WorkflowConfig())
+        second = SupervisorAgent(Mock(), Mock(), WorkflowConfig())
+        limited = SupervisorAgent(Mock(), Mock(), WorkflowConfig(max_concurrent_workflows=2))
+
+        assert first.admission_scheduler is second.admission_scheduler
+        assert first.admission_scheduler is get_admission_scheduler()
+        assert limited.admission_scheduler is not first.admission_scheduler
@@ -0,0 +1,207 @@
+"""
+Unit tests for the distributed workflow queue.
+
+Tests claim/ack semantics, visibility-timeout reclaim, the shared status
+store, the worker pool and queue-mode SupervisorAgent start/status.
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import Mock, AsyncMock
+
+from riskintel360.services.workflow_queue import InMemoryWorkflowQueue, WorkflowWorkerPool
+from riskintel360.services.workflow_orchestrator import SupervisorAgent, WorkflowConfig, WorkflowPhase
+
+
+class TestInMemoryWorkflowQueue:
+    """Test InMemoryWorkflowQueue behaviour"""
+
+    @pytest.mark.asyncio
+    async def test_claimed_job_is_invisible_until_acked(self):
+        """A claimed job is not handed to a second consumer"""
+        queue = InMemoryWorkflowQueue(visibility_timeout=30)
+        await queue.enqueue("wf-1", "user", {"business_concept": "Neo bank"})
+
+        first = await queue.claim("worker-a", block_ms=0)
+        second = await queue.claim("worker-b", block_ms=0)
+
+        assert [job.workflow_id for job in first] == ["wf-1"]
+        assert second == []
+        assert (await queue.get_queue_stats()) == {"queued": 0, "in_flight": 1}
+
+        await queue.ack(first[0].message_id)
+        assert (await queue.get_queue_stats()) == {"queued": 0, "in_flight": 0}
+
+    @pytest.mark.asyncio
+    async def test_expired_claim_is_redelivered(self):
+        """A job whose consumer stopped renewing its claim is reclaimed"""
+        queue = InMemoryWorkflowQueue(visibility_timeout=0.05)
+        await queue.enqueue("wf-1", "user", {})
+
+        await queue.claim("worker-a", block_ms=0)
+        await asyncio.sleep(0.1)
+        reclaimed = await queue.claim("worker-b", block_ms=0)
+
+        assert reclaimed[0].workflow_id == "wf-1"
+        assert reclaimed[0].attempts == 2
+
+    @pytest.mark.asyncio
+    async def test_extend_keeps_claim_alive(self):
+        """Renewing a claim prevents redelivery"""
+        queue = InMemoryWorkflowQueue(visibility_timeout=0.1)
+        await queue.enqueue("wf-1", "user", {})
+
+        job = (await queue.claim("worker-a", block_ms=0))[0]
+        await asyncio.sleep(0.06)
+        await queue.extend(job.message_id, "worker-a")
+        await asyncio.sleep(0.06)
+
+        assert await queue.claim("worker-b", block_ms=0) == []
+
+    @pytest.mark.asyncio
+    async def test_status_store(self):
+        """Status is shared and listed until it expires"""
+        queue = InMemoryWorkflowQueue(status_ttl=60)
+        await queue.set_status("wf-1", {"workflow_id": "wf-1", "progress": 0.5})
+
+        assert (await queue.get_status("wf-1"))["progress"] == 0.5
+        assert await queue.list_workflow_ids() == ["wf-1"]
+        assert await queue.get_status("missing") is None
+
+
+class TestWorkflowWorkerPool:
+    """Test WorkflowWorkerPool behaviour"""
+
+    @pytest.mark.asyncio
+    async def test_workers_execute_and_ack_jobs(self):
+        """Queued workflows are run on the supervisor and acknowledged"""
+        queue = InMemoryWorkflowQueue()
+        supervisor = Mock()
+        supervisor.execute_queued_workflow = AsyncMock()
+        pool = WorkflowWorkerPool(queue, supervisor, concurrency=2)
+
+        for index in range(3):
+            await queue.enqueue(f"wf-{index}", "user", {"index": index})
+
+        await pool.start()
+        for _ in range(50):
+            if pool.processed == 3:
+                break
+            await asyncio.sleep(0.01)
+        await pool.stop()
+
+        assert pool.processed == 3
+        assert supervisor.execute_queued_workflow.await_count == 3
+        assert (await queue.get_queue_stats()) == {"queued": 0, "in_flight": 0}
+
+    @pytest.mark.asyncio
+    async def test_job_abandoned_after_max_attempts(self):
+        """Repeatedly reclaimed jobs are marked failed instead of retried forever"""
+        queue = InMemoryWorkflowQueue()
+        supervisor = Mock()
+        supervisor.execute_queued_workflow = AsyncMock()
+        pool = WorkflowWorkerPool(queue, supervisor, max_attempts=1)
+
+        await queue.enqueue("wf-1", "user", {})
+        job = (await queue.claim("worker", block_ms=0))[0]
+        job.attempts = 2
+        await pool._process(job, "worker")
+
+        assert pool.abandoned == 1
+        assert supervisor.execute_queued_workflow.await_count == 0
+        assert (await queue.get_status("wf-1"))["status"] == "failed"
+
+
+class TestQueuedSupervisor:
+    """Test SupervisorAgent in distributed queue mode"""
+
+    @pytest.fixture
+    def supervisor(self):
+        agentcore_client = Mock()
+        agentcore_client.orchestrate_workflow = AsyncMock(return_value=Mock(success=True))
+        supervisor = SupervisorAgent(agentcore_client, Mock(), WorkflowConfig(), work_queue=InMemoryWorkflowQueue())
+        supervisor._send_progress_update = AsyncMock()
+        return supervisor
+
+    @pytest.mark.asyncio
+    async def test_start_workflow_enqueues(self, supervisor):
+        """Started workflows are queued and visible through the shared store"""
+        workflow_id = await supervisor.start_workflow("user", {"business_concept": "Neo bank"})
+
+        status = await supervisor.fetch_workflow_status(workflow_id)
+
+        assert workflow_id not in supervisor.active_workflows
+        assert status["status"] == "queued"
+        assert status["current_phase"] == WorkflowPhase.INITIALIZATION
+        assert await supervisor.fetch_active_workflows() == [workflow_id]
+        assert (await supervisor.work_queue.get_queue_stats())["queued"] == 1
+
+    @pytest.mark.asyncio
+    async def test_execute_queued_workflow_publishes_result(self, supervisor):
+        """A worker run publishes the final status and results"""
+        async def finish(workflow_id):
+            state = supervisor.active_workflows[workflow_id]
+            state["agent_results"] = {"kyc_verification": {"status": "completed"}}
+            state["current_phase"] = WorkflowPhase.COMPLETION
+            state["progress"] = 1.0
+            return "completed"
+
+        supervisor._execute_workflow = AsyncMock(side_effect=finish)
+
+        await supervisor.execute_queued_workflow("wf-1", "user", {"business_concept": "Neo bank"})
+        status = await supervisor.fetch_workflow_status("wf-1")
+
+        assert "wf-1" not in supervisor.active_workflows
+        assert status["status"] == "completed"
+        assert status["current_phase"] == WorkflowPhase.COMPLETION
+        assert status["agent_results"]["kyc_verification"]["status"] == "completed"
+
+    @pytest.mark.asyncio
+    async def test_execute_queued_workflow_publishes_real_outcome(self, supervisor):
+        """Timed-out and failed runs are not reported as completed"""
+        supervisor._execute_workflow = AsyncMock(return_value="timeout")
+        await supervisor.execute_queued_workflow("wf-1", "user", {})
+        assert (await supervisor.fetch_workflow_status("wf-1"))["status"] == "timeout"
+
+        supervisor._execute_workflow = AsyncMock(side_effect=RuntimeError("admission failed"))
+        with pytest.raises(RuntimeError):
+            await supervisor.execute_queued_workflow("wf-2", "user", {})
+        assert (await supervisor.fetch_workflow_status("wf-2"))["status"] == "failed"
+
+    @pytest.mark.asyncio
+    async def test_abandoned_job_status_is_readable(self, supervisor):
+        """Status written for an abandoned job parses like any other"""
+        pool = WorkflowWorkerPool(supervisor.work_queue, supervisor, max_attempts=1)
+        await supervisor.work_queue.enqueue("wf-1", "user", {})
+        job = (await supervisor.work_queue.claim("worker", block_ms=0))[0]
+        job.attempts = 2
+        await pool._process(job, "worker")
+
+        status = await supervisor.fetch_workflow_status("wf-1")
+
+        assert status["status"] == "failed"
+        assert status["current_phase"] == WorkflowPhase.COMPLETION
+
+
+class TestQueueModeStartup:
+    """Test queue mode wiring of the process-wide orchestrator"""
+
+    @pytest.mark.asyncio
+    async def test_queue_mode_starts_and_stops_workers(self, monkeypatch):
+        """WORKFLOW_QUEUE_ENABLED gives the shared supervisor a queue and local workers"""
+        from riskintel360.services import workflow_orchestrator
+
+        monkeypatch.setenv("WORKFLOW_QUEUE_ENABLED", "true")
+        monkeypatch.setenv("WORKFLOW_WORKER_CONCURRENCY", "1")
+
+        orchestrator = await workflow_orchestrator.start_workflow_orchestrator()
+        try:
+            assert workflow_orchestrator.get_workflow_orchestrator() is orchestrator
+            assert isinstance(orchestrator.supervisor.work_queue, InMemoryWorkflowQueue)
+            assert workflow_orchestrator._workflow_worker_pool.is_running
+        finally:
+            await workflow_orchestrator.shutdown_workflow_orchestrator()
+
+        assert workflow_orchestrator._workflow_worker_pool is None
+        assert workflow_orchestrator._workflow_orchestrator is None
@@ -0,0 +1,198 @@
+"""
+Unit tests for WorkflowResultCache.
+
+Tests request canonicalization, per-scope freshness, per-agent reuse and the
+cache hit path of SupervisorAgent.start_fintech_workflow.
+"""
+
+import pytest
+from unittest.mock import Mock, AsyncMock, patch
+
+from riskintel360.services.workflow_result_cache import WorkflowResultCache
+from riskintel360.services.workflow_orchestrator import SupervisorAgent, WorkflowConfig, WorkflowPhase
+
+
+class TestWorkflowResultCache:
+    """Test WorkflowResultCache behaviour"""
+
+    def test_request_key_is_canonical(self):
+        """Key order, scope order and volatile fields do not change the key"""
+        first = {
+            "business_concept": "Neo bank",
+            "target_market": "SMB",
+            "analysis_scope": ["fraud", "regulatory"],
+            "request_id": "a"
+        }
+        second = {
+            "request_id": "b",
+            "analysis_scope": ["regulatory", "fraud"],
+            "target_market": "SMB",
+            "business_concept": "Neo bank"
+        }
+
+        assert WorkflowResultCache.request_key(first) == WorkflowResultCache.request_key(second)
+        assert WorkflowResultCache.request_key(first) != WorkflowResultCache.request_key(
+            {**first, "target_market": "Retail"}
+        )
+
+    def test_keys_are_scoped_to_user_and_tenant(self):
+        """Identical requests from different users or tenants never share entries"""
+        request = {"business_concept": "Neo bank", "tenant_id": "acme"}
+        assignment = {"task": "kyc_analysis", "parameters": {}}
+
+        assert WorkflowResultCache.request_key(request, "alice") != WorkflowResultCache.request_key(request, "bob")
+        assert WorkflowResultCache.request_key(request, "alice") != WorkflowResultCache.request_key(
+            {**request, "tenant_id": "globex"}, "alice"
+        )
+        assert WorkflowResultCache.agent_input_key(assignment, "alice", "acme") != (
+            WorkflowResultCache.agent_input_key(assignment, "alice", "globex")
+        )
+
+    def test_freshness_uses_most_volatile_scope(self):
+        """A workflow expires with the shortest window among its scopes"""
+        cache = WorkflowResultCache({"regulatory": 100.0, "fraud": 10.0})
+
+        assert cache.freshness_window(["regulatory"]) == 100.0
+        assert cache.freshness_window(["regulatory", "fraud"]) == 10.0
+
+    def test_workflow_entry_expires(self):
+        """Entries are served until their freshness window elapses"""
+        cache = WorkflowResultCache({"fraud": 10.0})
+
+        with patch("riskintel360.services.workflow_result_cache.time.time", return_value=1000.0):
+            cache.put_workflow("key", ["fraud"], {"fraud_detection": {"status": "completed"}}, {})
+
+        with patch("riskintel360.services.workflow_result_cache.time.time", return_value=1005.0):
+            assert cache.get_workflow("key")["agent_results"]["fraud_detection"]["status"] == "completed"
+
+        with patch("riskintel360.services.workflow_result_cache.time.time", return_value=1011.0):
+            assert cache.get_workflow("key") is None
+
+        assert cache.get_stats()["workflow_hits"] == 1
+        assert cache.get_stats()["workflow_misses"] == 1
+
+    def test_agent_results_keyed_by_inputs(self):
+        """Agent results are reused only for identical task inputs"""
+        cache = WorkflowResultCache()
+        assignment = {"task": "kyc_analysis", "parameters": {"verification_level": "enhanced"}}
+        cache.put_agent_result("kyc_verification", WorkflowResultCache.agent_input_key(assignment), {"status": "completed"})
+
+        changed = {"task": "kyc_analysis", "parameters": {"verification_level": "basic"}}
+        assert cache.get_agent_result("kyc_verification", WorkflowResultCache.agent_input_key(assignment)) == {"status": "completed"}
+        assert cache.get_agent_result("kyc_verification", WorkflowResultCache.agent_input_key(changed)) is None
+
+    def test_cached_values_are_isolated(self):
+        """Mutating a returned entry must not corrupt the cache"""
+        cache = WorkflowResultCache()
+        cache.put_workflow("key", ["kyc"], {"kyc_verification": {"status": "completed"}}, {})
+
+        cache.get_workflow("key")["agent_results"]["kyc_verification"]["status"] = "failed"
+
+        assert cache.get_workflow("key")["agent_results"]["kyc_verification"]["status"] == "completed"
+
+    def test_lru_eviction(self):
+        """Least recently used entries are evicted beyond max_entries"""
+        cache = WorkflowResultCache(max_entries=2)
+        for key in ("a", "b", "c"):
+            cache.put_workflow(key, ["kyc"], {}, {})
+
+        assert cache.get_workflow("a") is None
+        assert cache.get_workflow("c") is not None
+        assert cache.get_stats()["evictions"] == 1
+
+
+class TestFintechWorkflowMemoization:
+    """Test the cache hit path of start_fintech_workflow"""
+
+    @pytest.fixture
+    def supervisor(self):
+        agentcore_client = Mock()
+        agentcore_client.orchestrate_workflow = AsyncMock(return_value=Mock(success=True))
+        supervisor = SupervisorAgent(agentcore_client, Mock(), WorkflowConfig())
+        supervisor._send_progress_update = AsyncMock()
+        supervisor._execute_workflow = AsyncMock()
+        return supervisor
+
+    @pytest.mark.asyncio
+    async def test_repeated_request_served_from_cache(self, supervisor):
+        """An identical request completes immediately without orchestration"""
+        request = {"business_concept": "Neo bank", "analysis_scope": ["kyc"]}
+        first_id = await supervisor.start_fintech_workflow("user", request)
+
+        # Simulate the first run finishing successfully
+        state = supervisor.active_workflows[first_id]
+        state["agent_results"] = {"kyc_verification": {"status": "completed", "confidence": 0.9}}
+        state["shared_context"] = {"quality_score": 0.9}
+        await supervisor._finalize_workflow_node(state)
+
+        second_id = await supervisor.start_fintech_workflow("user", dict(request))
+        cached_state = supervisor.active_workflows[second_id]
+
+        assert supervisor.agentcore_client.orchestrate_workflow.await_count == 1
+        assert cached_state["current_phase"] == WorkflowPhase.COMPLETION
+        assert cached_state["shared_context"]["cache_hit"] is True
+        assert cached_state["agent_results"]["kyc_verification"]["cached"] is True
+
+    @pytest.mark.asyncio
+    async def test_force_recompute_bypasses_cache(self, supervisor):
+        """force_recompute always starts a fresh workflow"""
+        request = {"business_concept": "Neo bank", "analysis_scope": ["kyc"]}
+        first_id = await supervisor.start_fintech_workflow("user", request)
+        state = supervisor.active_workflows[first_id]
+        state["agent_results"] = {"kyc_verification": {"status": "completed", "confidence": 0.9}}
+        await supervisor._finalize_workflow_node(state)
+
+        await supervisor.start_fintech_workflow("user", request, force_recompute=True)
+
+        assert supervisor.agentcore_client.orchestrate_workflow.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_is_not_shared_across_users(self, supervisor):
+        """Another user's identical request runs its own workflow"""
+        request = {"business_concept": "Neo bank", "analysis_scope": ["kyc"]}
+        first_id = await supervisor.start_fintech_workflow("alice", request)
+        state = supervisor.active_workflows[first_id]
+        state["agent_results"] = {"kyc_verification": {"status": "completed", "confidence": 0.9}}
+        await supervisor._finalize_workflow_node(state)
+
+        await supervisor.start_fintech_workflow("bob", dict(request))
+
+        assert supervisor.agentcore_client.orchestrate_workflow.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_published_in_queue_mode(self, supervisor):
+        """Cache hits are written to the shared status store with their results"""
+        request = {"business_concept": "Neo bank", "analysis_scope": ["kyc"]}
+        first_id = await supervisor.start_fintech_workflow("user", request)
+        state = supervisor.active_workflows[first_id]
+        state["agent_results"] = {"kyc_verification": {"status": "completed", "confidence": 0.9}}
+        await supervisor._finalize_workflow_node(state)
+
+        supervisor.work_queue = Mock()
+        supervisor.work_queue.set_status = AsyncMock()
+        second_id = await supervisor.start_fintech_workflow("user", dict(request))
+
+        workflow_id, record = supervisor.work_queue.set_status.await_args.args
+        assert workflow_id == second_id
+        assert record["status"] == "completed"
+        assert record["agent_results"]["kyc_verification"]["cached"] is True
+
+
+class TestSharedOrchestrator:
+    """Test the process-wide orchestrator used by the API"""
+
+    @pytest.mark.asyncio
+    async def test_orchestrator_is_shared_until_shutdown(self):
+        """Every caller gets the same orchestrator, and so the same result cache"""
+        from riskintel360.services import workflow_orchestrator
+
+        with patch.object(workflow_orchestrator, "WorkflowOrchestrator") as factory:
+            factory.return_value.stop_monitoring = AsyncMock()
+            factory.return_value.supervisor.progress_aggregator.stop = AsyncMock()
+
+            first = workflow_orchestrator.get_workflow_orchestrator()
+            assert workflow_orchestrator.get_workflow_orchestrator() is first
+            assert factory.call_count == 1
+
+            await workflow_orchestrator.shutdown_workflow_orchestrator()
+            assert workflow_orchestrator._workflow_orchestrator is None